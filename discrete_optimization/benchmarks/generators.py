@@ -0,0 +1,363 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Seeded generators of synthetic instances for every problem family, and of random solutions.
+
+All the generators are deterministic given their seed, so that benchmark results computed on
+different versions of the library can be compared.
+"""
+
+import math
+import random
+from typing import Dict, Hashable, List
+
+import numpy as np
+
+from discrete_optimization.coloring.coloring_model import (
+    ColoringProblem,
+    ColoringSolution,
+)
+from discrete_optimization.facility.facility_model import (
+    Customer,
+    Facility,
+    FacilityProblem2DPoints,
+    FacilitySolution,
+    Point,
+)
+from discrete_optimization.generic_tools.graph_api import Graph
+from discrete_optimization.knapsack.knapsack_model import (
+    Item,
+    KnapsackModel,
+    KnapsackSolution,
+)
+from discrete_optimization.pickup_vrp.builders.instance_builders import (
+    create_pickup_and_delivery,
+)
+from discrete_optimization.pickup_vrp.gpdp import GPDP
+from discrete_optimization.rcpsp.rcpsp_model import RCPSPModel, RCPSPSolution
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
+    Employee,
+    MS_RCPSPModel_Variant,
+    MS_RCPSPSolution_Variant,
+    SkillDetail,
+)
+from discrete_optimization.tsp.tsp_model import Point2D, SolutionTSP, TSPModel2D
+from discrete_optimization.vrp.vrp_model import Customer2D, VrpProblem2D, VrpSolution
+
+
+def generate_rcpsp_model(
+    nb_tasks: int, nb_modes: int = 1, calendar: bool = False, seed: int = 0
+) -> RCPSPModel:
+    """Random instance with 4 renewable resources, PSPLIB-like durations and consumptions.
+
+    The capacities are small compared to the consumptions, making the instance heavily
+    resource-constrained.
+
+    Args:
+        nb_tasks: number of non dummy tasks
+        nb_modes: number of modes of each non dummy task
+        calendar: if True, the capacities vary along the horizon
+        seed: seed of the random generator
+
+    """
+    rng = random.Random(seed)
+    resources_capacity = {f"R{k}": 10 for k in range(1, 5)}
+    horizon = 12 * nb_tasks
+    tasks = list(range(1, nb_tasks + 3))
+    mode_details = {tasks[0]: {1: {"duration": 0}}, tasks[-1]: {1: {"duration": 0}}}
+    for task in tasks[1:-1]:
+        mode_details[task] = {}
+        for mode in range(1, nb_modes + 1):
+            mode_details[task][mode] = {"duration": rng.randint(1, 10)}
+            for res in rng.sample(sorted(resources_capacity), rng.randint(1, 4)):
+                mode_details[task][mode][res] = rng.randint(1, 10)
+    successors = {task: [] for task in tasks}
+    for task in tasks[1:-1]:
+        for _ in range(rng.randint(1, 3)):
+            succ = rng.randint(task + 1, min(task + 50, tasks[-2]) + 1)
+            if succ not in successors[task]:
+                successors[task].append(succ)
+    for task in tasks[1:-1]:
+        successors[tasks[0]].append(task)
+        if tasks[-1] not in successors[task]:
+            successors[task].append(tasks[-1])
+    resources = dict(resources_capacity)
+    if calendar:
+        for res in resources_capacity:
+            availability = np.full(horizon, resources_capacity[res], dtype=int)
+            for _ in range(nb_tasks // 5):
+                t = rng.randint(0, horizon - 20)
+                availability[t : t + rng.randint(1, 20)] = rng.randint(5, 9)
+            resources[res] = list(availability)
+    return RCPSPModel(
+        resources=resources,
+        non_renewable_resources=[],
+        mode_details=mode_details,
+        successors=successors,
+        horizon=horizon,
+    )
+
+
+def generate_ms_rcpsp_model(
+    nb_tasks: int, nb_employees: int = 10, nb_skills: int = 3, seed: int = 0
+) -> MS_RCPSPModel_Variant:
+    """Random multiskill instance with 2 renewable resources.
+
+    Each skill is mastered by at least 2 employees, and each task needs at most one unit
+    of a skill, so that every task can be done by the team.
+
+    Args:
+        nb_tasks: number of non dummy tasks
+        nb_employees: number of employees, at least 2
+        nb_skills: number of skills
+        seed: seed of the random generator
+
+    """
+    rng = random.Random(seed)
+    horizon = 10 * nb_tasks
+    skills = [f"S{k}" for k in range(1, nb_skills + 1)]
+    tasks = list(range(1, nb_tasks + 3))
+    mode_details = {tasks[0]: {1: {"duration": 0}}, tasks[-1]: {1: {"duration": 0}}}
+    for task in tasks[1:-1]:
+        mode_details[task] = {}
+        for mode in range(1, rng.randint(1, 2) + 1):
+            mode_details[task][mode] = {
+                "duration": rng.randint(1, 10),
+                "R1": rng.randint(0, 3),
+                "R2": rng.randint(0, 2),
+            }
+            for skill in rng.sample(skills, rng.randint(1, min(2, nb_skills))):
+                mode_details[task][mode][skill] = 1
+    successors = {task: [] for task in tasks}
+    for task in tasks[1:-1]:
+        successors[tasks[0]].append(task)
+        if task < tasks[-2] and rng.random() < 0.5:
+            successors[task].append(rng.randint(task + 1, min(task + 20, tasks[-2])))
+        if tasks[-1] not in successors[task]:
+            successors[task].append(tasks[-1])
+    employees_skills: List[List[str]] = [
+        rng.sample(skills, rng.randint(1, nb_skills)) for _ in range(nb_employees)
+    ]
+    for k, skill in enumerate(skills):
+        for i in (k % nb_employees, (k + 1) % nb_employees):
+            if skill not in employees_skills[i]:
+                employees_skills[i].append(skill)
+    employees: Dict[Hashable, Employee] = {
+        f"employee_{i}": Employee(
+            dict_skill={
+                skill: SkillDetail(1, 1.0, 1.0) for skill in employees_skills[i]
+            },
+            calendar_employee=[rng.random() < 0.95 for _ in range(horizon)],
+            salary=rng.random(),
+        )
+        for i in range(nb_employees)
+    }
+    return MS_RCPSPModel_Variant(
+        skills_set=set(skills),
+        resources_set={"R1", "R2"},
+        non_renewable_resources=set(),
+        resources_availability={"R1": [6] * horizon, "R2": [4] * horizon},
+        employees=employees,
+        employees_availability=[nb_employees] * horizon,
+        mode_details=mode_details,
+        successors=successors,
+        horizon=horizon,
+    )
+
+
+def generate_tsp_model(nb_nodes: int, seed: int = 0) -> TSPModel2D:
+    """Euclidean tsp on nodes uniformly drawn in a square of side 1000."""
+    rng = np.random.default_rng(seed)
+    coordinates = rng.uniform(0, 1000, size=(nb_nodes, 2))
+    return TSPModel2D(
+        list_points=[Point2D(x=float(x), y=float(y)) for x, y in coordinates],
+        node_count=nb_nodes,
+    )
+
+
+def generate_vrp_model(
+    nb_customers: int, nb_vehicles: int = 5, seed: int = 0
+) -> VrpProblem2D:
+    """Euclidean capacitated vrp, with the depot (customer 0) in the center of the square.
+
+    The capacities of the vehicles exceed by 20% the average load per vehicle.
+    """
+    rng = np.random.default_rng(seed)
+    coordinates = rng.uniform(0, 1000, size=(nb_customers, 2))
+    coordinates[0, :] = 500
+    demands = rng.integers(1, 11, size=nb_customers)
+    demands[0] = 0
+    customers = [
+        Customer2D(
+            i, int(demands[i]), float(coordinates[i, 0]), float(coordinates[i, 1])
+        )
+        for i in range(nb_customers)
+    ]
+    capacity = math.ceil(1.2 * demands.sum() / nb_vehicles)
+    return VrpProblem2D(
+        vehicle_count=nb_vehicles,
+        vehicle_capacities=[capacity] * nb_vehicles,
+        customer_count=nb_customers,
+        customers=customers,
+        start_indexes=[0] * nb_vehicles,
+        end_indexes=[0] * nb_vehicles,
+    )
+
+
+def generate_knapsack_model(nb_items: int, seed: int = 0) -> KnapsackModel:
+    """Knapsack whose capacity allows to take around 40% of the items."""
+    rng = random.Random(seed)
+    list_items = [
+        Item(index=i, value=rng.randint(1, 100), weight=rng.randint(1, 50))
+        for i in range(nb_items)
+    ]
+    return KnapsackModel(list_items=list_items, max_capacity=10 * nb_items)
+
+
+def generate_coloring_problem(
+    nb_nodes: int, average_degree: float = 8.0, seed: int = 0
+) -> ColoringProblem:
+    """Coloring of a random graph with a given average degree (Erdős–Rényi G(n, m) model)."""
+    rng = random.Random(seed)
+    nb_edges = min(int(nb_nodes * average_degree / 2), nb_nodes * (nb_nodes - 1) // 2)
+    edges = set()
+    while len(edges) < nb_edges:
+        i, j = rng.randrange(nb_nodes), rng.randrange(nb_nodes)
+        if i != j:
+            edges.add((min(i, j), max(i, j)))
+    return ColoringProblem(
+        Graph(
+            [(i, {}) for i in range(nb_nodes)],
+            [(i, j, {}) for i, j in sorted(edges)],
+            undirected=True,
+            compute_predecessors=False,
+        )
+    )
+
+
+def generate_facility_problem(
+    nb_facilities: int, nb_customers: int, seed: int = 0
+) -> FacilityProblem2DPoints:
+    """Capacitated facility location, the total capacity being twice the total demand."""
+    rng = np.random.default_rng(seed)
+    demands = rng.integers(1, 51, size=nb_customers)
+    capacity = math.ceil(2 * demands.sum() / nb_facilities)
+    facilities = [
+        Facility(
+            index=i,
+            setup_cost=float(rng.uniform(1000, 10000)),
+            capacity=capacity,
+            location=Point(x=float(x), y=float(y)),
+        )
+        for i, (x, y) in enumerate(rng.uniform(0, 1000, size=(nb_facilities, 2)))
+    ]
+    customers = [
+        Customer(
+            index=i,
+            demand=int(demands[i]),
+            location=Point(x=float(x), y=float(y)),
+        )
+        for i, (x, y) in enumerate(rng.uniform(0, 1000, size=(nb_customers, 2)))
+    ]
+    return FacilityProblem2DPoints(
+        nb_facilities, nb_customers, facilities=facilities, customers=customers
+    )
+
+
+def generate_gpdp(nb_nodes: int, nb_vehicles: int = 1, seed: int = 0) -> GPDP:
+    """Pickup and delivery problem, see instance_builders.create_pickup_and_delivery()."""
+    return create_pickup_and_delivery(
+        number_of_vehicles=nb_vehicles,
+        number_of_node=nb_nodes,
+        include_pickup=True,
+        seed=seed,
+    )
+
+
+def random_rcpsp_solution(
+    problem: RCPSPModel, rng: np.random.Generator
+) -> RCPSPSolution:
+    return RCPSPSolution(
+        problem=problem,
+        rcpsp_permutation=list(rng.permutation(problem.n_jobs_non_dummy)),
+        rcpsp_modes=[
+            int(rng.integers(1, len(problem.mode_details[task]) + 1))
+            for task in problem.tasks_list_non_dummy
+        ],
+    )
+
+
+def random_ms_rcpsp_solution(
+    problem: MS_RCPSPModel_Variant, rng: np.random.Generator
+) -> MS_RCPSPSolution_Variant:
+    return MS_RCPSPSolution_Variant(
+        problem=problem,
+        priority_list_task=list(rng.permutation(problem.n_jobs_non_dummy)),
+        modes_vector=[
+            int(rng.integers(1, len(problem.mode_details[task]) + 1))
+            for task in problem.tasks_list_non_dummy
+        ],
+        priority_worker_per_task=[
+            [problem.employees_list[i] for i in rng.permutation(len(problem.employees))]
+            for _ in problem.tasks_list_non_dummy
+        ],
+    )
+
+
+def random_tsp_solution(problem: TSPModel2D, rng: np.random.Generator) -> SolutionTSP:
+    permutation = [node for node in range(problem.node_count) if node != 0]
+    rng.shuffle(permutation)
+    return SolutionTSP(
+        problem=problem, start_index=0, end_index=0, permutation=permutation
+    )
+
+
+def random_vrp_solution(problem: VrpProblem2D, rng: np.random.Generator) -> VrpSolution:
+    customers = [i for i in range(1, problem.customer_count)]
+    rng.shuffle(customers)
+    cuts = np.sort(rng.integers(0, len(customers) + 1, size=problem.vehicle_count - 1))
+    bounds = [0] + list(cuts) + [len(customers)]
+    return VrpSolution(
+        problem=problem,
+        list_start_index=problem.start_indexes,
+        list_end_index=problem.end_indexes,
+        list_paths=[
+            customers[bounds[v] : bounds[v + 1]] for v in range(problem.vehicle_count)
+        ],
+    )
+
+
+def random_knapsack_solution(
+    problem: KnapsackModel, rng: np.random.Generator
+) -> KnapsackSolution:
+    return KnapsackSolution(
+        problem=problem,
+        list_taken=[int(x) for x in rng.random(problem.nb_items) < 0.4],
+    )
+
+
+def random_coloring_solution(
+    problem: ColoringProblem, rng: np.random.Generator
+) -> ColoringSolution:
+    nb_colors = max(2, int(math.sqrt(problem.number_of_nodes)))
+    return ColoringSolution(
+        problem=problem,
+        colors=[
+            int(c) for c in rng.integers(0, nb_colors, size=problem.number_of_nodes)
+        ],
+    )
+
+
+def random_facility_solution(
+    problem: FacilityProblem2DPoints, rng: np.random.Generator
+) -> FacilitySolution:
+    return FacilitySolution(
+        problem=problem,
+        facility_for_customers=[
+            int(f)
+            for f in rng.integers(
+                0, problem.facility_count, size=problem.customer_count
+            )
+        ],
+    )
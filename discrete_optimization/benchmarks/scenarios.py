@@ -0,0 +1,279 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Standard benchmark scenarios, each returning a dictionary of json serializable metrics.
+
+The throughputs are measured after a warm-up call, so that the compilation time of the numba
+kernels is not included. The memory peaks are measured in a second run with tracemalloc,
+which traces the python and numpy allocations (not the allocations done by numba kernels).
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from discrete_optimization.generic_tools.callbacks.early_stoppers import (
+    NbIterationStopper,
+)
+from discrete_optimization.generic_tools.callbacks.recorder import TelemetryRecorder
+from discrete_optimization.generic_tools.do_problem import (
+    ModeOptim,
+    Problem,
+    Solution,
+    get_default_objective_setup,
+)
+from discrete_optimization.generic_tools.ea.ga import Ga
+from discrete_optimization.generic_tools.ls.local_search import RestartHandlerLimit
+from discrete_optimization.generic_tools.ls.simulated_annealing import (
+    ModeMutation,
+    SimulatedAnnealing,
+    TemperatureSchedulingFactor,
+)
+from discrete_optimization.generic_tools.mutations.mixed_mutation import (
+    BasicPortfolioMutation,
+)
+from discrete_optimization.generic_tools.mutations.mutation_catalog import (
+    get_available_mutations,
+)
+from discrete_optimization.pickup_vrp.gpdp import GPDP
+from discrete_optimization.pickup_vrp.solver.ortools_solver import (
+    ORToolsGPDP,
+    ParametersCost,
+    first_solution_strategy_enum,
+    local_search_metaheuristic_enum,
+)
+from discrete_optimization.rcpsp.rcpsp_model import (
+    RCPSPModel,
+    ScheduleGenerationScheme,
+    permutation_do_to_permutation_sgs_fast,
+)
+
+RandomSolution = Callable[[Problem, np.random.Generator], Solution]
+
+
+def memory_peak(func: Callable[[], Any]) -> Tuple[Any, int]:
+    """Run func with tracemalloc.
+
+    Returns: the output of func, and the peak of traced memory in bytes
+
+    """
+    tracemalloc.start()
+    try:
+        output = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return output, peak
+
+
+def seed_global_generators(seed: int) -> None:
+    """Seed the python and numpy global generators, used by the solvers."""
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def instance_scenario(
+    generate: Callable[[], Problem]
+) -> Tuple[Problem, Dict[str, Any]]:
+    """Generation time and memory peak of an instance.
+
+    Returns: the instance, and its metrics
+
+    """
+    t_start = time.perf_counter()
+    problem = generate()
+    generation_seconds = time.perf_counter() - t_start
+    _, peak = memory_peak(generate)
+    return problem, {
+        "generation_seconds": generation_seconds,
+        "memory_peak_bytes": peak,
+    }
+
+
+def evaluation_scenario(
+    problem: Problem,
+    random_solution: RandomSolution,
+    nb_solutions: int,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Throughput of `Problem.evaluate()` on random solutions, each solution being evaluated once."""
+
+    def build_solutions() -> List[Solution]:
+        rng = np.random.default_rng(seed)
+        return [random_solution(problem, rng) for _ in range(nb_solutions)]
+
+    problem.evaluate(random_solution(problem, np.random.default_rng(seed + 1)))
+    solutions = build_solutions()
+    t_start = time.perf_counter()
+    for solution in solutions:
+        problem.evaluate(solution)
+    duration = time.perf_counter() - t_start
+    solutions = build_solutions()
+    _, peak = memory_peak(lambda: [problem.evaluate(s) for s in solutions])
+    return {
+        "nb_solutions": nb_solutions,
+        "evaluations_per_second": nb_solutions / duration,
+        "memory_peak_bytes": peak,
+    }
+
+
+def sgs_scenario(
+    rcpsp_model: RCPSPModel, nb_permutations: int, seed: int = 0
+) -> Dict[str, Any]:
+    """Throughput of the sgs kernels of a rcpsp, one permutation at a time and in batch.
+
+    The modes of the tasks are their first modes.
+    """
+    rng = np.random.default_rng(seed)
+    permutations = np.array(
+        [rng.permutation(rcpsp_model.n_jobs_non_dummy) for _ in range(nb_permutations)],
+        dtype=np.int32,
+    )
+    modes_array = np.zeros(rcpsp_model.n_jobs, dtype=np.int32)
+    starts = np.empty(rcpsp_model.n_jobs, dtype=np.int64)
+    ends = np.empty(rcpsp_model.n_jobs, dtype=np.int64)
+    order = np.empty(rcpsp_model.n_jobs + 1, dtype=np.int64)
+    index_sink = rcpsp_model.index_task[rcpsp_model.sink_task]
+    metrics: Dict[str, Any] = {"nb_permutations": nb_permutations}
+    kernels = {
+        "serial": rcpsp_model.func_sgs_arrays,
+        "parallel": rcpsp_model.func_sgs_parallel_arrays,
+    }
+    for name, kernel in kernels.items():
+        permutations_task = [
+            permutation_do_to_permutation_sgs_fast(rcpsp_model, permutation)
+            for permutation in permutations
+        ]
+        kernel(
+            permutation_task=permutations_task[0],
+            modes_array=modes_array,
+            starts=starts,
+            ends=ends,
+            order=order,
+        )
+        makespans = []
+        t_start = time.perf_counter()
+        for permutation_task in permutations_task:
+            _, unfeasible = kernel(
+                permutation_task=permutation_task,
+                modes_array=modes_array,
+                starts=starts,
+                ends=ends,
+                order=order,
+            )
+            if not unfeasible:
+                makespans.append(ends[index_sink])
+        duration = time.perf_counter() - t_start
+        metrics[f"{name}_schedules_per_second"] = nb_permutations / duration
+        metrics[f"{name}_mean_makespan"] = (
+            float(np.mean(makespans)) if len(makespans) > 0 else None
+        )
+    sgs = rcpsp_model.sgs
+    try:
+        for scheme, name in [
+            (ScheduleGenerationScheme.SERIAL_SGS, "serial"),
+            (ScheduleGenerationScheme.PARALLEL_SGS, "parallel"),
+        ]:
+            rcpsp_model.sgs = scheme
+            rcpsp_model.evaluate_batch(permutations=permutations[:1])
+            t_start = time.perf_counter()
+            rcpsp_model.evaluate_batch(permutations=permutations)
+            duration = time.perf_counter() - t_start
+            metrics[f"batch_{name}_schedules_per_second"] = nb_permutations / duration
+    finally:
+        rcpsp_model.sgs = sgs
+    return metrics
+
+
+def _anytime_metrics(
+    recorder: TelemetryRecorder, mode_optim: ModeOptim
+) -> Dict[str, Any]:
+    incumbents = [
+        [record["time"], record["step"], record["fitness"]]
+        for record in recorder.to_records()
+        if record["event"] == "incumbent"
+    ]
+    return {
+        "mode_optim": mode_optim.name,
+        "solve_seconds": recorder.solve_time,
+        "nb_steps": len(recorder.steps),
+        "initial_fitness": incumbents[0][2] if len(incumbents) > 0 else None,
+        "final_fitness": incumbents[-1][2] if len(incumbents) > 0 else None,
+        "time_to_best_seconds": incumbents[-1][0] if len(incumbents) > 0 else None,
+        "incumbents": incumbents,
+    }
+
+
+def local_search_scenario(
+    problem: Problem, nb_iteration: int, seed: int = 0
+) -> Dict[str, Any]:
+    """Anytime quality of a simulated annealing starting from the dummy solution.
+
+    The neighbourhood is the portfolio of the mutations of the catalog available for the problem.
+    """
+    seed_global_generators(seed)
+    solution = problem.get_dummy_solution()
+    _, list_mutation = get_available_mutations(problem, solution)
+    mutations = [
+        mutate[0].build(problem, solution, **mutate[1]) for mutate in list_mutation
+    ]
+    mixed_mutation = BasicPortfolioMutation(mutations, np.ones(len(mutations)))
+    restart_handler = RestartHandlerLimit(3000, solution, problem.evaluate(solution))
+    solver = SimulatedAnnealing(
+        evaluator=problem,
+        mutator=mixed_mutation,
+        restart_handler=restart_handler,
+        temperature_handler=TemperatureSchedulingFactor(10, restart_handler, 0.9999),
+        mode_mutation=ModeMutation.MUTATE,
+    )
+    recorder = TelemetryRecorder()
+    solver.solve(solution, nb_iteration_max=nb_iteration, callbacks=[recorder])
+    metrics = _anytime_metrics(recorder, solver.mode_optim)
+    metrics["iterations_per_second"] = len(recorder.steps) / recorder.solve_time
+    return metrics
+
+
+def genetic_algorithm_scenario(
+    problem: Problem, max_evals: int, seed: int = 0
+) -> Dict[str, Any]:
+    """Anytime quality of a genetic algorithm with the default settings."""
+    seed_global_generators(seed)
+    params = get_default_objective_setup(problem)
+    solver = Ga(
+        problem,
+        max_evals=max_evals,
+        objective_handling=params.objective_handling,
+        objectives=params.objectives,
+        objective_weights=params.weights,
+        deap_verbose=False,
+    )
+    recorder = TelemetryRecorder()
+    solver.solve(callbacks=[recorder])
+    metrics = _anytime_metrics(recorder, params.sense_function)
+    metrics["phase_seconds"] = recorder.phase_durations()
+    return metrics
+
+
+def ortools_gpdp_scenario(
+    gpdp: GPDP, solution_limit: int, time_limit: int = 60
+) -> Dict[str, Any]:
+    """Anytime quality of the ortools routing solver on a pickup and delivery problem.
+
+    The steps are the solutions found by ortools, the fitness being the cost of the routing model.
+    """
+    solver = ORToolsGPDP(problem=gpdp)
+    solver.init_model(
+        include_demand=True,
+        include_pickup_and_delivery=True,
+        parameters_cost=[ParametersCost(dimension_name="Distance", global_span=True)],
+        first_solution_strategy=first_solution_strategy_enum.PATH_CHEAPEST_ARC,
+        local_search_metaheuristic=local_search_metaheuristic_enum.GUIDED_LOCAL_SEARCH,
+        time_limit=time_limit,
+    )
+    recorder = TelemetryRecorder()
+    solver.solve(callbacks=[recorder, NbIterationStopper(solution_limit)])
+    return _anytime_metrics(recorder, ModeOptim.MINIMIZATION)
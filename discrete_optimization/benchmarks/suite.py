@@ -0,0 +1,351 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Run the standard benchmark scenarios on the generated instances, and compare the results.
+
+Usage:
+    python -m discrete_optimization.benchmarks.suite --scale small --output results.json
+    python -m discrete_optimization.benchmarks.suite --compare reference.json current.json
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+import numba
+import numpy as np
+
+from discrete_optimization.benchmarks.generators import (
+    generate_coloring_problem,
+    generate_facility_problem,
+    generate_gpdp,
+    generate_knapsack_model,
+    generate_ms_rcpsp_model,
+    generate_rcpsp_model,
+    generate_tsp_model,
+    generate_vrp_model,
+    random_coloring_solution,
+    random_facility_solution,
+    random_knapsack_solution,
+    random_ms_rcpsp_solution,
+    random_rcpsp_solution,
+    random_tsp_solution,
+    random_vrp_solution,
+)
+from discrete_optimization.benchmarks.scenarios import (
+    RandomSolution,
+    evaluation_scenario,
+    genetic_algorithm_scenario,
+    instance_scenario,
+    local_search_scenario,
+    ortools_gpdp_scenario,
+    sgs_scenario,
+)
+from discrete_optimization.generic_tools.do_problem import Problem
+
+logger = logging.getLogger(__name__)
+
+# parameters of the generators and of the scenarios, per scale and per family
+SCALES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "small": {
+        "rcpsp": dict(
+            instance=dict(nb_tasks=100),
+            nb_solutions=100,
+            nb_permutations=100,
+            nb_iteration=500,
+        ),
+        "ms_rcpsp": dict(
+            instance=dict(nb_tasks=30, nb_employees=5),
+            nb_solutions=50,
+            nb_iteration=200,
+        ),
+        "tsp": dict(instance=dict(nb_nodes=200), nb_solutions=200, nb_iteration=500),
+        "vrp": dict(instance=dict(nb_customers=100), nb_solutions=200),
+        "knapsack": dict(
+            instance=dict(nb_items=200), nb_solutions=500, nb_iteration=1000
+        ),
+        "coloring": dict(instance=dict(nb_nodes=200), nb_solutions=200, max_evals=1000),
+        "facility": dict(
+            instance=dict(nb_facilities=10, nb_customers=100),
+            nb_solutions=200,
+            max_evals=1000,
+        ),
+        "gpdp": dict(instance=dict(nb_nodes=30), solution_limit=20),
+    },
+    "large": {
+        "rcpsp": dict(
+            instance=dict(nb_tasks=5000),
+            nb_solutions=100,
+            nb_permutations=100,
+            nb_iteration=2000,
+        ),
+        "ms_rcpsp": dict(
+            instance=dict(nb_tasks=500, nb_employees=30),
+            nb_solutions=50,
+            nb_iteration=500,
+        ),
+        "tsp": dict(instance=dict(nb_nodes=10000), nb_solutions=200, nb_iteration=2000),
+        "vrp": dict(instance=dict(nb_customers=2000, nb_vehicles=20), nb_solutions=200),
+        "knapsack": dict(
+            instance=dict(nb_items=100000), nb_solutions=200, nb_iteration=2000
+        ),
+        "coloring": dict(
+            instance=dict(nb_nodes=5000), nb_solutions=200, max_evals=5000
+        ),
+        "facility": dict(
+            instance=dict(nb_facilities=100, nb_customers=5000),
+            nb_solutions=100,
+            max_evals=2000,
+        ),
+        "gpdp": dict(instance=dict(nb_nodes=200), solution_limit=50),
+    },
+}
+
+GENERATORS: Dict[str, Callable[..., Problem]] = {
+    "rcpsp": generate_rcpsp_model,
+    "ms_rcpsp": generate_ms_rcpsp_model,
+    "tsp": generate_tsp_model,
+    "vrp": generate_vrp_model,
+    "knapsack": generate_knapsack_model,
+    "coloring": generate_coloring_problem,
+    "facility": generate_facility_problem,
+    "gpdp": generate_gpdp,
+}
+
+RANDOM_SOLUTIONS: Dict[str, RandomSolution] = {
+    "rcpsp": random_rcpsp_solution,
+    "ms_rcpsp": random_ms_rcpsp_solution,
+    "tsp": random_tsp_solution,
+    "vrp": random_vrp_solution,
+    "knapsack": random_knapsack_solution,
+    "coloring": random_coloring_solution,
+    "facility": random_facility_solution,
+}
+
+# families whose anytime quality is measured with a simulated annealing (the catalog of
+# mutations covering them) or with a genetic algorithm (no mutation in the catalog)
+LOCAL_SEARCH_FAMILIES = ["rcpsp", "ms_rcpsp", "tsp", "knapsack"]
+GENETIC_ALGORITHM_FAMILIES = ["coloring", "facility"]
+
+FAMILIES = list(GENERATORS)
+
+
+def run_family(family: str, parameters: Dict[str, Any], seed: int = 0) -> List[Dict]:
+    """Run the scenarios available for a family.
+
+    Returns: list of dictionaries with keys "family", "scenario", "parameters" and "metrics"
+
+    """
+    results = []
+
+    def add_result(scenario: str, scenario_parameters: Dict, metrics: Dict) -> None:
+        logger.info(
+            f"{family} {scenario}: "
+            f"{ {k: v for k, v in metrics.items() if k != 'incumbents'} }"
+        )
+        results.append(
+            {
+                "family": family,
+                "scenario": scenario,
+                "parameters": scenario_parameters,
+                "metrics": metrics,
+            }
+        )
+
+    instance_parameters = dict(parameters["instance"], seed=seed)
+    problem, metrics = instance_scenario(
+        lambda: GENERATORS[family](**instance_parameters)
+    )
+    add_result("instance", instance_parameters, metrics)
+    if family in RANDOM_SOLUTIONS:
+        nb_solutions = parameters["nb_solutions"]
+        add_result(
+            "evaluation",
+            dict(instance_parameters, nb_solutions=nb_solutions),
+            evaluation_scenario(
+                problem, RANDOM_SOLUTIONS[family], nb_solutions=nb_solutions, seed=seed
+            ),
+        )
+    if family == "rcpsp":
+        nb_permutations = parameters["nb_permutations"]
+        add_result(
+            "sgs",
+            dict(instance_parameters, nb_permutations=nb_permutations),
+            sgs_scenario(problem, nb_permutations=nb_permutations, seed=seed),
+        )
+    if family in LOCAL_SEARCH_FAMILIES:
+        nb_iteration = parameters["nb_iteration"]
+        add_result(
+            "local_search",
+            dict(instance_parameters, nb_iteration=nb_iteration),
+            local_search_scenario(problem, nb_iteration=nb_iteration, seed=seed),
+        )
+    if family in GENETIC_ALGORITHM_FAMILIES:
+        max_evals = parameters["max_evals"]
+        add_result(
+            "genetic_algorithm",
+            dict(instance_parameters, max_evals=max_evals),
+            genetic_algorithm_scenario(problem, max_evals=max_evals, seed=seed),
+        )
+    if family == "gpdp":
+        solution_limit = parameters["solution_limit"]
+        add_result(
+            "ortools",
+            dict(instance_parameters, solution_limit=solution_limit),
+            ortools_gpdp_scenario(problem, solution_limit=solution_limit),
+        )
+    return results
+
+
+def run_benchmarks(
+    families: Optional[List[str]] = None, scale: str = "small", seed: int = 0
+) -> Dict[str, Any]:
+    """Run the scenarios of the families at the given scale.
+
+    Args:
+        families: families to benchmark, all the FAMILIES if None
+        scale: key of SCALES
+        seed: seed of the generators of the instances, of the solutions and of the solvers
+
+    Returns: dictionary with keys "metadata" and "results", serializable with json
+
+    """
+    if families is None:
+        families = FAMILIES
+    results = []
+    for family in families:
+        results += run_family(family, SCALES[scale][family], seed=seed)
+    return {
+        "metadata": {
+            "seed": seed,
+            "scale": scale,
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "numba": numba.__version__,
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(),
+        },
+        "results": results,
+    }
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=1)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _is_higher_better(metric: str) -> Optional[bool]:
+    if metric.endswith("_per_second"):
+        return True
+    if metric.endswith("_seconds") or metric.endswith("_bytes"):
+        return False
+    return None
+
+
+def compare_results(
+    reference: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1
+) -> List[Dict[str, Any]]:
+    """Compare the performance metrics of two runs of the benchmarks.
+
+    Only the scenarios run with the same parameters are compared, on the throughputs
+    (metrics ending with "_per_second"), durations ("_seconds") and memory peaks ("_bytes").
+
+    Args:
+        reference: results of run_benchmarks for the reference version
+        current: results of run_benchmarks for the current version
+        tolerance: relative degradation above which a metric is flagged as a regression
+
+    Returns: list of dictionaries with keys "family", "scenario", "metric", "reference",
+        "current", "ratio" (current / reference) and "regression"
+
+    """
+    reference_results = {
+        (r["family"], r["scenario"], json.dumps(r["parameters"], sort_keys=True)): r
+        for r in reference["results"]
+    }
+    comparisons = []
+    for result in current["results"]:
+        key = (
+            result["family"],
+            result["scenario"],
+            json.dumps(result["parameters"], sort_keys=True),
+        )
+        if key not in reference_results:
+            continue
+        reference_metrics = reference_results[key]["metrics"]
+        for metric, value in result["metrics"].items():
+            higher_is_better = _is_higher_better(metric)
+            reference_value = reference_metrics.get(metric, None)
+            if (
+                higher_is_better is None
+                or not isinstance(value, (int, float))
+                or not isinstance(reference_value, (int, float))
+                or reference_value == 0
+            ):
+                continue
+            ratio = value / reference_value
+            if higher_is_better:
+                regression = ratio < 1 - tolerance
+            else:
+                regression = ratio > 1 + tolerance
+            comparisons.append(
+                {
+                    "family": result["family"],
+                    "scenario": result["scenario"],
+                    "metric": metric,
+                    "reference": reference_value,
+                    "current": value,
+                    "ratio": ratio,
+                    "regression": regression,
+                }
+            )
+    return comparisons
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--families", nargs="+", choices=FAMILIES, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("REFERENCE", "CURRENT"),
+        default=None,
+        help="compare two result files instead of running the benchmarks",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parsed_args = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+    if parsed_args.compare is not None:
+        comparisons = compare_results(
+            load_results(parsed_args.compare[0]),
+            load_results(parsed_args.compare[1]),
+            tolerance=parsed_args.tolerance,
+        )
+        for c in comparisons:
+            print(
+                f"{c['family']:>10} {c['scenario']:>18} {c['metric']:>40} "
+                f"{c['ratio']:8.3f}{'  REGRESSION' if c['regression'] else ''}"
+            )
+        return
+    results = run_benchmarks(
+        families=parsed_args.families, scale=parsed_args.scale, seed=parsed_args.seed
+    )
+    save_results(results, parsed_args.output)
+    print(f"Results saved in {parsed_args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,8 @@ The only constraint is that adjacent vertices should be colored by different col
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
-from typing import Dict, List, Optional, Type, Union
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 
@@ -25,6 +26,9 @@ from discrete_optimization.generic_tools.do_problem import (
 )
 from discrete_optimization.generic_tools.graph_api import Graph
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.generic_tools.do_mutation import LocalMove
+
 
 class ColoringSolution(Solution):
     """Solution class for graph coloring problem.
@@ -206,6 +210,8 @@ class ColoringProblem(Problem):
         self.index_to_nodes_name = {
             i: self.nodes_name[i] for i in range(self.number_of_nodes)
         }
+        # built lazily by init_delta_state()
+        self.incident_edges: Optional[List[List[Tuple[int, int, int]]]] = None
 
     def evaluate(self, variable: ColoringSolution) -> Dict[str, float]:  # type: ignore # avoid isinstance checks for efficiency
         """Evaluation implementation for ColoringProblem.
@@ -321,6 +327,68 @@ class ColoringProblem(Problem):
                     val += 1
         return val
 
+    def init_delta_state(self, variable: ColoringSolution) -> Optional[Tuple[Dict[int, int], int]]:  # type: ignore # avoid isinstance checks for efficiency
+        """Delta state of a coloring solution: number of vertices by color and number of violations.
+
+        Args:
+            variable (ColoringSolution): the solution from which local moves will be applied.
+
+        Returns: the delta state used by evaluate_delta(), None if the colors are not defined.
+
+        """
+        if variable.colors is None:
+            return None
+        if self.incident_edges is None:
+            self.incident_edges = [[] for i in range(self.number_of_nodes)]
+            for k, e in enumerate(self.graph.edges):
+                i, j = self.index_nodes_name[e[0]], self.index_nodes_name[e[1]]
+                self.incident_edges[i].append((k, i, j))
+                if j != i:
+                    self.incident_edges[j].append((k, i, j))
+        return dict(Counter(variable.colors)), self.count_violations(variable)
+
+    def evaluate_delta(  # type: ignore # avoid isinstance checks for efficiency
+        self,
+        variable: ColoringSolution,
+        move: "LocalMove",
+        cached_state: Tuple[Dict[int, int], int],
+    ) -> Optional[Tuple[Dict[str, float], Tuple[Dict[int, int], int]]]:
+        """Update the number of colors and violations, only visiting the edges touching recolored vertices.
+
+        Args:
+            variable (ColoringSolution): the solution on which the move has been applied.
+            move (LocalMove): the local move applied.
+            cached_state: delta state of the solution before the move.
+
+        Returns: kpis and delta state of the new solution, None if the move does not report its changes of colors.
+
+        """
+        changes = move.changed_values(variable)
+        if changes is None or changes[0] != "colors" or self.incident_edges is None:
+            return None
+        changed = changes[1]
+        colors_count, nb_violations = cached_state
+        colors_count = dict(colors_count)
+        for prev, new in changed.values():
+            colors_count[prev] -= 1
+            if colors_count[prev] == 0:
+                del colors_count[prev]
+            colors_count[new] = colors_count.get(new, 0) + 1
+        colors: Any = variable.colors
+        edges = set()
+        for i in changed:
+            edges.update(self.incident_edges[i])
+        for k, i, j in edges:
+            prev_i = changed[i][0] if i in changed else colors[i]
+            prev_j = changed[j][0] if j in changed else colors[j]
+            nb_violations += int(colors[i] == colors[j]) - int(prev_i == prev_j)
+        variable.nb_color = len(colors_count)
+        variable.nb_violations = nb_violations
+        return (
+            {"nb_colors": variable.nb_color, "nb_violations": nb_violations},
+            (colors_count, nb_violations),
+        )
+
     def evaluate_from_encoding(
         self, int_vector: List[int], encoding_name: str
     ) -> Dict[str, float]:
@@ -15,7 +15,7 @@ from abc import abstractmethod
 from collections import namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from discrete_optimization.generic_tools.do_problem import (
     EncodingRegister,
@@ -29,6 +29,11 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeObjective,
 )
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.generic_tools.do_mutation import LocalMove
+
+FacilityDeltaState = Tuple[List[float], List[int], float, float, float]
+
 
 @dataclass(frozen=True)
 class Point:
@@ -149,7 +154,7 @@ class FacilityProblem(Problem):
         d = self.evaluate_cost(variable)
         capacity_constraint_violation = 0
         for f in d["details"]:
-            capacity_constraint_violation = max(
+            capacity_constraint_violation += max(
                 d["details"][f]["capacity_used"] - self.facilities[f].capacity, 0
             )
         d["capacity_constraint_violation"] = capacity_constraint_violation
@@ -212,6 +217,110 @@ class FacilityProblem(Problem):
             cost += c
         return {"cost": cost, "setup_cost": setup_cost, "details": facility_details}
 
+    def init_delta_state(self, variable: FacilitySolution) -> FacilityDeltaState:  # type: ignore # avoid isinstance checks for efficiency
+        """Delta state of a facility solution.
+
+        Args:
+            variable (FacilitySolution): the solution from which local moves will be applied.
+
+        Returns: capacity used and number of customers of each facility, allocation cost, setup cost
+        and capacity violation of the solution.
+
+        """
+        capacity_used = [0.0] * self.facility_count
+        nb_customers = [0] * self.facility_count
+        cost = 0.0
+        for i in range(self.customer_count):
+            f = variable.facility_for_customers[i]
+            capacity_used[f] += self.customers[i].demand
+            nb_customers[f] += 1
+            cost += self.evaluate_customer_facility(
+                facility=self.facilities[f], customer=self.customers[i]
+            )
+        setup_cost = sum(
+            self.facilities[f].setup_cost
+            for f in range(self.facility_count)
+            if nb_customers[f] > 0
+        )
+        capacity_constraint_violation = sum(
+            max(capacity_used[f] - self.facilities[f].capacity, 0)
+            for f in range(self.facility_count)
+        )
+        return (
+            capacity_used,
+            nb_customers,
+            cost,
+            setup_cost,
+            capacity_constraint_violation,
+        )
+
+    def evaluate_delta(  # type: ignore # avoid isinstance checks for efficiency
+        self,
+        variable: FacilitySolution,
+        move: "LocalMove",
+        cached_state: FacilityDeltaState,
+    ) -> Optional[Tuple[Dict[str, float], FacilityDeltaState]]:
+        """Update costs and capacity violation for the facilities touched by the move only.
+
+        Args:
+            variable (FacilitySolution): the solution on which the move has been applied.
+            move (LocalMove): the local move applied.
+            cached_state: delta state of the solution before the move.
+
+        Returns: kpis (without the details by facility) and delta state of the new solution,
+        None if the move does not report its changes of allocation.
+
+        """
+        changes = move.changed_values(variable)
+        if changes is None or changes[0] != "facility_for_customers":
+            return None
+        (
+            capacity_used,
+            nb_customers,
+            cost,
+            setup_cost,
+            capacity_constraint_violation,
+        ) = cached_state
+        capacity_used = list(capacity_used)
+        nb_customers = list(nb_customers)
+        touched = set()
+        for i, (prev, new) in changes[1].items():
+            customer = self.customers[i]
+            for f, sign in ((prev, -1), (new, 1)):
+                if f not in touched:
+                    touched.add(f)
+                    capacity_constraint_violation -= max(
+                        capacity_used[f] - self.facilities[f].capacity, 0
+                    )
+                capacity_used[f] += sign * customer.demand
+                nb_customers[f] += sign
+                cost += sign * self.evaluate_customer_facility(
+                    facility=self.facilities[f], customer=customer
+                )
+            if nb_customers[prev] == 0:
+                setup_cost -= self.facilities[prev].setup_cost
+            if nb_customers[new] == 1:
+                setup_cost += self.facilities[new].setup_cost
+        for f in touched:
+            capacity_constraint_violation += max(
+                capacity_used[f] - self.facilities[f].capacity, 0
+            )
+        variable.dict_details = None
+        return (
+            {
+                "cost": cost,
+                "setup_cost": setup_cost,
+                "capacity_constraint_violation": capacity_constraint_violation,
+            },
+            (
+                capacity_used,
+                nb_customers,
+                cost,
+                setup_cost,
+                capacity_constraint_violation,
+            ),
+        )
+
     def satisfy(self, variable: FacilitySolution) -> bool:  # type: ignore # avoid isinstance checks for efficiency
         """Satisfaction function of a facility solution.
 
@@ -23,8 +23,12 @@ from deap.gp import (
     Terminal,
     genHalfAndHalf,
 )
+from numba import prange
 
-from discrete_optimization.facility.facility_model import FacilityProblem
+from discrete_optimization.facility.facility_model import (
+    FacilityProblem,
+    FacilitySolution,
+)
 from discrete_optimization.facility.solvers.facility_solver import SolverFacility
 from discrete_optimization.facility.solvers.greedy_solvers import (
     GreedySolverDistanceBased,
@@ -34,7 +38,14 @@ from discrete_optimization.generic_tools.do_problem import (
     Problem,
     build_aggreg_function_and_params_objective,
 )
-from discrete_optimization.generic_tools.ghh_tools import argsort, protected_div
+from discrete_optimization.generic_tools.ghh_tools import (
+    VECTORIZED_PRIMITIVES,
+    heuristic_values,
+    protected_div,
+    protected_div_array,
+    register_population_map,
+)
+from discrete_optimization.generic_tools.jit_kernels import jit_kernel
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
 )
@@ -116,6 +127,39 @@ feature_function_map: Dict[FeatureEnum, Callable[..., Iterable[float]]] = {
 }
 
 
+# vectorized versions of the primitives of ParametersGPHH.default(), features being arrays(customer, facility)
+vectorized_primitives: Dict[str, Callable[..., Any]] = dict(
+    VECTORIZED_PRIMITIVES,
+    max_element=np.maximum,
+    min_element=np.minimum,
+    protected_div_list=protected_div_array,
+    sub_list=np.subtract,
+    plus_list=np.add,
+)
+
+
+@jit_kernel(parallel=True)
+def greedy_allocation_batch(priorities, sorted_customers, demands, capacities):
+    """Allocate each customer to the first facility of its priorities with enough remaining capacity.
+
+    The customers are allocated in the order of sorted_customers, as in GreedySolverDistanceBased.
+
+    Returns: array(individual, customer)->facility index, -1 if no facility has enough capacity
+    """
+    nb_individuals, nb_customers, nb_facilities = priorities.shape
+    allocations = np.full((nb_individuals, nb_customers), -1, dtype=np.int64)
+    for i in prange(nb_individuals):
+        capacity_remaining = capacities.copy()
+        for customer in sorted_customers:
+            for k in range(nb_facilities):
+                f = priorities[i, customer, k]
+                if capacity_remaining[f] >= demands[customer]:
+                    allocations[i, customer] = f
+                    capacity_remaining[f] -= demands[customer]
+                    break
+    return allocations
+
+
 class ParametersGPHH:
     """Custom class to parametrize the GPHH solver.
 
@@ -232,6 +276,10 @@ class GPHH(SolverFacility):
         self.greedy_solver = GreedySolverDistanceBased(
             facility_problem=self.facility_problem
         )
+        self.greedy_solvers: Dict[FacilityProblem, GreedySolverDistanceBased] = {
+            self.facility_problem: self.greedy_solver
+        }
+        self.feature_arrays: Dict[FacilityProblem, List[npt.NDArray[np.float_]]] = {}
 
     def init_model(self, **kwargs: Any) -> None:
         tournament_ratio = self.params_gphh.tournament_ratio
@@ -257,6 +305,7 @@ class GPHH(SolverFacility):
             "population", tools.initRepeat, list, self.toolbox.individual
         )
         self.toolbox.register("compile", gp.compile, pset=self.pset)
+        register_population_map(self.toolbox, self.evaluate_population)
         self.toolbox.register(
             "evaluate", self.evaluate_heuristic, domains=self.training_domains
         )
@@ -308,7 +357,7 @@ class GPHH(SolverFacility):
         self.final_pop = pop
         self.func_heuristic = self.toolbox.compile(expr=self.best_heuristic)
         result = self.build_solution(
-            domain=self.facility_problem, func_heuristic=self.func_heuristic
+            domain=self.facility_problem, individual=self.best_heuristic
         )
         return result
 
@@ -317,41 +366,153 @@ class GPHH(SolverFacility):
             pset.renameArguments(**{"ARG" + str(i): self.list_feature[i].value})
         return pset
 
+    def get_greedy_solver(self, domain: FacilityProblem) -> GreedySolverDistanceBased:
+        """Greedy solver of a domain, storing its cost matrix and its order of the customers."""
+        if domain not in self.greedy_solvers:
+            self.greedy_solvers[domain] = GreedySolverDistanceBased(
+                facility_problem=domain
+            )
+        return self.greedy_solvers[domain]
+
+    def get_feature_arrays(
+        self, domain: FacilityProblem
+    ) -> List[npt.NDArray[np.float_]]:
+        """Features of the customers of a domain, computed once per domain.
+
+        Returns: one array(customer, facility) per feature
+
+        """
+        if domain not in self.feature_arrays:
+            self.feature_arrays[domain] = [
+                np.array(
+                    [
+                        feature_function_map[lf](problem=domain, customer_index=j)
+                        for j in range(domain.customer_count)
+                    ],
+                    dtype=float,
+                ).reshape((domain.customer_count, domain.facility_count))
+                for lf in self.list_feature
+            ]
+        return self.feature_arrays[domain]
+
+    def compute_allocations(
+        self,
+        domain: FacilityProblem,
+        individuals: List[Any],
+        func_heuristic: Optional[Callable[..., npt.ArrayLike]] = None,
+    ) -> npt.NDArray[np.int_]:
+        """Greedy allocations of the customers, the facilities being sorted by increasing value
+        of the heuristic of each individual.
+
+        Returns: array(individual, customer)->facility index, see greedy_allocation_batch()
+
+        """
+        features = self.get_feature_arrays(domain)
+        shape = (domain.customer_count, domain.facility_count)
+        priorities = np.array(
+            [
+                np.argsort(
+                    heuristic_values(
+                        expr=individual,
+                        pset=self.pset,
+                        features=features,
+                        shape=shape,
+                        vectorized_primitives=vectorized_primitives,
+                        func_heuristic=func_heuristic,
+                    ),
+                    axis=1,
+                )
+                for individual in individuals
+            ],
+            dtype=np.int32,
+        ).reshape((len(individuals),) + shape)
+        greedy_solver = self.get_greedy_solver(domain)
+        return greedy_allocation_batch(
+            priorities,
+            greedy_solver.sorted_customers,
+            np.array([c.demand for c in domain.customers], dtype=float),
+            np.array(greedy_solver.available_demands, dtype=float),
+        )
+
+    def allocations_objectives(
+        self, domain: FacilityProblem, allocations: npt.NDArray[np.int_]
+    ) -> List[Dict[str, float]]:
+        """Objectives of allocations, as given by FacilityProblem.evaluate()."""
+        nb_facilities = domain.facility_count
+        # customers without facility (-1) are counted on the last facility, as in FacilityProblem.evaluate()
+        allocations = allocations % nb_facilities
+        matrix_cost = self.get_greedy_solver(domain).matrix_cost
+        costs = np.sum(
+            matrix_cost[np.arange(domain.customer_count), allocations], axis=1
+        )
+        demands = np.array([c.demand for c in domain.customers], dtype=float)
+        capacities = np.array([f.capacity for f in domain.facilities], dtype=float)
+        setup_costs = np.array([f.setup_cost for f in domain.facilities], dtype=float)
+        objectives = []
+        for allocation, cost in zip(allocations, costs):
+            opened = np.bincount(allocation, minlength=nb_facilities) > 0
+            capacity_used = np.bincount(
+                allocation, weights=demands, minlength=nb_facilities
+            )
+            objectives.append(
+                {
+                    "cost": float(cost),
+                    "setup_cost": float(np.sum(setup_costs[opened])),
+                    "capacity_constraint_violation": float(
+                        np.sum(np.maximum(capacity_used - capacities, 0.0))
+                    ),
+                }
+            )
+        return objectives
+
     def build_solution(
         self,
         domain: FacilityProblem,
         individual: Optional[Any] = None,
         func_heuristic: Optional[Callable[..., npt.ArrayLike]] = None,
     ) -> ResultStorage:
-        if func_heuristic is None:
-            func_heuristic = self.toolbox.compile(expr=individual)
-        raw_values: List[Iterable[int]] = []
-
-        for j in range(domain.customer_count):
-            input_features: List[Iterable[float]] = [
-                feature_function_map[lf](problem=domain, customer_index=j)
-                for lf in self.list_feature
-            ]
-            output_value = func_heuristic(*input_features)
-            raw_values.append(argsort(output_value))
-        result = self.greedy_solver.solve(
-            **{"prio": {c: raw_values[c] for c in range(len(raw_values))}}
+        allocations = self.compute_allocations(
+            domain=domain, individuals=[individual], func_heuristic=func_heuristic
+        )
+        sol = FacilitySolution(
+            problem=domain, facility_for_customers=allocations[0].tolist()
+        )
+        return ResultStorage(
+            list_solution_fits=[(sol, self.aggreg_dict(domain.evaluate(sol)))],
+            best_solution=sol,
+            mode_optim=self.params_objective_function.sense_function,
         )
-        return result
 
     def evaluate_heuristic(
         self, individual: Any, domains: List[FacilityProblem]
     ) -> List[float]:
-        vals: List[float] = []
-        func_heuristic = self.toolbox.compile(expr=individual)
-        for domain in domains:
-            result = self.build_solution(
-                individual=individual, domain=domain, func_heuristic=func_heuristic
+        return self.evaluate_population(individuals=[individual], domains=domains)[0]
+
+    def evaluate_population(
+        self,
+        individuals: List[Any],
+        domains: Optional[List[FacilityProblem]] = None,
+    ) -> List[List[float]]:
+        """Fitness of a population, each domain allocating the customers of all the individuals in parallel."""
+        if domains is None:
+            domains = self.training_domains
+        if len(individuals) == 0:
+            return []
+        vals = np.zeros((len(domains), len(individuals)))
+        for i, domain in enumerate(domains):
+            allocations = self.compute_allocations(
+                domain=domain, individuals=individuals
             )
-            value: float = result.get_best_solution_fit()[1]  # type: ignore # could also be None or TupleFitness
-            vals.append(value)
-        fitness = [np.mean(vals)]
-        return [fitness[0] - 10 * self.evaluate_complexity(individual)]
+            vals[i, :] = [
+                self.aggreg_dict(objectives)
+                for objectives in self.allocations_objectives(
+                    domain=domain, allocations=allocations
+                )
+            ]
+        return [
+            [fitness - 10 * self.evaluate_complexity(individual)]
+            for fitness, individual in zip(np.mean(vals, axis=0), individuals)
+        ]
 
     def evaluate_complexity(self, individual: Any) -> float:
         all_primitives_list = []
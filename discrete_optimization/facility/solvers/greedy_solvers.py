@@ -111,7 +111,7 @@ class GreedySolverDistanceBased(SolverFacility):
             prior_customers = kwargs.get("prio", {}).get(
                 customer, self.sorted_distance[customer, :]
             )
-            if any(x % 1 != x for x in prior_customers):
+            if any(x % 1 != 0 for x in prior_customers):
                 prior_customers = self.sorted_distance[customer, :]
             for f in prior_customers:
                 f = int(f)
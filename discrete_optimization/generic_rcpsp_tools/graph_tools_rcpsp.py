@@ -2,7 +2,7 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
-from typing import Union
+from typing import Any, Dict, Hashable, Optional, Union
 
 import networkx as nx
 from networkx import NetworkXNoCycle
@@ -39,25 +39,13 @@ class GraphRCPSP:
         self.problem = problem
         self.graph = self.problem.compute_graph()
         self.graph_nx = self.graph.graph_nx
-        self.ancestors_map = {}
-        self.descendants_map = {}
-        descendants = {
-            n: nx.algorithms.descendants(self.graph_nx, n)
-            for n in self.graph_nx.nodes()
-        }
         self.source = self.problem.source_task
         self.sink = self.problem.sink_task
         self.all_activities = set(self.problem.tasks_list)
-        for k in descendants:
-            self.descendants_map[k] = {
-                "succs": descendants[k],
-                "nb": len(descendants[k]),
-            }
-        ancestors = {
-            n: nx.algorithms.ancestors(self.graph_nx, n) for n in self.graph_nx.nodes()
-        }
-        for k in ancestors:
-            self.ancestors_map[k] = {"succs": ancestors[k], "nb": len(ancestors[k])}
+        # None if the precedence graph has a cycle
+        self.closure = self.graph.get_transitive_closure()
+        self._ancestors_map: Optional[Dict[Hashable, Dict[str, Any]]] = None
+        self._descendants_map: Optional[Dict[Hashable, Dict[str, Any]]] = None
         self.graph_without_source_sink = nx.subgraph(
             self.graph_nx,
             [
@@ -67,6 +55,27 @@ class GraphRCPSP:
             ],
         )
 
+    @property
+    def descendants_map(self) -> Dict[Hashable, Dict[str, Any]]:
+        """Descendants ("succs") and their number ("nb") of each task, built at the first access."""
+        if self._descendants_map is None:
+            descendants = self.graph.descendants_map()
+            self._descendants_map = {
+                k: {"succs": descendants[k], "nb": len(descendants[k])}
+                for k in descendants
+            }
+        return self._descendants_map
+
+    @property
+    def ancestors_map(self) -> Dict[Hashable, Dict[str, Any]]:
+        """Ancestors ("succs") and their number ("nb") of each task, built at the first access."""
+        if self._ancestors_map is None:
+            ancestors = self.graph.ancestors_map()
+            self._ancestors_map = {
+                k: {"succs": ancestors[k], "nb": len(ancestors[k])} for k in ancestors
+            }
+        return self._ancestors_map
+
     def get_next_activities(self, task):
         return self.graph.get_neighbors(task)
 
@@ -74,11 +83,31 @@ class GraphRCPSP:
         return self.graph.get_predecessors(task)
 
     def get_descendants_activities(self, task):
+        if self.closure is not None and self._descendants_map is None:
+            if task not in self.closure.index:
+                return set()
+            return self.closure.descendants(task)
         return self.descendants_map.get(task, {"succs": set()})["succs"]
 
     def get_ancestors_activities(self, task):
+        if self.closure is not None and self._ancestors_map is None:
+            if task not in self.closure.index:
+                return set()
+            return self.closure.ancestors(task)
         return self.ancestors_map.get(task, {"succs": set()})["succs"]
 
+    def is_descendant(self, task, other_task) -> bool:
+        """Return True if other_task is a (direct or indirect) successor of task."""
+        if self.closure is not None:
+            return self.closure.is_reachable(task, other_task)
+        return other_task in self.get_descendants_activities(task)
+
+    def get_transitive_reduction(self):
+        """Precedence edges that are not implied by other precedences."""
+        if self.closure is None:
+            raise ValueError("The precedence graph has a cycle.")
+        return self.closure.transitive_reduction()
+
     def check_loop(self):
         try:
             cycles = nx.find_cycle(self.graph_nx, orientation="original")
@@ -144,15 +173,20 @@ class GraphRCPSPSpecialConstraints(GraphRCPSP):
 
 
 def build_unrelated_task(graph: GraphRCPSP):
-    ancestors = graph.ancestors_map
-    descendants = graph.descendants_map
-    all_tasks = set(descendants)
-    unrel = {
-        n: all_tasks.difference(
-            set(ancestors[n]["succs"]).union(set(descendants[n]["succs"])).union({n})
-        )
-        for n in all_tasks
-    }
+    if graph.closure is not None:
+        unrel = {n: graph.closure.unrelated(n) for n in graph.closure.nodes}
+    else:
+        ancestors = graph.ancestors_map
+        descendants = graph.descendants_map
+        all_tasks = set(descendants)
+        unrel = {
+            n: all_tasks.difference(
+                set(ancestors[n]["succs"])
+                .union(set(descendants[n]["succs"]))
+                .union({n})
+            )
+            for n in all_tasks
+        }
     set_pairs = set()
     for task in unrel:
         for other_task in unrel[task]:
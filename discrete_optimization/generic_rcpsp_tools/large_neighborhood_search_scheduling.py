@@ -3,7 +3,7 @@
 #  LICENSE file in the root directory of this source tree.
 
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 import discrete_optimization.rcpsp.solver.rcpsp_cp_lns_solver as rcpsp_lns
 from discrete_optimization.generic_rcpsp_tools.graph_tools_rcpsp import (
@@ -29,6 +29,7 @@ from discrete_optimization.generic_rcpsp_tools.neighbor_tools_rcpsp import (
 from discrete_optimization.generic_rcpsp_tools.solution_repair import (
     NeighborRepairProblems,
 )
+from discrete_optimization.generic_tools.callbacks.callback import Callback
 from discrete_optimization.generic_tools.cp_tools import CPSolverName, ParametersCP
 from discrete_optimization.generic_tools.do_problem import get_default_objective_setup
 from discrete_optimization.generic_tools.do_solver import SolverDO
@@ -492,6 +493,7 @@ class LargeNeighborhoodSearchScheduling(SolverDO):
         max_time_seconds: Optional[int] = None,
         skip_first_iteration: bool = False,
         stop_first_iteration_if_optimal: bool = True,
+        callbacks: Optional[List[Callback]] = None,
         **args
     ) -> ResultStorage:
         if parameters_cp is None:
@@ -503,4 +505,5 @@ class LargeNeighborhoodSearchScheduling(SolverDO):
             stop_first_iteration_if_optimal=stop_first_iteration_if_optimal,
             nb_iteration_no_improvement=nb_iteration_no_improvement,
             nb_iteration_lns=nb_iteration_lns,
+            callbacks=callbacks,
         )
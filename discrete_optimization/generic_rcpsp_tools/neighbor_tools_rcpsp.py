@@ -7,7 +7,17 @@ import math
 import random
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Hashable, Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 from minizinc import Instance
@@ -64,6 +74,9 @@ from discrete_optimization.rcpsp_multiskill.solvers.cp_solvers import (
     CP_MS_MRCPSP_MZN_PREEMPTIVE,
 )
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.rcpsp.solver.cpsat_solver import CPSatRCPSPSolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -1533,6 +1546,85 @@ class ConstraintHandlerScheduling(ConstraintHandler):
         pass
 
 
+class ConstraintHandlerCPSat(ConstraintHandler):
+    """Constraint handler for the CP-SAT solvers of rcpsp and multiskill rcpsp.
+
+    The CP-SAT model is built once: at each iteration, the start times of the tasks are only restricted
+    around the current solution by changing the domains of their variables (the tasks of the second subset
+    of the neighbor builder being the most constrained, with their mode fixed if their start time is fixed),
+    the makespan is bounded by the current one and the current solution is given as hint.
+    The domains are restored at the next iteration.
+    """
+
+    def __init__(
+        self,
+        problem: ANY_RCPSP,
+        neighbor_builder: NeighborBuilder,
+        params_constraint_builder: Optional[ParamsConstraintBuilder] = None,
+    ):
+        self.problem = problem
+        self.neighbor_builder = neighbor_builder
+        self.params_constraint_builder = params_constraint_builder
+        if self.params_constraint_builder is None:
+            self.params_constraint_builder = ParamsConstraintBuilder(
+                minus_delta_primary=6000,
+                plus_delta_primary=6000,
+                minus_delta_secondary=0,
+                plus_delta_secondary=0,
+                constraint_max_time_to_current_solution=True,
+            )
+
+    def adding_constraint_from_results_store(
+        self,
+        cp_solver: "CPSatRCPSPSolver",
+        child_instance: None,
+        result_storage: ResultStorage,
+        last_result_store: Optional[ResultStorage] = None,
+    ) -> Iterable[Any]:
+        if cp_solver.model is None:
+            cp_solver.init_model()
+        # LNS_CPlex does not call remove_constraints_from_previous_iteration()
+        cp_solver.reset_domains()
+        current_solution, fit = result_storage.get_best_solution_fit()
+        subtasks_1, subtasks_2 = self.neighbor_builder.find_subtasks(
+            current_solution=current_solution
+        )
+        logger.debug(f"{len(subtasks_1)} in first set, {len(subtasks_2)} in second set")
+        p = self.params_constraint_builder
+        max_time = get_max_time_solution(solution=current_solution)
+        modes = cp_solver.get_solution_modes(current_solution)
+        deltas = {
+            task: (p.minus_delta_secondary, p.plus_delta_secondary)
+            for task in subtasks_2
+        }
+        deltas.update(
+            {task: (p.minus_delta_primary, p.plus_delta_primary) for task in subtasks_1}
+        )
+        for task, (minus_delta, plus_delta) in deltas.items():
+            start_time = current_solution.get_start_time(task)
+            upper = start_time + plus_delta
+            if p.constraint_max_time_to_current_solution:
+                upper = min(max_time, upper)
+            cp_solver.set_start_bounds(
+                task, lower=max(0, start_time - minus_delta), upper=upper
+            )
+            if minus_delta == plus_delta == 0:
+                cp_solver.fix_mode(task, modes[task])
+        cp_solver.set_makespan_upper_bound(
+            current_solution.get_start_time(self.problem.sink_task)
+        )
+        cp_solver.set_hint(current_solution)
+        return list(cp_solver.initial_domains)
+
+    def remove_constraints_from_previous_iteration(
+        self,
+        cp_solver: "CPSatRCPSPSolver",
+        child_instance: None,
+        previous_constraints: Iterable[Any],
+    ):
+        cp_solver.reset_domains()
+
+
 class ConstraintHandlerMultiskillAllocation(ConstraintHandler):
     def __init__(
         self,
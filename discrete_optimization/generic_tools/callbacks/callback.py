@@ -0,0 +1,112 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Observers of the runs of the solvers.
+
+A solver accepting callbacks (argument `callbacks` of its solve method) notifies them of the events of the run:
+
+- `on_solve_start()` and `on_solve_end()` at the beginning and end of the run,
+- `on_new_incumbent()` when it finds a solution better than the previous ones,
+- `on_phase_end()` at the end of each phase of an iteration (e.g. neighbourhood building, solve and
+  post-processing for a large neighbourhood search), with its duration,
+- `on_step_end()` at the end of each iteration, the run being stopped if a callback returns True.
+
+The step of an event is the index of the iteration of the solver, its meaning depending on the solver
+(move of a local search, iteration of a large neighbourhood search, generation of a genetic algorithm...).
+"""
+
+from typing import Any, Iterable, List, Optional
+
+from discrete_optimization.generic_tools.do_problem import Solution
+
+
+class Callback:
+    """Base class of the callbacks, with methods doing nothing for all the events."""
+
+    def on_solve_start(self, solver: Any) -> None:
+        ...
+
+    def on_solve_end(self, res: Any, solver: Any) -> None:
+        """Called at the end of the run.
+
+        Args:
+            res: output of the solver, usually a ResultStorage
+            solver: solver running
+
+        """
+        ...
+
+    def on_new_incumbent(
+        self, step: int, solution: Optional[Solution], fitness: Any, solver: Any
+    ) -> None:
+        """Called when the solver finds a solution better than the previous ones.
+
+        Args:
+            step: iteration of the solver
+            solution: new best solution, None if the solver cannot provide it cheaply
+            fitness: fitness of the solution, in the optimization sense of the solver
+            solver: solver running
+
+        """
+        ...
+
+    def on_phase_end(self, step: int, phase: str, duration: float, solver: Any) -> None:
+        """Called at the end of a phase of an iteration of the solver.
+
+        Args:
+            step: iteration of the solver
+            phase: name of the phase, e.g. "neighbourhood", "solve", "post_process"
+            duration: duration of the phase in seconds
+            solver: solver running
+
+        """
+        ...
+
+    def on_step_end(self, step: int, res: Any, solver: Any) -> Optional[bool]:
+        """Called at the end of an iteration of the solver.
+
+        Args:
+            step: iteration of the solver
+            res: results found so far, usually a ResultStorage
+            solver: solver running
+
+        Returns: True to stop the run
+
+        """
+        ...
+
+
+class CallbackList(Callback):
+    """Callback forwarding the events to a list of callbacks.
+
+    The run is stopped at the end of a step if any of the callbacks asks for it,
+    all the callbacks being notified of the step anyway.
+    """
+
+    def __init__(self, callbacks: Optional[Iterable[Callback]] = None):
+        self.callbacks: List[Callback] = [] if callbacks is None else list(callbacks)
+
+    def on_solve_start(self, solver: Any) -> None:
+        for callback in self.callbacks:
+            callback.on_solve_start(solver)
+
+    def on_solve_end(self, res: Any, solver: Any) -> None:
+        for callback in self.callbacks:
+            callback.on_solve_end(res, solver)
+
+    def on_new_incumbent(
+        self, step: int, solution: Optional[Solution], fitness: Any, solver: Any
+    ) -> None:
+        for callback in self.callbacks:
+            callback.on_new_incumbent(step, solution, fitness, solver)
+
+    def on_phase_end(self, step: int, phase: str, duration: float, solver: Any) -> None:
+        for callback in self.callbacks:
+            callback.on_phase_end(step, phase, duration, solver)
+
+    def on_step_end(self, step: int, res: Any, solver: Any) -> bool:
+        stopping = False
+        for callback in self.callbacks:
+            stopping = bool(callback.on_step_end(step, res, solver)) or stopping
+        return stopping
@@ -0,0 +1,78 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Callbacks stopping the run of a solver, see callback.Callback.on_step_end()."""
+
+import logging
+import time
+from typing import Any, Optional
+
+from discrete_optimization.generic_tools.callbacks.callback import Callback
+from discrete_optimization.generic_tools.do_problem import ModeOptim, Solution
+
+logger = logging.getLogger(__name__)
+
+
+class TimerStopper(Callback):
+    """Stop the run when its duration exceeds a time budget."""
+
+    def __init__(self, total_seconds: float):
+        self.total_seconds = total_seconds
+        self.start_time = time.perf_counter()
+
+    def on_solve_start(self, solver: Any) -> None:
+        self.start_time = time.perf_counter()
+
+    def on_step_end(self, step: int, res: Any, solver: Any) -> Optional[bool]:
+        if time.perf_counter() - self.start_time > self.total_seconds:
+            logger.info(f"Stopping after {self.total_seconds} seconds")
+            return True
+        return False
+
+
+class NbIterationStopper(Callback):
+    """Stop the run after a given number of steps."""
+
+    def __init__(self, nb_iteration_max: int):
+        self.nb_iteration_max = nb_iteration_max
+        self.nb_iteration = 0
+
+    def on_solve_start(self, solver: Any) -> None:
+        self.nb_iteration = 0
+
+    def on_step_end(self, step: int, res: Any, solver: Any) -> Optional[bool]:
+        self.nb_iteration += 1
+        return self.nb_iteration >= self.nb_iteration_max
+
+
+class ObjectiveTargetStopper(Callback):
+    """Stop the run as soon as the fitness of the incumbent reaches a target.
+
+    Attributes:
+        target: fitness to reach
+        mode_optim: optimization sense of the fitness given by the solver
+        reached: True if the target has been reached
+
+    """
+
+    def __init__(self, target: float, mode_optim: ModeOptim = ModeOptim.MAXIMIZATION):
+        self.target = target
+        self.mode_optim = mode_optim
+        self.reached = False
+
+    def on_solve_start(self, solver: Any) -> None:
+        self.reached = False
+
+    def on_new_incumbent(
+        self, step: int, solution: Optional[Solution], fitness: Any, solver: Any
+    ) -> None:
+        if self.mode_optim == ModeOptim.MAXIMIZATION:
+            self.reached = self.reached or fitness >= self.target
+        else:
+            self.reached = self.reached or fitness <= self.target
+
+    def on_step_end(self, step: int, res: Any, solver: Any) -> Optional[bool]:
+        if self.reached:
+            logger.info(f"Stopping at step {step}, target {self.target} reached")
+        return self.reached
@@ -0,0 +1,131 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""In-memory recording of the events of the runs of the solvers, exported to csv or json."""
+
+import csv
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from discrete_optimization.generic_tools.callbacks.callback import Callback
+from discrete_optimization.generic_tools.do_problem import ModeOptim, Solution
+
+CSV_COLUMNS = ["event", "time", "step", "phase", "duration", "fitness"]
+
+
+def _to_builtin(fitness: Any) -> Union[float, str, List[Any]]:
+    """Fitness as a json serializable value."""
+    if hasattr(fitness, "vector_fitness"):  # TupleFitness
+        fitness = fitness.vector_fitness
+    if hasattr(fitness, "tolist"):
+        return fitness.tolist()
+    if isinstance(fitness, (tuple, list)):
+        return [_to_builtin(f) for f in fitness]
+    try:
+        return float(fitness)
+    except (TypeError, ValueError):
+        return str(fitness)
+
+
+class TelemetryRecorder(Callback):
+    """Record the new incumbents, the phase durations and the end of the steps of a run.
+
+    The events are stored as tuples, the times being the seconds elapsed since the start of the run.
+
+    Attributes:
+        incumbents: list of (time, step, fitness)
+        phases: list of (time, step, phase, duration)
+        steps: list of (time, step), one step out of every_n_steps being recorded
+        solve_time: duration of the run, None if not finished
+
+    """
+
+    def __init__(self, every_n_steps: int = 1):
+        """
+        Args:
+            every_n_steps: period of the recording of the steps, to limit the memory used by
+                solvers making millions of steps
+
+        """
+        self.every_n_steps = every_n_steps
+        self.start_time = time.perf_counter()
+        self.incumbents: List[Tuple[float, int, Any]] = []
+        self.phases: List[Tuple[float, int, str, float]] = []
+        self.steps: List[Tuple[float, int]] = []
+        self.solve_time: Optional[float] = None
+
+    def on_solve_start(self, solver: Any) -> None:
+        self.start_time = time.perf_counter()
+        self.incumbents = []
+        self.phases = []
+        self.steps = []
+        self.solve_time = None
+
+    def on_solve_end(self, res: Any, solver: Any) -> None:
+        self.solve_time = time.perf_counter() - self.start_time
+
+    def on_new_incumbent(
+        self, step: int, solution: Optional[Solution], fitness: Any, solver: Any
+    ) -> None:
+        self.incumbents.append((time.perf_counter() - self.start_time, step, fitness))
+
+    def on_phase_end(self, step: int, phase: str, duration: float, solver: Any) -> None:
+        self.phases.append(
+            (time.perf_counter() - self.start_time, step, phase, duration)
+        )
+
+    def on_step_end(self, step: int, res: Any, solver: Any) -> Optional[bool]:
+        if step % self.every_n_steps == 0:
+            self.steps.append((time.perf_counter() - self.start_time, step))
+        return False
+
+    def phase_durations(self) -> Dict[str, float]:
+        """Total duration of each phase."""
+        durations: Dict[str, float] = defaultdict(float)
+        for _, _, phase, duration in self.phases:
+            durations[phase] += duration
+        return dict(durations)
+
+    def time_to_target(
+        self, target: float, mode_optim: ModeOptim = ModeOptim.MAXIMIZATION
+    ) -> Optional[float]:
+        """Time at which the fitness of the incumbent reached the target, None if never reached."""
+        for incumbent_time, _, fitness in self.incumbents:
+            if (mode_optim == ModeOptim.MAXIMIZATION and fitness >= target) or (
+                mode_optim == ModeOptim.MINIMIZATION and fitness <= target
+            ):
+                return incumbent_time
+        return None
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Events as dictionaries with keys CSV_COLUMNS, sorted by time."""
+        records = [
+            dict(event="incumbent", time=t, step=step, fitness=_to_builtin(fitness))
+            for t, step, fitness in self.incumbents
+        ]
+        records += [
+            dict(event="phase", time=t, step=step, phase=phase, duration=duration)
+            for t, step, phase, duration in self.phases
+        ]
+        records += [dict(event="step", time=t, step=step) for t, step in self.steps]
+        records.sort(key=lambda record: record["time"])
+        return [
+            {column: record.get(column) for column in CSV_COLUMNS} for record in records
+        ]
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            writer.writerows(self.to_records())
+
+    def to_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(
+                {"solve_time": self.solve_time, "events": self.to_records()},
+                f,
+                indent=1,
+            )
@@ -15,6 +15,7 @@ from typing import Any, Dict, Optional, Union
 
 from minizinc import Instance, Result, Status
 
+from discrete_optimization import check_minizinc_version
 from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
@@ -22,6 +23,8 @@ from discrete_optimization.generic_tools.result_storage.result_storage import (
 
 logger = logging.getLogger(__name__)
 
+check_minizinc_version()
+
 
 class CPSolverName(Enum):
     """
@@ -3,7 +3,7 @@
 #  LICENSE file in the root directory of this source tree.
 
 from abc import abstractmethod
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from discrete_optimization.generic_tools.do_problem import Problem, Solution
 
@@ -17,6 +17,20 @@ class LocalMove:
     def backtrack_local_move(self, solution: Solution) -> Solution:
         ...
 
+    def changed_values(
+        self, solution: Solution
+    ) -> Optional[Tuple[str, Dict[int, Tuple[Any, Any]]]]:
+        """Values of the solution attribute modified by the move, used for delta evaluation.
+
+        Args:
+            solution (Solution): the solution on which the move has been applied.
+
+        Returns: name of the modified attribute and a dictionnary index -> (previous value, new value),
+        or None if the move does not keep track of the modified indexes.
+
+        """
+        return None
+
 
 class LocalMoveDefault(LocalMove):
     """
@@ -26,9 +40,17 @@ class LocalMoveDefault(LocalMove):
     So the backward operator is then obvious.
     """
 
-    def __init__(self, prev_solution: Solution, new_solution: Solution):
+    def __init__(
+        self,
+        prev_solution: Solution,
+        new_solution: Solution,
+        attribute: Optional[str] = None,
+        list_index_change: Optional[List[int]] = None,
+    ):
         self.prev_solution = prev_solution
         self.new_solution = new_solution
+        self.attribute = attribute
+        self.list_index_change = list_index_change
 
     def apply_local_move(self, solution: Solution) -> Solution:
         return self.new_solution
@@ -36,6 +58,17 @@ class LocalMoveDefault(LocalMove):
     def backtrack_local_move(self, solution: Solution) -> Solution:
         return self.prev_solution
 
+    def changed_values(
+        self, solution: Solution
+    ) -> Optional[Tuple[str, Dict[int, Tuple[Any, Any]]]]:
+        if self.attribute is None or self.list_index_change is None:
+            return None
+        prev = getattr(self.prev_solution, self.attribute)
+        new = getattr(self.new_solution, self.attribute)
+        return self.attribute, {
+            i: (prev[i], new[i]) for i in self.list_index_change if prev[i] != new[i]
+        }
+
 
 class Mutation:
     @staticmethod
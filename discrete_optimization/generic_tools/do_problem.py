@@ -9,6 +9,7 @@ from abc import abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -29,6 +30,9 @@ from discrete_optimization.generic_tools.result_storage.multiobj_utils import (
     TupleFitness,
 )
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.generic_tools.do_mutation import LocalMove
+
 logger = logging.getLogger(__name__)
 
 
@@ -335,6 +339,40 @@ class Problem:
         keys = sorted(self.get_objective_register().dict_objective_to_doc.keys())
         return TupleFitness(np.array([dict_values[k] for k in keys]), len(keys))
 
+    def init_delta_state(self, variable: Solution) -> Any:
+        """Build the cached state used by evaluate_delta() for a given solution.
+
+        Problems supporting incremental evaluation should override this method along with evaluate_delta().
+        The default implementation returns None, meaning that delta evaluation is not available.
+
+        Args:
+            variable (Solution): the Solution object from which local moves will be applied.
+
+        Returns: state summarizing the solution (typically aggregated sums), or None.
+
+        """
+        return None
+
+    def evaluate_delta(
+        self, variable: Solution, move: "LocalMove", cached_state: Any
+    ) -> Optional[Tuple[Dict[str, float], Any]]:
+        """Evaluate a solution obtained by applying a local move, from the cached state of the previous solution.
+
+        Only the values modified by the move (see LocalMove.changed_values()) are visited,
+        so that the cost is proportional to the size of the move instead of the size of the solution.
+        cached_state must not be modified in place as it is still used if the move is rejected.
+
+        Args:
+            variable (Solution): the solution on which the move has been applied.
+            move (LocalMove): the local move applied.
+            cached_state: state of the solution before the move, see init_delta_state().
+
+        Returns: the kpis of the solution (as evaluate() would return) and the state of the new solution,
+        or None if the move is not supported, in which case evaluate() should be used.
+
+        """
+        return None
+
     @abstractmethod
     def satisfy(self, variable: Solution) -> bool:
         """Computes if a solution satisfies or not the constraints of the problem.
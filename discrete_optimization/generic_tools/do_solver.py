@@ -20,7 +20,8 @@ class SolverDO:
         """Generic solving function.
 
         Args:
-            **kwargs: any argument specific to the solver
+            **kwargs: any argument specific to the solver. The solvers notifying observers of their run
+                take an argument `callbacks`, a list of `Callback` (see generic_tools.callbacks.callback).
 
         Returns (ResultStorage): a result object containing potentially a pool of solutions
         to a discrete-optimization problem
@@ -14,6 +14,7 @@ from discrete_optimization.generic_tools.ea.ga import (
     DeapCrossover,
     DeapMutation,
     DeapSelection,
+    EvaluationBackend,
     Ga,
 )
 from discrete_optimization.generic_tools.result_storage.result_storage import (
@@ -52,6 +53,9 @@ class AlternatingGa:
         crossover_rate: Optional[float] = None,
         tournament_size: Optional[float] = None,
         deap_verbose: bool = False,
+        evaluation_backend: EvaluationBackend = EvaluationBackend.BATCH,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         self.problem = problem
         self.encodings = encodings
@@ -68,6 +72,9 @@ class AlternatingGa:
         self.crossover_rate = crossover_rate
         self.tournament_size = tournament_size
         self.deap_verbose = deap_verbose
+        self.evaluation_backend = evaluation_backend
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
 
         (
             self.aggreg_from_sol,
@@ -114,6 +121,10 @@ class AlternatingGa:
                 objectives=self.objectives,
                 objective_weights=self.objective_weights,
                 deap_verbose=self.deap_verbose,
+                # each sub GA ships the problem with its current fixed attributes to its workers
+                evaluation_backend=self.evaluation_backend,
+                n_workers=self.n_workers,
+                chunk_size=self.chunk_size,
                 **kwargs_ga
             )
             tmp_sol = ga_solver.solve().get_best_solution()
@@ -3,24 +3,33 @@
 #  LICENSE file in the root directory of this source tree.
 
 import logging
+import multiprocessing
 import random
+import time
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from deap import algorithms, base, creator, tools
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.do_mutation import Mutation
 from discrete_optimization.generic_tools.do_problem import (
     EncodingRegister,
     ObjectiveHandling,
     Problem,
+    Solution,
     TypeAttribute,
     build_aggreg_function_and_params_objective,
     lower_bound_vector_encoding_from_dict,
     upper_bound_vector_encoding_from_dict,
 )
+from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.generic_tools.ea.deap_wrappers import generic_mutate_wrapper
+from discrete_optimization.generic_tools.ghh_tools import register_population_map
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
 )
@@ -52,6 +61,102 @@ class DeapCrossover(Enum):
     CX_PARTIALY_MATCHED = 5  # perm
 
 
+class EvaluationBackend(Enum):
+    SERIAL = 0  # one individual at a time, in the main process
+    PROCESS_POOL = 1  # individuals dispatched to a pool of worker processes
+    BATCH = 2  # whole population given to problem.evaluate_batch_from_encoding()
+
+
+# problem and encoding of the current evaluation worker process, set by _init_evaluation_worker
+_worker_problem: Optional[Problem] = None
+_worker_encoding_variable_name: Optional[str] = None
+
+
+def _init_evaluation_worker(problem: Problem, encoding_variable_name: str) -> None:
+    global _worker_problem, _worker_encoding_variable_name
+    _worker_problem = problem
+    _worker_encoding_variable_name = encoding_variable_name
+
+
+def _evaluate_in_worker(int_vector: List[int]) -> Dict[str, float]:
+    return _worker_problem.evaluate_from_encoding(  # type: ignore
+        int_vector, _worker_encoding_variable_name
+    )
+
+
+class PopulationEvaluator:
+    """Compute the objective values of a population of encoded individuals.
+
+    The process pool, if any, is created when entering the evaluator context and
+    the problem is shipped only once to each worker, through the pool initializer.
+    Results are always returned in the order of the individuals, so that the
+    evolution does not depend on the backend for a given seed.
+
+    Args:
+        problem: the problem to evaluate
+        encoding_variable_name: name of the solution attribute encoded by the individuals
+        backend: how to evaluate the individuals. With BATCH, problems not supporting
+            batch evaluation are evaluated serially.
+        n_workers: number of worker processes for PROCESS_POOL backend. Default to the number of cpus.
+        chunk_size: number of individuals sent at once to a worker. By default, chosen by `multiprocessing.Pool.map()`.
+
+    """
+
+    def __init__(
+        self,
+        problem: Problem,
+        encoding_variable_name: str,
+        backend: EvaluationBackend = EvaluationBackend.BATCH,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        self.problem = problem
+        self.encoding_variable_name = encoding_variable_name
+        self.backend = backend
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+
+    def __enter__(self) -> "PopulationEvaluator":
+        if self.backend == EvaluationBackend.PROCESS_POOL:
+            self._pool = multiprocessing.Pool(
+                processes=self.n_workers,
+                initializer=_init_evaluation_worker,
+                initargs=(self.problem, self.encoding_variable_name),
+            )
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def evaluate(self, individuals: List[List[int]]) -> List[Dict[str, float]]:
+        if len(individuals) == 0:
+            return []
+        if self._pool is not None:
+            return self._pool.map(
+                _evaluate_in_worker,
+                [list(ind) for ind in individuals],
+                chunksize=self.chunk_size,
+            )
+        if self.backend == EvaluationBackend.BATCH and hasattr(
+            self.problem, "evaluate_batch_from_encoding"
+        ):
+            objective_values_list = self.problem.evaluate_batch_from_encoding(
+                np.array(individuals), self.encoding_variable_name
+            )
+            if objective_values_list is not None:
+                return objective_values_list
+        return [
+            self.problem.evaluate_from_encoding(  # type: ignore
+                ind, self.encoding_variable_name
+            )
+            for ind in individuals
+        ]
+
+
 _default_crossovers = {
     TypeAttribute.LIST_BOOLEAN: DeapCrossover.CX_UNIFORM,
     TypeAttribute.LIST_INTEGER: DeapCrossover.CX_ONE_POINT,
@@ -67,7 +172,7 @@ _default_mutations = {
 }
 
 
-class Ga:
+class Ga(SolverDO):
     """Single objective GA
 
     Args:
@@ -78,6 +183,12 @@ class Ga:
             or a dictionary of the form {'type': TypeAttribute, 'n': int} where type refers to a TypeAttribute and n
              to the dimension of the problem in this encoding (e.g. length of the vector)
             by default, the first encoding in the problem register_solution will be used.
+        evaluation_backend:
+            how populations are evaluated, see `EvaluationBackend`
+        n_workers:
+            number of processes used by the PROCESS_POOL backend (default to the number of cpus)
+        chunk_size:
+            number of individuals sent at once to a worker process
 
     """
 
@@ -98,6 +209,9 @@ class Ga:
         tournament_size: float = 0.2,  # as a percentage of the population
         deap_verbose: bool = True,
         initial_population: Optional[List[List[Any]]] = None,
+        evaluation_backend: EvaluationBackend = EvaluationBackend.BATCH,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         self.problem = problem
         if not hasattr(self.problem, "evaluate_from_encoding"):
@@ -199,6 +313,13 @@ class Ga:
             self.ups = [1 for i in range(self.n)]
 
         self._encoding_name: str = encoding_name
+        self._population_evaluator = PopulationEvaluator(
+            problem=self.problem,
+            encoding_variable_name=self._encoding_variable_name,
+            backend=evaluation_backend,
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+        )
 
         logger.debug(
             f"Encoding used by the GA: {self._encoding_name}: {self._encoding_type} of length {self.n}"
@@ -318,6 +439,8 @@ class Ga:
             "evaluate",
             self.evaluate_problem,
         )
+        # Evaluate whole populations at once, with the chosen evaluation backend
+        register_population_map(self._toolbox, self.evaluate_population)
 
         # Define crossover
         if crossover is None:
@@ -405,6 +528,18 @@ class Ga:
         objective_values: Dict[str, float] = self.problem.evaluate_from_encoding(  # type: ignore
             int_vector, self._encoding_variable_name
         )
+        return self.fitness_from_objective_values(objective_values)
+
+    def evaluate_population(self, individuals: List[List[int]]) -> List[Tuple[float]]:
+        """Evaluate individuals with the evaluation backend of the GA."""
+        return [
+            self.fitness_from_objective_values(objective_values)
+            for objective_values in self._population_evaluator.evaluate(individuals)
+        ]
+
+    def fitness_from_objective_values(
+        self, objective_values: Dict[str, float]
+    ) -> Tuple[float]:
         if self._objective_handling == ObjectiveHandling.SINGLE:
             val = objective_values[self._objectives[0]]
         elif self._objective_handling == ObjectiveHandling.AGGREGATE:
@@ -434,6 +569,14 @@ class Ga:
         return pop
 
     def solve(self, **kwargs: Any) -> ResultStorage:
+        with self._population_evaluator:
+            return self._solve(**kwargs)
+
+    def _solve(
+        self, callbacks: Optional[List[Callback]] = None, **kwargs: Any
+    ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         if self.initial_population is None:
             # Initialise the population (here at random)
             population = self._toolbox.population()
@@ -452,28 +595,78 @@ class Ga:
         stats.register("std", np.std)
         stats.register("min", np.min)
         stats.register("max", np.max)
-
-        # Run the GA: final population and statistics logbook are created
-        pop_vector, logbook = algorithms.eaSimple(
-            population=population,
-            toolbox=self._toolbox,
-            cxpb=self._crossover_rate,
-            mutpb=self._mut_rate,
-            ngen=int(self._max_evals / self._pop_size),
-            stats=stats,
-            halloffame=hof,
-            verbose=self._deap_verbose,
+        logbook = tools.Logbook()
+        logbook.header = ["gen", "nevals"] + stats.fields
+
+        # Run the GA, same generational process as deap.algorithms.eaSimple
+        hof.update(population)
+        record = stats.compile(population)
+        logbook.record(gen=0, nevals=0, **record)
+        if self._deap_verbose:
+            print(logbook.stream)
+        best_vector = hof[0]
+        problem_sol = self._build_solution(best_vector)
+        callbacks_list.on_new_incumbent(
+            step=0,
+            solution=problem_sol,
+            fitness=self.aggreg_from_sol(problem_sol),
+            solver=self,
         )
+        ngen = int(self._max_evals / self._pop_size)
+        for gen in range(1, ngen + 1):
+            t_phase = time.perf_counter()
+            offspring = self._toolbox.select(population, len(population))
+            offspring = algorithms.varAnd(
+                offspring, self._toolbox, self._crossover_rate, self._mut_rate
+            )
+            callbacks_list.on_phase_end(
+                step=gen,
+                phase="variation",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
 
-        best_vector = hof[0]
+            # Evaluate the individuals with an invalid fitness
+            t_phase = time.perf_counter()
+            invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
+            fitnesses = self._toolbox.map(self._toolbox.evaluate, invalid_ind)
+            for ind, fit in zip(invalid_ind, fitnesses):
+                ind.fitness.values = fit
+            callbacks_list.on_phase_end(
+                step=gen,
+                phase="evaluation",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
 
-        s_pure_int = [i for i in best_vector]
-        kwargs = {self._encoding_variable_name: s_pure_int, "problem": self.problem}
-        problem_sol = self.problem.get_solution_type()(**kwargs)
+            hof.update(offspring)
+            population[:] = offspring
+            record = stats.compile(population)
+            logbook.record(gen=gen, nevals=len(invalid_ind), **record)
+            if self._deap_verbose:
+                print(logbook.stream)
+            if hof[0] is not best_vector:
+                best_vector = hof[0]
+                problem_sol = self._build_solution(best_vector)
+                callbacks_list.on_new_incumbent(
+                    step=gen,
+                    solution=problem_sol,
+                    fitness=self.aggreg_from_sol(problem_sol),
+                    solver=self,
+                )
+            if callbacks_list.on_step_end(step=gen, res=population, solver=self):
+                logger.info(f"GA stopped by a callback at generation {gen}")
+                break
 
         result_storage = ResultStorage(
             list_solution_fits=[(problem_sol, self.aggreg_from_sol(problem_sol))],
             best_solution=problem_sol,
             mode_optim=self.params_objective_function.sense_function,
         )
+        callbacks_list.on_solve_end(res=result_storage, solver=self)
         return result_storage
+
+    def _build_solution(self, individual: List[Any]) -> Solution:
+        s_pure_int = [i for i in individual]
+        kwargs = {self._encoding_variable_name: s_pure_int, "problem": self.problem}
+        return self.problem.get_solution_type()(**kwargs)
@@ -2,13 +2,14 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 from discrete_optimization.generic_tools.do_mutation import Mutation
 from discrete_optimization.generic_tools.ea.ga import (
     DeapCrossover,
     DeapMutation,
     DeapSelection,
+    EvaluationBackend,
     ObjectiveHandling,
 )
 
@@ -29,6 +30,9 @@ class ParametersGa:
         crossover_rate: float,
         tournament_size: float,
         deap_verbose: bool,
+        evaluation_backend: EvaluationBackend = EvaluationBackend.BATCH,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         self.mutation = mutation
         self.crossover = crossover
@@ -43,6 +47,9 @@ class ParametersGa:
         self.crossover_rate = crossover_rate
         self.tournament_size = tournament_size
         self.deap_verbose = deap_verbose
+        self.evaluation_backend = evaluation_backend
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
 
     @staticmethod
     def default_rcpsp() -> "ParametersGa":
@@ -80,6 +87,9 @@ class ParametersAltGa:
         tournament_size: float,
         deap_verbose: bool,
         sub_evals: List[int],
+        evaluation_backend: EvaluationBackend = EvaluationBackend.BATCH,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         self.mutations = mutations
         self.crossovers = crossovers
@@ -95,6 +105,9 @@ class ParametersAltGa:
         self.tournament_size = tournament_size
         self.deap_verbose = deap_verbose
         self.sub_evals = sub_evals
+        self.evaluation_backend = evaluation_backend
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
 
     @staticmethod
     def default_mrcpsp() -> "ParametersAltGa":
@@ -4,11 +4,16 @@
 
 import logging
 import random
+import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from deap import algorithms, base, creator, tools
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.do_mutation import Mutation
 from discrete_optimization.generic_tools.do_problem import (
     EncodingRegister,
@@ -20,12 +25,16 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeAttribute,
     build_evaluate_function_aggregated,
 )
+from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.generic_tools.ea.deap_wrappers import generic_mutate_wrapper
 from discrete_optimization.generic_tools.ea.ga import (
     DeapCrossover,
     DeapMutation,
     DeapSelection,
+    EvaluationBackend,
+    PopulationEvaluator,
 )
+from discrete_optimization.generic_tools.ghh_tools import register_population_map
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
     TupleFitness,
@@ -48,7 +57,7 @@ _default_mutations = {
 }
 
 
-class Nsga:
+class Nsga(SolverDO):
     """NSGA
 
     Args:
@@ -75,6 +84,9 @@ class Nsga:
         mut_rate: float = 0.1,
         crossover_rate: float = 0.9,
         deap_verbose: bool = True,
+        evaluation_backend: EvaluationBackend = EvaluationBackend.BATCH,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         self.problem = problem
         if not hasattr(self.problem, "evaluate_from_encoding"):
@@ -272,6 +284,15 @@ class Nsga:
             "evaluate",
             self.evaluate_problem,
         )
+        # Evaluate whole populations at once, with the chosen evaluation backend
+        self._population_evaluator = PopulationEvaluator(
+            problem=self.problem,
+            encoding_variable_name=self._encoding_variable_name,
+            backend=evaluation_backend,
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+        )
+        register_population_map(self._toolbox, self.evaluate_population)
 
         # Define crossover
         if crossover is None:
@@ -336,11 +357,33 @@ class Nsga:
         objective_values = self.problem.evaluate_from_encoding(  # type: ignore
             int_vector, self._encoding_variable_name
         )
+        return self.fitness_from_objective_values(objective_values)
+
+    def evaluate_population(
+        self, individuals: List[List[int]]
+    ) -> List[Tuple[float, ...]]:
+        """Evaluate individuals with the evaluation backend of the GA."""
+        return [
+            self.fitness_from_objective_values(objective_values)
+            for objective_values in self._population_evaluator.evaluate(individuals)
+        ]
+
+    def fitness_from_objective_values(
+        self, objective_values: Dict[str, float]
+    ) -> Tuple[float, ...]:
         val = tuple([objective_values[obj_name] for obj_name in self._objectives])
 
         return val
 
     def solve(self, **kwargs: Any) -> ResultStorage:
+        with self._population_evaluator:
+            return self._solve(**kwargs)
+
+    def _solve(
+        self, callbacks: Optional[List[Callback]] = None, **kwargs: Any
+    ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
 
         #  Define the statistics to collect at each generation
         stats = tools.Statistics(lambda ind: ind.fitness.values)
@@ -369,23 +412,47 @@ class Nsga:
         ngen = int(self._max_evals / self._pop_size)
         logger.debug(f"ngen: {ngen}")
         for gen in range(1, ngen):
+            t_phase = time.perf_counter()
             offspring = algorithms.varAnd(
                 pop, self._toolbox, self._crossover_rate, self._mut_rate
             )
+            callbacks_list.on_phase_end(
+                step=gen,
+                phase="variation",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
 
             # Evaluate the individuals with an invalid fitness
+            t_phase = time.perf_counter()
             invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
             fitnesses = self._toolbox.map(self._toolbox.evaluate, invalid_ind)
             for ind, fit in zip(invalid_ind, fitnesses):
                 ind.fitness.values = fit
+            callbacks_list.on_phase_end(
+                step=gen,
+                phase="evaluation",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
 
             # Select the next generation population from parents and offspring
+            t_phase = time.perf_counter()
             pop = self._toolbox.select(pop + offspring, self._pop_size)
+            callbacks_list.on_phase_end(
+                step=gen,
+                phase="selection",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
 
             # Compile statistics about the new population
             record = stats.compile(pop)
             logbook.record(gen=gen, evals=len(invalid_ind), **record)
             logger.debug(logbook.stream)
+            if callbacks_list.on_step_end(step=gen, res=pop, solver=self):
+                logger.info(f"NSGA stopped by a callback at generation {gen}")
+                break
 
         sols = []
         for s in pop:
@@ -399,4 +466,5 @@ class Nsga:
             best_solution=None,
             mode_optim=self.params_objective_function.sense_function,
         )
+        callbacks_list.on_solve_end(res=rs, solver=self)
         return rs
@@ -3,10 +3,22 @@
 #  LICENSE file in the root directory of this source tree.
 
 import sys
-from typing import Any, Iterable, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 import numpy.typing as npt
+from deap import base, gp
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -92,3 +104,118 @@ def min_operator_list(
     list_: Iterable[SupportsRichComparisonT],
 ) -> SupportsRichComparisonT:
     return min(list_)
+
+
+def protected_div_array(left: npt.ArrayLike, right: npt.ArrayLike) -> npt.NDArray[Any]:
+    """Vectorized version of protected_div."""
+    left, right = np.broadcast_arrays(
+        np.asarray(left, dtype=float), np.asarray(right, dtype=float)
+    )
+    return np.divide(left, right, out=np.ones(left.shape), where=right != 0.0)
+
+
+# vectorized versions of the primitives of the library, indexed by primitive name.
+# Scalar features are given as arrays(n), list features as arrays(n, size of the list).
+VECTORIZED_PRIMITIVES: Dict[str, Callable[..., Any]] = {
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "neg": np.negative,
+    "protected_div": protected_div_array,
+    "max_operator": np.maximum,
+    "min_operator": np.minimum,
+    "if_then_else": np.where,
+    "max_operator_list": lambda x: np.max(x, axis=-1),
+    "min_operator_list": lambda x: np.min(x, axis=-1),
+}
+
+
+def compile_vectorized(
+    expr: gp.PrimitiveTree,
+    pset: gp.PrimitiveSet,
+    vectorized_primitives: Optional[Dict[str, Callable[..., Any]]] = None,
+) -> Optional[Callable[..., Any]]:
+    """Compile a gp tree into a function of arrays of features, as `deap.gp.compile()` does for scalars.
+
+    Args:
+        expr: the gp tree
+        pset: primitive set of the tree, its arguments being the features
+        vectorized_primitives: vectorized versions of the primitives, VECTORIZED_PRIMITIVES by default
+
+    Returns: the compiled function, None if a primitive of the tree has no vectorized version.
+
+    """
+    if vectorized_primitives is None:
+        vectorized_primitives = VECTORIZED_PRIMITIVES
+    context = dict(pset.context)
+    for node in expr:
+        if isinstance(node, gp.Primitive):
+            if node.name not in vectorized_primitives:
+                return None
+            context[node.name] = vectorized_primitives[node.name]
+    code = f"lambda {','.join(pset.arguments)}: {expr}"
+    return eval(code, context, {})
+
+
+def heuristic_values(
+    expr: gp.PrimitiveTree,
+    pset: gp.PrimitiveSet,
+    features: Sequence[np.ndarray],
+    shape: Tuple[int, ...],
+    vectorized_primitives: Optional[Dict[str, Callable[..., Any]]] = None,
+    func_heuristic: Optional[Callable[..., Any]] = None,
+) -> npt.NDArray[np.float_]:
+    """Values of a gp tree on all the rows of precomputed feature arrays.
+
+    The tree is evaluated once on the whole arrays when all its primitives are vectorized,
+    otherwise row by row with the compiled scalar function.
+
+    Args:
+        expr: the gp tree
+        pset: primitive set of the tree
+        features: one array per argument of the primitive set, the first dimension being the rows
+        shape: shape of the output
+        vectorized_primitives: see compile_vectorized()
+        func_heuristic: compiled scalar function of the tree, used instead of the vectorized one if given
+
+    Returns: array of the values with the given shape
+
+    """
+    func_vectorized = None
+    if func_heuristic is None:
+        func_vectorized = compile_vectorized(
+            expr, pset, vectorized_primitives=vectorized_primitives
+        )
+    if func_vectorized is not None:
+        with np.errstate(all="ignore"):
+            values = func_vectorized(*features)
+        return np.broadcast_to(np.asarray(values, dtype=float), shape)
+    if func_heuristic is None:
+        func_heuristic = gp.compile(expr, pset)
+    rows = zip(*(feature.tolist() for feature in features))
+    return np.array([func_heuristic(*row) for row in rows], dtype=float).reshape(shape)
+
+
+def register_population_map(
+    toolbox: base.Toolbox,
+    evaluate_population: Callable[[List[Any]], List[Any]],
+) -> None:
+    """Register the map used by the deap algorithms, evaluating whole populations at once.
+
+    Mapping toolbox.evaluate on individuals is replaced by a single call to evaluate_population,
+    the other functions being mapped one individual at a time.
+
+    Args:
+        toolbox: toolbox of the deap algorithm
+        evaluate_population: function returning the fitnesses of a list of individuals
+
+    """
+
+    def map_evaluation(
+        func: Callable[[Any], Any], iterable: Iterable[Any]
+    ) -> List[Any]:
+        if func is toolbox.evaluate:
+            return evaluate_population(list(iterable))
+        return list(map(func, iterable))
+
+    toolbox.register("map", map_evaluation)
@@ -2,10 +2,23 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
-from typing import Any, Dict, Hashable, KeysView, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    KeysView,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import networkx as nx
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.generic_tools.graph_closure import TransitiveClosure
+
 
 class Graph:
     def __init__(
@@ -26,6 +39,8 @@ class Graph:
         self.build_edges()
         self.nodes_name = list(self.nodes_infos_dict)
         self.graph_nx = self.to_networkx()
+        self._transitive_closure: Optional["TransitiveClosure"] = None
+        self._transitive_closure_computed = False
         self.full_predecessors: Optional[Dict[Hashable, Set[Hashable]]]
         self.full_successors: Optional[Dict[Hashable, Set[Hashable]]]
         if compute_predecessors:
@@ -88,15 +103,46 @@ class Graph:
             cycles = None
         return cycles
 
+    def get_transitive_closure(self) -> Optional["TransitiveClosure"]:
+        """Bit array index of the ancestors and descendants of the nodes (computed once).
+
+        Returns: None if the graph is undirected or has a cycle.
+
+        """
+        if not self._transitive_closure_computed:
+            self._transitive_closure_computed = True
+            if not self.undirected:
+                # numba kernels, only loaded when a closure is needed
+                from discrete_optimization.generic_tools.graph_closure import (
+                    TransitiveClosure,
+                )
+
+                try:
+                    self._transitive_closure = TransitiveClosure(
+                        nodes=list(self.graph_nx.nodes()), edges=self.graph_nx.edges()
+                    )
+                except ValueError:
+                    self._transitive_closure = None
+        return self._transitive_closure
+
     def precedessors_nodes(self, n: Hashable) -> Set[Hashable]:
+        closure = self.get_transitive_closure()
+        if closure is not None:
+            return closure.ancestors(n)
         return nx.algorithms.ancestors(self.graph_nx, n)
 
     def ancestors_map(self) -> Dict[Hashable, Set[Hashable]]:
+        closure = self.get_transitive_closure()
+        if closure is not None:
+            return {n: closure.ancestors(n) for n in closure.nodes}
         return {
             n: nx.algorithms.ancestors(self.graph_nx, n) for n in self.graph_nx.nodes()
         }
 
     def descendants_map(self) -> Dict[Hashable, Set[Hashable]]:
+        closure = self.get_transitive_closure()
+        if closure is not None:
+            return {n: closure.descendants(n) for n in closure.nodes}
         return {
             n: nx.algorithms.descendants(self.graph_nx, n)
             for n in self.graph_nx.nodes()
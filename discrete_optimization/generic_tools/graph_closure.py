@@ -0,0 +1,212 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Transitive closure of directed acyclic graphs stored as packed bit arrays.
+
+`TransitiveClosure` computes, in topological order, the descendants and ancestors of all the nodes of a
+directed acyclic graph as rows of bits (one uint64 word per 64 nodes), i.e. n²/8 bytes per relation
+instead of python sets. Reachability queries are O(1), and the sets of ancestors or descendants of a node are
+extracted on demand.
+"""
+
+from typing import Hashable, Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from discrete_optimization.generic_tools.jit_kernels import jit_kernel, register_warm_up
+
+
+@jit_kernel
+def _topological_order(successors_ptr, successors_index):
+    """Kahn's algorithm, the order being shorter than the number of nodes if the graph has a cycle."""
+    nb_nodes = successors_ptr.shape[0] - 1
+    in_degree = np.zeros(nb_nodes, dtype=np.int64)
+    for e in range(successors_index.shape[0]):
+        in_degree[successors_index[e]] += 1
+    order = np.empty(nb_nodes, dtype=np.int64)
+    nb_ordered = 0
+    for i in range(nb_nodes):
+        if in_degree[i] == 0:
+            order[nb_ordered] = i
+            nb_ordered += 1
+    current = 0
+    while current < nb_ordered:
+        node = order[current]
+        current += 1
+        for e in range(successors_ptr[node], successors_ptr[node + 1]):
+            successor = successors_index[e]
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                order[nb_ordered] = successor
+                nb_ordered += 1
+    return order[:nb_ordered]
+
+
+@jit_kernel
+def _closure_bits(order, neighbors_ptr, neighbors_index, nb_words):
+    """Bits of the nodes reachable from each node, the neighbors of a node being before it in order."""
+    nb_nodes = neighbors_ptr.shape[0] - 1
+    bits = np.zeros((nb_nodes, nb_words), dtype=np.uint64)
+    one = np.uint64(1)
+    for k in range(order.shape[0]):
+        node = order[k]
+        for e in range(neighbors_ptr[node], neighbors_ptr[node + 1]):
+            neighbor = neighbors_index[e]
+            for w in range(nb_words):
+                bits[node, w] |= bits[neighbor, w]
+            bits[node, neighbor >> 6] |= one << np.uint64(neighbor & 63)
+    return bits
+
+
+@jit_kernel
+def _popcount_rows(bits):
+    counts = np.zeros(bits.shape[0], dtype=np.int64)
+    for i in range(bits.shape[0]):
+        for w in range(bits.shape[1]):
+            word = bits[i, w]
+            while word:
+                word &= word - np.uint64(1)
+                counts[i] += 1
+    return counts
+
+
+@jit_kernel
+def _transitive_reduction_mask(successors_ptr, successors_index, descendants_bits):
+    """Mask of the edges (u, v) such that v is not a descendant of another successor of u."""
+    nb_nodes = successors_ptr.shape[0] - 1
+    nb_words = descendants_bits.shape[1]
+    keep = np.ones(successors_index.shape[0], dtype=np.bool_)
+    reachable = np.zeros(nb_words, dtype=np.uint64)
+    one = np.uint64(1)
+    for node in range(nb_nodes):
+        reachable[:] = 0
+        for e in range(successors_ptr[node], successors_ptr[node + 1]):
+            for w in range(nb_words):
+                reachable[w] |= descendants_bits[successors_index[e], w]
+        for e in range(successors_ptr[node], successors_ptr[node + 1]):
+            successor = successors_index[e]
+            if reachable[successor >> 6] & (one << np.uint64(successor & 63)):
+                keep[e] = False
+    return keep
+
+
+def _bits_to_indexes(row: np.ndarray) -> np.ndarray:
+    return np.flatnonzero(
+        np.unpackbits(row.astype("<u8", copy=False).view(np.uint8), bitorder="little")
+    )
+
+
+class TransitiveClosure:
+    """Reachability index of a directed acyclic graph.
+
+    Attributes:
+        nodes: list of the nodes, a node being identified by its position in the bit arrays
+        index: position of each node
+        descendants_bits: array(nb_nodes, nb_words) of uint64, bit j of row i being set
+            if node j can be reached from node i
+        ancestors_bits: same for the nodes from which node i can be reached
+        nb_descendants: number of descendants of each node
+        nb_ancestors: number of ancestors of each node
+
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[Hashable],
+        edges: Iterable[Tuple[Hashable, Hashable]],
+    ):
+        """Compute the transitive closure of a graph.
+
+        Args:
+            nodes: nodes of the graph
+            edges: edges (node, successor) of the graph
+
+        Raises:
+            ValueError: if the graph has a cycle
+
+        """
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        nb_nodes = len(self.nodes)
+        edges_array = np.array(
+            [(self.index[n1], self.index[n2]) for n1, n2 in edges], dtype=np.int64
+        ).reshape((-1, 2))
+        edges_array = np.unique(edges_array, axis=0)
+        self.successors_ptr, self.successors_index = self._csr(
+            edges_array[:, 0], edges_array[:, 1], nb_nodes
+        )
+        predecessors_ptr, predecessors_index = self._csr(
+            edges_array[:, 1], edges_array[:, 0], nb_nodes
+        )
+        order = _topological_order(self.successors_ptr, self.successors_index)
+        if order.shape[0] < nb_nodes:
+            raise ValueError(
+                "The transitive closure is only defined for acyclic graphs."
+            )
+        nb_words = max((nb_nodes + 63) // 64, 1)
+        self.descendants_bits = _closure_bits(
+            order[::-1].copy(), self.successors_ptr, self.successors_index, nb_words
+        )
+        self.ancestors_bits = _closure_bits(
+            order, predecessors_ptr, predecessors_index, nb_words
+        )
+        self.nb_descendants = _popcount_rows(self.descendants_bits)
+        self.nb_ancestors = _popcount_rows(self.ancestors_bits)
+
+    @staticmethod
+    def _csr(
+        sources: np.ndarray, targets: np.ndarray, nb_nodes: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        sort = np.argsort(sources, kind="stable")
+        ptr = np.zeros(nb_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=nb_nodes), out=ptr[1:])
+        return ptr, np.ascontiguousarray(targets[sort])
+
+    def is_reachable(self, node: Hashable, other_node: Hashable) -> bool:
+        """Return True if other_node is a descendant of node."""
+        j = self.index[other_node]
+        word = int(self.descendants_bits[self.index[node], j >> 6])
+        return bool((word >> (j & 63)) & 1)
+
+    def descendants_indexes(self, node: Hashable) -> np.ndarray:
+        return _bits_to_indexes(self.descendants_bits[self.index[node]])
+
+    def ancestors_indexes(self, node: Hashable) -> np.ndarray:
+        return _bits_to_indexes(self.ancestors_bits[self.index[node]])
+
+    def descendants(self, node: Hashable) -> Set[Hashable]:
+        return {self.nodes[i] for i in self.descendants_indexes(node).tolist()}
+
+    def ancestors(self, node: Hashable) -> Set[Hashable]:
+        return {self.nodes[i] for i in self.ancestors_indexes(node).tolist()}
+
+    def unrelated(self, node: Hashable) -> Set[Hashable]:
+        """Nodes that are neither ancestors nor descendants of the node (nor the node itself)."""
+        i = self.index[node]
+        related = self.ancestors_bits[i] | self.descendants_bits[i]
+        unrelated = np.ones(len(self.nodes), dtype=bool)
+        unrelated[_bits_to_indexes(related)] = False
+        unrelated[i] = False
+        return {self.nodes[j] for j in np.flatnonzero(unrelated).tolist()}
+
+    def transitive_reduction(self) -> List[Tuple[Hashable, Hashable]]:
+        """Edges of the graph that are not implied by other edges, with the same closure."""
+        keep = _transitive_reduction_mask(
+            self.successors_ptr, self.successors_index, self.descendants_bits
+        )
+        sources = np.repeat(
+            np.arange(len(self.nodes)), np.diff(self.successors_ptr)
+        ).tolist()
+        return [
+            (self.nodes[i], self.nodes[j])
+            for i, j, k in zip(sources, self.successors_index.tolist(), keep.tolist())
+            if k
+        ]
+
+
+@register_warm_up("graph_closure")
+def warm_up_graph_closure_kernels() -> None:
+    """Run the transitive closure kernels on a tiny graph, see jit_kernels.warm_up_kernels()."""
+    closure = TransitiveClosure(nodes=[0, 1, 2], edges=[(0, 1), (1, 2), (0, 2)])
+    closure.transitive_reduction()
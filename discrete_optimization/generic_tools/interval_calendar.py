@@ -0,0 +1,226 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Calendars stored as step functions instead of lists of horizon length.
+
+`IntervalCalendar` behaves as a read-only sequence, so that it can be used where a list is expected.
+"""
+
+from collections.abc import Sequence as AbcSequence
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class IntervalCalendar(AbcSequence):
+    """Calendar given by a step function.
+
+    Attributes:
+        breakpoints: sorted array of the times where the value changes, starting at 0
+        values: array of the value from each breakpoint to the next one (or to the horizon)
+        horizon: length of the calendar
+
+    """
+
+    breakpoints: np.ndarray
+    values: np.ndarray
+    horizon: int
+
+    def __init__(
+        self,
+        breakpoints: Union[Sequence[int], np.ndarray],
+        values: Union[Sequence[int], np.ndarray],
+        horizon: int,
+    ):
+        breakpoints = np.array(breakpoints, dtype=np.int64).reshape(-1)
+        values = np.array(values, dtype=np.int64).reshape(-1)
+        if horizon > 0 and (len(breakpoints) == 0 or breakpoints[0] != 0):
+            raise ValueError("The first breakpoint of a calendar should be 0.")
+        if breakpoints.shape != values.shape:
+            raise ValueError("A calendar needs one value per breakpoint.")
+        if np.any(np.diff(breakpoints) <= 0) or (
+            len(breakpoints) > 0 and breakpoints[-1] >= max(horizon, 1)
+        ):
+            raise ValueError(
+                "The breakpoints of a calendar should be increasing and lower than its horizon."
+            )
+        # merge consecutive steps with the same value
+        keep = np.ones(len(values), dtype=bool)
+        keep[1:] = values[1:] != values[:-1]
+        self.breakpoints = breakpoints[keep]
+        self.values = values[keep]
+        self.breakpoints.flags.writeable = False
+        self.values.flags.writeable = False
+        self.horizon = int(horizon)
+
+    @staticmethod
+    def from_sequence(sequence: Union[Sequence[int], np.ndarray]) -> "IntervalCalendar":
+        """Compress a calendar given as a sequence of values, one per time."""
+        array = np.asarray(sequence, dtype=np.int64).reshape(-1)
+        breakpoints = np.flatnonzero(array[1:] != array[:-1]) + 1
+        if len(array) > 0:
+            breakpoints = np.concatenate((np.zeros(1, dtype=np.int64), breakpoints))
+        return IntervalCalendar(
+            breakpoints=breakpoints, values=array[breakpoints], horizon=len(array)
+        )
+
+    @staticmethod
+    def from_intervals(
+        intervals: Iterable[Tuple[int, int]],
+        horizon: int,
+        value: int = 1,
+        default_value: int = 0,
+    ) -> "IntervalCalendar":
+        """Build a calendar equal to value on the given intervals, and default_value elsewhere.
+
+        Args:
+            intervals: disjoint intervals [start, end), in any order, clipped to [0, horizon)
+            horizon: length of the calendar
+            value: value on the intervals, e.g. 1 for the working periods of an employee
+            default_value: value outside of the intervals
+
+        """
+        breakpoints = [0]
+        values = [default_value]
+        for start, end in sorted(intervals):
+            start, end = max(int(start), 0), min(int(end), horizon)
+            if start >= end:
+                continue
+            if start < breakpoints[-1]:
+                raise ValueError(f"Interval {(start, end)} overlaps another one.")
+            if start == breakpoints[-1]:
+                values[-1] = value
+            else:
+                breakpoints.append(start)
+                values.append(value)
+            if end < horizon:
+                breakpoints.append(end)
+                values.append(default_value)
+        if horizon == 0:
+            breakpoints, values = [], []
+        return IntervalCalendar(breakpoints=breakpoints, values=values, horizon=horizon)
+
+    @staticmethod
+    def constant(value: int, horizon: int) -> "IntervalCalendar":
+        return IntervalCalendar(
+            breakpoints=[0] if horizon > 0 else [],
+            values=[value] if horizon > 0 else [],
+            horizon=horizon,
+        )
+
+    def __len__(self) -> int:
+        return self.horizon
+
+    def _index(self, time: int) -> int:
+        return int(np.searchsorted(self.breakpoints, time, side="right")) - 1
+
+    def __getitem__(self, item: Union[int, slice]) -> Any:
+        if isinstance(item, slice):
+            # dense list, as for a list calendar
+            return [self[time] for time in range(*item.indices(self.horizon))]
+        time = int(item)
+        if time < 0:
+            time += self.horizon
+        if not 0 <= time < self.horizon:
+            raise IndexError("calendar index out of range")
+        return int(self.values[self._index(time)])
+
+    def __iter__(self) -> Iterator[int]:
+        ends = self.ends()
+        for value, start, end in zip(self.values.tolist(), self.breakpoints, ends):
+            for _ in range(start, end):
+                yield value
+
+    def __array__(self, dtype: Any = None) -> np.ndarray:
+        array = np.repeat(self.values, self.ends() - self.breakpoints)
+        return array if dtype is None else array.astype(dtype)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalCalendar):
+            return NotImplemented
+        return (
+            self.horizon == other.horizon
+            and np.array_equal(self.breakpoints, other.breakpoints)
+            and np.array_equal(self.values, other.values)
+        )
+
+    def __repr__(self) -> str:
+        return f"IntervalCalendar(horizon={self.horizon}, intervals={self.intervals()})"
+
+    def ends(self) -> np.ndarray:
+        """End of each step of the calendar."""
+        return np.append(self.breakpoints[1:], self.horizon)
+
+    def intervals(self) -> List[Tuple[int, int, int]]:
+        """Steps of the calendar, as a list of (start, end, value)."""
+        return list(
+            zip(
+                self.breakpoints.tolist(),
+                self.ends().tolist(),
+                self.values.tolist(),
+            )
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "horizon": self.horizon,
+            "breakpoints": self.breakpoints.tolist(),
+            "values": self.values.tolist(),
+        }
+
+    @staticmethod
+    def from_json(data: Dict[str, Any]) -> "IntervalCalendar":
+        return IntervalCalendar(
+            breakpoints=data["breakpoints"],
+            values=data["values"],
+            horizon=data["horizon"],
+        )
+
+
+def calendar_step_function(
+    calendar: Union[IntervalCalendar, Sequence[int]], horizon: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Step function of a calendar restricted to [0, horizon).
+
+    Args:
+        calendar: IntervalCalendar, or sequence of values (one per time)
+        horizon: end of the period of interest. Times not covered by the calendar have value 0.
+
+    Returns: breakpoints, values (see IntervalCalendar)
+
+    """
+    if not isinstance(calendar, IntervalCalendar):
+        calendar = IntervalCalendar.from_sequence(np.asarray(calendar[:horizon]))
+    k = np.searchsorted(calendar.breakpoints, horizon, side="left")
+    breakpoints = calendar.breakpoints[:k]
+    values = calendar.values[:k]
+    if calendar.horizon < horizon:
+        breakpoints = np.append(breakpoints, calendar.horizon)
+        values = np.append(values, 0)
+    return breakpoints.astype(np.int64), values.astype(np.int64)
+
+
+def calendar_total(
+    calendar: Union[IntervalCalendar, Sequence[int]], horizon: int
+) -> int:
+    """Sum of the values of a calendar over [0, horizon)."""
+    breakpoints, values = calendar_step_function(calendar, horizon)
+    return int(np.sum(values * np.diff(np.append(breakpoints, horizon))))
+
+
+def calendar_available_intervals(
+    calendar: Union[IntervalCalendar, Sequence[int]], horizon: int
+) -> np.ndarray:
+    """Maximal intervals of [0, horizon) where the calendar value is positive.
+
+    Returns: array(nb_intervals, 2) of sorted and disjoint [start, end)
+
+    """
+    breakpoints, values = calendar_step_function(calendar, horizon)
+    positive = np.concatenate(([False], values > 0, [False]))
+    changes = np.append(breakpoints, horizon)
+    # indexes of the steps starting and ending a positive period
+    starts = np.flatnonzero(positive[1:-1] & ~positive[:-2])
+    ends = np.flatnonzero(positive[1:-1] & ~positive[2:]) + 1
+    return np.stack((changes[starts], changes[ends]), axis=1).astype(np.int64)
@@ -0,0 +1,148 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Registry of the numba kernels of the library, compiled with a persistent on-disk cache.
+
+The cache is written in the __pycache__ folder of the modules (or in NUMBA_CACHE_DIR),
+and can be disabled by setting the environment variable DO_NUMBA_CACHE to 0.
+"""
+
+import importlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from numba import njit
+
+logger = logging.getLogger(__name__)
+
+# modules registering warm-up functions, imported by warm_up_kernels()
+WARM_UP_MODULES = [
+    "discrete_optimization.generic_tools.graph_closure",
+    "discrete_optimization.rcpsp.rcpsp_model",
+    "discrete_optimization.rcpsp.rcpsp_model_preemptive",
+    "discrete_optimization.rcpsp_multiskill.rcpsp_multiskill",
+]
+
+_kernels: Dict[str, Any] = {}
+_warm_up_functions: Dict[str, Callable[[], None]] = {}
+
+
+def use_disk_cache() -> bool:
+    """Return True if the compiled kernels are cached on disk (environment variable DO_NUMBA_CACHE)."""
+    return os.environ.get("DO_NUMBA_CACHE", "1") != "0"
+
+
+def jit_kernel(func: Optional[Callable] = None, **options: Any) -> Any:
+    """Compile a function with numba in nopython mode and register it.
+
+    Can be used as @jit_kernel or @jit_kernel(parallel=True), options being passed to numba.njit.
+
+    Returns: the numba dispatcher, compiled at the first call.
+
+    """
+
+    def decorator(function: Callable) -> Any:
+        dispatcher = njit(cache=use_disk_cache(), **options)(function)
+        _kernels[f"{function.__module__}.{function.__name__}"] = dispatcher
+        return dispatcher
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+def get_kernels() -> Dict[str, Any]:
+    """Return the registered kernels (numba dispatchers) indexed by their qualified name."""
+    return dict(_kernels)
+
+
+@dataclass
+class KernelStats:
+    """Compilation metrics of a kernel.
+
+    Attributes:
+        name: qualified name of the kernel
+        nb_signatures: number of type signatures compiled or loaded in the current process
+        compile_time: time (s) spent in numba compilation in the current process
+        cache_hits: number of signatures loaded from the disk cache
+        cache_misses: number of signatures compiled
+
+    """
+
+    name: str
+    nb_signatures: int
+    compile_time: float
+    cache_hits: int
+    cache_misses: int
+
+
+def get_kernels_stats(only_compiled: bool = True) -> List[KernelStats]:
+    """Compilation metrics of the registered kernels.
+
+    Args:
+        only_compiled: if True, kernels not used yet in the current process are skipped
+
+    """
+    list_stats = []
+    for name, dispatcher in _kernels.items():
+        overloads = list(dispatcher.overloads.values())
+        if only_compiled and len(overloads) == 0:
+            continue
+        compile_time = 0.0
+        for cres in overloads:
+            if cres.metadata is not None:
+                compile_time += cres.metadata.get("timers", {}).get(
+                    "compiler_lock", 0.0
+                )
+        stats = dispatcher.stats
+        list_stats.append(
+            KernelStats(
+                name=name,
+                nb_signatures=len(overloads),
+                compile_time=compile_time,
+                cache_hits=sum(stats.cache_hits.values()),
+                cache_misses=sum(stats.cache_misses.values()),
+            )
+        )
+    return list_stats
+
+
+def register_warm_up(name: str) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """Register a function running kernels on a tiny instance, used by warm_up_kernels()."""
+
+    def decorator(function: Callable[[], None]) -> Callable[[], None]:
+        _warm_up_functions[name] = function
+        return function
+
+    return decorator
+
+
+def warm_up_kernels(names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+    """Compile, or load from the disk cache, the kernels of the library.
+
+    Typically called once at the start of a batch job or in the initializer of worker processes,
+    so that the first evaluations do not pay the compilation.
+
+    Args:
+        names: names of the warm-up functions to run (e.g. "rcpsp", "ms_rcpsp"), all of them if None
+
+    Returns: duration (s) of each warm-up
+
+    """
+    for module in WARM_UP_MODULES:
+        importlib.import_module(module)
+    if names is None:
+        names = list(_warm_up_functions)
+    durations = {}
+    for name in names:
+        t_start = time.perf_counter()
+        _warm_up_functions[name]()
+        durations[name] = time.perf_counter() - t_start
+        logger.info(f"Kernels warm-up {name}: {durations[name]:.2f}s")
+    for stats in get_kernels_stats():
+        logger.debug(stats)
+    return durations
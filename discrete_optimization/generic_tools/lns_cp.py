@@ -13,6 +13,10 @@ from typing import Any, Dict, Iterable, List, Optional
 import numpy as np
 from minizinc import Instance, Status
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.cp_tools import CPSolver, ParametersCP
 from discrete_optimization.generic_tools.do_problem import (
     ModeOptim,
@@ -97,8 +101,11 @@ class LNS_CP(SolverDO):
         max_time_seconds: Optional[int] = None,
         skip_first_iteration: bool = False,
         stop_first_iteration_if_optimal: bool = True,
+        callbacks: Optional[List[Callback]] = None,
         **args: Any,
     ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         sense = self.params_objective_function.sense_function
         if max_time_seconds is None:
             max_time_seconds = 3600 * 24  # One day
@@ -129,6 +136,9 @@ class LNS_CP(SolverDO):
             except:
                 pass
             best_objective = objective
+            callbacks_list.on_new_incumbent(
+                step=0, solution=init_solution, fitness=objective, solver=self
+            )
         else:
             best_objective = (
                 float("inf") if sense == ModeOptim.MINIMIZATION else -float("inf")
@@ -141,6 +151,7 @@ class LNS_CP(SolverDO):
             )
             with self.cp_solver.instance.branch() as child:
                 if iteration == 0 and not skip_first_iteration or iteration >= 1:
+                    t_phase = time.perf_counter()
                     constraint_iterable = (
                         self.constraint_handler.adding_constraint_from_results_store(
                             cp_solver=self.cp_solver,
@@ -151,7 +162,14 @@ class LNS_CP(SolverDO):
                             else result_store,
                         )
                     )
+                    callbacks_list.on_phase_end(
+                        step=iteration,
+                        phase="neighbourhood",
+                        duration=time.perf_counter() - t_phase,
+                        solver=self,
+                    )
                 try:
+                    t_phase = time.perf_counter()
                     if iteration == 0:
                         result = child.solve(
                             timeout=timedelta(seconds=parameters_cp.time_limit_iter0),
@@ -173,6 +191,12 @@ class LNS_CP(SolverDO):
                     result_store = self.cp_solver.retrieve_solutions(
                         result, parameters_cp=parameters_cp
                     )
+                    callbacks_list.on_phase_end(
+                        step=iteration,
+                        phase="solve",
+                        duration=time.perf_counter() - t_phase,
+                        solver=self,
+                    )
                     logger.info(f"iteration n° {iteration} Solved !!!")
                     logger.info(result.status)
                     if len(result_store.list_solution_fits) > 0:
@@ -186,10 +210,23 @@ class LNS_CP(SolverDO):
                         else:
                             logger.debug(f"Satisfaction Before = {False}")
                         logger.debug("Post Process..")
+                        t_phase = time.perf_counter()
                         result_store = self.post_process_solution.build_other_solution(
                             result_store
                         )
+                        callbacks_list.on_phase_end(
+                            step=iteration,
+                            phase="post_process",
+                            duration=time.perf_counter() - t_phase,
+                            solver=self,
+                        )
                         bsol, fit = result_store.get_best_solution_fit()
+                        if (
+                            sense == ModeOptim.MAXIMIZATION and fit > best_objective
+                        ) or (sense == ModeOptim.MINIMIZATION and fit < best_objective):
+                            callbacks_list.on_new_incumbent(
+                                step=iteration, solution=bsol, fitness=fit, solver=self
+                            )
                         if bsol is not None:
                             logger.debug(
                                 f"Satisfaction After = {self.problem.satisfy(bsol)}"
@@ -231,6 +268,11 @@ class LNS_CP(SolverDO):
                 except Exception as e:
                     current_nb_iteration_no_improvement += 1
                     logger.warning("Failed ! reason : ", e)
+                if callbacks_list.on_step_end(
+                    step=iteration, res=store_lns, solver=self
+                ):
+                    logger.info("Finish LNS stopped by a callback")
+                    break
                 if time.time() - deb_time > max_time_seconds:
                     logger.info("Finish LNS with time limit reached")
                     break
@@ -240,6 +282,7 @@ class LNS_CP(SolverDO):
                 if current_nb_iteration_no_improvement > nb_iteration_no_improvement:
                     logger.info("Finish LNS with maximum no improvement iteration ")
                     break
+        callbacks_list.on_solve_end(res=store_lns, solver=self)
         return store_lns
 
     def solve(self, **kwargs: Any) -> ResultStorage:
@@ -282,8 +325,11 @@ class LNS_CPlex(SolverDO):
         max_time_seconds: Optional[int] = None,
         skip_first_iteration: bool = False,
         stop_first_iteration_if_optimal: bool = True,
+        callbacks: Optional[List[Callback]] = None,
         **args: Any,
     ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         sense = self.params_objective_function.sense_function
         if max_time_seconds is None:
             max_time_seconds = 3600 * 24  # One day
@@ -305,6 +351,9 @@ class LNS_CPlex(SolverDO):
             except:
                 pass
             best_objective = objective
+            callbacks_list.on_new_incumbent(
+                step=0, solution=init_solution, fitness=objective, solver=self
+            )
         else:
             best_objective = (
                 float("inf") if sense == ModeOptim.MINIMIZATION else -float("inf")
@@ -316,6 +365,7 @@ class LNS_CPlex(SolverDO):
                 f"Starting iteration n° {iteration} current objective {best_objective}"
             )
             if iteration == 0 and not skip_first_iteration or iteration >= 1:
+                t_phase = time.perf_counter()
                 constraint_iterable = (
                     self.constraint_handler.adding_constraint_from_results_store(
                         cp_solver=self.cp_solver,
@@ -324,14 +374,27 @@ class LNS_CPlex(SolverDO):
                         last_result_store=store_lns if iteration == 0 else result_store,
                     )
                 )
+                callbacks_list.on_phase_end(
+                    step=iteration,
+                    phase="neighbourhood",
+                    duration=time.perf_counter() - t_phase,
+                    solver=self,
+                )
 
             try:
+                t_phase = time.perf_counter()
                 if iteration == 0:
                     p = parameters_cp.default()
                     p.time_limit = parameters_cp.time_limit_iter0
                     result_store = self.cp_solver.solve(parameters_cp=parameters_cp)
                 else:
                     result_store = self.cp_solver.solve(parameters_cp=parameters_cp)
+                callbacks_list.on_phase_end(
+                    step=iteration,
+                    phase="solve",
+                    duration=time.perf_counter() - t_phase,
+                    solver=self,
+                )
                 logger.debug(f"iteration n° {iteration} Solved !!!")
                 if len(result_store.list_solution_fits) > 0:
                     logger.debug("Solved !!!")
@@ -339,11 +402,24 @@ class LNS_CPlex(SolverDO):
                     logger.debug(f"Fitness Before = {fit}")
                     logger.debug(f"Satisfaction Before = {self.problem.satisfy(bsol)}")
                     logger.debug("Post Process..")
+                    t_phase = time.perf_counter()
                     result_store = self.post_process_solution.build_other_solution(
                         result_store
                     )
+                    callbacks_list.on_phase_end(
+                        step=iteration,
+                        phase="post_process",
+                        duration=time.perf_counter() - t_phase,
+                        solver=self,
+                    )
                     bsol, fit = result_store.get_best_solution_fit()
                     logger.debug(f"Satisfy after : {self.problem.satisfy(bsol)}")
+                    if (sense == ModeOptim.MAXIMIZATION and fit > best_objective) or (
+                        sense == ModeOptim.MINIMIZATION and fit < best_objective
+                    ):
+                        callbacks_list.on_new_incumbent(
+                            step=iteration, solution=bsol, fitness=fit, solver=self
+                        )
                     if sense == ModeOptim.MAXIMIZATION and fit >= best_objective:
                         if fit > best_objective:
                             current_nb_iteration_no_improvement = 0
@@ -370,6 +446,9 @@ class LNS_CPlex(SolverDO):
             except Exception as e:
                 current_nb_iteration_no_improvement += 1
                 logger.warning(f"Failed ! reason : {e}")
+            if callbacks_list.on_step_end(step=iteration, res=store_lns, solver=self):
+                logger.info("Finish LNS stopped by a callback")
+                break
             if time.time() - deb_time > max_time_seconds:
                 logger.info("Finish LNS with time limit reached")
                 break
@@ -379,6 +458,7 @@ class LNS_CPlex(SolverDO):
             if current_nb_iteration_no_improvement > nb_iteration_no_improvement:
                 logger.info("Finish LNS with maximum no improvement iteration ")
                 break
+        callbacks_list.on_solve_end(res=store_lns, solver=self)
         return store_lns
 
     def solve(self, **kwargs: Any) -> ResultStorage:
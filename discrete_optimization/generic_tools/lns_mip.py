@@ -5,8 +5,12 @@
 import logging
 import time
 from abc import abstractmethod
-from typing import Any, Hashable, Mapping, Optional
+from typing import Any, Hashable, List, Mapping, Optional
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.do_problem import (
     ModeOptim,
     ParamsObjectiveFunction,
@@ -114,8 +118,11 @@ class LNS_MILP(SolverDO):
         nb_iteration_no_improvement: Optional[int] = None,
         max_time_seconds: Optional[int] = None,
         skip_first_iteration: Optional[bool] = False,
+        callbacks: Optional[List[Callback]] = None,
         **args: Any,
     ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         sense = self.params_objective_function.sense_function
         if max_time_seconds is None:
             max_time_seconds = 3600 * 24  # One day
@@ -132,21 +139,44 @@ class LNS_MILP(SolverDO):
                 )
             )
             best_objective = objective
+            callbacks_list.on_new_incumbent(
+                step=0, solution=init_solution, fitness=objective, solver=self
+            )
         else:
             best_objective = float("inf")
             constraint_iterable = {"empty": []}
             store_lns = None
         for iteration in range(nb_iteration_lns):
+            t_phase = time.perf_counter()
             result_store = self.milp_solver.solve(
                 parameters_milp=parameters_milp, **args
             )
+            callbacks_list.on_phase_end(
+                step=iteration,
+                phase="solve",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
             logger.debug("Solved !!!")
             bsol, fit = result_store.get_best_solution_fit()
             logger.debug(f"Fitness = {fit}")
             logger.debug("Post Process..")
+            t_phase = time.perf_counter()
             result_store = self.post_process_solution.build_other_solution(result_store)
+            callbacks_list.on_phase_end(
+                step=iteration,
+                phase="post_process",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
             bsol, fit = result_store.get_best_solution_fit()
             logger.debug(f"After postpro = {fit}")
+            if (sense == ModeOptim.MAXIMIZATION and fit > best_objective) or (
+                sense == ModeOptim.MINIMIZATION and fit < best_objective
+            ):
+                callbacks_list.on_new_incumbent(
+                    step=iteration, solution=bsol, fitness=fit, solver=self
+                )
             if sense == ModeOptim.MAXIMIZATION and fit >= best_objective:
                 if fit > best_objective:
                     current_nb_iteration_no_improvement = 0
@@ -166,6 +196,7 @@ class LNS_MILP(SolverDO):
                     raise RuntimeError("store_lns should have been initialized for now")
                 store_lns.add_solution(solution=s, fitness=f)
             logger.debug("Removing constraint:")
+            t_phase = time.perf_counter()
             self.constraint_handler.remove_constraints_from_previous_iteration(
                 milp_solver=self.milp_solver, previous_constraints=constraint_iterable
             )
@@ -175,6 +206,15 @@ class LNS_MILP(SolverDO):
                     milp_solver=self.milp_solver, result_storage=result_store
                 )
             )
+            callbacks_list.on_phase_end(
+                step=iteration,
+                phase="neighbourhood",
+                duration=time.perf_counter() - t_phase,
+                solver=self,
+            )
+            if callbacks_list.on_step_end(step=iteration, res=store_lns, solver=self):
+                logger.info("Finish LNS stopped by a callback")
+                break
             if time.time() - deb_time > max_time_seconds:
                 logger.info("Finish LNS with time limit reached")
                 break
@@ -183,4 +223,5 @@ class LNS_MILP(SolverDO):
                 break
         if store_lns is None:  # for mypy, should never happen
             raise RuntimeError("store_lns should have been initialized for now")
+        callbacks_list.on_solve_end(res=store_lns, solver=self)
         return store_lns
@@ -5,8 +5,12 @@
 import logging
 import pickle
 import time
-from typing import Optional
+from typing import List, Optional
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.do_mutation import Mutation
 from discrete_optimization.generic_tools.do_problem import (
     ModeOptim,
@@ -15,9 +19,11 @@ from discrete_optimization.generic_tools.do_problem import (
     Solution,
     build_evaluate_function_aggregated,
 )
+from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.generic_tools.ls.local_search import (
     ModeMutation,
     RestartHandler,
+    evaluate_neighbour,
 )
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ParetoFront,
@@ -27,7 +33,7 @@ from discrete_optimization.generic_tools.result_storage.result_storage import (
 logger = logging.getLogger(__name__)
 
 
-class HillClimber:
+class HillClimber(SolverDO):
     def __init__(
         self,
         evaluator: Problem,
@@ -63,7 +69,10 @@ class HillClimber:
         max_time_seconds: Optional[int] = None,
         pickle_result: bool = False,
         pickle_name: str = "debug",
+        callbacks: Optional[List[Callback]] = None,
     ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         objective = self.aggreg_from_dict_values(
             self.evaluator.evaluate(initial_variable)
         )
@@ -87,14 +96,27 @@ class HillClimber:
         cur_best_objective = objective
         init_time = time.time()
         self.restart_handler.best_fitness = objective
+        callbacks_list.on_new_incumbent(
+            step=0, solution=cur_best_variable, fitness=objective, solver=self
+        )
+        # incremental evaluation of the moves, when the problem supports it
+        use_delta = self.mode_mutation == ModeMutation.MUTATE and (
+            self.evaluator.init_delta_state(cur_variable) is not None
+        )
+        delta_state = None
         iteration = 0
         while iteration < nb_iteration_max:
             accept = False
             local_improvement = False
             global_improvement = False
             if self.mode_mutation == ModeMutation.MUTATE:
+                if use_delta and delta_state is None:
+                    delta_state = self.evaluator.init_delta_state(cur_variable)
                 nv, move = self.mutator.mutate(cur_variable)
-                objective = self.aggreg_from_solution(nv)
+                objective_dict_values, nv_delta_state = evaluate_neighbour(
+                    self.evaluator, nv, move, delta_state
+                )
+                objective = self.aggreg_from_dict_values(objective_dict_values)
             elif self.mode_mutation == ModeMutation.MUTATE_AND_EVALUATE:
                 nv, move, objective_dict_values = self.mutator.mutate_and_compute_obj(
                     cur_variable
@@ -113,6 +135,8 @@ class HillClimber:
             if accept:
                 cur_objective = objective
                 cur_variable = nv
+                if use_delta:
+                    delta_state = nv_delta_state
             else:
                 cur_variable = move.backtrack_local_move(nv)
             if self.store_solution:
@@ -124,22 +148,37 @@ class HillClimber:
                 cur_best_variable = cur_variable.copy()
                 if not self.store_solution:
                     store.add_solution(cur_variable.copy(), objective)
+                callbacks_list.on_new_incumbent(
+                    step=iteration,
+                    solution=cur_best_variable,
+                    fitness=objective,
+                    solver=self,
+                )
             # Update the temperature
             self.restart_handler.update(
                 nv, objective, global_improvement, local_improvement
             )
             # Update info in restart handler
+            prev_variable = cur_variable
             cur_variable, cur_objective = self.restart_handler.restart(
                 cur_variable, cur_objective
             )
+            if cur_variable is not prev_variable:
+                delta_state = None
             # possibly restart somewhere
+            stopping = callbacks_list.on_step_end(
+                step=iteration, res=store, solver=self
+            )
             iteration += 1
+            if stopping:
+                break
             if pickle_result and iteration % 20000 == 0:
                 pickle.dump(cur_best_variable, open(pickle_name + ".pk", "wb"))
             if max_time_seconds is not None and iteration % 1000 == 0:
                 if time.time() - init_time > max_time_seconds:
                     break
         store.finalize()
+        callbacks_list.on_solve_end(res=store, solver=self)
         return store
 
 
@@ -172,7 +211,10 @@ class HillClimberPareto(HillClimber):
         pickle_result: bool = False,
         pickle_name: str = "tsp",
         update_iteration_pareto: int = 1000,
+        callbacks: Optional[List[Callback]] = None,
     ) -> ParetoFront:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         init_time = time.time()
         objective = self.aggreg_from_dict_values(
             self.evaluator.evaluate(initial_variable)
@@ -187,6 +229,11 @@ class HillClimberPareto(HillClimber):
         cur_objective = objective
         cur_best_objective = objective
         self.restart_handler.best_fitness = objective
+        # incremental evaluation of the moves, when the problem supports it
+        use_delta = self.mode_mutation == ModeMutation.MUTATE and (
+            self.evaluator.init_delta_state(cur_variable) is not None
+        )
+        delta_state = None
         iteration = 0
         while iteration < nb_iteration_max:
             accept = False
@@ -195,8 +242,13 @@ class HillClimberPareto(HillClimber):
             if iteration % update_iteration_pareto == 0:
                 pareto_front.finalize()
             if self.mode_mutation == ModeMutation.MUTATE:
+                if use_delta and delta_state is None:
+                    delta_state = self.evaluator.init_delta_state(cur_variable)
                 nv, move = self.mutator.mutate(cur_variable)
-                objective = self.aggreg_from_solution(nv)
+                objective_dict_values, nv_delta_state = evaluate_neighbour(
+                    self.evaluator, nv, move, delta_state
+                )
+                objective = self.aggreg_from_dict_values(objective_dict_values)
             elif self.mode_mutation == ModeMutation.MUTATE_AND_EVALUATE:
                 nv, move, objective_dict_values = self.mutator.mutate_and_compute_obj(
                     cur_variable
@@ -232,6 +284,8 @@ class HillClimberPareto(HillClimber):
                 logger.debug(f"Accept : {objective}")
                 cur_objective = objective
                 cur_variable = nv
+                if use_delta:
+                    delta_state = nv_delta_state
             else:
                 cur_variable = move.backtrack_local_move(nv)
             if global_improvement:
@@ -244,14 +298,23 @@ class HillClimberPareto(HillClimber):
             )
             logger.debug(f"Len pareto : {pareto_front.len_pareto_front()}")
             # Update info in restart handler
+            prev_variable = cur_variable
             cur_variable, cur_objective = self.restart_handler.restart(
                 cur_variable, cur_objective
             )
+            if cur_variable is not prev_variable:
+                delta_state = None
             # possibly restart somewhere
+            stopping = callbacks_list.on_step_end(
+                step=iteration, res=pareto_front, solver=self
+            )
             iteration += 1
+            if stopping:
+                break
             if max_time_seconds is not None and iteration % 1000 == 0:
                 if time.time() - init_time > max_time_seconds:
                     break
 
         pareto_front.finalize()
+        callbacks_list.on_solve_end(res=pareto_front, solver=self)
         return pareto_front
@@ -3,9 +3,10 @@
 #  LICENSE file in the root directory of this source tree.
 
 from enum import Enum
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
-from discrete_optimization.generic_tools.do_problem import Solution
+from discrete_optimization.generic_tools.do_mutation import LocalMove
+from discrete_optimization.generic_tools.do_problem import Problem, Solution
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
     fitness_class,
@@ -17,6 +18,28 @@ class ModeMutation(Enum):
     MUTATE_AND_EVALUATE = 1
 
 
+def evaluate_neighbour(
+    problem: Problem, solution: Solution, move: LocalMove, delta_state: Any
+) -> Tuple[Dict[str, float], Any]:
+    """Evaluate a solution obtained by a local move, incrementally when possible.
+
+    Args:
+        problem (Problem): problem used to evaluate the solution
+        solution (Solution): solution on which the move has been applied
+        move (LocalMove): the local move
+        delta_state: cached state of the solution before the move (see Problem.init_delta_state()),
+            None to do a full evaluation.
+
+    Returns: kpis of the solution, and its delta state (None if a full evaluation was needed).
+
+    """
+    if delta_state is not None:
+        res = problem.evaluate_delta(solution, move, delta_state)
+        if res is not None:
+            return res
+    return problem.evaluate(solution), None
+
+
 class RestartHandler:
     solution_restart: Solution
     solution_best: Solution
@@ -89,7 +112,7 @@ class ResultLS(ResultStorage):
         self.list_solution_fits = result_storage.list_solution_fits
         self.maximize = result_storage.maximize
         self.limit_store = result_storage.limit_store
-        self.nb_best_score = result_storage.nb_best_score
+        self.nb_best_store = result_storage.nb_best_store
         self.map_solutions = result_storage.map_solutions
         self.heap = result_storage.heap
         self.min = result_storage.min
@@ -7,10 +7,14 @@ import pickle
 import random
 import time
 from abc import abstractmethod
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.do_mutation import Mutation
 from discrete_optimization.generic_tools.do_problem import (
     ModeOptim,
@@ -20,9 +24,11 @@ from discrete_optimization.generic_tools.do_problem import (
     Solution,
     build_aggreg_function_and_params_objective,
 )
+from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.generic_tools.ls.local_search import (
     ModeMutation,
     RestartHandler,
+    evaluate_neighbour,
 )
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
@@ -41,7 +47,7 @@ class TemperatureScheduling:
         ...
 
 
-class SimulatedAnnealing:
+class SimulatedAnnealing(SolverDO):
     def __init__(
         self,
         evaluator: Problem,
@@ -85,8 +91,11 @@ class SimulatedAnnealing:
         max_time_seconds: Optional[int] = None,
         pickle_result: bool = False,
         pickle_name: str = "debug",
+        callbacks: Optional[List[Callback]] = None,
         **kwargs: Any,
     ) -> ResultStorage:
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         init_time = time.time()
         objective = self.aggreg_from_dict_values(
             self.evaluator.evaluate(initial_variable)
@@ -112,13 +121,26 @@ class SimulatedAnnealing:
                 nb_best_store=1,
             )
         self.restart_handler.best_fitness = objective
+        callbacks_list.on_new_incumbent(
+            step=0, solution=cur_best_variable, fitness=objective, solver=self
+        )
+        # incremental evaluation of the moves, when the problem supports it
+        use_delta = self.mode_mutation == ModeMutation.MUTATE and (
+            self.evaluator.init_delta_state(cur_variable) is not None
+        )
+        delta_state = None
         iteration = 0
         while iteration < nb_iteration_max:
             local_improvement = False
             global_improvement = False
             if self.mode_mutation == ModeMutation.MUTATE:
+                if use_delta and delta_state is None:
+                    delta_state = self.evaluator.init_delta_state(cur_variable)
                 nv, move = self.mutator.mutate(cur_variable)
-                objective = self.aggreg_from_dict_values(self.evaluator.evaluate(nv))
+                objective_dict_values, nv_delta_state = evaluate_neighbour(
+                    self.evaluator, nv, move, delta_state
+                )
+                objective = self.aggreg_from_dict_values(objective_dict_values)
             else:  # self.mode_mutation == ModeMutation.MUTATE_AND_EVALUATE:
                 nv, move, objective_dict_values = self.mutator.mutate_and_compute_obj(
                     cur_variable
@@ -149,6 +171,8 @@ class SimulatedAnnealing:
             if accept:
                 cur_objective = objective
                 cur_variable = nv
+                if use_delta:
+                    delta_state = nv_delta_state
                 logger.debug(f"iter accepted {iteration}")
                 logger.debug(f"acceptance {objective}")
             else:
@@ -162,23 +186,38 @@ class SimulatedAnnealing:
                 cur_best_variable = cur_variable.copy()
                 if not self.store_solution:
                     store.add_solution(cur_variable.copy(), objective)
+                callbacks_list.on_new_incumbent(
+                    step=iteration,
+                    solution=cur_best_variable,
+                    fitness=objective,
+                    solver=self,
+                )
             self.temperature_handler.next_temperature()
             # Update the temperature
             self.restart_handler.update(
                 nv, objective, global_improvement, local_improvement
             )
             # Update info in restart handler
+            prev_variable = cur_variable
             cur_variable, cur_objective = self.restart_handler.restart(  # type: ignore
                 cur_variable, cur_objective
             )
+            if cur_variable is not prev_variable:
+                delta_state = None
             # possibly restart somewhere
+            stopping = callbacks_list.on_step_end(
+                step=iteration, res=store, solver=self
+            )
             iteration += 1
+            if stopping:
+                break
             if pickle_result and iteration % 20000 == 0:
                 pickle.dump(cur_best_variable, open(pickle_name + ".pk", "wb"))
             if max_time_seconds is not None and iteration % 1000 == 0:
                 if time.time() - init_time > max_time_seconds:
                     break
         store.finalize()
+        callbacks_list.on_solve_end(res=store, solver=self)
         return store
 
 
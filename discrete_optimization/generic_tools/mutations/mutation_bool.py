@@ -31,6 +31,14 @@ class BitFlipMove(LocalMove):
     def backtrack_local_move(self, solution: Solution) -> Solution:
         return self.apply_local_move(solution)
 
+    def changed_values(
+        self, solution: Solution
+    ) -> Tuple[str, Dict[int, Tuple[Any, Any]]]:
+        l = getattr(solution, self.attribute)
+        return self.attribute, {
+            index: (1 - l[index], l[index]) for index in self.list_index_flip
+        }
+
 
 class MutationBitFlip(Mutation):
     @staticmethod
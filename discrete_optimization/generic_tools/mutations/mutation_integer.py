@@ -87,12 +87,19 @@ class MutationIntegerSpecificArity(Mutation):
     def mutate(self, solution: Solution) -> Tuple[Solution, LocalMove]:
         s2 = solution.copy()
         vector = getattr(s2, self.attribute)
+        list_index_change = []
         for k in range(self.size):
             if random.random() <= self.probability_flip:
                 new_arity = random.choice(self.range_arities[k])
                 vector[k] = new_arity
+                list_index_change.append(k)
         setattr(s2, self.attribute, vector)
-        return s2, LocalMoveDefault(solution, s2)
+        return s2, LocalMoveDefault(
+            solution,
+            s2,
+            attribute=self.attribute,
+            list_index_change=list_index_change,
+        )
 
     def mutate_and_compute_obj(
         self, solution: Solution
@@ -141,11 +141,26 @@ class SwapsLocalMove(LocalMove):
 
     def backtrack_local_move(self, solution: Solution) -> Solution:
         current = getattr(solution, self.attribute)
-        for i1, i2 in self.list_index_swap:
+        for i1, i2 in self.list_index_swap[::-1]:
             v1, v2 = current[i1], current[i2]
             current[i1], current[i2] = v2, v1
         return solution
 
+    def changed_values(
+        self, solution: Solution
+    ) -> Tuple[str, Dict[int, Tuple[Any, Any]]]:
+        current = getattr(solution, self.attribute)
+        previous = {}
+        for i1, i2 in self.list_index_swap:
+            previous[i1] = current[i1]
+            previous[i2] = current[i2]
+        # undo the swaps on the touched indexes only
+        for i1, i2 in self.list_index_swap[::-1]:
+            previous[i1], previous[i2] = previous[i2], previous[i1]
+        return self.attribute, {
+            i: (previous[i], current[i]) for i in previous if previous[i] != current[i]
+        }
+
 
 class PermutationSwap(Mutation):
     @staticmethod
@@ -208,6 +223,21 @@ class TwoOptMove(LocalMove):
         setattr(solution, self.attribute, current)
         return solution
 
+    def changed_values(
+        self, solution: Solution
+    ) -> Tuple[str, Dict[int, Tuple[Any, Any]]]:
+        current = getattr(solution, self.attribute)
+        low = min(i for i, j in self.index_2opt)
+        high = max(j for i, j in self.index_2opt)
+        previous = list(current[low : high + 1])
+        for i, j in self.index_2opt[::-1]:
+            previous[i - low : j + 1 - low] = previous[i - low : j + 1 - low][::-1]
+        return self.attribute, {
+            low + k: (previous[k], current[low + k])
+            for k in range(len(previous))
+            if previous[k] != current[low + k]
+        }
+
 
 class TwoOptMutation(Mutation):
     @staticmethod
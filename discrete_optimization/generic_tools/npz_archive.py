@@ -0,0 +1,135 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Storage of numpy arrays and json metadata in a single uncompressed .npz archive.
+
+Arrays are stored uncompressed so that they can be memory-mapped when loading,
+and without python objects so that the archive is loaded without pickle.
+"""
+
+import json
+import os
+import struct
+import zipfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+METADATA_KEY = "__metadata__"
+
+# size of the fixed part of a zip local file header
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def save_npz_archive(
+    path: Union[str, os.PathLike],
+    arrays: Dict[str, np.ndarray],
+    metadata: Dict[str, Any],
+) -> None:
+    """Save arrays and json serializable metadata in an uncompressed .npz archive.
+
+    Args:
+        path: path of the archive. As with numpy.savez, the .npz extension is appended if missing.
+        arrays: arrays to save, indexed by their name
+        metadata: json serializable dictionary
+
+    """
+    if METADATA_KEY in arrays:
+        raise ValueError(f"{METADATA_KEY} is a reserved array name.")
+    np.savez(path, **arrays, **{METADATA_KEY: np.array(json.dumps(metadata))})
+
+
+def load_npz_archive(
+    path: Union[str, os.PathLike], mmap_mode: Optional[str] = None
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Load an archive saved by `save_npz_archive()`.
+
+    Args:
+        path: path of the archive
+        mmap_mode: if not None, memory-map the arrays with the given mode (see numpy.memmap),
+            e.g. "r" for read-only arrays or "c" for copy-on-write arrays
+
+    Returns: arrays, metadata
+
+    """
+    if mmap_mode is None:
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+    else:
+        arrays = _memmap_npz(path, mmap_mode=mmap_mode)
+    metadata = json.loads(str(arrays.pop(METADATA_KEY)))
+    return arrays, metadata
+
+
+def _memmap_npz(path: Union[str, os.PathLike], mmap_mode: str) -> Dict[str, np.ndarray]:
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(
+                    f"{info.filename} is compressed in {path}, it cannot be memory-mapped."
+                )
+            # the .npy file starts after the local header of the zip entry
+            f.seek(info.header_offset)
+            local_header = f.read(_ZIP_LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+            f.seek(
+                info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+            )
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            name = info.filename[: -len(".npy")]
+            if dtype.hasobject:
+                raise ValueError(f"{name} contains python objects in {path}.")
+            if len(shape) == 0 or 0 in shape:
+                # scalars and empty arrays cannot be memory-mapped
+                arrays[name] = np.fromfile(
+                    f, dtype=dtype, count=int(np.prod(shape))
+                ).reshape(shape)
+            else:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode=mmap_mode,
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
+
+
+def pack_sequences(
+    sequences: Sequence[Sequence[Any]], dtype: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack sequences of variable length in CSR format.
+
+    Returns: ptr, values so that the i-th sequence is values[ptr[i]:ptr[i + 1]]
+
+    """
+    ptr = np.zeros(len(sequences) + 1, dtype=np.int64)
+    ptr[1:] = np.cumsum([len(sequence) for sequence in sequences])
+    values = np.zeros(ptr[-1], dtype=dtype)
+    for i, sequence in enumerate(sequences):
+        values[ptr[i] : ptr[i + 1]] = sequence
+    return ptr, values
+
+
+def unpack_sequences(ptr: np.ndarray, values: np.ndarray) -> List[List[Any]]:
+    """Inverse of `pack_sequences()`, returning lists of python scalars."""
+    bounds = ptr.tolist()
+    list_values = values.tolist()
+    return [list_values[bounds[i] : bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def check_json_serializable(value: Any, name: str) -> None:
+    """Check that a value is unchanged by a json round trip (e.g. no tuple or numpy scalar)."""
+    try:
+        serializable = json.loads(json.dumps(value)) == value
+    except TypeError:
+        serializable = False
+    if not serializable:
+        raise ValueError(f"{name} cannot be saved in json metadata: {value}")
@@ -2,6 +2,8 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
+from typing import Any, List, Optional, Sequence
+
 import numpy as np
 
 
@@ -47,3 +49,135 @@ class TupleFitness:
 
     def __mul__(self, other: float) -> "TupleFitness":
         return TupleFitness(other * self.vector_fitness, self.size)
+
+
+def get_non_dominated_mask(points: np.ndarray, maximize: bool = True) -> np.ndarray:
+    """Compute which points are not dominated by any other point.
+
+    Identical points do not dominate each other, so all copies of a non-dominated
+    point are kept.
+    Bi-objective problems are handled by a sweep line after a lexicographic sort,
+    other dimensions by successive vectorized filtering of the points dominated by
+    a pivot, the pivots being taken by decreasing sum of objectives.
+
+    Args:
+        points: array of shape (nb_points, nb_objectives)
+        maximize: True if the objectives are to be maximized
+
+    Returns: boolean mask of shape (nb_points,)
+
+    """
+    points = np.asarray(points, dtype=np.float64)
+    nb_points = points.shape[0]
+    if nb_points == 0:
+        return np.zeros(0, dtype=bool)
+    if not maximize:
+        points = -points
+    if points.ndim == 1 or points.shape[1] == 1:
+        values = points.reshape(-1)
+        return values == values.max()
+    if points.shape[1] == 2:
+        return _get_non_dominated_mask_2d(points)
+    order = np.argsort(-points.sum(axis=1), kind="stable")
+    candidates = points[order]
+    indices = np.arange(nb_points)
+    pivot = 0
+    while pivot < candidates.shape[0]:
+        keep = np.any(candidates > candidates[pivot], axis=1) | np.all(
+            candidates == candidates[pivot], axis=1
+        )
+        indices = indices[keep]
+        candidates = candidates[keep]
+        pivot = np.count_nonzero(keep[:pivot]) + 1
+    mask = np.zeros(nb_points, dtype=bool)
+    mask[order[indices]] = True
+    return mask
+
+
+def _get_non_dominated_mask_2d(points: np.ndarray) -> np.ndarray:
+    # sort by decreasing first objective, then decreasing second objective
+    order = np.lexsort((-points[:, 1], -points[:, 0]))
+    x = points[order, 0]
+    y = points[order, 1]
+    is_group_start = np.empty(x.shape[0], dtype=bool)
+    is_group_start[0] = True
+    is_group_start[1:] = x[1:] != x[:-1]
+    group = np.cumsum(is_group_start) - 1
+    group_max_y = y[is_group_start]
+    # best second objective among points with a strictly greater first objective
+    previous_max_y = np.empty(group_max_y.shape[0])
+    previous_max_y[0] = -np.inf
+    previous_max_y[1:] = np.maximum.accumulate(group_max_y)[:-1]
+    sorted_mask = (y == group_max_y[group]) & (y > previous_max_y[group])
+    mask = np.zeros(points.shape[0], dtype=bool)
+    mask[order] = sorted_mask
+    return mask
+
+
+class ParetoArchive:
+    """Archive of non-dominated items, backed by a contiguous array of objective vectors.
+
+    Items added one by one are buffered and the dominated ones are filtered
+    in batches, when the buffer is full or when the front is queried.
+    The items of the front are kept in their insertion order.
+
+    Args:
+        maximize: True if the objectives are to be maximized
+        batch_size: maximal number of buffered items before filtering
+
+    """
+
+    def __init__(self, maximize: bool = True, batch_size: int = 1024):
+        self.maximize = maximize
+        self.batch_size = batch_size
+        self._items: List[Any] = []
+        self._points: Optional[np.ndarray] = None
+        self._pending_items: List[Any] = []
+        self._pending_points: List[np.ndarray] = []
+
+    def clear(self) -> None:
+        self._items = []
+        self._points = None
+        self._pending_items = []
+        self._pending_points = []
+
+    def add(self, item: Any, vector: np.ndarray) -> None:
+        self._pending_items.append(item)
+        self._pending_points.append(np.asarray(vector, dtype=np.float64))
+        if len(self._pending_items) >= self.batch_size:
+            self._flush()
+
+    def add_batch(self, items: Sequence[Any], vectors: Sequence[np.ndarray]) -> None:
+        self._pending_items.extend(items)
+        self._pending_points.extend(np.asarray(v, dtype=np.float64) for v in vectors)
+        self._flush()
+
+    def _flush(self) -> None:
+        if len(self._pending_items) == 0:
+            return
+        pending_points = np.stack(self._pending_points)
+        if self._points is None:
+            points = pending_points
+        else:
+            points = np.concatenate((self._points, pending_points))
+        items = self._items + self._pending_items
+        mask = get_non_dominated_mask(points, maximize=self.maximize)
+        self._points = np.ascontiguousarray(points[mask])
+        self._items = [item for item, keep in zip(items, mask) if keep]
+        self._pending_items = []
+        self._pending_points = []
+
+    @property
+    def items(self) -> List[Any]:
+        self._flush()
+        return self._items
+
+    @property
+    def points(self) -> np.ndarray:
+        self._flush()
+        if self._points is None:
+            return np.zeros((0, 0))
+        return self._points
+
+    def __len__(self) -> int:
+        return len(self.items)
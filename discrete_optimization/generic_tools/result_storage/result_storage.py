@@ -4,9 +4,10 @@
 
 import random
 from heapq import heapify, heappush, heappushpop, nlargest, nsmallest
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
 
-import matplotlib.pyplot as plt
+from sortedcontainers import SortedList
 
 from discrete_optimization.generic_tools.do_problem import (
     ModeOptim,
@@ -17,9 +18,14 @@ from discrete_optimization.generic_tools.do_problem import (
     build_aggreg_function_and_params_objective,
     get_default_objective_setup,
 )
+from discrete_optimization.generic_tools.result_storage.multiobj_utils import (
+    ParetoArchive,
+)
 
 fitness_class = Union[float, TupleFitness]
 
+_NB_MAX_RANDOM_SAMPLING = 100
+
 
 class ResultStorage:
     list_solution_fits: List[Tuple[Solution, fitness_class]]
@@ -41,7 +47,7 @@ class ResultStorage:
         self.size_heap = 0
         self.heap: List[fitness_class] = []
         self.limit_store = limit_store
-        self.nb_best_score = nb_best_store
+        self.nb_best_store = nb_best_store
         self.map_solutions = {}
         for i in range(len(self.list_solution_fits)):
             if self.list_solution_fits[i][0] not in self.map_solutions:
@@ -50,14 +56,14 @@ class ResultStorage:
                 ] = self.list_solution_fits[i][1]
                 heappush(self.heap, self.list_solution_fits[i][1])
                 self.size_heap += 1
-        if self.size_heap >= self.nb_best_score and self.limit_store:
+        if self.size_heap >= self.nb_best_store and self.limit_store:
             self.heap = (
-                nsmallest(self.nb_best_score, self.heap)
+                nsmallest(self.nb_best_store, self.heap)
                 if not self.maximize
-                else nlargest(self.nb_best_score, self.heap)
+                else nlargest(self.nb_best_store, self.heap)
             )
             heapify(self.heap)
-            self.size_heap = self.nb_best_score
+            self.size_heap = self.nb_best_store
         if len(self.heap) > 0:
             self.min = min(self.heap)
             self.max = max(self.heap)
@@ -65,11 +71,15 @@ class ResultStorage:
                 f = min if not self.maximize else max
                 self.best_solution = f(self.list_solution_fits, key=lambda x: x[1])[0]
 
+    @property
+    def nb_best_score(self) -> int:
+        """Former name of `nb_best_store`, kept for compatibility."""
+        return self.nb_best_store
+
     def add_solution(self, solution: Solution, fitness: fitness_class) -> None:
         self.list_solution_fits += [(solution, fitness)]
         if solution not in self.map_solutions:
             self.map_solutions[solution] = fitness
-            self.list_solution_fits += [(solution, fitness)]
         if (
             self.maximize
             and fitness > self.max
@@ -81,7 +91,7 @@ class ResultStorage:
             and fitness >= self.min
             or (not self.maximize and fitness <= self.max)
         ):
-            if self.size_heap >= self.nb_best_score and self.limit_store:
+            if self.size_heap >= self.nb_best_store and self.limit_store:
                 heappushpop(self.heap, fitness)
                 self.min = min(fitness, self.min)
                 self.max = max(fitness, self.max)
@@ -127,11 +137,8 @@ class ResultStorage:
         return self.list_solution_fits[sol]
 
     def get_random_solution(self) -> Tuple[Solution, fitness_class]:
-        s = [
-            l
-            for l in self.list_solution_fits
-            if l[1] != self.get_best_solution_fit()[1]
-        ]
+        best_fit = self.get_best_solution_fit()[1]
+        s = [l for l in self.list_solution_fits if l[1] != best_fit]
         if len(s) > 0:
             return random.choice(s)
         else:
@@ -146,9 +153,10 @@ class ResultStorage:
     def get_n_best_solution(
         self, n_solutions: int
     ) -> List[Tuple[Solution, fitness_class]]:
-        f = max if self.maximize else min
         n = min(n_solutions, len(self.list_solution_fits))
-        l = sorted(self.list_solution_fits, key=lambda x: x[1])[:n]
+        l = sorted(self.list_solution_fits, key=lambda x: x[1], reverse=self.maximize)[
+            :n
+        ]
         return l
 
     def remove_duplicate_solutions(self, var_name: str) -> None:
@@ -173,6 +181,205 @@ class ResultStorage:
         ]
 
 
+class BoundedResultStorage(ResultStorage):
+    """Result storage with a bounded memory footprint.
+
+    Only the `nb_best_store` best solutions and the `nb_last_store` most recently
+    added ones are kept, every other solution is evicted when it leaves both windows.
+    The best solutions are indexed in a sorted list and the best fitness is updated
+    incrementally, so that best, n-best and random-best queries do not scan the
+    whole history anymore.
+
+    Fitnesses are expected to be totally ordered (scalar fitness).
+
+    Args:
+        list_solution_fits: initial solutions with their fitness
+        best_solution: if given, overrides the best solution computed from `list_solution_fits`
+        mode_optim: optimization sense
+        limit_store: kept for compatibility with `ResultStorage`, storage is always bounded
+        nb_best_store: number of best solutions kept
+        nb_last_store: number of most recent solutions kept
+
+    """
+
+    def __init__(
+        self,
+        list_solution_fits: List[Tuple[Solution, fitness_class]],
+        best_solution: Optional[Solution] = None,
+        mode_optim: ModeOptim = ModeOptim.MAXIMIZATION,
+        limit_store: bool = True,
+        nb_best_store: int = 1000,
+        nb_last_store: int = 1000,
+    ):
+        if nb_best_store < 1:
+            raise ValueError("nb_best_store must be at least 1.")
+        self.mode_optim = mode_optim
+        self.maximize = mode_optim == ModeOptim.MAXIMIZATION
+        self.limit_store = limit_store
+        self.nb_best_store = nb_best_store
+        self.nb_last_store = nb_last_store
+        self._reset()
+        for solution, fitness in list_solution_fits:
+            self.add_solution(solution, fitness)
+        if best_solution is not None:
+            self.best_solution = best_solution
+
+    def _reset(self) -> None:
+        self.best_solution = None
+        self.map_solutions = {}
+        self._solution_counts: Dict[Solution, int] = {}
+        self._entries: Dict[int, Tuple[Solution, fitness_class]] = {}
+        self._list_cache: Optional[List[Tuple[Solution, fitness_class]]] = None
+        self._nb_added = 0
+        # sorted index of the best solutions, the worst one is evicted first
+        self._best_index = SortedList()
+        self._best_index_ids: Set[int] = set()
+        # ids of all the solutions sharing the best fitness, in insertion order
+        self._best_ids: List[int] = []
+        self._best_fitness: Optional[fitness_class] = None
+
+    @property
+    def size_heap(self) -> int:
+        return len(self._best_index)
+
+    @property
+    def heap(self) -> List[fitness_class]:  # type: ignore
+        return [self._entries[key[-1]][1] for key in self._iter_best_keys()]
+
+    @property
+    def list_solution_fits(self) -> List[Tuple[Solution, fitness_class]]:  # type: ignore
+        if self._list_cache is None:
+            self._list_cache = list(self._entries.values())
+        return self._list_cache
+
+    @list_solution_fits.setter
+    def list_solution_fits(
+        self, list_solution_fits: List[Tuple[Solution, fitness_class]]
+    ) -> None:
+        # support in place modification of the list such as `storage.list_solution_fits += [...]`
+        list_solution_fits = list(list_solution_fits)
+        self._reset()
+        for solution, fitness in list_solution_fits:
+            self.add_solution(solution, fitness)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _index_key(self, fitness: fitness_class, index: int) -> Tuple[Any, ...]:
+        # ties are broken so that the oldest solutions are evicted first
+        if self.maximize:
+            return fitness, index, index
+        else:
+            return fitness, -index, index
+
+    def _iter_best_keys(self) -> Iterator[Tuple[Any, ...]]:
+        if self.maximize:
+            return reversed(self._best_index)
+        else:
+            return iter(self._best_index)
+
+    def _is_recent(self, index: int) -> bool:
+        return index >= self._nb_added - self.nb_last_store
+
+    def _evict(self, index: int) -> None:
+        solution, fitness = self._entries.pop(index)
+        self._list_cache = None
+        count = self._solution_counts[solution] - 1
+        if count == 0:
+            del self._solution_counts[solution]
+            del self.map_solutions[solution]
+        else:
+            self._solution_counts[solution] = count
+        if len(self._best_ids) > 0 and self._best_ids[0] == index:
+            self._best_ids.pop(0)
+
+    def add_solution(self, solution: Solution, fitness: fitness_class) -> None:
+        index = self._nb_added
+        self._nb_added += 1
+        self._entries[index] = (solution, fitness)
+        if self._list_cache is not None:
+            self._list_cache.append((solution, fitness))
+        self.map_solutions[solution] = fitness
+        self._solution_counts[solution] = self._solution_counts.get(solution, 0) + 1
+        if self._best_fitness is None or (
+            fitness > self._best_fitness
+            if self.maximize
+            else fitness < self._best_fitness
+        ):
+            self._best_fitness = fitness
+            self._best_ids = [index]
+            self.best_solution = solution
+        elif fitness == self._best_fitness:
+            self._best_ids.append(index)
+        if len(self._entries) == 1:
+            self.min = fitness
+            self.max = fitness
+        else:
+            self.min = min(fitness, self.min)
+            self.max = max(fitness, self.max)
+        self._best_index.add(self._index_key(fitness, index))
+        self._best_index_ids.add(index)
+        if len(self._best_index) > self.nb_best_store:
+            worst_key = self._best_index.pop(0 if self.maximize else -1)
+            worst_index = worst_key[-1]
+            self._best_index_ids.remove(worst_index)
+            if not self._is_recent(worst_index):
+                self._evict(worst_index)
+        out_of_window = index - self.nb_last_store
+        if (
+            out_of_window >= 0
+            and out_of_window in self._entries
+            and out_of_window not in self._best_index_ids
+        ):
+            self._evict(out_of_window)
+
+    def finalize(self) -> None:
+        pass
+
+    def get_best_solution_fit(
+        self,
+    ) -> Union[Tuple[Solution, fitness_class], Tuple[None, None]]:
+        if len(self._best_ids) == 0:
+            return None, None
+        return self._entries[self._best_ids[0]]
+
+    def get_last_best_solution(self) -> Tuple[Solution, fitness_class]:
+        return self._entries[self._best_ids[-1]]
+
+    def get_random_best_solution(self) -> Tuple[Solution, fitness_class]:
+        return self._entries[random.choice(self._best_ids)]
+
+    def get_random_solution(self) -> Tuple[Solution, fitness_class]:
+        # rejection sampling over the union of the best index and the recent window
+        nb_best = len(self._best_index)
+        first_recent = max(0, self._nb_added - self.nb_last_store)
+        nb_recent = self._nb_added - first_recent
+        for _ in range(_NB_MAX_RANDOM_SAMPLING):
+            r = random.randrange(nb_best + nb_recent)
+            if r < nb_best:
+                index = self._best_index[r][-1]
+            else:
+                index = first_recent + r - nb_best
+                if index in self._best_index_ids:
+                    continue
+            if self._entries[index][1] != self._best_fitness:
+                return self._entries[index]
+        return super().get_random_solution()
+
+    def get_best_solution(self) -> Optional[Solution]:
+        if len(self._best_ids) == 0:
+            return None
+        return self._entries[self._best_ids[0]][0]
+
+    def get_n_best_solution(
+        self, n_solutions: int
+    ) -> List[Tuple[Solution, fitness_class]]:
+        return [
+            self._entries[key[-1]]
+            for key in islice(self._iter_best_keys(), n_solutions)
+        ]
+
+
 def merge_results_storage(
     result_1: ResultStorage, result_2: ResultStorage
 ) -> ResultStorage:
@@ -220,7 +427,7 @@ def result_storage_to_pareto_front(
         best_solution=None,
         mode_optim=result_storage.mode_optim,
         limit_store=result_storage.limit_store,
-        nb_best_store=result_storage.nb_best_score,
+        nb_best_store=result_storage.nb_best_store,
     )
     pf.finalize()
     return pf
@@ -242,43 +449,34 @@ class ParetoFront(ResultStorage):
             limit_store=limit_store,
             nb_best_store=nb_best_store,
         )
-        self.paretos: List[Tuple[Solution, TupleFitness]] = []
+        self.archive = ParetoArchive(maximize=self.maximize)
+
+    @property
+    def paretos(self) -> List[Tuple[Solution, TupleFitness]]:
+        return self.archive.items
+
+    @paretos.setter
+    def paretos(self, paretos: List[Tuple[Solution, TupleFitness]]) -> None:
+        self.archive.clear()
+        self.archive.add_batch(paretos, [t.vector_fitness for s, t in paretos])
 
     def add_point(self, solution: Solution, tuple_fitness: TupleFitness) -> None:
-        if self.maximize:
-            if all(tuple_fitness >= t[1] for t in self.paretos):
-                self.paretos += [(solution, tuple_fitness)]
-                pp = []
-                for p in self.paretos:
-                    if p[1] < tuple_fitness:
-                        continue
-                    else:
-                        pp += [p]
-                self.paretos = pp
-        if not self.maximize:
-            if all(tuple_fitness <= t[1] for t in self.paretos):
-                self.paretos += [(solution, tuple_fitness)]
-                pp = []
-                for p in self.paretos:
-                    if p[1] > tuple_fitness:
-                        continue
-                    else:
-                        pp += [p]
-                self.paretos = pp
+        self.archive.add((solution, tuple_fitness), tuple_fitness.vector_fitness)
 
     def len_pareto_front(self) -> int:
-        return len(self.paretos)
+        return len(self.archive)
 
     def finalize(self) -> None:
         super().finalize()
-        self.paretos = []
         for s, t in self.list_solution_fits:
             if not isinstance(t, TupleFitness):
                 raise RuntimeError(
                     "self.list_solution_fits must be a list of tuple[Solution, TupleFitness] "
                     "for a Pareto front."
                 )
-            self.add_point(solution=s, tuple_fitness=t)
+        self.paretos = cast(
+            List[Tuple[Solution, TupleFitness]], self.list_solution_fits
+        )
 
     def compute_extreme_points(self) -> List[Tuple[Solution, TupleFitness]]:
         function_used = max if self.maximize else min
@@ -297,6 +495,8 @@ def plot_storage_2d(
     color: str = "r",
 ) -> None:
     if ax is None:
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(1)
     # Specify for mypy that we should be in the multiobjective case
     list_solution_fits = cast(
@@ -315,6 +515,8 @@ def plot_pareto_2d(
     pareto_front: ParetoFront, name_axis: List[str], ax: Any = None, color: str = "b"
 ) -> Any:
     if ax is None:
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(1)
     ax.scatter(
         x=[p[1].vector_fitness[0] for p in pareto_front.paretos],
@@ -329,6 +531,8 @@ def plot_fitness(
     result_storage: ResultStorage, ax: Any = None, color: str = "b", title: str = ""
 ) -> Any:
     if ax is None:
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(1)
     ax.set_title(title)
     ax.plot([x[1] for x in result_storage.list_solution_fits], color=color)
@@ -23,7 +23,6 @@ from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
     fitness_class,
     plot_pareto_2d,
-    result_storage_to_pareto_front,
 )
 
 logger = logging.getLogger(__name__)
@@ -122,8 +121,8 @@ class ResultComparator:
         for rs in self.list_result_storage:
             for s in rs.list_solution_fits:
                 sols.append(s)
-        rs = ResultStorage(list_solution_fits=sols, best_solution=None)
-        pareto_store = result_storage_to_pareto_front(result_storage=rs, problem=None)
+        pareto_store = ParetoFront(list_solution_fits=sols, best_solution=None)
+        pareto_store.finalize()
         return pareto_store
 
     def plot_all_2d_paretos_single_plot(
@@ -130,22 +130,18 @@ class RobustnessTool:
         p = Pool(min(8, len(models)))
         l = p.map(solve_models_function, models)
         solutions: List[RCPSPSolution] = [li.best_solution for li in l]  # type: ignore
+        # the test instances are evaluated together, as scenarios of a same problem
+        model_test = Aggreg_RCPSPModel(
+            list_problem=self.test_instance,
+            method_aggregating=MethodAggregating(BaseMethodAggregating.MEAN),
+        )
         results = np.zeros((len(solutions), len(self.test_instance), 3))
-        for index_instance in range(len(self.test_instance)):
-            logger.debug(f"Evaluating in instance #{index_instance}")
-            instance = self.test_instance[index_instance]
-            for index_pareto in range(len(solutions)):
-                sol_ = RCPSPSolution(
-                    problem=instance,
-                    rcpsp_permutation=solutions[index_pareto].rcpsp_permutation,
-                    rcpsp_modes=solutions[index_pareto].rcpsp_modes,
-                )
-                fit = instance.evaluate(sol_)
-                results[index_pareto, index_instance, 0] = (
-                    1 if sol_.rcpsp_schedule_feasible else 0
-                )
-                results[index_pareto, index_instance, 1] = fit["makespan"]
-                results[index_pareto, index_instance, 2] = fit["mean_resource_reserve"]
+        for index_pareto in range(len(solutions)):
+            logger.debug(f"Evaluating solution #{index_pareto} on test instances")
+            fits = model_test.evaluate_scenarios(solutions[index_pareto])
+            results[index_pareto, :, 0] = fits["feasible"]
+            results[index_pareto, :, 1] = fits["makespan"]
+            results[index_pareto, :, 2] = fits["mean_resource_reserve"]
         return results
 
     def plot(self, results: npt.NDArray[np.float_], image_tag: str = "") -> None:
@@ -4,7 +4,18 @@
 
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import numpy as np
 
@@ -23,6 +34,9 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeObjective,
 )
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.generic_tools.do_mutation import LocalMove
+
 
 @dataclass(frozen=True)
 class Item:
@@ -175,6 +189,37 @@ class KnapsackModel(Problem):
     def evaluate_weight_violation(self, knapsack_solution: KnapsackSolution) -> float:
         return max(0.0, knapsack_solution.weight - self.max_capacity)  # type: ignore  # avoid is None check for efficiency
 
+    def init_delta_state(self, knapsack_solution: KnapsackSolution) -> Tuple[float, float]:  # type: ignore # avoid isinstance checks for efficiency
+        """Delta state of a knapsack solution: its total value and weight."""
+        value = 0.0
+        weight = 0.0
+        for i in range(self.nb_items):
+            if knapsack_solution.list_taken[i]:
+                value += self.list_items[i].value
+                weight += self.list_items[i].weight
+        return value, weight
+
+    def evaluate_delta(  # type: ignore # avoid isinstance checks for efficiency
+        self,
+        knapsack_solution: KnapsackSolution,
+        move: "LocalMove",
+        cached_state: Tuple[float, float],
+    ) -> Optional[Tuple[Dict[str, float], Tuple[float, float]]]:
+        """Update value and weight with the items flipped by the move only."""
+        changes = move.changed_values(knapsack_solution)
+        if changes is None or changes[0] != "list_taken":
+            return None
+        value, weight = cached_state
+        for i, (prev, new) in changes[1].items():
+            value += (new - prev) * self.list_items[i].value
+            weight += (new - prev) * self.list_items[i].weight
+        knapsack_solution.value = value
+        knapsack_solution.weight = weight
+        return (
+            {"value": value, "weight_violation": max(0.0, weight - self.max_capacity)},
+            (value, weight),
+        )
+
     def satisfy(self, knapsack_solution: KnapsackSolution) -> bool:  # type: ignore  # avoid isinstance checks for efficiency
         if knapsack_solution.value is None:
             self.evaluate(knapsack_solution)
@@ -238,6 +283,10 @@ class KnapsackModel_Mobj(KnapsackModel):
         res["weight"] = weight
         return res
 
+    def init_delta_state(self, knapsack_solution: KnapsackSolution) -> None:  # type: ignore # avoid isinstance checks for efficiency
+        # the heaviest item cannot be updated incrementally
+        return None
+
     def evaluate_mobj_from_dict(self, dict_values: Dict[str, float]) -> TupleFitness:
         return TupleFitness(
             np.array([dict_values["value"], -dict_values["heaviest_item"]]), 2
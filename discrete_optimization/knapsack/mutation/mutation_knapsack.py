@@ -3,7 +3,7 @@
 #  LICENSE file in the root directory of this source tree.
 
 import random
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import numpy as np
 
@@ -36,6 +36,11 @@ class SingleBitFlipMove(LocalMove):
     def backtrack_local_move(self, solution: KnapsackSolution) -> KnapsackSolution:  # type: ignore # avoid isinstance checks for efficiency
         return self.apply_local_move(solution)
 
+    def changed_values(self, solution: KnapsackSolution) -> Tuple[str, Dict[int, Tuple[Any, Any]]]:  # type: ignore # avoid isinstance checks for efficiency
+        return "list_taken", {
+            self.i: (1 - solution.list_taken[self.i], solution.list_taken[self.i])
+        }
+
 
 class KnapsackMutationSingleBitFlip(Mutation):
     def __init__(self, problem: KnapsackModel):
@@ -105,6 +110,12 @@ class BitFlipMoveKP(LocalMove):
     def backtrack_local_move(self, solution: KnapsackSolution) -> KnapsackSolution:  # type: ignore # avoid isinstance checks for efficiency
         return self.apply_local_move(solution)
 
+    def changed_values(self, solution: KnapsackSolution) -> Tuple[str, Dict[int, Tuple[Any, Any]]]:  # type: ignore # avoid isinstance checks for efficiency
+        l = getattr(solution, self.attribute)
+        return self.attribute, {
+            index: (1 - l[index], l[index]) for index in self.list_index_flip
+        }
+
 
 class MutationKnapsack(Mutation):
     @staticmethod
@@ -4,7 +4,8 @@
 
 import logging
 import time
-from typing import Any, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -40,7 +41,8 @@ class KnapsackDynProg(SolverKnapsack):
                 "Coercing it to an integer for the solver."
             )
         self.capacity: int = capacity
-        self.table = np.zeros((self.nb_items + 1, self.capacity + 1))
+        # full table, allocated only by solve() and solve_np()
+        self.table: Optional[np.ndarray] = None
         (
             self.aggreg_sol,
             self.aggreg_dict,
@@ -50,7 +52,20 @@ class KnapsackDynProg(SolverKnapsack):
             params_objective_function=params_objective_function,
         )
 
+    def init_table(self) -> None:
+        if self.table is None:
+            self.table = np.zeros((self.nb_items + 1, self.capacity + 1))
+
     def solve(self, **kwargs: Any) -> ResultStorage:
+        """Dynamic programming on the full (items x capacity) table.
+
+        Keyword Args:
+            lean_memory (bool): if True, use `solve_lean()` instead.
+
+        """
+        if kwargs.get("lean_memory", False):
+            return self.solve_lean(**kwargs)
+        self.init_table()
         start_by_most_promising = kwargs.get("greedy_start", False)
         max_items = kwargs.get("max_items", self.knapsack_model.nb_items + 1)
         max_items = min(self.knapsack_model.nb_items + 1, max_items)
@@ -129,6 +144,7 @@ class KnapsackDynProg(SolverKnapsack):
         )
 
     def solve_np(self, **kwargs: Any) -> ResultStorage:
+        self.init_table()
         start_by_most_promising = kwargs.get("greedy_start", False)
         max_items = kwargs.get("max_items", self.knapsack_model.nb_items + 1)
         max_time_seconds = kwargs.get("max_time_seconds", None)
@@ -162,9 +178,14 @@ class KnapsackDynProg(SolverKnapsack):
             weight = int(self.knapsack_model.list_items[index_item].weight)
             value = self.knapsack_model.list_items[index_item].value
             vec_1 = self.table[nb_item - 1, :]
-            ind = [max(capacity - weight, 0) for capacity in range(self.capacity + 1)]
-            vec_2 = vec_1[ind] + value * (ind != 0)
-            self.table[nb_item, :] = np.maximum(vec_1, vec_2)
+            self.table[nb_item, :] = vec_1
+            if weight <= self.capacity:
+                # shifted row: vec_1[capacity - weight] + value
+                np.maximum(
+                    vec_1[weight:],
+                    vec_1[: self.capacity + 1 - weight] + value,
+                    out=self.table[nb_item, weight:],
+                )
             cur_indexes = (nb_item, self.capacity)
             logger.debug(f"Cur obj : {self.table[nb_item, self.capacity]}")
         taken = [0] * self.nb_items
@@ -197,3 +218,122 @@ class KnapsackDynProg(SolverKnapsack):
             best_solution=sol,
             mode_optim=self.params_objective_function.sense_function,
         )
+
+    def solve_lean(self, **kwargs: Any) -> ResultStorage:
+        """Memory-lean dynamic programming.
+
+        Only two rows of values are kept, the take/skip decisions being stored in a packed
+        bit matrix (1 bit per cell) used for the traceback. Items are first reduced
+        by `reduce_items()`.
+
+        Keyword Args:
+            greedy_start (bool): process items by decreasing value/weight ratio
+            max_items (int): maximum number of (reduced) items processed
+            max_time_seconds (float): time limit, the solution is built from the items
+                processed so far
+
+        """
+        start_by_most_promising = kwargs.get("greedy_start", False)
+        max_time_seconds = kwargs.get("max_time_seconds", None)
+        weights, values, groups, always_taken = reduce_items(
+            self.knapsack_model, capacity=self.capacity
+        )
+        if start_by_most_promising:
+            order = np.argsort(-values / np.maximum(weights, 1), kind="stable")
+            weights, values = weights[order], values[order]
+            groups = [groups[i] for i in order]
+        max_items = min(kwargs.get("max_items", len(weights)), len(weights))
+        t_start = time.time()
+        row = np.zeros(self.capacity + 1)
+        candidate = np.empty(self.capacity + 1)
+        decisions = np.zeros((max_items, (self.capacity + 1 + 7) // 8), dtype=np.uint8)
+        nb_rows = 0
+        for i in range(max_items):
+            if (
+                max_time_seconds is not None
+                and time.time() - t_start > max_time_seconds
+            ):
+                break
+            weight = weights[i]
+            # candidate[c] = row[c - weight] + value for c >= weight
+            candidate[:weight] = -np.inf
+            np.add(row[: self.capacity + 1 - weight], values[i], out=candidate[weight:])
+            take = candidate > row
+            decisions[i, :] = np.packbits(take)
+            np.maximum(row, candidate, out=row)
+            nb_rows += 1
+            logger.debug(f"Cur obj : {row[self.capacity]}")
+        taken = [0] * self.nb_items
+        for index in always_taken:
+            taken[index] = 1
+        capacity = self.capacity
+        for i in range(nb_rows - 1, -1, -1):
+            if decisions[i, capacity >> 3] >> (7 - (capacity & 7)) & 1:
+                for index in groups[i]:
+                    taken[index] = 1
+                capacity -= weights[i]
+        sol = KnapsackSolution(problem=self.knapsack_model, list_taken=taken)
+        self.knapsack_model.evaluate(sol)
+        fit = self.aggreg_sol(sol)
+        return ResultStorage(
+            list_solution_fits=[(sol, fit)],
+            best_solution=sol,
+            mode_optim=self.params_objective_function.sense_function,
+        )
+
+
+def reduce_items(
+    knapsack_model: KnapsackModel, capacity: int
+) -> Tuple[np.ndarray, np.ndarray, List[List[int]], List[int]]:
+    """Reduce the items of a knapsack before dynamic programming.
+
+    - items heavier than the capacity or without positive value are dropped,
+    - items without weight and with a positive value are always taken,
+    - for a given weight w, only the capacity // w most valuable items are kept,
+    - identical items (same weight and value) are grouped, m copies being replaced
+      by bundles of 1, 2, 4, ... copies (binary splitting), so that any number of
+      copies up to m can be taken with log(m) 0-1 items.
+
+    Returns: integer weights and values of the reduced items, the list of the positions
+        (in knapsack_model.list_items) of the items making each reduced item,
+        and the positions of the items always taken.
+
+    """
+    if any(int(item.weight) != item.weight for item in knapsack_model.list_items):
+        logger.warning(
+            "item weights should be integers for dynamic programming. "
+            "Coercing them to integers for the solver."
+        )
+    always_taken: List[int] = []
+    by_weight: Dict[int, List[Tuple[float, int]]] = defaultdict(list)
+    for position, item in enumerate(knapsack_model.list_items):
+        weight = int(item.weight)
+        if item.value <= 0 or weight > capacity:
+            continue
+        if weight <= 0:
+            always_taken.append(position)
+            continue
+        by_weight[weight].append((item.value, position))
+    weights: List[int] = []
+    values: List[float] = []
+    groups: List[List[int]] = []
+    for weight, items in by_weight.items():
+        # dominance: at most capacity // weight items of this weight can be taken
+        items = sorted(items, key=lambda x: -x[0])[: capacity // weight]
+        by_value: Dict[float, List[int]] = defaultdict(list)
+        for value, position in items:
+            by_value[value].append(position)
+        for value, positions in by_value.items():
+            size_bundle = 1
+            while len(positions) > 0:
+                bundle, positions = positions[:size_bundle], positions[size_bundle:]
+                weights.append(weight * len(bundle))
+                values.append(value * len(bundle))
+                groups.append(bundle)
+                size_bundle *= 2
+    return (
+        np.array(weights, dtype=np.int64),
+        np.array(values, dtype=np.float64),
+        groups,
+        always_taken,
+    )
@@ -4,7 +4,7 @@
 
 import operator
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import networkx as nx
@@ -20,6 +20,7 @@ from deap.gp import (
     Terminal,
     genHalfAndHalf,
 )
+from numba import prange
 
 from discrete_optimization.generic_tools.do_problem import (
     ParamsObjectiveFunction,
@@ -28,12 +29,16 @@ from discrete_optimization.generic_tools.do_problem import (
 )
 from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.generic_tools.ghh_tools import (
+    VECTORIZED_PRIMITIVES,
+    heuristic_values,
     max_operator,
     max_operator_list,
     min_operator,
     min_operator_list,
     protected_div,
+    register_population_map,
 )
+from discrete_optimization.generic_tools.jit_kernels import jit_kernel
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
 )
@@ -86,6 +91,43 @@ feature_function_map: Dict[FeatureEnum, Callable[..., Union[float, List[float]]]
 }
 
 
+# vectorized versions of the primitives of ParametersGPHH.default(), list features being arrays(item, dimension)
+vectorized_primitives: Dict[str, Callable[..., Any]] = dict(
+    VECTORIZED_PRIMITIVES,
+    mean_list=lambda x: np.mean(x, axis=-1),
+    sub_list=np.subtract,
+    plus_list=np.add,
+)
+
+
+@jit_kernel(parallel=True)
+def greedy_fill_batch(orders, values, weights, capacities):
+    """Take the items in the order of each individual, skipping the ones exceeding a capacity.
+
+    Returns: array(individual, item)->taken, array(individual)->value,
+        array(individual, dimension)->weight
+    """
+    nb_individuals, nb_items = orders.shape
+    nb_dimensions = capacities.shape[0]
+    taken = np.zeros((nb_individuals, nb_items), dtype=np.int8)
+    total_values = np.zeros(nb_individuals)
+    total_weights = np.zeros((nb_individuals, nb_dimensions))
+    for i in prange(nb_individuals):
+        for k in range(nb_items):
+            item = orders[i, k]
+            fit = True
+            for j in range(nb_dimensions):
+                if total_weights[i, j] + weights[item, j] > capacities[j]:
+                    fit = False
+                    break
+            if fit:
+                taken[i, item] = 1
+                total_values[i] += values[item]
+                for j in range(nb_dimensions):
+                    total_weights[i, j] += weights[item, j]
+    return taken, total_values, total_weights
+
+
 class ParametersGPHH:
     def __init__(
         self,
@@ -187,6 +229,7 @@ class GPHH(SolverDO):
             problem=self.domain_model,
             params_objective_function=params_objective_function,
         )
+        self.feature_arrays: Dict[Problem, List[npt.NDArray[np.float_]]] = {}
 
     def init_model(self) -> None:
         tournament_ratio = self.params_gphh.tournament_ratio
@@ -212,6 +255,7 @@ class GPHH(SolverDO):
             "population", tools.initRepeat, list, self.toolbox.individual
         )
         self.toolbox.register("compile", gp.compile, pset=self.pset)
+        register_population_map(self.toolbox, self.evaluate_population)
         self.toolbox.register(
             "evaluate", self.evaluate_heuristic, domains=self.training_domains
         )
@@ -263,7 +307,7 @@ class GPHH(SolverDO):
         self.final_pop = pop
         self.func_heuristic = self.toolbox.compile(expr=self.best_heuristic)
         solution = self.build_solution(
-            domain=self.domain_model, func_heuristic=self.func_heuristic
+            domain=self.domain_model, individual=self.best_heuristic
         )
         return ResultStorage(
             list_solution_fits=[(solution, self.aggreg_from_sol(solution))],
@@ -273,9 +317,7 @@ class GPHH(SolverDO):
     def build_result_storage_for_domain(
         self, domain: MultidimensionalKnapsack
     ) -> ResultStorage:
-        solution = self.build_solution(
-            domain=domain, func_heuristic=self.func_heuristic
-        )
+        solution = self.build_solution(domain=domain, individual=self.best_heuristic)
         return ResultStorage(
             list_solution_fits=[
                 (solution, self.aggreg_dict(domain.evaluate(solution)))
@@ -288,67 +330,123 @@ class GPHH(SolverDO):
             pset.renameArguments(**{"ARG" + str(i): self.list_feature[i].value})
         return pset
 
+    def get_feature_arrays(
+        self, domain: MultidimensionalKnapsack
+    ) -> List[npt.NDArray[np.float_]]:
+        """Features of the items of a domain, computed once per domain.
+
+        Returns: one array per feature, array(item) or array(item, dimension) for list features
+
+        """
+        if domain not in self.feature_arrays:
+            self.feature_arrays[domain] = [
+                np.array(
+                    [
+                        feature_function_map[lf](problem=domain, item_index=j)
+                        for j in range(len(domain.list_items))
+                    ],
+                    dtype=float,
+                )
+                for lf in self.list_feature
+            ]
+        return self.feature_arrays[domain]
+
+    def compute_orders(
+        self,
+        domain: MultidimensionalKnapsack,
+        individuals: List[Any],
+        func_heuristic: Optional[Callable[..., float]] = None,
+    ) -> npt.NDArray[np.int_]:
+        """Items sorted by decreasing value of the heuristic of each individual.
+
+        Returns: array(individual, rank)->item index
+
+        """
+        features = self.get_feature_arrays(domain)
+        nb_items = len(domain.list_items)
+        return np.array(
+            [
+                np.argsort(
+                    -heuristic_values(
+                        expr=individual,
+                        pset=self.pset,
+                        features=features,
+                        shape=(nb_items,),
+                        vectorized_primitives=vectorized_primitives,
+                        func_heuristic=func_heuristic,
+                    ),
+                    kind="stable",
+                )
+                for individual in individuals
+            ],
+            dtype=np.int64,
+        ).reshape((len(individuals), nb_items))
+
+    def fill_knapsacks(
+        self, domain: MultidimensionalKnapsack, orders: npt.NDArray[np.int_]
+    ) -> Tuple[npt.NDArray[np.int8], npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+        """Greedy filling of the knapsack of a domain, for each order of the items.
+
+        Returns: taken, values and weights of each filling, see greedy_fill_batch()
+
+        """
+        return greedy_fill_batch(
+            orders,
+            np.array([item.value for item in domain.list_items], dtype=float),
+            np.array([item.weights for item in domain.list_items], dtype=float),
+            np.array(domain.max_capacities, dtype=float),
+        )
+
     def build_solution(
         self,
         domain: MultidimensionalKnapsack,
         individual: Optional[Any] = None,
         func_heuristic: Optional[Callable[..., float]] = None,
     ) -> KnapsackSolutionMultidimensional:
-        if func_heuristic is None:
-            func_heuristic = self.toolbox.compile(expr=individual)
-        d: MultidimensionalKnapsack = domain
-        raw_values: List[float] = []
-        for j in range(len(d.list_items)):
-            input_features = [
-                feature_function_map[lf](problem=domain, item_index=j)
-                for lf in self.list_feature
-            ]
-            output_value = func_heuristic(*input_features)
-            raw_values.append(output_value)
-        sorted_indexes = [
-            x
-            for x in sorted(
-                range(len(raw_values)), key=lambda k: raw_values[k], reverse=True
-            )
-        ]
-        current_weight = [0.0] * len(d.max_capacities)
-        k = 0
-        list_taken = [0] * len(d.list_items)
-        value = 0.0
-        while all(
-            current_weight[j] <= d.max_capacities[j]
-            for j in range(len(d.max_capacities))
-        ) and k < len(sorted_indexes):
-            if all(
-                current_weight[j] + d.list_items[sorted_indexes[k]].weights[j]
-                <= d.max_capacities[j]
-                for j in range(len(d.max_capacities))
-            ):
-                list_taken[sorted_indexes[k]] = 1
-                value += d.list_items[sorted_indexes[k]].value
-                for j in range(len(d.max_capacities)):
-                    current_weight[j] = (
-                        current_weight[j] + d.list_items[sorted_indexes[k]].weights[j]
-                    )
-            k += 1
+        orders = self.compute_orders(
+            domain=domain, individuals=[individual], func_heuristic=func_heuristic
+        )
+        taken, values, weights = self.fill_knapsacks(domain=domain, orders=orders)
         solution = KnapsackSolutionMultidimensional(
-            problem=d, list_taken=list_taken, value=value, weights=current_weight
+            problem=domain,
+            list_taken=taken[0].tolist(),
+            value=float(values[0]),
+            weights=weights[0].tolist(),
         )
         return solution
 
     def evaluate_heuristic(
         self, individual: Any, domains: List[MultidimensionalKnapsack]
     ) -> List[float]:
-        vals = []
-        func_heuristic = self.toolbox.compile(expr=individual)
-        for domain in domains:
-            solution = self.build_solution(
-                individual=individual, domain=domain, func_heuristic=func_heuristic
+        return self.evaluate_population(individuals=[individual], domains=domains)[0]
+
+    def evaluate_population(
+        self,
+        individuals: List[Any],
+        domains: Optional[List[MultidimensionalKnapsack]] = None,
+    ) -> List[List[float]]:
+        """Fitness of a population, each domain filling the knapsacks of all the individuals in parallel."""
+        if domains is None:
+            domains = self.training_domains
+        if len(individuals) == 0:
+            return []
+        vals = np.zeros((len(domains), len(individuals)))
+        for i, domain in enumerate(domains):
+            orders = self.compute_orders(domain=domain, individuals=individuals)
+            _, values, weights = self.fill_knapsacks(domain=domain, orders=orders)
+            weight_violations = np.sum(
+                np.maximum(0.0, weights - np.array(domain.max_capacities)), axis=1
             )
-            value: float = self.aggreg_dict(domain.evaluate(solution))  # type: ignore # could also be TupleFitness
-            vals.append(value)
-        fitness = [np.mean(vals)]
-        return [fitness[0] - 10 * self.evaluate_complexity(individual)]
+            vals[i, :] = [
+                self.aggreg_dict(
+                    {"value": float(value), "weight_violation": float(violation)}
+                )
+                for value, violation in zip(values, weight_violations)
+            ]
+        return [
+            [fitness - 10 * self.evaluate_complexity(individual)]
+            for fitness, individual in zip(np.mean(vals, axis=0), individuals)
+        ]
 
     def evaluate_complexity(self, individual: Any) -> float:
         all_primitives_list = []
@@ -3,6 +3,7 @@
 #  LICENSE file in the root directory of this source tree.
 
 import random
+from typing import Optional
 
 import numpy as np
 import scipy.spatial.distance as dist
@@ -12,14 +13,18 @@ import discrete_optimization.vrp.vrp_parser as vrp_parser
 from discrete_optimization.pickup_vrp.gpdp import GPDP, ProxyClass
 
 
-def create_selective_tsp(nb_nodes=300, nb_vehicles=1, nb_clusters=30):
+def create_selective_tsp(
+    nb_nodes=300, nb_vehicles=1, nb_clusters=30, seed: Optional[int] = None
+):
     """
     Create a random orienteering/selective TSP problem
     :param nb_nodes: number of nodes to consider in the network (excluding the origin/target of vehicles)
     :param nb_vehicles: number of vehicles to consider
     :param nb_clusters: number of cluster of nodes.
+    :param seed: seed of the random generator, the global numpy generator being used if None
     :return: a gpdp model
     """
+    np_random = np.random if seed is None else np.random.RandomState(seed)
     number_vehicle = nb_vehicles
     nb_nodes_transportation = nb_nodes
     # non dummy nodes
@@ -47,7 +52,7 @@ def create_selective_tsp(nb_nodes=300, nb_vehicles=1, nb_clusters=30):
     # real number of nodes in the problem definition
     nb_nodes_real = nb_nodes_transportation + 2 * number_vehicle
     # we sample random 2D coordinates
-    coordinates = np.random.randint(-20, 20, size=(nb_nodes_real, 2))
+    coordinates = np_random.randint(-20, 20, size=(nb_nodes_real, 2))
     coordinates[:, 0] += 40
     distance_delta = dist.cdist(coordinates, coordinates)
     distance_delta = np.array(distance_delta, dtype=np.int32)
@@ -99,7 +104,15 @@ def create_pickup_and_delivery(
     include_pickup=True,
     fraction_of_pickup_deliver=0.125,
     pickup_per_cluster=False,
+    seed: Optional[int] = None,
 ):
+    """
+    Create a random pickup and delivery problem
+    :param seed: seed of the random generators, the global python and numpy generators being used if None
+    :return: a gpdp model
+    """
+    np_random = np.random if seed is None else np.random.RandomState(seed)
+    py_random = random if seed is None else random.Random(seed)
     number_vehicle = number_of_vehicles
     nb_nodes_transportation = number_of_node
     nodes_transportation = set(range(nb_nodes_transportation))
@@ -120,7 +133,7 @@ def create_pickup_and_delivery(
     resources_flow_node = {i: {} for i in all_nodes}
     resources_flow_edges = {i: {j: {} for j in all_nodes if j != i} for i in all_nodes}
 
-    coordinates = np.random.randint(-20, 20, size=(len(all_nodes), 2))
+    coordinates = np_random.randint(-20, 20, size=(len(all_nodes), 2))
 
     distance_delta = dist.cdist(coordinates, coordinates)
     distance_delta = np.array(distance_delta, dtype=np.int32)
@@ -156,9 +169,9 @@ def create_pickup_and_delivery(
                 nodes_possible.remove(node_target)
             n = int(len(nodes_possible) * fraction_of_pickup_deliver)
             for j in range(n):
-                k1 = random.choice(list(nodes_possible))
+                k1 = py_random.choice(list(nodes_possible))
                 nodes_possible.remove(k1)
-                k2 = random.choice(list(nodes_possible))
+                k2 = py_random.choice(list(nodes_possible))
                 nodes_possible.remove(k2)
                 list_pickup_deliverable += [({k1}, {k2})]
         else:
@@ -171,9 +184,9 @@ def create_pickup_and_delivery(
                     cluster_possible.remove(clusters_dict[target_vehicle[j]])
             n = len(cluster_possible) // 4
             for j in range(n):
-                cluster_1 = random.choice(list(cluster_possible))
+                cluster_1 = py_random.choice(list(cluster_possible))
                 cluster_possible.remove(cluster_1)
-                cluster_2 = random.choice(list(cluster_possible))
+                cluster_2 = py_random.choice(list(cluster_possible))
                 cluster_possible.remove(cluster_2)
                 list_pickup_deliverable_per_cluster += [({cluster_1}, {cluster_2})]
     return GPDP(
@@ -350,7 +350,11 @@ def build_pruned_problem(problem: GPDP, undirected=True, compute_graph: bool = F
         resources_set=problem.resources_set,
         capacities=problem.capacities,
         resources_flow_node=problem.resources_flow_node,
-        resources_flow_edges={e: problem.resources_flow_edges[e] for e in kept_edges},
+        resources_flow_edges={
+            e: problem.resources_flow_edges[e]
+            for e in kept_edges
+            if e in problem.resources_flow_edges
+        },
         distance_delta={
             x: {
                 y: problem.distance_delta[x][y]
@@ -398,28 +402,54 @@ def max_time(problem: GPDP):
     )
 
 
+def build_sparse_matrix(
+    problem: GPDP, delta: Dict[Hashable, Dict[Hashable, float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compressed sparse row storage of the values of the edges of the graph.
+
+    Args:
+        problem: problem whose nodes are indexed by problem.index_nodes
+        delta: values of the edges, e.g. problem.distance_delta or problem.time_delta
+
+    Returns: ptr, index, values such that the edges leaving the node of index i are going to
+        the nodes index[ptr[i]:ptr[i+1]], with values values[ptr[i]:ptr[i+1]]
+
+    """
+    nb_nodes = len(problem.all_nodes_dict)
+    sources = [problem.index_nodes[j] for j in delta for _ in range(len(delta[j]))]
+    targets = [problem.index_nodes[k] for j in delta for k in delta[j]]
+    values = [delta[j][k] for j in delta for k in delta[j]]
+    sources = np.array(sources, dtype=np.int64)
+    order = np.argsort(sources, kind="stable")
+    ptr = np.zeros(nb_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=nb_nodes), out=ptr[1:])
+    return (
+        ptr,
+        np.array(targets, dtype=np.int64)[order],
+        np.array(values, dtype=np.float64)[order],
+    )
+
+
+def sparse_to_dense_matrix(
+    ptr: np.ndarray, index: np.ndarray, values: np.ndarray, default_value: float
+) -> np.ndarray:
+    """Dense matrix of a graph stored in csr, missing edges having the default value."""
+    nb_nodes = ptr.shape[0] - 1
+    matrix = np.full((nb_nodes, nb_nodes), default_value, dtype=np.float64)
+    matrix[np.repeat(np.arange(nb_nodes), np.diff(ptr)), index] = values
+    return matrix
+
+
 def build_matrix_distance(problem: GPDP):
-    matrix_distance = 100000 * np.ones(
-        (len(problem.all_nodes_dict), len(problem.all_nodes_dict))
+    return sparse_to_dense_matrix(
+        *build_sparse_matrix(problem, problem.distance_delta), default_value=100000
     )
-    for j in problem.distance_delta:
-        for k in problem.distance_delta[j]:
-            matrix_distance[
-                problem.index_nodes[j], problem.index_nodes[k]
-            ] = problem.distance_delta[j][k]
-    return matrix_distance
 
 
 def build_matrix_time(problem: GPDP):
-    matrix_time = 10000 * np.ones(
-        (len(problem.all_nodes_dict), len(problem.all_nodes_dict))
+    return sparse_to_dense_matrix(
+        *build_sparse_matrix(problem, problem.time_delta), default_value=10000
     )
-    for j in problem.time_delta:
-        for k in problem.time_delta[j]:
-            matrix_time[
-                problem.index_nodes[j], problem.index_nodes[k]
-            ] = problem.time_delta[j][k]
-    return matrix_time
 
 
 class ProxyClass:
@@ -7,18 +7,24 @@ from __future__ import print_function
 import logging
 from enum import Enum
 from functools import partial
-from typing import Any, Iterable, List, Union
+from typing import Any, Iterable, List, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from ortools.constraint_solver import pywrapcp, routing_enums_pb2
 from ortools.util.optional_boolean_pb2 import BOOL_FALSE, BOOL_TRUE
 
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
 from discrete_optimization.generic_tools.do_solver import SolverDO
 from discrete_optimization.pickup_vrp.gpdp import (
     GPDP,
     build_matrix_distance,
     build_matrix_time,
+    build_sparse_matrix,
+    sparse_to_dense_matrix,
 )
 
 logger = logging.getLogger(__name__)
@@ -135,6 +141,31 @@ status_description = {
 }
 
 
+def build_matrix_resource_transition(problem: GPDP, resource: Any) -> np.ndarray:
+    """Consumption of a resource when going from a node to another one, node consumption included.
+
+    Nodes are given by their index, as in the resource transition callback of ORToolsGPDP.
+    """
+    nb_nodes = len(problem.all_nodes_dict)
+    matrix = np.zeros((nb_nodes, nb_nodes), dtype=np.int64)
+    matrix += np.array(
+        [
+            problem.resources_flow_node.get(j, {}).get(resource, 0)
+            for j in range(nb_nodes)
+        ],
+        dtype=np.int64,
+    )[np.newaxis, :]
+    edges = [
+        (i, j, flow.get(resource, 0))
+        for (i, j), flow in problem.resources_flow_edges.items()
+        if i in problem.nodes_to_index and j in problem.nodes_to_index
+    ]
+    if len(edges) > 0:
+        sources, targets, values = zip(*edges)
+        matrix[list(sources), list(targets)] += np.array(values, dtype=np.int64)
+    return matrix
+
+
 class ORToolsGPDP(SolverDO):
     def __init__(
         self,
@@ -174,6 +205,9 @@ class ORToolsGPDP(SolverDO):
         max_time_per_vehicle = kwargs.get("max_time_per_vehicle", 1000000)
         max_distance_per_vehicle = kwargs.get("max_distance_per_vehicle", 1000000)
         set_transit_cost_by_default = kwargs.get("set_transit_cost_by_default", True)
+        # register the transits as integer matrices/vectors evaluated natively by ortools,
+        # instead of python callbacks called at each evaluation during the search
+        use_native_transit = kwargs.get("use_native_transit", False)
         # use or not the distance callback function to evaluate the cost of each edge.
         # Whatever the cost function you want to optimize (via the list_parameters_cost argument),
         # these cost are still included in the objective function
@@ -182,12 +216,14 @@ class ORToolsGPDP(SolverDO):
             if matrix_distance_int is None:
                 matrix_distance = build_matrix_distance(self.problem)
                 matrix_distance_int = np.array(
-                    matrix_distance * self.factor_multiplier_distance, dtype=np.int
+                    matrix_distance * self.factor_multiplier_distance, dtype=np.int64
                 )
+            else:
+                matrix_distance_int = np.asarray(matrix_distance_int, dtype=np.int64)
             if include_time_dimension:
                 matrix_time = build_matrix_time(self.problem)
                 matrix_time_int = np.array(
-                    matrix_time * self.factor_multiplier_time, dtype=np.int
+                    matrix_time * self.factor_multiplier_time, dtype=np.int64
                 )
         capacities_dict = {
             r: [
@@ -292,9 +328,19 @@ class ORToolsGPDP(SolverDO):
                         )
                     else:
                         charge_dimension.CumulVar(index).SetMax(constraint[1])
-        transit_distance_callback_index = routing.RegisterTransitCallback(
-            distance_callback
-        )
+        if use_native_transit:
+            if not use_matrix:
+                matrix_distance_int = sparse_to_dense_matrix(
+                    *build_sparse_matrix(self.problem, self.problem.distance_delta),
+                    default_value=1000000000,
+                ).astype(np.int64)
+            transit_distance_callback_index = routing.RegisterTransitMatrix(
+                matrix_distance_int.tolist()
+            )
+        else:
+            transit_distance_callback_index = routing.RegisterTransitCallback(
+                distance_callback
+            )
         # Define cost of each arc.
         if set_transit_cost_by_default:
             routing.SetArcCostEvaluatorOfAllVehicles(transit_distance_callback_index)
@@ -315,20 +361,32 @@ class ORToolsGPDP(SolverDO):
                 )
                 return l
 
-            demand_callback_index_dict = {
-                r: [
-                    routing.RegisterTransitCallback(
-                        partial(
-                            ressource_transition,
-                            ressource=r,
-                            problem=self.problem,
-                            vehicle=v,
-                        )
+            if use_native_transit:
+                resource_transition_index = {
+                    r: routing.RegisterTransitMatrix(
+                        build_matrix_resource_transition(self.problem, r).tolist()
                     )
-                    for v in range(self.problem.number_vehicle)
-                ]
-                for r in demands
-            }
+                    for r in demands
+                }
+                demand_callback_index_dict = {
+                    r: [resource_transition_index[r]] * self.problem.number_vehicle
+                    for r in demands
+                }
+            else:
+                demand_callback_index_dict = {
+                    r: [
+                        routing.RegisterTransitCallback(
+                            partial(
+                                ressource_transition,
+                                ressource=r,
+                                problem=self.problem,
+                                vehicle=v,
+                            )
+                        )
+                        for v in range(self.problem.number_vehicle)
+                    ]
+                    for r in demands
+                }
             for r in demand_callback_index_dict:
                 routing.AddDimensionWithVehicleTransitAndCapacity(
                     demand_callback_index_dict[r],
@@ -347,12 +405,18 @@ class ORToolsGPDP(SolverDO):
                 from_node = manager.IndexToNode(from_index)
                 return demands[ressource][from_node]
 
-            demand_callback_index_dict = {
-                r: routing.RegisterUnaryTransitCallback(
-                    partial(demand_callback, ressource=r)
-                )
-                for r in demands
-            }
+            if use_native_transit:
+                demand_callback_index_dict = {
+                    r: routing.RegisterUnaryTransitVector([int(d) for d in demands[r]])
+                    for r in demands
+                }
+            else:
+                demand_callback_index_dict = {
+                    r: routing.RegisterUnaryTransitCallback(
+                        partial(demand_callback, ressource=r)
+                    )
+                    for r in demands
+                }
             for r in demand_callback_index_dict:
                 routing.AddDimensionWithVehicleCapacity(
                     demand_callback_index_dict[r],
@@ -403,7 +467,14 @@ class ORToolsGPDP(SolverDO):
                 to_node = manager.IndexToNode(to_index)
                 return matrix_time_int[from_node, to_node]
 
-            transit_time_callback_index = routing.RegisterTransitCallback(time_callback)
+            if use_native_transit:
+                transit_time_callback_index = routing.RegisterTransitMatrix(
+                    matrix_time_int.tolist()
+                )
+            else:
+                transit_time_callback_index = routing.RegisterTransitCallback(
+                    time_callback
+                )
             time = "Time"
 
             routing.AddDimension(
@@ -556,10 +627,10 @@ class ORToolsGPDP(SolverDO):
                     self.problem.target_vehicle[v] for v in self.problem.target_vehicle
                 }
             ]
+            # nodes outside of any disjunction are always visited. A disjunction gathering
+            # several nodes, some of them being pickups or deliveries, is not supported by
+            # the pickup and delivery operators of ortools and corrupts its memory.
             if len(mandatory_nodes) > 0:
-                routing.AddDisjunction(
-                    mandatory_nodes, 1000000000, len(mandatory_nodes)
-                )
                 routing.solver().Add(
                     routing.solver().Sum(
                         [routing.ActiveVar(i) for i in mandatory_nodes]
@@ -579,8 +650,8 @@ class ORToolsGPDP(SolverDO):
                     self.problem.target_vehicle[v] for v in self.problem.target_vehicle
                 }
             ]
-            if len(other_nodes) > 0:
-                routing.AddDisjunction(other_nodes, 0, len(other_nodes))
+            for node in other_nodes:
+                routing.AddDisjunction([node], 0)
         include_node_vehicle = kwargs.get("include_node_vehicle", True)
         if include_node_vehicle:
             if self.problem.node_vehicle is not None:
@@ -750,22 +821,37 @@ class ORToolsGPDP(SolverDO):
         search_parameters.time_limit.seconds = kwargs.get("time_limit", 100)
         return search_parameters
 
-    def solve(self, search_parameters=None, **kwargs) -> Iterable[Any]:
+    def solve(
+        self,
+        search_parameters=None,
+        callbacks: Optional[List[Callback]] = None,
+        **kwargs,
+    ) -> Iterable[Any]:
         if search_parameters is None:
             search_parameters = self.search_parameters
+        callbacks_list = CallbackList(callbacks=callbacks)
+        callbacks_list.on_solve_start(solver=self)
         sols = []
-        callback = make_routing_monitor(self)
+        callback = make_routing_monitor(self, callbacks_list=callbacks_list)
         self.routing.AddAtSolutionCallback(callback)
         sols = self.routing.SolveWithParameters(search_parameters)
+        callbacks_list.on_solve_end(res=callback.sols, solver=self)
         return callback.sols
 
 
-def make_routing_monitor(solver: ORToolsGPDP) -> callable:
+def make_routing_monitor(
+    solver: ORToolsGPDP, callbacks_list: Optional[CallbackList] = None
+) -> callable:
     class RoutingMonitor:
-        def __init__(self, solver: ORToolsGPDP):
+        def __init__(
+            self, solver: ORToolsGPDP, callbacks_list: Optional[CallbackList] = None
+        ):
             self.model = solver.routing
             self.problem = solver.problem
             self.solver = solver
+            if callbacks_list is None:
+                callbacks_list = CallbackList()
+            self.callbacks_list = callbacks_list
             self._counter = 0
             self._best_objective = np.inf
             self._counter_limit = 10000000
@@ -783,10 +869,20 @@ def make_routing_monitor(solver: ORToolsGPDP) -> callable:
                 self._best_objective = self.model.CostVar().Max()
                 self.retrieve_current_solution()
                 self._counter = 0
+                self.callbacks_list.on_new_incumbent(
+                    step=self.nb_solutions,
+                    solution=None,
+                    fitness=self._best_objective,
+                    solver=self.solver,
+                )
             else:
                 self._counter += 1
                 if self._counter > self._counter_limit:
                     self.model.solver().FinishCurrentSearch()
+            if self.callbacks_list.on_step_end(
+                step=self.nb_solutions, res=self.sols, solver=self.solver
+            ):
+                self.model.solver().FinishCurrentSearch()
             self.nb_solutions += 1
 
         def retrieve_current_solution(self):
@@ -862,7 +958,7 @@ def make_routing_monitor(solver: ORToolsGPDP) -> callable:
             ]
             self.sols += postpro_sol
 
-    return RoutingMonitor(solver)
+    return RoutingMonitor(solver, callbacks_list=callbacks_list)
 
 
 def plot_ortools_solution(result, problem: GPDP):
@@ -2,44 +2,51 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
+import heapq
 import logging
 
 import numba.typed
 import numba.types
 import numpy as np
-from numba import njit
+from numba import prange
+
+from discrete_optimization.generic_tools.jit_kernels import jit_kernel
 
 logger = logging.getLogger(__name__)
 
 int32_array = numba.types.Array(numba.types.int32, 1, "C")
 
 
-@njit
-def sgs_fast(
+@jit_kernel
+def sgs_fast_arrays(
     permutation_task,
-    modes_array,  # permutation_task=array(task)->task index
-    consumption_array,  # modes=array(task)->0, 1... # consumption_array=array3D(task, mode, res),
+    modes_array,
+    starts,
+    ends,
+    order,
+    consumption_array,
     duration_array,
-    predecessors,  # array(task, task) -> bool
-    successors,  # array(task, task)->bool
+    predecessors,
+    successors,
     horizon,
     ressource_available,
     ressource_renewable,
     minimum_starting_time_array,
 ):
-    activity_end_times = {}
+    """Serial SGS of sgs_fast writing the schedule into preallocated arrays.
+
+    Same outputs as sgs_fast_event_arrays.
+    """
     unfeasible_non_renewable_resources = False
     new_horizon = horizon
-    resource_avail_in_time = {}
-    for index in range(ressource_available.shape[0]):
-        resource_avail_in_time[index] = np.copy(
-            ressource_available[index][: new_horizon + 1]
-        )
-    minimum_starting_time = {}
-    for act in range(permutation_task.shape[0]):
+    resource_avail_in_time = np.copy(ressource_available[:, : new_horizon + 1])
+    nb_task = permutation_task.shape[0]
+    minimum_starting_time = np.zeros(nb_task, dtype=np.int64)
+    for act in range(nb_task):
         minimum_starting_time[act] = minimum_starting_time_array[act]
+        starts[act] = -1
+        ends[act] = -1
     done = 0
-    nb_task = permutation_task.shape[0]
     pred_links = np.sum(predecessors[permutation_task, :], axis=1)
     done_np = np.zeros((permutation_task.shape[0]), dtype=np.int32)
     while done < nb_task and not unfeasible_non_renewable_resources:
@@ -63,7 +70,7 @@ def sgs_fast(
                 for res in range(ressource_available.shape[0]):
                     if t < new_horizon:
                         if (
-                            resource_avail_in_time[res][t]
+                            resource_avail_in_time[res, t]
                             < consumption_array[act_id, modes_array[act_id], res]
                         ):  # 11
                             valid = False
@@ -79,39 +86,801 @@ def sgs_fast(
             end_t = current_min_time + duration_array[act_id, modes_array[act_id]]
             for res in range(ressource_available.shape[0]):
                 if ressource_renewable[res]:
-                    resource_avail_in_time[res][
-                        current_min_time:end_t
+                    resource_avail_in_time[
+                        res, current_min_time:end_t
                     ] -= consumption_array[act_id, modes_array[act_id], res]
                 else:
-                    resource_avail_in_time[res][current_min_time:] -= consumption_array[
+                    resource_avail_in_time[res, current_min_time:] -= consumption_array[
                         act_id, modes_array[act_id], res
                     ]
-                    if resource_avail_in_time[res][-1] < 0:
+                    if resource_avail_in_time[res, -1] < 0:
                         unfeasible_non_renewable_resources = True
                         break
             if unfeasible_non_renewable_resources:
                 break
-            activity_end_times[act_id] = end_t
+            starts[act_id] = current_min_time
+            ends[act_id] = end_t
+            order[done] = act_id
             done_np[index_id] = 1
             done += 1
             # for s in range(successors.shape[1]):
             for j in range(nb_task):
                 if successors[act_id, permutation_task[j]] == 1:
                     minimum_starting_time[permutation_task[j]] = max(
-                        int(minimum_starting_time[permutation_task[j]]),
-                        int(activity_end_times[act_id]),
+                        minimum_starting_time[permutation_task[j]], end_t
                     )
                     pred_links[j] -= 1
+    return done, unfeasible_non_renewable_resources
+
+
+@jit_kernel
+def sgs_fast(
+    permutation_task,
+    modes_array,  # permutation_task=array(task)->task index
+    consumption_array,  # modes=array(task)->0, 1... # consumption_array=array3D(task, mode, res),
+    duration_array,
+    predecessors,  # array(task, task) -> bool
+    successors,  # array(task, task)->bool
+    horizon,
+    ressource_available,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    nb_task = permutation_task.shape[0]
+    starts = np.empty(nb_task, dtype=np.int64)
+    ends = np.empty(nb_task, dtype=np.int64)
+    order = np.empty(nb_task, dtype=np.int64)
+    done, unfeasible_non_renewable_resources = sgs_fast_arrays(
+        permutation_task,
+        modes_array,
+        starts,
+        ends,
+        order,
+        consumption_array,
+        duration_array,
+        predecessors,
+        successors,
+        horizon,
+        ressource_available,
+        ressource_renewable,
+        minimum_starting_time_array,
+    )
+    rcpsp_schedule = {}
+    for act_id in order[:done]:
+        rcpsp_schedule[act_id] = (starts[act_id], ends[act_id])
+    return rcpsp_schedule, unfeasible_non_renewable_resources
+
+
+def build_successors_csr(nb_tasks, edges):
+    """Build the CSR representation of precedence constraints.
+
+    Args:
+        nb_tasks: number of tasks
+        edges: array(nb_edges, 2) of (task index, successor index), duplicates are ignored
+
+    Returns: successors_ptr, successors_index, predecessors_count so that the successors of task i
+        are successors_index[successors_ptr[i]:successors_ptr[i + 1]]
+
+    """
+    edges = np.unique(np.asarray(edges, dtype=np.int32).reshape((-1, 2)), axis=0)
+    successors_ptr = np.zeros(nb_tasks + 1, dtype=np.int32)
+    np.cumsum(np.bincount(edges[:, 0], minlength=nb_tasks), out=successors_ptr[1:])
+    # np.unique sorts the edges by task index
+    successors_index = np.ascontiguousarray(edges[:, 1])
+    predecessors_count = np.bincount(edges[:, 1], minlength=nb_tasks).astype(np.int32)
+    return successors_ptr, successors_index, predecessors_count
+
+
+def dense_precedences_from_csr(successors_ptr, successors_index):
+    nb_tasks = successors_ptr.shape[0] - 1
+    predecessors = np.zeros((nb_tasks, nb_tasks), dtype=np.int32)
+    successors = np.zeros((nb_tasks, nb_tasks), dtype=np.int32)
+    tasks = np.repeat(np.arange(nb_tasks), np.diff(successors_ptr))
+    successors[tasks, successors_index] = 1
+    predecessors[successors_index, tasks] = 1
+    return predecessors, successors
+
+
+def compute_resource_breakpoints(ressource_available):
+    """Compress resource availabilities into a step function.
+
+    Args:
+        ressource_available: array(res, horizon) of available quantity at each time
+
+    Returns: breakpoints, breakpoints_availability where breakpoints is the sorted array of times
+        where the availability of at least one resource changes (starting at 0), and
+        breakpoints_availability is the array(res, nb_breakpoints) of availability of each resource
+        from each breakpoint to the next one.
+
+    """
+    if ressource_available.shape[1] == 0:
+        return (
+            np.zeros(1, dtype=np.int32),
+            np.zeros((ressource_available.shape[0], 1), dtype=np.int32),
+        )
+    changes = (
+        np.flatnonzero(
+            np.any(ressource_available[:, 1:] != ressource_available[:, :-1], axis=0)
+        )
+        + 1
+    )
+    breakpoints = np.concatenate((np.zeros(1, dtype=np.int32), changes)).astype(
+        np.int32
+    )
+    return breakpoints, np.ascontiguousarray(ressource_available[:, breakpoints])
+
+
+@jit_kernel
+def _insert_breakpoint(times, avail, nb_points, t):
+    # index of the breakpoint at time t in the profile, inserted if needed
+    k = np.searchsorted(times[:nb_points], t, side="right") - 1
+    if times[k] == t:
+        return k, nb_points
+    for j in range(nb_points, k + 1, -1):
+        times[j] = times[j - 1]
+        for res in range(avail.shape[0]):
+            avail[res, j] = avail[res, j - 1]
+    times[k + 1] = t
+    for res in range(avail.shape[0]):
+        avail[res, k + 1] = avail[res, k]
+    return k + 1, nb_points + 1
+
+
+@jit_kernel
+def sgs_fast_event_arrays(
+    permutation_task,
+    modes_array,
+    starts,
+    ends,
+    order,
+    consumption_array,
+    duration_array,
+    predecessors_count,
+    successors_ptr,
+    successors_index,
+    horizon,
+    breakpoints,
+    breakpoints_availability,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Event based serial SGS writing the schedule into preallocated arrays, see sgs_fast_event.
+
+    starts and ends (array(task)) receive the start and end times of the tasks, -1 for the tasks
+    that could not be scheduled, and order (array(task)) the indexes of the scheduled tasks
+    in scheduling order.
+
+    Returns: number of scheduled tasks, and the unfeasibility flag
+    """
+    nb_task = permutation_task.shape[0]
+    nb_res = breakpoints_availability.shape[0]
+    capacity = breakpoints.shape[0] + 2 * nb_task + 1
+    times = np.zeros(capacity, dtype=np.int64)
+    avail = np.zeros((nb_res, capacity), dtype=np.int64)
+    nb_points = breakpoints.shape[0]
+    for k in range(nb_points):
+        times[k] = breakpoints[k]
+        for res in range(nb_res):
+            avail[res, k] = breakpoints_availability[res, k]
+    position = np.zeros(nb_task, dtype=np.int64)
+    for i in range(nb_task):
+        position[permutation_task[i]] = i
+    pred_links = np.zeros(nb_task, dtype=np.int64)
+    minimum_starting_time = np.zeros(nb_task, dtype=np.int64)
+    eligible = [np.int64(x) for x in range(0)]
+    for i in range(nb_task):
+        pred_links[i] = predecessors_count[i]
+        minimum_starting_time[i] = minimum_starting_time_array[i]
+    for i in range(nb_task):
+        if pred_links[permutation_task[i]] == 0:
+            heapq.heappush(eligible, np.int64(i))
+    for i in range(nb_task):
+        starts[i] = -1
+        ends[i] = -1
+    done = 0
+    unfeasible_non_renewable_resources = False
+    while len(eligible) > 0:
+        act_id = permutation_task[heapq.heappop(eligible)]
+        mode = modes_array[act_id]
+        duration = duration_array[act_id, mode]
+        start = minimum_starting_time[act_id]
+        if duration > 0:
+            k = np.searchsorted(times[:nb_points], start, side="right") - 1
+            while True:
+                if start + duration > horizon:
+                    unfeasible_non_renewable_resources = True
+                    break
+                valid = True
+                j = k
+                while j < nb_points and times[j] < start + duration:
+                    for res in range(nb_res):
+                        if avail[res, j] < consumption_array[act_id, mode, res]:
+                            valid = False
+                            break
+                    if not valid:
+                        break
+                    j += 1
+                if valid:
+                    break
+                # jump to the end of the segment lacking resources
+                k = j + 1
+                start = times[k] if k < nb_points else horizon
+            if unfeasible_non_renewable_resources:
+                break
+        end = start + duration
+        k_start = nb_points
+        if start < horizon:
+            k_start, nb_points = _insert_breakpoint(times, avail, nb_points, start)
+        k_end = nb_points
+        if end < horizon:
+            k_end, nb_points = _insert_breakpoint(times, avail, nb_points, end)
+        for res in range(nb_res):
+            consumption = consumption_array[act_id, mode, res]
+            if ressource_renewable[res]:
+                for k in range(k_start, k_end):
+                    avail[res, k] -= consumption
+            else:
+                for k in range(k_start, nb_points):
+                    avail[res, k] -= consumption
+                if avail[res, nb_points - 1] < 0:
+                    unfeasible_non_renewable_resources = True
+                    break
+        if unfeasible_non_renewable_resources:
+            break
+        starts[act_id] = start
+        ends[act_id] = end
+        order[done] = act_id
+        done += 1
+        for s in range(successors_ptr[act_id], successors_ptr[act_id + 1]):
+            succ = successors_index[s]
+            minimum_starting_time[succ] = max(minimum_starting_time[succ], end)
+            pred_links[succ] -= 1
+            if pred_links[succ] == 0:
+                heapq.heappush(eligible, position[succ])
+    return done, unfeasible_non_renewable_resources
+
+
+@jit_kernel
+def sgs_fast_event(
+    permutation_task,
+    modes_array,  # permutation_task=array(task)->task index
+    consumption_array,  # modes=array(task)->0, 1... # consumption_array=array3D(task, mode, res),
+    duration_array,
+    predecessors_count,  # array(task)->number of predecessors
+    successors_ptr,  # CSR pointers of successors lists
+    successors_index,  # CSR successors indexes
+    horizon,
+    breakpoints,  # array(nb_breakpoints)->time where availability changes
+    breakpoints_availability,  # array(res, nb_breakpoints)->availability
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Serial SGS working on a resource profile made of breakpoints.
+
+    Same output as sgs_fast, but the candidate start time of a task jumps directly
+    to the end of the first profile segment lacking resources, instead of being
+    increased one time unit at a time, and precedences are given in CSR format.
+    """
+    nb_task = permutation_task.shape[0]
+    starts = np.empty(nb_task, dtype=np.int64)
+    ends = np.empty(nb_task, dtype=np.int64)
+    order = np.empty(nb_task, dtype=np.int64)
+    done, unfeasible_non_renewable_resources = sgs_fast_event_arrays(
+        permutation_task,
+        modes_array,
+        starts,
+        ends,
+        order,
+        consumption_array,
+        duration_array,
+        predecessors_count,
+        successors_ptr,
+        successors_index,
+        horizon,
+        breakpoints,
+        breakpoints_availability,
+        ressource_renewable,
+        minimum_starting_time_array,
+    )
+    rcpsp_schedule = {}
+    for act_id in order[:done]:
+        rcpsp_schedule[act_id] = (starts[act_id], ends[act_id])
+    return rcpsp_schedule, unfeasible_non_renewable_resources
+
+
+@jit_kernel(parallel=True)
+def sgs_fast_event_batch(
+    permutations_task,  # array(individual, task)->task index
+    modes_arrays,  # array(individual, task)->0, 1...
+    consumption_array,
+    duration_array,
+    predecessors_count,
+    successors_ptr,
+    successors_index,
+    horizon,
+    breakpoints,
+    breakpoints_availability,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Run the event based serial SGS on a batch of individuals in parallel.
+
+    Returns: array(individual)->makespan, i.e. the maximum end time of the scheduled
+        tasks, and array(individual)->unfeasibility flag
+    """
+    nb_individuals = permutations_task.shape[0]
+    makespans = np.zeros(nb_individuals, dtype=np.int64)
+    unfeasible = np.zeros(nb_individuals, dtype=np.bool_)
+    nb_task = permutations_task.shape[1]
+    for i in prange(nb_individuals):
+        starts = np.empty(nb_task, dtype=np.int64)
+        ends = np.empty(nb_task, dtype=np.int64)
+        order = np.empty(nb_task, dtype=np.int64)
+        done, unfeasible_i = sgs_fast_event_arrays(
+            permutations_task[i],
+            modes_arrays[i],
+            starts,
+            ends,
+            order,
+            consumption_array,
+            duration_array,
+            predecessors_count,
+            successors_ptr,
+            successors_index,
+            horizon,
+            breakpoints,
+            breakpoints_availability,
+            ressource_renewable,
+            minimum_starting_time_array,
+        )
+        makespan = 0
+        for act_id in order[:done]:
+            makespan = max(makespan, ends[act_id])
+        makespans[i] = makespan
+        unfeasible[i] = unfeasible_i
+    return makespans, unfeasible
+
+
+@jit_kernel(parallel=True)
+def sgs_fast_event_scenarios(
+    permutation_task,  # array(task)->task index
+    modes_array,  # array(task)->0, 1...
+    consumption_arrays,  # array(scenario, task, mode, res)
+    duration_arrays,  # array(scenario, task, mode)
+    predecessors_count,
+    successors_ptr,
+    successors_index,
+    horizon,
+    breakpoints,
+    breakpoints_availability,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Run the event based serial SGS of one solution on a batch of scenarios in parallel.
+
+    The scenarios share the precedences and the resources availability, only the durations
+    and the consumptions of the tasks differ.
+
+    Returns: array(scenario, task)->end time (-1 for tasks not scheduled),
+        and array(scenario)->unfeasibility flag
+    """
+    nb_scenarios = duration_arrays.shape[0]
+    ends = np.empty((nb_scenarios, permutation_task.shape[0]), dtype=np.int64)
+    unfeasible = np.zeros(nb_scenarios, dtype=np.bool_)
+    for i in prange(nb_scenarios):
+        starts_i = np.empty(permutation_task.shape[0], dtype=np.int64)
+        order = np.empty(permutation_task.shape[0], dtype=np.int64)
+        _, unfeasible_i = sgs_fast_event_arrays(
+            permutation_task,
+            modes_array,
+            starts_i,
+            ends[i],
+            order,
+            consumption_arrays[i],
+            duration_arrays[i],
+            predecessors_count,
+            successors_ptr,
+            successors_index,
+            horizon,
+            breakpoints,
+            breakpoints_availability,
+            ressource_renewable,
+            minimum_starting_time_array,
+        )
+        unfeasible[i] = unfeasible_i
+    return ends, unfeasible
+
+
+@jit_kernel
+def _fits_on_profile(times, avail, nb_points, start, end, consumption):
+    # True if the resources of the profile cover the consumption on [start, end)
+    j = np.searchsorted(times[:nb_points], start, side="right") - 1
+    while j < nb_points and times[j] < end:
+        for res in range(avail.shape[0]):
+            if avail[res, j] < consumption[res]:
+                return False
+        j += 1
+    return True
+
+
+@jit_kernel
+def sgs_fast_parallel_arrays(
+    permutation_task,
+    modes_array,
+    starts,
+    ends,
+    order,
+    consumption_array,
+    duration_array,
+    predecessors_count,
+    successors_ptr,
+    successors_index,
+    horizon,
+    breakpoints,
+    breakpoints_availability,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Parallel SGS writing the schedule into preallocated arrays, see sgs_fast_parallel.
+
+    Same arguments and outputs as sgs_fast_event_arrays.
+    """
+    nb_task = permutation_task.shape[0]
+    nb_res = breakpoints_availability.shape[0]
+    capacity = breakpoints.shape[0] + 2 * nb_task + 1
+    times = np.zeros(capacity, dtype=np.int64)
+    avail = np.zeros((nb_res, capacity), dtype=np.int64)
+    nb_points = breakpoints.shape[0]
+    for k in range(nb_points):
+        times[k] = breakpoints[k]
+        for res in range(nb_res):
+            avail[res, k] = breakpoints_availability[res, k]
+    position = np.zeros(nb_task, dtype=np.int64)
+    for i in range(nb_task):
+        position[permutation_task[i]] = i
+    pred_links = np.zeros(nb_task, dtype=np.int64)
+    minimum_starting_time = np.zeros(nb_task, dtype=np.int64)
+    eligible = [np.int64(x) for x in range(0)]
+    for i in range(nb_task):
+        pred_links[i] = predecessors_count[i]
+        minimum_starting_time[i] = minimum_starting_time_array[i]
+    for i in range(nb_task):
+        if pred_links[permutation_task[i]] == 0:
+            heapq.heappush(eligible, np.int64(i))
+    for i in range(nb_task):
+        starts[i] = -1
+        ends[i] = -1
+    done = 0
+    unfeasible_non_renewable_resources = False
+    current_time = 0
+    while len(eligible) > 0:
+        # decision point: the eligible tasks are started in the order of the permutation
+        # if they fit, the successors of tasks with null duration being eligible right away
+        next_time = -1
+        postponed = [np.int64(x) for x in range(0)]
+        while len(eligible) > 0:
+            index = heapq.heappop(eligible)
+            act_id = permutation_task[index]
+            mode = modes_array[act_id]
+            end = current_time + duration_array[act_id, mode]
+            if minimum_starting_time[act_id] > current_time:
+                postponed.append(index)
+                if next_time == -1 or minimum_starting_time[act_id] < next_time:
+                    next_time = minimum_starting_time[act_id]
+                continue
+            if end > horizon:
+                unfeasible_non_renewable_resources = True
+                break
+            # as in the serial sgs, tasks with null duration do not use renewable resources
+            if duration_array[act_id, mode] > 0 and not _fits_on_profile(
+                times,
+                avail,
+                nb_points,
+                current_time,
+                end,
+                consumption_array[act_id, mode],
+            ):
+                postponed.append(index)
+                continue
+            k_start = nb_points
+            if current_time < horizon:
+                k_start, nb_points = _insert_breakpoint(
+                    times, avail, nb_points, current_time
+                )
+            k_end = nb_points
+            if end < horizon:
+                k_end, nb_points = _insert_breakpoint(times, avail, nb_points, end)
+            for res in range(nb_res):
+                consumption = consumption_array[act_id, mode, res]
+                if ressource_renewable[res]:
+                    for k in range(k_start, k_end):
+                        avail[res, k] -= consumption
+                else:
+                    for k in range(k_start, nb_points):
+                        avail[res, k] -= consumption
+                    if avail[res, nb_points - 1] < 0:
+                        unfeasible_non_renewable_resources = True
+                        break
+            if unfeasible_non_renewable_resources:
+                break
+            starts[act_id] = current_time
+            ends[act_id] = end
+            order[done] = act_id
+            done += 1
+            for s in range(successors_ptr[act_id], successors_ptr[act_id + 1]):
+                succ = successors_index[s]
+                minimum_starting_time[succ] = max(minimum_starting_time[succ], end)
+                pred_links[succ] -= 1
+                if pred_links[succ] == 0:
+                    heapq.heappush(eligible, position[succ])
+        if unfeasible_non_renewable_resources or len(postponed) == 0:
+            break
+        for index in postponed:
+            heapq.heappush(eligible, index)
+        # next decision point: end of a task, change of the resources availability or release date
+        k = np.searchsorted(times[:nb_points], current_time, side="right")
+        if k < nb_points and (next_time == -1 or times[k] < next_time):
+            next_time = times[k]
+        if next_time == -1:
+            # the availability does not change anymore, postponed tasks never fit
+            unfeasible_non_renewable_resources = True
+            break
+        current_time = next_time
+    return done, unfeasible_non_renewable_resources
+
+
+@jit_kernel
+def sgs_fast_parallel(
+    permutation_task,
+    modes_array,
+    consumption_array,
+    duration_array,
+    predecessors_count,
+    successors_ptr,
+    successors_index,
+    horizon,
+    breakpoints,
+    breakpoints_availability,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Parallel SGS working on a resource profile made of breakpoints.
+
+    Time driven: at each decision point (end of a task, change of the resources availability
+    or release date), the eligible tasks are started in the order of the permutation as long as
+    they fit. Same inputs and output as sgs_fast_event.
+    """
+    nb_task = permutation_task.shape[0]
+    starts = np.empty(nb_task, dtype=np.int64)
+    ends = np.empty(nb_task, dtype=np.int64)
+    order = np.empty(nb_task, dtype=np.int64)
+    done, unfeasible_non_renewable_resources = sgs_fast_parallel_arrays(
+        permutation_task,
+        modes_array,
+        starts,
+        ends,
+        order,
+        consumption_array,
+        duration_array,
+        predecessors_count,
+        successors_ptr,
+        successors_index,
+        horizon,
+        breakpoints,
+        breakpoints_availability,
+        ressource_renewable,
+        minimum_starting_time_array,
+    )
+    rcpsp_schedule = {}
+    for act_id in order[:done]:
+        rcpsp_schedule[act_id] = (starts[act_id], ends[act_id])
+    return rcpsp_schedule, unfeasible_non_renewable_resources
+
+
+@jit_kernel(parallel=True)
+def sgs_fast_parallel_batch(
+    permutations_task,  # array(individual, task)->task index
+    modes_arrays,  # array(individual, task)->0, 1...
+    consumption_array,
+    duration_array,
+    predecessors_count,
+    successors_ptr,
+    successors_index,
+    horizon,
+    breakpoints,
+    breakpoints_availability,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Run the parallel SGS on a batch of individuals in parallel, see sgs_fast_event_batch."""
+    nb_individuals = permutations_task.shape[0]
+    makespans = np.zeros(nb_individuals, dtype=np.int64)
+    unfeasible = np.zeros(nb_individuals, dtype=np.bool_)
+    nb_task = permutations_task.shape[1]
+    for i in prange(nb_individuals):
+        starts = np.empty(nb_task, dtype=np.int64)
+        ends = np.empty(nb_task, dtype=np.int64)
+        order = np.empty(nb_task, dtype=np.int64)
+        done, unfeasible_i = sgs_fast_parallel_arrays(
+            permutations_task[i],
+            modes_arrays[i],
+            starts,
+            ends,
+            order,
+            consumption_array,
+            duration_array,
+            predecessors_count,
+            successors_ptr,
+            successors_index,
+            horizon,
+            breakpoints,
+            breakpoints_availability,
+            ressource_renewable,
+            minimum_starting_time_array,
+        )
+        makespan = 0
+        for act_id in order[:done]:
+            makespan = max(makespan, ends[act_id])
+        makespans[i] = makespan
+        unfeasible[i] = unfeasible_i
+    return makespans, unfeasible
+
+
+@jit_kernel
+def sgs_fast_partial_schedule_incomplete_permutation_tasks_csr(
+    current_time,
+    permutation_task,
+    modes_array,
+    completed_task_indicator,
+    completed_task_times,
+    scheduled_task,
+    consumption_array,
+    duration_array,
+    predecessors_count,  # array(task)->number of predecessors
+    successors_ptr,  # CSR pointers of successors lists
+    successors_index,  # CSR successors indexes
+    horizon,
+    ressource_available,
+    ressource_renewable,
+    minimum_starting_time_array,
+):
+    """Partial serial SGS taking precedences in CSR format.
+
+    Same inputs and output as sgs_fast_partial_schedule_incomplete_permutation_tasks,
+    the dense precedence matrices being replaced by predecessors_count, successors_ptr
+    and successors_index.
+    """
+    activity_end_times = {}
+    unfeasible_non_renewable_resources = False
+    new_horizon = horizon
+    resource_avail_in_time = {}
+    for index in range(ressource_available.shape[0]):
+        resource_avail_in_time[index] = np.copy(
+            ressource_available[index][: new_horizon + 1]
+        )
+    nb_all_tasks = successors_ptr.shape[0] - 1
+    nb_task = permutation_task.shape[0]
+    # position of the tasks in the permutation, -1 for tasks absent from it
+    position = -np.ones(nb_all_tasks, dtype=np.int64)
+    minimum_starting_time = np.zeros(nb_all_tasks, dtype=np.int64)
+    pred_links = np.zeros(nb_task, dtype=np.int64)
+    for act in range(nb_task):
+        position[permutation_task[act]] = act
+        minimum_starting_time[permutation_task[act]] = max(
+            current_time, minimum_starting_time_array[act]
+        )
+        pred_links[act] = predecessors_count[permutation_task[act]]
+    done = 0
+    done_np = np.zeros(nb_all_tasks, dtype=np.int32)
+    for t in range(nb_task):
+        activity_end_times[t] = 0
+    for t in range(nb_task):
+        if scheduled_task[t] != -1:
+            activity_end_times[t] = (
+                scheduled_task[t] + duration_array[t, modes_array[t]]
+            )
+            for res in range(ressource_available.shape[0]):
+                if ressource_renewable[res]:
+                    resource_avail_in_time[res][
+                        scheduled_task[t] : activity_end_times[t]
+                    ] -= consumption_array[t, modes_array[t], res]
+                else:
+                    resource_avail_in_time[res][
+                        scheduled_task[t] :
+                    ] -= consumption_array[t, modes_array[t], res]
+                    if resource_avail_in_time[res][-1] < 0:
+                        unfeasible_non_renewable_resources = True
+                        break
+            if unfeasible_non_renewable_resources:
+                break
+            for k in range(successors_ptr[t], successors_ptr[t + 1]):
+                s = successors_index[k]
+                if position[s] != -1:
+                    minimum_starting_time[s] = max(
+                        minimum_starting_time[s], activity_end_times[t]
+                    )
+                    pred_links[position[s]] -= 1
+            done += 1
+            done_np[t] = 1
+        if completed_task_indicator[t] == 1:
+            done += 1
+            done_np[t] = 1
+            activity_end_times[t] = completed_task_times[t]
+            for k in range(successors_ptr[t], successors_ptr[t + 1]):
+                s = successors_index[k]
+                if position[s] != -1:
+                    minimum_starting_time[s] = max(
+                        minimum_starting_time[s], activity_end_times[t]
+                    )
+                    pred_links[position[s]] -= 1
+
+    while done < nb_task and not unfeasible_non_renewable_resources:
+        act_id = 0
+        found = False
+        for i in range(nb_task):
+            if pred_links[i] == 0 and done_np[permutation_task[i]] == 0:
+                act_id = permutation_task[i]
+                found = True
+                break
+        if not found:
+            break
+        current_min_time = minimum_starting_time[act_id]
+        valid = False
+        while not valid:
+            valid = True
+            end_time = current_min_time + duration_array[act_id, modes_array[act_id]]
+            for t in range(current_min_time, end_time):
+                for res in range(ressource_available.shape[0]):
+                    if t < new_horizon:
+                        if (
+                            resource_avail_in_time[res][t]
+                            < consumption_array[act_id, modes_array[act_id], res]
+                        ):
+                            valid = False
+                            break
+                    else:
+                        unfeasible_non_renewable_resources = True
+                        break
+            if not valid:
+                current_min_time += 1
+        if unfeasible_non_renewable_resources:
+            break
+        end_t = current_min_time + duration_array[act_id, modes_array[act_id]]
+        for res in range(ressource_available.shape[0]):
+            if ressource_renewable[res]:
+                resource_avail_in_time[res][
+                    current_min_time:end_t
+                ] -= consumption_array[act_id, modes_array[act_id], res]
+            else:
+                resource_avail_in_time[res][current_min_time:] -= consumption_array[
+                    act_id, modes_array[act_id], res
+                ]
+                if resource_avail_in_time[res][-1] < 0:
+                    unfeasible_non_renewable_resources = True
+                    break
+        if unfeasible_non_renewable_resources:
+            break
+        activity_end_times[act_id] = end_t
+        done_np[act_id] = 1
+        done += 1
+        for k in range(successors_ptr[act_id], successors_ptr[act_id + 1]):
+            s = successors_index[k]
+            if position[s] != -1:
+                minimum_starting_time[s] = max(
+                    minimum_starting_time[s], activity_end_times[act_id]
+                )
+                pred_links[position[s]] -= 1
     rcpsp_schedule = {}
     for act_id in activity_end_times:
         rcpsp_schedule[act_id] = (
             activity_end_times[act_id] - duration_array[act_id, modes_array[act_id]],
             activity_end_times[act_id],
         )
+
     return rcpsp_schedule, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_preemptive(
     permutation_task,
     modes_array,  # permutation_task=array(task)->task index
@@ -255,7 +1024,7 @@ def sgs_fast_preemptive(
     return starts_dict, ends_dict, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_preemptive_some_special_constraints(
     permutation_task,
     modes_array,  # permutation_task=array(task)->task index
@@ -439,7 +1208,7 @@ def sgs_fast_preemptive_some_special_constraints(
     return starts_dict, ends_dict, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_preemptive_minduration(
     permutation_task,
     modes_array,  # permutation_task=array(task)->task index
@@ -591,7 +1360,7 @@ def sgs_fast_preemptive_minduration(
     return starts_dict, ends_dict, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_partial_schedule(
     current_time,
     permutation_task,
@@ -725,7 +1494,7 @@ def sgs_fast_partial_schedule(
     return rcpsp_schedule, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_partial_schedule_incomplete_permutation_tasks(
     current_time,
     permutation_task,
@@ -868,7 +1637,7 @@ def sgs_fast_partial_schedule_incomplete_permutation_tasks(
     return rcpsp_schedule, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_partial_schedule_preemptive(
     current_time,
     permutation_task,
@@ -1058,7 +1827,7 @@ def sgs_fast_partial_schedule_preemptive(
     return starts_dict, ends_dict, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_partial_schedule_preemptive_minduration(
     current_time,
     permutation_task,
@@ -1267,7 +2036,7 @@ def sgs_fast_partial_schedule_preemptive_minduration(
     return starts_dict, ends_dict, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def compute_mean_ressource(
     modes_array,
     consumption_array,
@@ -1310,7 +2079,7 @@ def compute_mean_ressource(
     return mean_resource_reserve
 
 
-@njit
+@jit_kernel
 def compute_ressource_consumption(
     modes_array,
     consumption_array,
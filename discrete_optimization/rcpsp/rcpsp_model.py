@@ -7,11 +7,20 @@ from collections import defaultdict
 from copy import deepcopy
 from enum import Enum
 from functools import partial
-from typing import Dict, Hashable, Iterable, List, Sequence, Tuple, Type, Union
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.stats import poisson, randint, rv_discrete
 from sortedcontainers import SortedDict
 
 from discrete_optimization.generic_tools.do_problem import (
@@ -29,14 +38,36 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeObjective,
 )
 from discrete_optimization.generic_tools.graph_api import Graph
+from discrete_optimization.generic_tools.jit_kernels import register_warm_up
 from discrete_optimization.rcpsp.fast_function_rcpsp import (
+    build_successors_csr,
     compute_mean_ressource,
+    compute_resource_breakpoints,
+    dense_precedences_from_csr,
     sgs_fast,
+    sgs_fast_arrays,
+    sgs_fast_event,
+    sgs_fast_event_arrays,
+    sgs_fast_event_batch,
+    sgs_fast_event_scenarios,
+    sgs_fast_parallel,
+    sgs_fast_parallel_arrays,
+    sgs_fast_parallel_batch,
     sgs_fast_partial_schedule_incomplete_permutation_tasks,
+    sgs_fast_partial_schedule_incomplete_permutation_tasks_csr,
 )
+from discrete_optimization.rcpsp.rcpsp_schedule import ArraySchedule
 
 logger = logging.getLogger(__name__)
 
+# Instances with at least this number of tasks or this horizon use by default the
+# event based sgs kernel, see `use_event_based_sgs()`.
+EVENT_SGS_MIN_NB_TASKS = 1000
+EVENT_SGS_MIN_HORIZON = 10000
+
+# Makespan given to solutions whose schedule could not be completed.
+UNFEASIBLE_MAKESPAN = 99999999
+
 
 def tree():
     return defaultdict(tree)
@@ -55,7 +86,8 @@ class TaskDetails:
 
 class RCPSPSolution(Solution):
     rcpsp_permutation: Union[List[int], np.array]
-    rcpsp_schedule: Dict[Hashable, Dict]
+    # dictionary, or ArraySchedule view when computed by the fast sgs
+    rcpsp_schedule: Mapping[Hashable, Dict]
     rcpsp_modes: List[int]
     standardised_permutation: Union[List[int], np.array]
 
@@ -68,8 +100,13 @@ class RCPSPSolution(Solution):
         rcpsp_schedule_feasible=None,
         standardised_permutation=None,
         fast=True,
+        sgs: Optional[ScheduleGenerationScheme] = None,
     ):
         self.problem = problem
+        # schedule generation scheme decoding the permutation, by default the one of the problem
+        if sgs is None:
+            sgs = getattr(problem, "sgs", ScheduleGenerationScheme.SERIAL_SGS)
+        self.sgs = sgs
         self.rcpsp_permutation = rcpsp_permutation
         self.rcpsp_schedule = rcpsp_schedule
         self._schedule_to_recompute = rcpsp_schedule is None
@@ -93,7 +130,7 @@ class RCPSPSolution(Solution):
                 self._schedule_to_recompute = False
         if rcpsp_schedule is None:
             if not isinstance(problem, Aggreg_RCPSPModel):
-                self.generate_schedule_from_permutation_serial_sgs(do_fast=fast)
+                self.generate_schedule_from_permutation(do_fast=fast)
         if self.standardised_permutation is None:
             if not isinstance(problem, Aggreg_RCPSPModel):
                 self.standardised_permutation = (
@@ -122,6 +159,7 @@ class RCPSPSolution(Solution):
             rcpsp_schedule_feasible=self.rcpsp_schedule_feasible,
             standardised_permutation=self.standardised_permutation,
             fast=self.fast,
+            sgs=self.sgs,
         )
 
     def lazy_copy(self):
@@ -133,6 +171,7 @@ class RCPSPSolution(Solution):
             rcpsp_schedule_feasible=self.rcpsp_schedule_feasible,
             standardised_permutation=self.standardised_permutation,
             fast=self.fast,
+            sgs=self.sgs,
         )
 
     def __str__(self):
@@ -144,11 +183,15 @@ class RCPSPSolution(Solution):
         return val
 
     def generate_permutation_from_schedule(self):
-        sorted_task = [
-            self.problem.index_task_non_dummy[i]
-            for i in sorted(
+        if isinstance(self.rcpsp_schedule, ArraySchedule):
+            sorted_tasks = self.rcpsp_schedule.tasks_sorted_by_start_time()
+        else:
+            sorted_tasks = sorted(
                 self.rcpsp_schedule, key=lambda x: self.rcpsp_schedule[x]["start_time"]
             )
+        sorted_task = [
+            self.problem.index_task_non_dummy[i]
+            for i in sorted_tasks
             if i in self.problem.index_task_non_dummy
         ]
         return sorted_task
@@ -163,16 +206,15 @@ class RCPSPSolution(Solution):
                 return 0.0
             last_activity = self.problem.sink_task
             makespan = self.rcpsp_schedule[last_activity]["end_time"]
-            if max(self.rcpsp_modes) > self.problem.max_number_of_mode:
+            modes_array = self.problem.build_mode_array(self.rcpsp_modes)
+            if not self.problem.are_existing_modes(modes_array):
                 # non existing modes
                 return 0.0
             else:
                 return self.problem.compute_mean_resource(
                     horizon=makespan,
-                    modes_array=np.array(
-                        self.problem.build_mode_array(self.rcpsp_modes)
-                    )
-                    - 1,  # permutation_task=array(task)->task index
+                    # permutation_task=array(task)->task index
+                    modes_array=modes_array - 1,
                     start_array=np.array(
                         [
                             self.rcpsp_schedule[t]["start_time"]
@@ -187,34 +229,63 @@ class RCPSPSolution(Solution):
                     ),
                 )
 
+    def generate_schedule_from_permutation(self, do_fast=True):
+        """Compute the schedule with the schedule generation scheme of the solution."""
+        if self.sgs == ScheduleGenerationScheme.PARALLEL_SGS:
+            self.generate_schedule_from_permutation_parallel_sgs()
+        else:
+            self.generate_schedule_from_permutation_serial_sgs(do_fast=do_fast)
+
+    def generate_schedule_from_permutation_parallel_sgs(self):
+        """Compute the schedule with the parallel sgs kernel (see `sgs_fast_parallel()`)."""
+        self.problem.check_parallel_sgs_supported()
+        self._set_schedule_from_sgs_arrays(self.problem.func_sgs_parallel_arrays)
+
+    def _set_schedule_from_sgs_arrays(self, func_sgs_arrays) -> None:
+        """Compute the schedule with a sgs kernel writing into arrays, stored as an ArraySchedule.
+
+        The sink task is given the makespan UNFEASIBLE_MAKESPAN when it could not be scheduled.
+        """
+        n_jobs = self.problem.n_jobs
+        starts = np.empty(n_jobs, dtype=np.int64)
+        ends = np.empty(n_jobs, dtype=np.int64)
+        # one more slot for the sink task when it is not scheduled
+        order = np.empty(n_jobs + 1, dtype=np.int64)
+        modes_array = self.problem.build_mode_array(self.rcpsp_modes)
+        if not self.problem.are_existing_modes(modes_array):
+            # non existing modes
+            starts[:] = -1
+            ends[:] = -1
+            nb_scheduled, unfeasible = 0, True
+        else:
+            nb_scheduled, unfeasible = func_sgs_arrays(
+                permutation_task=permutation_do_to_permutation_sgs_fast(
+                    self.problem, self.rcpsp_permutation
+                ),
+                modes_array=modes_array - 1,
+                starts=starts,
+                ends=ends,
+                order=order,
+            )
+        index_sink = self.problem.index_task[self.problem.sink_task]
+        if starts[index_sink] < 0:
+            starts[index_sink] = UNFEASIBLE_MAKESPAN
+            ends[index_sink] = UNFEASIBLE_MAKESPAN
+            order[nb_scheduled] = index_sink
+            nb_scheduled += 1
+        self.rcpsp_schedule = ArraySchedule(
+            tasks_list=self.problem.tasks_list,
+            index_task=self.problem.index_task,
+            starts=starts,
+            ends=ends,
+            order=order[:nb_scheduled],
+        )
+        self.rcpsp_schedule_feasible = not unfeasible
+        self._schedule_to_recompute = False
+
     def generate_schedule_from_permutation_serial_sgs(self, do_fast=True):
         if do_fast:
-            if max(self.rcpsp_modes) > self.problem.max_number_of_mode:
-                # non existing modes
-                schedule, unfeasible = {}, True
-            else:
-                schedule, unfeasible = self.problem.func_sgs(
-                    permutation_task=permutation_do_to_permutation_sgs_fast(
-                        self.problem, self.rcpsp_permutation
-                    ),
-                    modes_array=np.array(
-                        self.problem.build_mode_array(self.rcpsp_modes)
-                    )
-                    - 1,
-                )
-            self.rcpsp_schedule_feasible = not unfeasible
-            self.rcpsp_schedule = {}
-            for k in schedule:
-                self.rcpsp_schedule[self.problem.tasks_list[k]] = {
-                    "start_time": schedule[k][0],
-                    "end_time": schedule[k][1],
-                }
-            if self.problem.sink_task not in self.rcpsp_schedule:
-                self.rcpsp_schedule[self.problem.sink_task] = {
-                    "start_time": 99999999,
-                    "end_time": 99999999,
-                }
-            self._schedule_to_recompute = False
+            self._set_schedule_from_sgs_arrays(self.problem.func_sgs_arrays)
         else:
             schedule, feasible = generate_schedule_from_permutation_serial_sgs(
                 solution=self, rcpsp_problem=self.problem
@@ -235,7 +306,8 @@ class RCPSPSolution(Solution):
         if scheduled_tasks_start_times is None:
             scheduled_tasks_start_times = None
         if do_fast:
-            if max(self.rcpsp_modes) > self.problem.max_number_of_mode:
+            modes_array = self.problem.build_mode_array(self.rcpsp_modes)
+            if not self.problem.are_existing_modes(modes_array):
                 # non existing modes
                 schedule, unfeasible = {}, True
             else:
@@ -266,10 +338,7 @@ class RCPSPSolution(Solution):
                     permutation_task=permutation_do_to_permutation_sgs_fast(
                         self.problem, self.rcpsp_permutation
                     ),
-                    modes_array=np.array(
-                        self.problem.build_mode_array(self.rcpsp_modes)
-                    )
-                    - 1,
+                    modes_array=modes_array - 1,
                 )
             self.rcpsp_schedule = {}
             for k in schedule:
@@ -300,12 +369,18 @@ class RCPSPSolution(Solution):
             self._schedule_to_recompute = False
 
     def get_max_end_time(self):
+        if isinstance(self.rcpsp_schedule, ArraySchedule):
+            return self.rcpsp_schedule.get_max_end_time()
         return max([self.get_end_time(x) for x in self.rcpsp_schedule])
 
     def get_start_time(self, task):
+        if isinstance(self.rcpsp_schedule, ArraySchedule):
+            return self.rcpsp_schedule.get_start_time(task)
         return self.rcpsp_schedule.get(task, {"start_time": None})["start_time"]
 
     def get_end_time(self, task):
+        if isinstance(self.rcpsp_schedule, ArraySchedule):
+            return self.rcpsp_schedule.get_end_time(task)
         return self.rcpsp_schedule.get(task, {"end_time": None})["end_time"]
 
     def get_start_times_list(self, task):
@@ -384,6 +459,7 @@ class RCPSPModel(Problem):
         source_task=None,
         sink_task=None,
         name_task: Dict[int, str] = None,
+        np_data: Optional[Dict[str, np.ndarray]] = None,
         **args,
     ):
         self.resources = resources
@@ -435,23 +511,101 @@ class RCPSPModel(Problem):
             )
             if not self.is_calendar:
                 self.resources = {r: int(self.resources[r][0]) for r in self.resources}
-        (
-            self.func_sgs,
-            self.func_sgs_2,
-            self.compute_mean_resource,
-        ) = create_np_data_and_jit_functions(self)
+        self.index_tasks_non_dummy = np.array(
+            [self.index_task[t] for t in self.tasks_list_non_dummy], dtype=np.int32
+        )
+        # numpy data (see create_np_data()) can be given when already available,
+        # e.g. when loading a saved model
+        if np_data is None:
+            np_data = create_np_data(self)
+        self.np_data = np_data
+        self._build_sgs_functions()
+        # default schedule generation scheme of the solutions
+        self.sgs = args.get("sgs", ScheduleGenerationScheme.SERIAL_SGS)
         self.costs = {
             "makespan": True,
             "mean_resource_reserve": args.get("mean_resource_reserve", False),
         }
-        self.graph = self.compute_graph()
-
-    def update_functions(self):
+        self._graph: Optional[Graph] = None
+
+    @property
+    def graph(self) -> Graph:
+        """Precedence graph, computed at first use."""
+        if self._graph is None:
+            self._graph = self.compute_graph()
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Graph) -> None:
+        self._graph = graph
+
+    def _build_sgs_functions(self):
+        """Build all the sgs functions from the numpy data of the problem."""
+        use_event_sgs = use_event_based_sgs(self)
+        dense_precedences = None
+        if not use_event_sgs:
+            # shared by the sgs writing into dictionaries and into arrays
+            dense_precedences = dense_precedences_from_csr(
+                self.np_data["successors_ptr"], self.np_data["successors_index"]
+            )
         (
             self.func_sgs,
             self.func_sgs_2,
             self.compute_mean_resource,
-        ) = create_np_data_and_jit_functions(rcpsp_problem=self)
+            self.func_sgs_batch,
+        ) = create_jit_functions(
+            self,
+            np_data=self.np_data,
+            use_event_sgs=use_event_sgs,
+            dense_precedences=dense_precedences,
+        )
+        (
+            self.func_sgs_parallel,
+            self.func_sgs_parallel_batch,
+        ) = create_parallel_sgs_functions(self, np_data=self.np_data)
+        (
+            self.func_sgs_arrays,
+            self.func_sgs_parallel_arrays,
+        ) = create_sgs_arrays_functions(
+            self,
+            np_data=self.np_data,
+            use_event_sgs=use_event_sgs,
+            dense_precedences=dense_precedences,
+        )
+
+    def update_functions(self, modified_fields: Optional[Iterable[str]] = None):
+        """Rebuild the numpy data and the sgs functions after a modification of the problem.
+
+        Args:
+            modified_fields: names of the modified fields (see `np_data_builders`), e.g. ["mode_details"].
+                Only the numpy arrays depending on them are rebuilt. By default, everything is rebuilt.
+
+        """
+        self.np_data = create_np_data(
+            self, np_data=self.np_data, modified_fields=modified_fields
+        )
+        self._build_sgs_functions()
+        if modified_fields is None or not {"mode_details", "successors"}.isdisjoint(
+            modified_fields
+        ):
+            self._graph = None
+
+    def _copy_sharing_compiled_data(self, cls: Type["RCPSPModel"]) -> "RCPSPModel":
+        """Copy the problem as an instance of cls, without rebuilding its numpy data.
+
+        The numpy data, sgs functions and precedence graph are shared with the original problem
+        and must not be modified in place. mode_details and successors are copied, so that they can
+        be modified on the copy, update_functions() being then called to take them into account.
+
+        """
+        model = cls.__new__(cls)
+        model.__dict__.update(self.__dict__)
+        model.mode_details = copy_mode_details(self.mode_details)
+        model.successors = {
+            task: list(self.successors[task]) for task in self.successors
+        }
+        model.costs = dict(self.costs)
+        return model
 
     def is_rcpsp_multimode(self):
         return self.is_multimode
@@ -465,6 +619,20 @@ class RCPSPModel(Problem):
     def is_multiskill(self):
         return False
 
+    def has_special_constraints(self):
+        return False
+
+    def check_parallel_sgs_supported(self) -> None:
+        """Raise an error if the parallel sgs kernel cannot decode the solutions of the problem.
+
+        The kernel only handles precedences and resources, not special constraints or preemption.
+        """
+        if self.has_special_constraints() or self.is_preemptive():
+            raise NotImplementedError(
+                "The parallel sgs does not handle special constraints and preemption, "
+                "use ScheduleGenerationScheme.SERIAL_SGS for this problem."
+            )
+
     def get_resource_names(self):
         return self.resources_list
 
@@ -498,7 +666,7 @@ class RCPSPModel(Problem):
 
     def evaluate_function(self, rcpsp_sol: RCPSPSolution):
         if rcpsp_sol._schedule_to_recompute:
-            rcpsp_sol.generate_schedule_from_permutation_serial_sgs()
+            rcpsp_sol.generate_schedule_from_permutation()
         makespan = rcpsp_sol.rcpsp_schedule[self.sink_task]["end_time"]
         if self.costs["mean_resource_reserve"]:
             obj_mean_resource_reserve = rcpsp_sol.compute_mean_resource_reserve()
@@ -515,6 +683,78 @@ class RCPSPModel(Problem):
             return objectives
         return None
 
+    def evaluate_batch_from_encoding(
+        self, int_vectors: np.ndarray, encoding_name: str
+    ) -> Optional[List[Dict[str, float]]]:
+        """Batch version of `evaluate_from_encoding()`.
+
+        Returns: the objectives of each individual, or None if the encoding or the objectives
+            are not supported by the batch evaluation.
+
+        """
+        if encoding_name != "rcpsp_permutation":
+            return None
+        return self._objectives_from_batch(permutations=int_vectors, modes=None)
+
+    def _objectives_from_batch(
+        self, permutations: np.ndarray, modes: Optional[np.ndarray]
+    ) -> Optional[List[Dict[str, float]]]:
+        if self.costs["mean_resource_reserve"]:
+            return None
+        makespans, _ = self.evaluate_batch(permutations=permutations, modes=modes)
+        return [
+            {"makespan": int(makespan), "mean_resource_reserve": 0}
+            for makespan in makespans
+        ]
+
+    def evaluate_batch(
+        self, permutations: np.ndarray, modes: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the makespan of a batch of solutions with the sgs of the problem, in parallel.
+
+        Args:
+            permutations: array(individual, n_jobs_non_dummy) of permutations,
+                as in `RCPSPSolution.rcpsp_permutation`
+            modes: array(individual, n_jobs_non_dummy) of modes, as in `RCPSPSolution.rcpsp_modes`,
+                or a single modes list used for every individual. By default, first mode for every task.
+
+        Returns: makespans, feasible arrays. Unfeasible individuals get the makespan
+            given by `evaluate()` for them.
+
+        """
+        permutations = np.asarray(permutations, dtype=np.int32).reshape(
+            (-1, self.n_jobs_non_dummy)
+        )
+        nb_individuals = permutations.shape[0]
+        if modes is None:
+            modes = np.ones((nb_individuals, self.n_jobs_non_dummy), dtype=np.int32)
+        else:
+            modes = np.broadcast_to(
+                np.asarray(modes, dtype=np.int32),
+                (nb_individuals, self.n_jobs_non_dummy),
+            )
+        nb_modes = self.np_data["nb_modes_array"][self.index_tasks_non_dummy]
+        existing_modes = np.all((modes >= 1) & (modes <= nb_modes), axis=1)
+        permutations_task = np.empty((nb_individuals, self.n_jobs), dtype=np.int32)
+        permutations_task[:, 0] = self.index_task[self.source_task]
+        permutations_task[:, 1:-1] = self.index_tasks_non_dummy[permutations]
+        permutations_task[:, -1] = self.index_task[self.sink_task]
+        modes_arrays = np.zeros((nb_individuals, self.n_jobs), dtype=np.int32)
+        modes_arrays[:, self.index_tasks_non_dummy] = modes - 1
+        # non existing modes are not given to the sgs
+        modes_arrays[~existing_modes, :] = 0
+        if self.sgs == ScheduleGenerationScheme.PARALLEL_SGS:
+            self.check_parallel_sgs_supported()
+            func_sgs_batch = self.func_sgs_parallel_batch
+        else:
+            func_sgs_batch = self.func_sgs_batch
+        makespans, unfeasible = func_sgs_batch(
+            permutations_task=permutations_task, modes_arrays=modes_arrays
+        )
+        feasible = ~unfeasible & existing_modes
+        makespans[~feasible] = UNFEASIBLE_MAKESPAN
+        return makespans, feasible
+
     def evaluate(self, rcpsp_sol: RCPSPSolution) -> Dict[str, float]:
         obj_makespan, obj_mean_resource_reserve = self.evaluate_function(rcpsp_sol)
         return {
@@ -541,13 +781,15 @@ class RCPSPModel(Problem):
         return modes_dict
 
     def build_mode_array(self, rcpsp_modes_from_solution):
-        modes_dict = {
-            self.tasks_list_non_dummy[i]: rcpsp_modes_from_solution[i]
-            for i in range(self.n_jobs_non_dummy)
-        }
-        modes_dict[self.source_task] = 1
-        modes_dict[self.sink_task] = 1
-        return [modes_dict[t] for t in self.tasks_list]
+        modes_array = np.ones(self.n_jobs, dtype=int)
+        modes_array[self.index_tasks_non_dummy] = rcpsp_modes_from_solution
+        return modes_array
+
+    def are_existing_modes(self, modes_array: np.ndarray) -> bool:
+        """Check that each task is given one of its own modes, in an array built by `build_mode_array()`."""
+        return bool(
+            np.all((modes_array >= 1) & (modes_array <= self.np_data["nb_modes_array"]))
+        )
 
     def return_index_task(self, task, offset=0):
         return self.index_task[task] + offset
@@ -560,67 +802,106 @@ class RCPSPModel(Problem):
             modes_dict = self.build_mode_dict(
                 rcpsp_modes_from_solution=rcpsp_sol.rcpsp_modes
             )
-            start_times = [
-                rcpsp_sol.rcpsp_schedule[t]["start_time"]
-                for t in rcpsp_sol.rcpsp_schedule
-            ]
-            for t in start_times:
-                resource_usage = {}
-                for res in self.resources_list:
-                    resource_usage[res] = 0
-                for act_id in rcpsp_sol.rcpsp_schedule:
-                    start = rcpsp_sol.rcpsp_schedule[act_id]["start_time"]
-                    end = rcpsp_sol.rcpsp_schedule[act_id]["end_time"]
-                    mode = modes_dict[act_id]
-                    for res in self.resources_list:
-                        if start <= t < end:
-                            resource_usage[res] += self.mode_details[act_id][mode].get(
-                                res, 0
-                            )
-                for res in self.resources.keys():
-                    if resource_usage[res] > self.get_resource_available(res, t):
-                        logger.debug(
-                            [
-                                act
-                                for act in rcpsp_sol.rcpsp_schedule
-                                if rcpsp_sol.rcpsp_schedule[act]["start_time"]
-                                <= t
-                                < rcpsp_sol.rcpsp_schedule[act]["end_time"]
-                            ]
-                        )
-                        logger.debug(
-                            f"Time step resource violation: time: {t} "
-                            f"res {res} res_usage: {resource_usage[res]}"
-                            f"res_avail: {self.resources[res]}"
-                        )
-                        return False
+            tasks = list(rcpsp_sol.rcpsp_schedule)
+            index_in_schedule = {t: i for i, t in enumerate(tasks)}
+            starts = np.array(
+                [rcpsp_sol.rcpsp_schedule[t]["start_time"] for t in tasks], dtype=int
+            )
+            ends = np.array(
+                [rcpsp_sol.rcpsp_schedule[t]["end_time"] for t in tasks], dtype=int
+            )
+            consumptions = np.array(
+                [
+                    [
+                        self.mode_details[t][modes_dict[t]].get(res, 0)
+                        for res in self.resources_list
+                    ]
+                    for t in tasks
+                ],
+                dtype=int,
+            ).reshape((len(tasks), len(self.resources_list)))
+
+            # Check for resource violation at each time step: usage profile
+            # built from the start/end events of the tasks
+            running = starts < ends
+            nb_time_steps = int(ends[running].max(initial=0))
+            usage = np.zeros((nb_time_steps + 1, len(self.resources_list)), dtype=int)
+            np.add.at(usage, starts[running], consumptions[running])
+            np.add.at(usage, ends[running], -consumptions[running])
+            usage = np.cumsum(usage, axis=0)[:nb_time_steps]
+            availability = np.zeros_like(usage)
+            for k, res in enumerate(self.resources_list):
+                availability[:, k] = self._get_resource_availability_profile(
+                    res, nb_time_steps
+                )
+            violations = usage > availability
+            if violations.any():
+                t, k = np.unravel_index(np.argmax(violations), violations.shape)
+                res = self.resources_list[k]
+                logger.debug(
+                    [
+                        act
+                        for act in tasks
+                        if rcpsp_sol.rcpsp_schedule[act]["start_time"]
+                        <= t
+                        < rcpsp_sol.rcpsp_schedule[act]["end_time"]
+                    ]
+                )
+                logger.debug(
+                    f"Time step resource violation: time: {t} "
+                    f"res {res} res_usage: {usage[t, k]}"
+                    f"res_avail: {availability[t, k]}"
+                )
+                return False
 
             # Check for non-renewable resource violation
             for res in self.non_renewable_resources:
-                usage = 0
-                for act_id in rcpsp_sol.rcpsp_schedule:
-                    mode = modes_dict[act_id]
-                    usage += self.mode_details[act_id][mode][res]
-                    if usage > self.resources[res]:
-                        logger.debug(
-                            f"Non-renewable resource violation: act_id: {act_id}"
-                            f"res {res} res_usage: {usage} res_avail: {self.resources[res]}"
-                        )
-                        return False
+                k = self.resources_list.index(res)
+                cumulated_usage = np.cumsum(consumptions[:, k])
+                exceeding = np.flatnonzero(
+                    cumulated_usage > self.get_max_resource_capacity(res)
+                )
+                if len(exceeding) > 0:
+                    logger.debug(
+                        f"Non-renewable resource violation: act_id: {tasks[exceeding[0]]}"
+                        f"res {res} res_usage: {cumulated_usage[exceeding[0]]} "
+                        f"res_avail: {self.get_max_resource_capacity(res)}"
+                    )
+                    return False
             # Check precedences / successors
-            for act_id in list(self.successors.keys()):
-                for succ_id in self.successors[act_id]:
-                    start_succ = rcpsp_sol.rcpsp_schedule[succ_id]["start_time"]
-                    end_pred = rcpsp_sol.rcpsp_schedule[act_id]["end_time"]
-                    if start_succ < end_pred:
-                        logger.debug(
-                            f"Precedence relationship broken: {act_id} end at {end_pred} "
-                            f"while {succ_id} start at {start_succ}"
-                        )
-                        return False
+            edges = np.array(
+                [
+                    (index_in_schedule[act_id], index_in_schedule[succ_id])
+                    for act_id in self.successors
+                    for succ_id in self.successors[act_id]
+                ],
+                dtype=int,
+            ).reshape((-1, 2))
+            broken = np.flatnonzero(starts[edges[:, 1]] < ends[edges[:, 0]])
+            if len(broken) > 0:
+                act_id, succ_id = (tasks[i] for i in edges[broken[0]])
+                logger.debug(
+                    f"Precedence relationship broken: {act_id} end at {ends[edges[broken[0], 0]]} "
+                    f"while {succ_id} start at {starts[edges[broken[0], 1]]}"
+                )
+                return False
 
             return True
 
+    def _get_resource_availability_profile(self, res, nb_time_steps: int) -> np.ndarray:
+        """Availability of the resource on the time steps [0, nb_time_steps).
+
+        The availability after the end of the resource calendar is the last available value.
+        """
+        availability = np.asarray(self.get_resource_availability_array(res), dtype=int)
+        if len(availability) >= nb_time_steps:
+            return availability[:nb_time_steps]
+        return np.pad(
+            availability,
+            (0, nb_time_steps - len(availability)),
+            mode="edge" if len(availability) > 0 else "constant",
+        )
+
     def __str__(self):
         val = (
             "I'm a RCPSP model with "
@@ -695,6 +976,8 @@ class RCPSPModel(Problem):
         return consumptions
 
     def plot_ressource_view(self, rcpsp_sol: RCPSPSolution):
+        import matplotlib.pyplot as plt
+
         consumption = self.compute_resource_consumption(rcpsp_sol=rcpsp_sol)
         fig, ax = plt.subplots(nrows=len(self.resources_list), sharex=True)
         for i in range(len(self.resources_list)):
@@ -705,13 +988,17 @@ class RCPSPModel(Problem):
             ax[i].legend()
 
     def copy(self):
+        if self.__class__ is RCPSPModel:
+            return self._copy_sharing_compiled_data(RCPSPModel)
+        # subclasses without their own copy() are copied as a plain RCPSPModel,
+        # whose numpy data may differ (e.g. no special constraints)
         return RCPSPModel(
             resources=self.resources,
             tasks_list=self.tasks_list,
             source_task=self.source_task,
             sink_task=self.sink_task,
             non_renewable_resources=self.non_renewable_resources,
-            mode_details=deepcopy(self.mode_details),
+            mode_details=copy_mode_details(self.mode_details),
             successors=deepcopy(self.successors),
             horizon=self.horizon,
             horizon_multiplier=self.horizon_multiplier,
@@ -753,6 +1040,7 @@ class RCPSPModelCalendar(RCPSPModel):
         name_task: Dict[int, str] = None,
         calendar_details: Dict[str, List[List[int]]] = None,
         name_ressource_to_index: Dict[str, int] = None,
+        np_data: Optional[Dict[str, np.ndarray]] = None,
     ):
         super().__init__(
             resources=resources,
@@ -765,6 +1053,7 @@ class RCPSPModelCalendar(RCPSPModel):
             source_task=source_task,
             sink_task=sink_task,
             name_task=name_task,
+            np_data=np_data,
         )
         self.calendar_details = calendar_details
         self.name_ressource_to_index = name_ressource_to_index
@@ -773,82 +1062,163 @@ class RCPSPModelCalendar(RCPSPModel):
         return self.resources.get(res, [0])[time]
 
     def copy(self):
-        return RCPSPModelCalendar(
-            resources={w: deepcopy(self.resources[w]) for w in self.resources},
-            non_renewable_resources=self.non_renewable_resources,
-            mode_details=deepcopy(self.mode_details),
-            successors=deepcopy(self.successors),
-            horizon=self.horizon,
-            horizon_multiplier=self.horizon_multiplier,
-            calendar_details=deepcopy(self.calendar_details),
-            tasks_list=self.tasks_list,
-            source_task=self.source_task,
-            sink_task=self.sink_task,
-            name_task=self.name_task,
-            name_ressource_to_index=self.name_ressource_to_index,
-        )
+        model = self._copy_sharing_compiled_data(RCPSPModelCalendar)
+        model.resources = {w: list(self.resources[w]) for w in self.resources}
+        model.calendar_details = deepcopy(self.calendar_details)
+        return model
+
+
+def use_event_based_sgs(rcpsp_problem: RCPSPModel) -> bool:
+    """Decide if the event based sgs kernel should be used for the given problem.
+
+    The time-step scanning sgs and its dense precedence matrices become too costly
+    on long horizons or on instances with many tasks.
+    """
+    return (
+        rcpsp_problem.n_jobs >= EVENT_SGS_MIN_NB_TASKS
+        or rcpsp_problem.horizon >= EVENT_SGS_MIN_HORIZON
+    )
 
 
 def create_np_data_and_jit_functions(
-    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar]
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar],
+    use_event_sgs: Optional[bool] = None,
 ):
+    """Build the numpy data of the problem and the sgs functions using them.
+
+    Args:
+        rcpsp_problem: problem to compile
+        use_event_sgs: if True, use the event based sgs kernel with precedences in CSR format,
+            if False use the time-step scanning one. By default, chosen according to the size of
+            the instance (see `use_event_based_sgs()`).
+
+    Returns: func_sgs, func_sgs_2, func_compute_mean_resource, func_sgs_batch
+
+    """
+    return create_jit_functions(
+        rcpsp_problem,
+        np_data=create_np_data(rcpsp_problem),
+        use_event_sgs=use_event_sgs,
+    )
+
+
+def create_np_data(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar],
+    np_data: Optional[Dict[str, np.ndarray]] = None,
+    modified_fields: Optional[Iterable[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """Build the numpy arrays describing the problem, used by the sgs kernels.
+
+    Args:
+        rcpsp_problem: problem to compile
+        np_data: numpy data previously built for the problem
+        modified_fields: fields of the problem modified since np_data was built (see `np_data_builders`).
+            If given with np_data, only the arrays depending on them are rebuilt, the other arrays being
+            shared with np_data.
+
+    Returns: dictionary of arrays with keys
+        consumption_array: array(task, mode, res) of resource consumption
+        duration_array: array(task, mode) of durations
+        nb_modes_array: array(task) of number of modes
+        ressource_available: array(res, horizon) of resource availability
+        ressource_renewable: array(res) of booleans
+        successors_ptr, successors_index, predecessors_count: precedences in CSR format,
+            see `build_successors_csr()`
+        minimum_starting_time_array: array(task) of release dates
+        breakpoints, breakpoints_availability: step function of the resource availability,
+            see `compute_resource_breakpoints()`
+
+    """
+    if np_data is None or modified_fields is None:
+        builders = list(dict.fromkeys(np_data_builders.values()))
+        new_np_data = {}
+    else:
+        unknown_fields = set(modified_fields).difference(np_data_builders)
+        if len(unknown_fields) > 0:
+            raise ValueError(
+                f"Numpy data cannot be updated for modified fields {unknown_fields}."
+            )
+        builders = list(dict.fromkeys(np_data_builders[f] for f in modified_fields))
+        new_np_data = dict(np_data)
+    for builder in builders:
+        new_np_data.update(builder(rcpsp_problem))
+    return new_np_data
+
+
+def create_np_data_modes(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar]
+) -> Dict[str, np.ndarray]:
+    n_resources = len(rcpsp_problem.resources_list)
     consumption_array = np.zeros(
-        (
-            rcpsp_problem.n_jobs,
-            rcpsp_problem.max_number_of_mode,
-            len(rcpsp_problem.resources_list),
-        ),
+        (rcpsp_problem.n_jobs, rcpsp_problem.max_number_of_mode, n_resources),
         dtype=np.int32,
     )
     duration_array = np.zeros(
         (rcpsp_problem.n_jobs, rcpsp_problem.max_number_of_mode), dtype=np.int32
     )
-    predecessors = np.zeros(
-        (rcpsp_problem.n_jobs, rcpsp_problem.n_jobs), dtype=np.int32
-    )
-    successors = np.zeros((rcpsp_problem.n_jobs, rcpsp_problem.n_jobs), dtype=np.int32)
-    horizon = rcpsp_problem.horizon
-    ressource_available = np.zeros(
-        (len(rcpsp_problem.resources_list), horizon), dtype=np.int32
+    nb_modes_array = np.zeros(rcpsp_problem.n_jobs, dtype=np.int32)
+    for i, task in enumerate(rcpsp_problem.tasks_list):
+        task_mode_details = rcpsp_problem.mode_details[task]
+        nb_modes_array[i] = len(task_mode_details)
+        for index_mode, mode in enumerate(sorted(task_mode_details)):
+            details = task_mode_details[mode]
+            for k, resource in enumerate(rcpsp_problem.resources_list):
+                consumption_array[i, index_mode, k] = details.get(resource, 0)
+            duration_array[i, index_mode] = details["duration"]
+    return dict(
+        consumption_array=consumption_array,
+        duration_array=duration_array,
+        nb_modes_array=nb_modes_array,
     )
-    ressource_renewable = np.ones((len(rcpsp_problem.resources_list)), dtype=bool)
 
-    for i in range(len(rcpsp_problem.tasks_list)):
-        task = rcpsp_problem.tasks_list[i]
-        index_mode = 0
-        for mode in sorted(
-            rcpsp_problem.mode_details[rcpsp_problem.tasks_list[i]].keys()
-        ):
-            for k in range(len(rcpsp_problem.resources_list)):
-                consumption_array[i, index_mode, k] = rcpsp_problem.mode_details[task][
-                    mode
-                ].get(rcpsp_problem.resources_list[k], 0)
-            duration_array[i, index_mode] = rcpsp_problem.mode_details[task][mode][
-                "duration"
-            ]
-            index_mode += 1
 
-    task_index = {rcpsp_problem.tasks_list[i]: i for i in range(rcpsp_problem.n_jobs)}
-    for k in range(len(rcpsp_problem.resources_list)):
+def create_np_data_resources(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar]
+) -> Dict[str, np.ndarray]:
+    n_resources = len(rcpsp_problem.resources_list)
+    horizon = rcpsp_problem.horizon
+    ressource_available = np.zeros((n_resources, horizon), dtype=np.int32)
+    ressource_renewable = np.ones(n_resources, dtype=bool)
+    for k, resource in enumerate(rcpsp_problem.resources_list):
         if rcpsp_problem.is_varying_resource():
-            ressource_available[k, :] = rcpsp_problem.resources[
-                rcpsp_problem.resources_list[k]
-            ][: ressource_available.shape[1]]
+            ressource_available[k, :] = rcpsp_problem.resources[resource][:horizon]
         else:
-            ressource_available[k, :] = np.full(
-                ressource_available.shape[1],
-                rcpsp_problem.resources[rcpsp_problem.resources_list[k]],
-                dtype=int,
-            )
-        if rcpsp_problem.resources_list[k] in rcpsp_problem.non_renewable_resources:
+            ressource_available[k, :] = rcpsp_problem.resources[resource]
+        if resource in rcpsp_problem.non_renewable_resources:
             ressource_renewable[k] = False
+    breakpoints, breakpoints_availability = compute_resource_breakpoints(
+        ressource_available
+    )
+    return dict(
+        ressource_available=ressource_available,
+        ressource_renewable=ressource_renewable,
+        breakpoints=breakpoints,
+        breakpoints_availability=breakpoints_availability,
+    )
+
+
+def create_np_data_precedences(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar]
+) -> Dict[str, np.ndarray]:
+    task_index = rcpsp_problem.index_task
+    edges = [
+        (i, task_index[s])
+        for i, task in enumerate(rcpsp_problem.tasks_list)
+        for s in rcpsp_problem.successors[task]
+    ]
+    successors_ptr, successors_index, predecessors_count = build_successors_csr(
+        rcpsp_problem.n_jobs, edges
+    )
+    return dict(
+        successors_ptr=successors_ptr,
+        successors_index=successors_index,
+        predecessors_count=predecessors_count,
+    )
+
 
-    for i in range(len(rcpsp_problem.tasks_list)):
-        task = rcpsp_problem.tasks_list[i]
-        for s in rcpsp_problem.successors[task]:
-            index_s = task_index[s]
-            predecessors[index_s, i] = 1
-            successors[i, index_s] = 1
+def create_np_data_release_dates(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar]
+) -> Dict[str, np.ndarray]:
     minimum_starting_time_array = np.zeros(rcpsp_problem.n_jobs, dtype=int)
     if "special_constraints" in rcpsp_problem.__dict__.keys():
         for t in rcpsp_problem.special_constraints.start_times_window:
@@ -856,35 +1226,218 @@ def create_np_data_and_jit_functions(
                 minimum_starting_time_array[
                     rcpsp_problem.index_task[t]
                 ] = rcpsp_problem.special_constraints.start_times_window[t][0]
-    func_sgs = partial(
-        sgs_fast,
+    return dict(minimum_starting_time_array=minimum_starting_time_array)
+
+
+# functions building the numpy data depending on each field of the problem,
+# see `create_np_data()`
+np_data_builders = {
+    "mode_details": create_np_data_modes,
+    "resources": create_np_data_resources,
+    "non_renewable_resources": create_np_data_resources,
+    "horizon": create_np_data_resources,
+    "successors": create_np_data_precedences,
+    "special_constraints": create_np_data_release_dates,
+}
+
+
+def copy_mode_details(
+    mode_details: Dict[Hashable, Dict[int, Dict[str, int]]]
+) -> Dict[Hashable, Dict[int, Dict[str, int]]]:
+    """Copy mode details, much faster than deepcopy as the details are dictionaries of numbers."""
+    return {
+        task: {mode: dict(details) for mode, details in mode_details[task].items()}
+        for task in mode_details
+    }
+
+
+def create_jit_functions(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar],
+    np_data: Dict[str, np.ndarray],
+    use_event_sgs: Optional[bool] = None,
+    dense_precedences: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+):
+    """Build the sgs functions from the numpy data of the problem (see `create_np_data()`).
+
+    Args:
+        rcpsp_problem: problem to compile
+        np_data: numpy data of the problem
+        use_event_sgs: see `create_np_data_and_jit_functions()`
+        dense_precedences: predecessors and successors matrices used by the time-step scanning sgs
+            (see `dense_precedences_from_csr()`), built from np_data if not given
+
+    Returns: func_sgs, func_sgs_2, func_compute_mean_resource, func_sgs_batch
+
+    """
+    if use_event_sgs is None:
+        use_event_sgs = use_event_based_sgs(rcpsp_problem)
+    horizon = rcpsp_problem.horizon
+    consumption_array = np_data["consumption_array"]
+    duration_array = np_data["duration_array"]
+    ressource_available = np_data["ressource_available"]
+    ressource_renewable = np_data["ressource_renewable"]
+    successors_ptr = np_data["successors_ptr"]
+    successors_index = np_data["successors_index"]
+    predecessors_count = np_data["predecessors_count"]
+    minimum_starting_time_array = np_data["minimum_starting_time_array"]
+    breakpoints = np_data["breakpoints"]
+    breakpoints_availability = np_data["breakpoints_availability"]
+    if use_event_sgs:
+        func_sgs = partial(
+            sgs_fast_event,
+            consumption_array=consumption_array,
+            duration_array=duration_array,
+            predecessors_count=predecessors_count,
+            successors_ptr=successors_ptr,
+            successors_index=successors_index,
+            horizon=horizon,
+            breakpoints=breakpoints,
+            breakpoints_availability=breakpoints_availability,
+            ressource_renewable=ressource_renewable,
+            minimum_starting_time_array=minimum_starting_time_array,
+        )
+        func_sgs_2 = partial(
+            sgs_fast_partial_schedule_incomplete_permutation_tasks_csr,
+            consumption_array=consumption_array,
+            duration_array=duration_array,
+            predecessors_count=predecessors_count,
+            successors_ptr=successors_ptr,
+            successors_index=successors_index,
+            horizon=horizon,
+            ressource_available=ressource_available,
+            ressource_renewable=ressource_renewable,
+            minimum_starting_time_array=minimum_starting_time_array,
+        )
+    else:
+        if dense_precedences is None:
+            dense_precedences = dense_precedences_from_csr(
+                successors_ptr, successors_index
+            )
+        predecessors, successors = dense_precedences
+        func_sgs = partial(
+            sgs_fast,
+            consumption_array=consumption_array,
+            duration_array=duration_array,
+            predecessors=predecessors,
+            successors=successors,
+            horizon=horizon,
+            ressource_available=ressource_available,
+            ressource_renewable=ressource_renewable,
+            minimum_starting_time_array=minimum_starting_time_array,
+        )
+        func_sgs_2 = partial(
+            sgs_fast_partial_schedule_incomplete_permutation_tasks,
+            consumption_array=consumption_array,
+            duration_array=duration_array,
+            predecessors=predecessors,
+            successors=successors,
+            horizon=horizon,
+            ressource_available=ressource_available,
+            ressource_renewable=ressource_renewable,
+            minimum_starting_time_array=minimum_starting_time_array,
+        )
+    func_compute_mean_resource = partial(
+        compute_mean_ressource,
         consumption_array=consumption_array,
-        duration_array=duration_array,
-        predecessors=predecessors,
-        successors=successors,
-        horizon=horizon,
         ressource_available=ressource_available,
         ressource_renewable=ressource_renewable,
-        minimum_starting_time_array=minimum_starting_time_array,
     )
-    func_sgs_2 = partial(
-        sgs_fast_partial_schedule_incomplete_permutation_tasks,
+    func_sgs_batch = partial(
+        sgs_fast_event_batch,
         consumption_array=consumption_array,
         duration_array=duration_array,
-        predecessors=predecessors,
-        successors=successors,
+        predecessors_count=predecessors_count,
+        successors_ptr=successors_ptr,
+        successors_index=successors_index,
         horizon=horizon,
-        ressource_available=ressource_available,
+        breakpoints=breakpoints,
+        breakpoints_availability=breakpoints_availability,
         ressource_renewable=ressource_renewable,
         minimum_starting_time_array=minimum_starting_time_array,
     )
-    func_compute_mean_resource = partial(
-        compute_mean_ressource,
-        consumption_array=consumption_array,
-        ressource_available=ressource_available,
-        ressource_renewable=ressource_renewable,
+    return func_sgs, func_sgs_2, func_compute_mean_resource, func_sgs_batch
+
+
+def create_parallel_sgs_functions(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar],
+    np_data: Dict[str, np.ndarray],
+):
+    """Build the parallel sgs functions from the numpy data of the problem (see `create_np_data()`).
+
+    Returns: func_sgs_parallel, func_sgs_parallel_batch, with the same arguments as
+        func_sgs and func_sgs_batch returned by `create_jit_functions()`
+
+    """
+    kwargs = dict(
+        consumption_array=np_data["consumption_array"],
+        duration_array=np_data["duration_array"],
+        predecessors_count=np_data["predecessors_count"],
+        successors_ptr=np_data["successors_ptr"],
+        successors_index=np_data["successors_index"],
+        horizon=rcpsp_problem.horizon,
+        breakpoints=np_data["breakpoints"],
+        breakpoints_availability=np_data["breakpoints_availability"],
+        ressource_renewable=np_data["ressource_renewable"],
+        minimum_starting_time_array=np_data["minimum_starting_time_array"],
+    )
+    return partial(sgs_fast_parallel, **kwargs), partial(
+        sgs_fast_parallel_batch, **kwargs
+    )
+
+
+def create_sgs_arrays_functions(
+    rcpsp_problem: Union[RCPSPModel, RCPSPModelCalendar],
+    np_data: Dict[str, np.ndarray],
+    use_event_sgs: Optional[bool] = None,
+    dense_precedences: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+):
+    """Build the sgs functions writing the schedule into preallocated arrays (see `sgs_fast_event_arrays()`).
+
+    Args:
+        rcpsp_problem: problem to compile
+        np_data: numpy data of the problem (see `create_np_data()`)
+        use_event_sgs: see `create_np_data_and_jit_functions()`
+        dense_precedences: predecessors and successors matrices used by the time-step scanning sgs
+            (see `dense_precedences_from_csr()`), built from np_data if not given
+
+    Returns: func_sgs_arrays, func_sgs_parallel_arrays, with the arguments
+        permutation_task, modes_array, starts, ends and order
+
+    """
+    if use_event_sgs is None:
+        use_event_sgs = use_event_based_sgs(rcpsp_problem)
+    kwargs = dict(
+        consumption_array=np_data["consumption_array"],
+        duration_array=np_data["duration_array"],
+        predecessors_count=np_data["predecessors_count"],
+        successors_ptr=np_data["successors_ptr"],
+        successors_index=np_data["successors_index"],
+        horizon=rcpsp_problem.horizon,
+        breakpoints=np_data["breakpoints"],
+        breakpoints_availability=np_data["breakpoints_availability"],
+        ressource_renewable=np_data["ressource_renewable"],
+        minimum_starting_time_array=np_data["minimum_starting_time_array"],
     )
-    return func_sgs, func_sgs_2, func_compute_mean_resource
+    if use_event_sgs:
+        func_sgs_arrays = partial(sgs_fast_event_arrays, **kwargs)
+    else:
+        if dense_precedences is None:
+            dense_precedences = dense_precedences_from_csr(
+                np_data["successors_ptr"], np_data["successors_index"]
+            )
+        predecessors, successors = dense_precedences
+        func_sgs_arrays = partial(
+            sgs_fast_arrays,
+            consumption_array=np_data["consumption_array"],
+            duration_array=np_data["duration_array"],
+            predecessors=predecessors,
+            successors=successors,
+            horizon=rcpsp_problem.horizon,
+            ressource_available=np_data["ressource_available"],
+            ressource_renewable=np_data["ressource_renewable"],
+            minimum_starting_time_array=np_data["minimum_starting_time_array"],
+        )
+    return func_sgs_arrays, partial(sgs_fast_parallel_arrays, **kwargs)
 
 
 def permutation_do_to_permutation_sgs_fast(rcpsp_problem: RCPSPModel, permutation_do):
@@ -899,14 +1452,7 @@ def permutation_do_to_permutation_sgs_fast(rcpsp_problem: RCPSPModel, permutatio
 
 class SingleModeRCPSPModel(RCPSPModel):
     def copy(self):
-        return SingleModeRCPSPModel(
-            resources=self.resources,
-            non_renewable_resources=self.non_renewable_resources,
-            mode_details=deepcopy(self.mode_details),
-            successors=deepcopy(self.successors),
-            horizon=self.horizon,
-            horizon_multiplier=self.horizon_multiplier,
-        )
+        return self._copy_sharing_compiled_data(SingleModeRCPSPModel)
 
 
 class MultiModeRCPSPModel(RCPSPModel):
@@ -921,6 +1467,7 @@ class MultiModeRCPSPModel(RCPSPModel):
         successors,
         horizon,
         horizon_multiplier=1,
+        **args,
     ):
         RCPSPModel.__init__(
             self,
@@ -930,6 +1477,7 @@ class MultiModeRCPSPModel(RCPSPModel):
             successors=successors,
             horizon=horizon,
             horizon_multiplier=horizon_multiplier,
+            **args,
         )
         self.fixed_modes = None
         self.fixed_permutation = None
@@ -962,18 +1510,25 @@ class MultiModeRCPSPModel(RCPSPModel):
         objectives = self.evaluate(rcpsp_sol)
         return objectives
 
+    def evaluate_batch_from_encoding(
+        self, int_vectors: np.ndarray, encoding_name: str
+    ) -> Optional[List[Dict[str, float]]]:
+        if encoding_name == "rcpsp_permutation":
+            return self._objectives_from_batch(
+                permutations=int_vectors, modes=self.fixed_modes
+            )
+        elif encoding_name == "rcpsp_modes":
+            int_vectors = np.asarray(int_vectors)
+            return self._objectives_from_batch(
+                permutations=np.broadcast_to(
+                    np.asarray(self.fixed_permutation), int_vectors.shape
+                ),
+                modes=int_vectors,
+            )
+        return None
+
     def copy(self):
-        mm = MultiModeRCPSPModel(
-            resources=self.resources,
-            non_renewable_resources=self.non_renewable_resources,
-            mode_details=deepcopy(self.mode_details),
-            successors=deepcopy(self.successors),
-            horizon=self.horizon,
-            horizon_multiplier=self.horizon_multiplier,
-        )
-        mm.fixed_permutation = self.fixed_permutation
-        mm.fixed_modes = self.fixed_modes
-        return mm
+        return self._copy_sharing_compiled_data(MultiModeRCPSPModel)
 
     def get_dummy_solution(self):
         sol = RCPSPSolution(
@@ -998,6 +1553,16 @@ class Aggreg_RCPSPModel(RobustProblem, RCPSPModel):
         self.n_jobs = list_problem[0].n_jobs
         self.mode_details = list_problem[0].mode_details
         self.resources_list = list_problem[0].resources_list
+        # numpy data of the scenarios stacked along a first axis, see create_np_data_scenarios()
+        self._np_data_scenarios: Optional[Dict[str, np.ndarray]] = None
+        self._np_data_scenarios_built = False
+
+    @property
+    def np_data_scenarios(self) -> Optional[Dict[str, np.ndarray]]:
+        if not self._np_data_scenarios_built:
+            self._np_data_scenarios = create_np_data_scenarios(self.list_problem)
+            self._np_data_scenarios_built = True
+        return self._np_data_scenarios
 
     def get_dummy_solution(self):
         a: RCPSPSolution = self.list_problem[0].get_dummy_solution()
@@ -1018,8 +1583,14 @@ class Aggreg_RCPSPModel(RobustProblem, RCPSPModel):
                     )
                     agg = int(self.agg_vec(rs))
                     model.mode_details[job][mode][res] = agg
+        model.update_functions(modified_fields=["mode_details"])
         return model
 
+    def evaluate_batch_from_encoding(
+        self, int_vectors: np.ndarray, encoding_name: str
+    ) -> Optional[List[Dict[str, float]]]:
+        return None
+
     def evaluate_from_encoding(self, int_vector, encoding_name):
         fits = [
             self.list_problem[i].evaluate_from_encoding(int_vector, encoding_name)
@@ -1033,7 +1604,30 @@ class Aggreg_RCPSPModel(RobustProblem, RCPSPModel):
         return aggreg
 
     def evaluate(self, variable: Solution):
+        fits = self.evaluate_scenarios(variable)
+        return {k: self.agg_vec(fits[k]) for k in fits if k != "feasible"}
+
+    def evaluate_scenarios(self, variable: RCPSPSolution) -> Dict[str, np.ndarray]:
+        """Evaluate a solution on each scenario.
+
+        When the scenarios only differ by their durations and consumptions and the mean resource
+        reserve is not an objective, the schedules of all scenarios are computed by a single
+        parallel numba kernel (see `sgs_fast_event_scenarios()`).
+
+        Returns: dictionary of arrays(scenario) with the objectives given by `RCPSPModel.evaluate()`,
+            and "feasible" the feasibility of the schedule of each scenario
+
+        """
+        np_data_scenarios = self.np_data_scenarios
+        if np_data_scenarios is not None:
+            return evaluate_scenarios_from_np_data(
+                rcpsp_problem=self.list_problem[0],
+                np_data_scenarios=np_data_scenarios,
+                rcpsp_permutation=variable.rcpsp_permutation,
+                rcpsp_modes=variable.rcpsp_modes,
+            )
         fits = []
+        feasible = []
         for i in range(self.nb_problem):
             var: RCPSPSolution = variable.lazy_copy()
             var.rcpsp_schedule = None
@@ -1041,12 +1635,114 @@ class Aggreg_RCPSPModel(RobustProblem, RCPSPModel):
             var.problem = self.list_problem[i]
             fit = self.list_problem[i].evaluate(var)
             fits += [fit]
-        keys = fits[0].keys()
-        aggreg = {}
-        for k in keys:
-            vals = np.array([fit[k] for fit in fits])
-            aggreg[k] = self.agg_vec(vals)
-        return aggreg
+            feasible += [var.rcpsp_schedule_feasible]
+        scenarios_fits = {k: np.array([fit[k] for fit in fits]) for k in fits[0]}
+        scenarios_fits["feasible"] = np.array(feasible, dtype=bool)
+        return scenarios_fits
+
+
+def create_np_data_scenarios(
+    list_problem: Sequence[RCPSPModel],
+) -> Optional[Dict[str, np.ndarray]]:
+    """Stack the numpy data of scenarios of a same problem (see `create_np_data()`).
+
+    Returns: None if the scenarios differ by something else than the durations and consumptions
+        of the tasks, if they have special constraints or preemption, or if the mean resource
+        reserve is an objective. Otherwise the numpy data
+        of the first scenario, with consumption_array and duration_array replaced by
+        consumption_arrays=array(scenario, task, mode, res) and duration_arrays=array(scenario, task, mode).
+
+    """
+    reference = list_problem[0]
+    shared_keys = [
+        "ressource_renewable",
+        "successors_ptr",
+        "successors_index",
+        "predecessors_count",
+        "minimum_starting_time_array",
+        "breakpoints",
+        "breakpoints_availability",
+        "nb_modes_array",
+    ]
+    for problem in list_problem:
+        if (
+            not isinstance(problem, RCPSPModel)
+            or problem.has_special_constraints()
+            or problem.is_preemptive()
+            or problem.costs.get("mean_resource_reserve", False)
+            or problem.horizon != reference.horizon
+            or problem.tasks_list != reference.tasks_list
+            or problem.resources_list != reference.resources_list
+            or problem.np_data["duration_array"].shape
+            != reference.np_data["duration_array"].shape
+        ):
+            return None
+        for key in shared_keys:
+            if problem.np_data[key] is not reference.np_data[key] and not (
+                np.array_equal(problem.np_data[key], reference.np_data[key])
+            ):
+                return None
+    np_data_scenarios = {key: reference.np_data[key] for key in shared_keys}
+    np_data_scenarios["consumption_arrays"] = np.stack(
+        [problem.np_data["consumption_array"] for problem in list_problem]
+    )
+    np_data_scenarios["duration_arrays"] = np.stack(
+        [problem.np_data["duration_array"] for problem in list_problem]
+    )
+    return np_data_scenarios
+
+
+def evaluate_scenarios_from_np_data(
+    rcpsp_problem: RCPSPModel,
+    np_data_scenarios: Dict[str, np.ndarray],
+    rcpsp_permutation: List[int],
+    rcpsp_modes: List[int],
+) -> Dict[str, np.ndarray]:
+    """Schedule a solution on stacked scenarios (see `create_np_data_scenarios()`).
+
+    Args:
+        rcpsp_problem: one of the scenarios, giving the tasks and modes indexing
+        np_data_scenarios: stacked numpy data of the scenarios
+        rcpsp_permutation: permutation of the solution, as in `RCPSPSolution.rcpsp_permutation`
+        rcpsp_modes: modes of the solution, as in `RCPSPSolution.rcpsp_modes`
+
+    Returns: dictionary of arrays(scenario) "makespan", "mean_resource_reserve" (always 0)
+        and "feasible". Unfeasible scenarios get the makespan given by `RCPSPModel.evaluate()`.
+
+    """
+    nb_scenarios = np_data_scenarios["duration_arrays"].shape[0]
+    modes_array = rcpsp_problem.build_mode_array(rcpsp_modes)
+    if not rcpsp_problem.are_existing_modes(modes_array):
+        # non existing modes
+        makespans = np.full(nb_scenarios, UNFEASIBLE_MAKESPAN, dtype=np.int64)
+        feasible = np.zeros(nb_scenarios, dtype=bool)
+    else:
+        ends, unfeasible = sgs_fast_event_scenarios(
+            permutation_task=permutation_do_to_permutation_sgs_fast(
+                rcpsp_problem, rcpsp_permutation
+            ),
+            modes_array=modes_array - 1,
+            consumption_arrays=np_data_scenarios["consumption_arrays"],
+            duration_arrays=np_data_scenarios["duration_arrays"],
+            predecessors_count=np_data_scenarios["predecessors_count"],
+            successors_ptr=np_data_scenarios["successors_ptr"],
+            successors_index=np_data_scenarios["successors_index"],
+            horizon=rcpsp_problem.horizon,
+            breakpoints=np_data_scenarios["breakpoints"],
+            breakpoints_availability=np_data_scenarios["breakpoints_availability"],
+            ressource_renewable=np_data_scenarios["ressource_renewable"],
+            minimum_starting_time_array=np_data_scenarios[
+                "minimum_starting_time_array"
+            ],
+        )
+        feasible = ~unfeasible
+        makespans = ends[:, rcpsp_problem.index_task[rcpsp_problem.sink_task]]
+        makespans[makespans < 0] = UNFEASIBLE_MAKESPAN
+    return {
+        "makespan": makespans,
+        "mean_resource_reserve": np.zeros(nb_scenarios, dtype=np.int64),
+        "feasible": feasible,
+    }
 
 
 class MethodBaseRobustification(Enum):
@@ -1159,6 +1855,8 @@ class UncertainRCPSPModel:
         poisson_laws: Dict[int, Dict[int, Dict[str, Tuple[int, int, int]]]],
         uniform_law=True,
     ):
+        from scipy.stats import poisson, randint, rv_discrete
+
         self.base_rcpsp_model = base_rcpsp_model
         self.poisson_laws = poisson_laws
         self.probas = {}
@@ -1245,6 +1943,7 @@ class UncertainRCPSPModel:
                         model.mode_details[activity][mode][detail] = self.probas[
                             activity
                         ][mode][detail]["prob-distribution"].rvs(size=1)[0]
+        model.update_functions(modified_fields=["mode_details"])
         return model
 
 
@@ -1791,3 +2490,42 @@ class SGSWithoutArray:
         else:
             rcpsp_schedule_feasible = True
         return rcpsp_schedule, rcpsp_schedule_feasible, resource_avail_in_time
+
+
+@register_warm_up("rcpsp")
+def warm_up_rcpsp_kernels() -> None:
+    """Run the sgs kernels used by RCPSPModel on a tiny instance, see jit_kernels.warm_up_kernels()."""
+    rcpsp_model = RCPSPModel(
+        resources={"R1": 2},
+        non_renewable_resources=[],
+        mode_details={
+            1: {1: {"duration": 0}},
+            2: {1: {"duration": 2, "R1": 1}},
+            3: {1: {"duration": 3, "R1": 2}},
+            4: {1: {"duration": 0}},
+        },
+        successors={1: [2, 3], 2: [4], 3: [4], 4: []},
+        horizon=10,
+    )
+    for use_event_sgs in [False, True]:
+        (
+            rcpsp_model.func_sgs,
+            rcpsp_model.func_sgs_2,
+            rcpsp_model.compute_mean_resource,
+            rcpsp_model.func_sgs_batch,
+        ) = create_np_data_and_jit_functions(rcpsp_model, use_event_sgs=use_event_sgs)
+        rcpsp_model.func_sgs_arrays, _ = create_sgs_arrays_functions(
+            rcpsp_model, np_data=rcpsp_model.np_data, use_event_sgs=use_event_sgs
+        )
+        solution = RCPSPSolution(problem=rcpsp_model, rcpsp_permutation=[1, 0])
+        rcpsp_model.func_sgs(
+            permutation_task=np.array([0, 1, 2, 3], dtype=np.int32),
+            modes_array=np.zeros(4, dtype=np.int64),
+        )
+        solution.generate_schedule_from_permutation_serial_sgs_2(
+            current_t=0, completed_tasks={}, scheduled_tasks_start_times={}
+        )
+        rcpsp_model.evaluate_batch(np.array([[0, 1], [1, 0]]))
+    rcpsp_model.sgs = ScheduleGenerationScheme.PARALLEL_SGS
+    RCPSPSolution(problem=rcpsp_model, rcpsp_permutation=[1, 0])
+    rcpsp_model.evaluate_batch(np.array([[0, 1], [1, 0]]))
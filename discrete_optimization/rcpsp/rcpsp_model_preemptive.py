@@ -10,7 +10,6 @@ from enum import Enum
 from functools import partial
 from typing import Dict, Hashable, Iterable, List, Tuple, Type, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from discrete_optimization.generic_tools.do_problem import (
@@ -26,6 +25,7 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeObjective,
 )
 from discrete_optimization.generic_tools.graph_api import Graph
+from discrete_optimization.generic_tools.jit_kernels import register_warm_up
 from discrete_optimization.rcpsp.fast_function_rcpsp import (
     compute_mean_ressource,
     sgs_fast_partial_schedule_preemptive,
@@ -33,6 +33,7 @@ from discrete_optimization.rcpsp.fast_function_rcpsp import (
     sgs_fast_preemptive,
     sgs_fast_preemptive_minduration,
 )
+from discrete_optimization.rcpsp.rcpsp_model import copy_mode_details
 
 logger = logging.getLogger(__name__)
 
@@ -518,6 +519,9 @@ class RCPSPModelPreemptive(Problem):
             self.compute_mean_resource,
         ) = create_np_data_and_jit_functions(self)
 
+    def update_functions(self):
+        self.update_function()
+
     def is_rcpsp_multimode(self):
         return self.is_multimode
 
@@ -712,6 +716,8 @@ class RCPSPModelPreemptive(Problem):
         return consumptions
 
     def plot_ressource_view(self, rcpsp_sol: RCPSPSolutionPreemptive):
+        import matplotlib.pyplot as plt
+
         consumption = self.compute_resource_consumption(rcpsp_sol=rcpsp_sol)
         fig, ax = plt.subplots(nrows=len(self.resources_list), sharex=True)
         for i in range(len(self.resources_list)):
@@ -722,17 +728,23 @@ class RCPSPModelPreemptive(Problem):
             ax[i].legend()
 
     def copy(self):
-        return RCPSPModelPreemptive(
-            resources=self.resources,
-            non_renewable_resources=self.non_renewable_resources,
-            mode_details=deepcopy(self.mode_details),
-            successors=deepcopy(self.successors),
-            horizon=self.horizon,
-            horizon_multiplier=self.horizon_multiplier,
-        )
+        """Copy the problem without rebuilding its numpy data.
+
+        The sgs functions (and the numpy data they use) are shared with the original problem.
+        mode_details and successors are copied, so that they can be modified on the copy,
+        update_functions() being then called to take them into account.
+
+        """
+        model = type(self).__new__(type(self))
+        model.__dict__.update(self.__dict__)
+        model.mode_details = copy_mode_details(self.mode_details)
+        model.successors = {
+            task: list(self.successors[task]) for task in self.successors
+        }
+        return model
 
     def copy_with_multiplier(self, multiplier=0.5):
-        mode_details = deepcopy(self.mode_details)
+        mode_details = copy_mode_details(self.mode_details)
         n = int(1 / multiplier)
         for t in mode_details:
             for m in mode_details[t]:
@@ -743,7 +755,7 @@ class RCPSPModelPreemptive(Problem):
             resources={r: self.resources[r][::n] * n for r in self.resources},
             non_renewable_resources=self.non_renewable_resources,
             mode_details=mode_details,
-            successors=deepcopy(self.successors),
+            successors={task: list(self.successors[task]) for task in self.successors},
             horizon=int(self.horizon / n),
             horizon_multiplier=self.horizon_multiplier,
         )
@@ -1367,3 +1379,21 @@ def get_rcpsp_modelp_preemptive(rcpsp_model):
         },
         name_task=rcpsp_model.name_task,
     )
+
+
+@register_warm_up("rcpsp_preemptive")
+def warm_up_rcpsp_preemptive_kernels() -> None:
+    """Run the sgs kernels used by RCPSPModelPreemptive on a tiny instance, see jit_kernels.warm_up_kernels()."""
+    rcpsp_model = RCPSPModelPreemptive(
+        resources={"R1": 2},
+        non_renewable_resources=[],
+        mode_details={
+            1: {1: {"duration": 0}},
+            2: {1: {"duration": 2, "R1": 1}},
+            3: {1: {"duration": 3, "R1": 2}},
+            4: {1: {"duration": 0}},
+        },
+        successors={1: [2, 3], 2: [4], 3: [4], 4: []},
+        horizon=10,
+    )
+    rcpsp_model.evaluate(rcpsp_model.get_dummy_solution())
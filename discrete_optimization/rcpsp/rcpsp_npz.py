@@ -0,0 +1,243 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Binary .npz format for rcpsp models, loaded without rebuilding the numpy data of the sgs kernels."""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from discrete_optimization.generic_tools.npz_archive import (
+    check_json_serializable,
+    load_npz_archive,
+    pack_sequences,
+    save_npz_archive,
+    unpack_sequences,
+)
+from discrete_optimization.rcpsp.rcpsp_model import (
+    MultiModeRCPSPModel,
+    RCPSPModel,
+    RCPSPModelCalendar,
+    SingleModeRCPSPModel,
+)
+
+FORMAT_VERSION = 1
+
+rcpsp_model_classes = {
+    cls.__name__: cls
+    for cls in [
+        RCPSPModel,
+        SingleModeRCPSPModel,
+        MultiModeRCPSPModel,
+        RCPSPModelCalendar,
+    ]
+}
+
+# arrays of RCPSPModel.np_data
+np_data_keys = [
+    "consumption_array",
+    "duration_array",
+    "ressource_available",
+    "ressource_renewable",
+    "successors_ptr",
+    "successors_index",
+    "predecessors_count",
+    "minimum_starting_time_array",
+    "breakpoints",
+    "breakpoints_availability",
+]
+
+
+def save_rcpsp_model(rcpsp_model: RCPSPModel, path: Union[str, os.PathLike]) -> None:
+    """Save a rcpsp model in .npz format.
+
+    Supported models are RCPSPModel, SingleModeRCPSPModel, MultiModeRCPSPModel and RCPSPModelCalendar
+    (without the fixed modes or permutation of MultiModeRCPSPModel),
+    with integer or string task ids and integer mode ids.
+
+    Args:
+        rcpsp_model: model to save
+        path: path of the file. The .npz extension is appended if missing.
+
+    """
+    class_name = rcpsp_model.__class__.__name__
+    if rcpsp_model_classes.get(class_name) is not rcpsp_model.__class__:
+        raise NotImplementedError(f"{class_name} cannot be saved in npz format.")
+    for name in ["tasks_list", "resources_list", "non_renewable_resources"]:
+        check_json_serializable(getattr(rcpsp_model, name), name)
+    arrays: Dict[str, np.ndarray] = {
+        key: rcpsp_model.np_data[key] for key in np_data_keys
+    }
+
+    # mode details
+    resources_list = rcpsp_model.resources_list
+    mode_ids = np.zeros((rcpsp_model.n_jobs, rcpsp_model.max_number_of_mode), dtype=int)
+    nb_modes = np.zeros(rcpsp_model.n_jobs, dtype=int)
+    resources_defined = np.zeros(
+        (rcpsp_model.n_jobs, rcpsp_model.max_number_of_mode, len(resources_list)),
+        dtype=bool,
+    )
+    keys = set(resources_list) | {"duration"}
+    for i, task in enumerate(rcpsp_model.tasks_list):
+        task_mode_details = rcpsp_model.mode_details[task]
+        nb_modes[i] = len(task_mode_details)
+        for index_mode, mode in enumerate(sorted(task_mode_details)):
+            details = task_mode_details[mode]
+            if not isinstance(mode, int) or not keys.issuperset(details):
+                raise ValueError(
+                    f"Mode {mode} of task {task} cannot be saved in npz format: {details}"
+                )
+            mode_ids[i, index_mode] = mode
+            resources_defined[i, index_mode, :] = [
+                resource in details for resource in resources_list
+            ]
+    arrays["mode_ids"] = mode_ids
+    arrays["nb_modes"] = nb_modes
+    arrays["resources_defined"] = resources_defined
+    arrays["task_successors_ptr"], arrays["task_successors_index"] = pack_sequences(
+        [
+            [rcpsp_model.index_task[s] for s in rcpsp_model.successors[task]]
+            for task in rcpsp_model.tasks_list
+        ],
+        dtype=np.int32,
+    )
+
+    # resources
+    if rcpsp_model.is_calendar:
+        arrays["resources_ptr"], arrays["resources_values"] = pack_sequences(
+            [rcpsp_model.resources[resource] for resource in resources_list],
+            dtype=np.int32,
+        )
+    else:
+        arrays["resources_values"] = np.array(
+            [rcpsp_model.resources[resource] for resource in resources_list],
+            dtype=np.int32,
+        )
+
+    metadata: Dict[str, Any] = dict(
+        format_version=FORMAT_VERSION,
+        class_name=class_name,
+        tasks_list=rcpsp_model.tasks_list,
+        source_task=rcpsp_model.source_task,
+        sink_task=rcpsp_model.sink_task,
+        resources_list=resources_list,
+        non_renewable_resources=rcpsp_model.non_renewable_resources,
+        horizon=int(rcpsp_model.horizon),
+        horizon_multiplier=rcpsp_model.horizon_multiplier,
+        is_calendar=rcpsp_model.is_calendar,
+        mean_resource_reserve=rcpsp_model.costs["mean_resource_reserve"],
+        name_task=None,
+    )
+    if rcpsp_model.name_task != {task: str(task) for task in rcpsp_model.mode_details}:
+        metadata["name_task"] = [
+            rcpsp_model.name_task[task] for task in rcpsp_model.tasks_list
+        ]
+    if isinstance(rcpsp_model, RCPSPModelCalendar):
+        metadata["name_ressource_to_index"] = rcpsp_model.name_ressource_to_index
+        metadata["calendar_details"] = None
+        if rcpsp_model.calendar_details is not None:
+            metadata["calendar_details"] = list(rcpsp_model.calendar_details)
+            for k, resource in enumerate(rcpsp_model.calendar_details):
+                arrays[f"calendar_details_{k}"] = np.array(
+                    rcpsp_model.calendar_details[resource], dtype=np.int32
+                )
+    check_json_serializable(metadata, "metadata")
+    save_npz_archive(path, arrays=arrays, metadata=metadata)
+
+
+def load_rcpsp_model(
+    path: Union[str, os.PathLike], mmap_mode: Optional[str] = None
+) -> RCPSPModel:
+    """Load a rcpsp model saved by `save_rcpsp_model()`.
+
+    Args:
+        path: path of the file
+        mmap_mode: if not None, memory-map the numpy data used by the sgs kernels
+            (see numpy.memmap, "c" giving writeable copy-on-write arrays)
+
+    """
+    arrays, metadata = load_npz_archive(path, mmap_mode=mmap_mode)
+    if metadata["format_version"] != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported format version {metadata['format_version']} for {path}."
+        )
+    tasks_list = metadata["tasks_list"]
+    resources_list = metadata["resources_list"]
+    mode_details, successors = _build_mode_details_and_successors(
+        arrays, tasks_list=tasks_list, resources_list=resources_list
+    )
+    resources: Dict[str, Any]
+    if metadata["is_calendar"]:
+        resources = dict(
+            zip(
+                resources_list,
+                unpack_sequences(arrays["resources_ptr"], arrays["resources_values"]),
+            )
+        )
+    else:
+        resources = dict(zip(resources_list, arrays["resources_values"].tolist()))
+    name_task = None
+    if metadata["name_task"] is not None:
+        name_task = dict(zip(tasks_list, metadata["name_task"]))
+    kwargs: Dict[str, Any] = dict(
+        resources=resources,
+        non_renewable_resources=metadata["non_renewable_resources"],
+        mode_details=mode_details,
+        successors=successors,
+        horizon=metadata["horizon"],
+        horizon_multiplier=metadata["horizon_multiplier"],
+        tasks_list=tasks_list,
+        source_task=metadata["source_task"],
+        sink_task=metadata["sink_task"],
+        name_task=name_task,
+        np_data=dict(
+            {key: arrays[key] for key in np_data_keys},
+            nb_modes_array=arrays["nb_modes"].astype(np.int32),
+        ),
+    )
+    class_name = metadata["class_name"]
+    if class_name == RCPSPModelCalendar.__name__:
+        if metadata["calendar_details"] is not None:
+            kwargs["calendar_details"] = {
+                resource: arrays[f"calendar_details_{k}"].tolist()
+                for k, resource in enumerate(metadata["calendar_details"])
+            }
+        kwargs["name_ressource_to_index"] = metadata["name_ressource_to_index"]
+    else:
+        kwargs["mean_resource_reserve"] = metadata["mean_resource_reserve"]
+    return rcpsp_model_classes[class_name](**kwargs)
+
+
+def _build_mode_details_and_successors(
+    arrays: Dict[str, np.ndarray], tasks_list: List[Any], resources_list: List[str]
+) -> Tuple[Dict[Any, Dict[int, Dict[str, int]]], Dict[Any, List[Any]]]:
+    durations = arrays["duration_array"].tolist()
+    consumptions = arrays["consumption_array"].tolist()
+    mode_ids = arrays["mode_ids"].tolist()
+    nb_modes = arrays["nb_modes"].tolist()
+    resources_defined = arrays["resources_defined"].tolist()
+    mode_details = {}
+    for i, task in enumerate(tasks_list):
+        mode_details[task] = {}
+        for index_mode in range(nb_modes[i]):
+            details = {"duration": durations[i][index_mode]}
+            for resource, consumption, defined in zip(
+                resources_list,
+                consumptions[i][index_mode],
+                resources_defined[i][index_mode],
+            ):
+                if defined:
+                    details[resource] = consumption
+            mode_details[task][mode_ids[i][index_mode]] = details
+    successors = {
+        task: [tasks_list[j] for j in task_successors]
+        for task, task_successors in zip(
+            tasks_list,
+            unpack_sequences(
+                arrays["task_successors_ptr"], arrays["task_successors_index"]
+            ),
+        )
+    }
+    return mode_details, successors
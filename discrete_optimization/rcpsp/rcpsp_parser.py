@@ -65,10 +65,9 @@ def parse_psplib(input_data):
         str(tmp1[(i * 2)]) + str(tmp1[(i * 2) + 1]): int(tmp2[i])
         for i in range(len(tmp2))
     }
-    non_renewable_resources = [
-        name for name in list(resources.keys()) if name.startswith("N")
-    ]
-    n_resources = len(resources.keys())
+    resources_list = list(resources)
+    non_renewable_resources = [name for name in resources_list if name.startswith("N")]
+    n_resources = len(resources_list)
 
     # Parsing precedence relationship
     multi_mode = False
@@ -95,14 +94,10 @@ def parse_psplib(input_data):
             duration = int(tmp[1])
             resources_usage = [int(x) for x in tmp[2 : (3 + n_resources)]]
 
-        if int(task_id) not in list(mode_details.keys()):
-            mode_details[int(task_id)] = {}
-        mode_details[int(task_id)][mode_id] = {}  # Dict[int, Dict[str, int]]
-        mode_details[int(task_id)][mode_id]["duration"] = duration
-        for i in range(n_resources):
-            mode_details[int(task_id)][mode_id][
-                list(resources.keys())[i]
-            ] = resources_usage[i]
+        if task_id not in mode_details:
+            mode_details[task_id] = {}
+        mode_details[task_id][mode_id] = {"duration": duration}  # Dict[str, int]
+        mode_details[task_id][mode_id].update(zip(resources_list, resources_usage))
 
     if multi_mode:
         problem = MultiModeRCPSPModel(
@@ -0,0 +1,102 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Schedule of a rcpsp solution stored as numpy arrays.
+
+The sgs kernels write the start and end times of the tasks in arrays indexed like `RCPSPModel.tasks_list`.
+`ArraySchedule` keeps these arrays and exposes them as the usual dictionary
+{task: {"start_time": ..., "end_time": ...}}, without building one dictionary per task.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+class ArraySchedule(Mapping):
+    """Read-only view of a schedule stored as arrays of start and end times.
+
+    Behaves as the dictionary {task: {"start_time": ..., "end_time": ...}} of the scheduled tasks,
+    iterated in scheduling order. The values are read-only mappings built on access, the schedule
+    being modified by replacing it with a dictionary. The arrays are never modified, so that shallow
+    copies of the schedule share them.
+
+    Attributes:
+        tasks_list: tasks of the problem, a task being identified by its position in the arrays
+        index_task: position of each task
+        starts: array(task) of start times, -1 for the tasks not scheduled
+        ends: array(task) of end times, -1 for the tasks not scheduled
+        order: array of the positions of the scheduled tasks, in scheduling order
+
+    """
+
+    def __init__(
+        self,
+        tasks_list: Sequence[Hashable],
+        index_task: Dict[Hashable, int],
+        starts: np.ndarray,
+        ends: np.ndarray,
+        order: np.ndarray,
+    ):
+        self.tasks_list = tasks_list
+        self.index_task = index_task
+        self.starts = starts
+        self.ends = ends
+        self.order = order
+        for array in (self.starts, self.ends, self.order):
+            array.flags.writeable = False
+
+    def _index(self, task: Hashable) -> Optional[int]:
+        i = self.index_task.get(task)
+        if i is None or self.starts[i] < 0:
+            return None
+        return i
+
+    def __getitem__(self, task: Hashable) -> Mapping[str, int]:
+        i = self._index(task)
+        if i is None:
+            raise KeyError(task)
+        return MappingProxyType(
+            {"start_time": int(self.starts[i]), "end_time": int(self.ends[i])}
+        )
+
+    def __contains__(self, task: object) -> bool:
+        return self._index(task) is not None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return (self.tasks_list[i] for i in self.order.tolist())
+
+    def __len__(self) -> int:
+        return self.order.shape[0]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __deepcopy__(self, memo) -> "ArraySchedule":
+        # the tasks are owned by the problem, only the arrays are copied
+        return ArraySchedule(
+            tasks_list=self.tasks_list,
+            index_task=self.index_task,
+            starts=self.starts.copy(),
+            ends=self.ends.copy(),
+            order=self.order.copy(),
+        )
+
+    def get_start_time(self, task: Hashable) -> Optional[int]:
+        i = self._index(task)
+        return None if i is None else int(self.starts[i])
+
+    def get_end_time(self, task: Hashable) -> Optional[int]:
+        i = self._index(task)
+        return None if i is None else int(self.ends[i])
+
+    def get_max_end_time(self) -> int:
+        return int(self.ends[self.order].max())
+
+    def tasks_sorted_by_start_time(self) -> List[Hashable]:
+        """Scheduled tasks sorted by start time, ties being broken by the scheduling order."""
+        sorted_order = self.order[np.argsort(self.starts[self.order], kind="stable")]
+        return [self.tasks_list[i] for i in sorted_order.tolist()]
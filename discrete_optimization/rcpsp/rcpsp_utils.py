@@ -6,13 +6,7 @@ import logging
 from copy import deepcopy
 from typing import List, Union
 
-import matplotlib.cm
-import matplotlib.pyplot as plt
 import numpy as np
-import scipy.stats
-from matplotlib.collections import PatchCollection
-from matplotlib.patches import Polygon as pp
-from shapely.geometry import Polygon
 
 from discrete_optimization.generic_tools.graph_api import Graph
 from discrete_optimization.rcpsp.rcpsp_model import RCPSPModel, RCPSPSolution
@@ -92,6 +86,11 @@ def plot_ressource_view(
     fig=None,
     ax=None,
 ):
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import Polygon as pp
+    from shapely.geometry import Polygon
+
     modes_extended = deepcopy(rcpsp_sol.rcpsp_modes)
     modes_extended.insert(0, 1)
     modes_extended.append(1)
@@ -141,7 +140,7 @@ def plot_ressource_view(
             x, y = polygon.exterior.xy
             ax[i].plot(x, y, zorder=-1, color="b")
             patches.append(pp(xy=polygon.exterior.coords))
-        p = PatchCollection(patches, cmap=matplotlib.cm.get_cmap("Blues"), alpha=0.4)
+        p = PatchCollection(patches, cmap=plt.cm.get_cmap("Blues"), alpha=0.4)
         ax[i].add_collection(p)
     merged_times, merged_cons = compute_nice_resource_consumption(
         rcpsp_model, rcpsp_sol, list_resources=list_resource
@@ -189,6 +188,11 @@ def plot_task_gantt(
     title=None,
     current_t=None,
 ):
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import Polygon as pp
+    from shapely.geometry import Polygon
+
     if fig is None or ax is None:
         fig, ax = plt.subplots(1, figsize=(10, 10))
         ax.set_title("Gantt Task")
@@ -385,6 +389,11 @@ def plot_resource_individual_gantt(
     ax=None,
     current_t=None,
 ):
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import Polygon as pp
+    from shapely.geometry import Polygon
+
     array_ressource_usage = compute_schedule_per_resource_individual(
         rcpsp_model, rcpsp_sol, resource_types_to_consider=resource_types_to_consider
     )
@@ -458,7 +467,9 @@ def kendall_tau_similarity(rcpsp_sols: (RCPSPSolution, RCPSPSolution)):
     perm1 = sol1.generate_permutation_from_schedule()
     perm2 = sol2.generate_permutation_from_schedule()
 
-    ktd, p_value = scipy.stats.kendalltau(perm1, perm2)
+    from scipy.stats import kendalltau
+
+    ktd, p_value = kendalltau(perm1, perm2)
     return ktd
 
 
@@ -3,12 +3,13 @@
 #  LICENSE file in the root directory of this source tree.
 
 import random
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Iterable, List, Optional, Union
 
 import numpy as np
 from deprecation import deprecated
 from minizinc import Instance
 
+from discrete_optimization.generic_tools.callbacks.callback import Callback
 from discrete_optimization.generic_tools.cp_tools import CPSolverName, ParametersCP
 from discrete_optimization.generic_tools.do_problem import get_default_objective_setup
 from discrete_optimization.generic_tools.lns_cp import (
@@ -378,6 +379,7 @@ class SolverWithCalendarIterative(SolverDO):
         nb_iteration_no_improvement: Optional[int] = None,
         max_time_seconds: Optional[int] = None,
         skip_first_iteration: bool = False,
+        callbacks: Optional[List[Callback]] = None,
         **args
     ) -> ResultStorage:
         if parameters_cp is None:
@@ -388,4 +390,5 @@ class SolverWithCalendarIterative(SolverDO):
             skip_first_iteration=skip_first_iteration,
             nb_iteration_no_improvement=nb_iteration_no_improvement,
             nb_iteration_lns=nb_iteration_lns,
+            callbacks=callbacks,
         )
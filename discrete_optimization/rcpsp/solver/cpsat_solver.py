@@ -0,0 +1,322 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""OR-Tools CP-SAT solver for rcpsp.
+
+The CP-SAT model is built once by `CPSatRCPSPSolver.init_model()`. A large neighborhood search then
+only changes the domains of its variables (start times, modes, makespan) and the solution hint
+between two calls to `solve()`, see `ConstraintHandlerCPSat` in generic_rcpsp_tools.neighbor_tools_rcpsp.
+The changes are undone by `reset_domains()`, the model being never rebuilt.
+"""
+
+import logging
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Union
+
+from ortools.sat.python import cp_model
+
+from discrete_optimization.generic_tools.cp_tools import (
+    CPSolver,
+    ParametersCP,
+    StatusSolver,
+)
+from discrete_optimization.generic_tools.do_problem import (
+    ParamsObjectiveFunction,
+    build_aggreg_function_and_params_objective,
+)
+from discrete_optimization.generic_tools.interval_calendar import calendar_step_function
+from discrete_optimization.generic_tools.result_storage.result_storage import (
+    ResultStorage,
+)
+from discrete_optimization.rcpsp.rcpsp_model import RCPSPModel, RCPSPSolution
+
+logger = logging.getLogger(__name__)
+
+map_cpsat_status_to_do_status: Dict[int, StatusSolver] = {
+    cp_model.OPTIMAL: StatusSolver.OPTIMAL,
+    cp_model.FEASIBLE: StatusSolver.SATISFIED,
+    cp_model.INFEASIBLE: StatusSolver.UNSATISFIABLE,
+    cp_model.MODEL_INVALID: StatusSolver.UNKNOWN,
+    cp_model.UNKNOWN: StatusSolver.UNKNOWN,
+}
+
+
+class _SolutionCollector(cp_model.CpSolverSolutionCallback):
+    """Store the values of some variables for each solution found by CP-SAT."""
+
+    def __init__(self, variables: List[cp_model.IntVar], nr_solutions: int):
+        super().__init__()
+        self.variables = variables
+        self.nr_solutions = nr_solutions
+        self.values: List[List[int]] = []
+
+    def on_solution_callback(self) -> None:
+        self.values.append([self.Value(var) for var in self.variables])
+        if len(self.values) >= self.nr_solutions:
+            self.StopSearch()
+
+
+class CPSatRCPSPSolver(CPSolver):
+    """CP-SAT model of a non-preemptive rcpsp, minimizing the makespan.
+
+    Single and multi-mode tasks, renewable resources with a calendar and non-renewable resources are supported.
+    """
+
+    model: Optional[cp_model.CpModel] = None
+
+    def __init__(
+        self,
+        rcpsp_model: RCPSPModel,
+        params_objective_function: Optional[ParamsObjectiveFunction] = None,
+        **kwargs: Any,
+    ):
+        self.rcpsp_model = rcpsp_model
+        (
+            self.aggreg_from_sol,
+            self.aggreg_dict,
+            self.params_objective_function,
+        ) = build_aggreg_function_and_params_objective(
+            problem=self.rcpsp_model,
+            params_objective_function=params_objective_function,
+        )
+        self.instance = None
+        self.start: Dict[Hashable, cp_model.IntVar] = {}
+        self.end: Dict[Hashable, cp_model.IntVar] = {}
+        self.duration: Dict[Hashable, cp_model.IntVar] = {}
+        self.interval: Dict[Hashable, cp_model.IntervalVar] = {}
+        self.modes: Dict[Hashable, Dict[int, cp_model.IntVar]] = {}
+        self.mode_intervals: Dict[Hashable, Dict[int, cp_model.IntervalVar]] = {}
+        self.makespan: Optional[cp_model.IntVar] = None
+        # original domains of the variables modified since the last reset_domains()
+        self.initial_domains: Dict[int, List[int]] = {}
+
+    def get_resource_availability(self, resource: str) -> Union[int, Sequence[int]]:
+        return self.rcpsp_model.resources[resource]
+
+    def init_model(self, **kwargs: Any) -> None:
+        horizon = int(self.rcpsp_model.horizon)
+        self.model = cp_model.CpModel()
+        mode_details = self.rcpsp_model.mode_details
+        for task in self.rcpsp_model.tasks_list:
+            task_modes = sorted(mode_details[task])
+            durations = [mode_details[task][mode]["duration"] for mode in task_modes]
+            self.start[task] = self.model.NewIntVar(0, horizon, f"start_{task}")
+            self.end[task] = self.model.NewIntVar(0, horizon, f"end_{task}")
+            self.duration[task] = self.model.NewIntVarFromDomain(
+                cp_model.Domain.FromValues(durations), f"duration_{task}"
+            )
+            self.interval[task] = self.model.NewIntervalVar(
+                self.start[task],
+                self.duration[task],
+                self.end[task],
+                f"interval_{task}",
+            )
+            self.modes[task] = {}
+            self.mode_intervals[task] = {}
+            if len(task_modes) == 1:
+                self.modes[task][task_modes[0]] = self.model.NewConstant(1)
+                self.mode_intervals[task][task_modes[0]] = self.interval[task]
+                continue
+            for mode, duration in zip(task_modes, durations):
+                self.modes[task][mode] = self.model.NewBoolVar(f"mode_{task}_{mode}")
+                self.mode_intervals[task][mode] = self.model.NewOptionalIntervalVar(
+                    self.start[task],
+                    duration,
+                    self.end[task],
+                    self.modes[task][mode],
+                    f"interval_{task}_{mode}",
+                )
+            self.model.AddExactlyOne(self.modes[task].values())
+        for task in self.rcpsp_model.tasks_list:
+            for successor in self.rcpsp_model.successors[task]:
+                self.model.Add(self.start[successor] >= self.end[task])
+        non_renewable_resources = set(self.rcpsp_model.non_renewable_resources)
+        for resource in self.rcpsp_model.resources_list:
+            availability = self.get_resource_availability(resource)
+            if resource in non_renewable_resources:
+                capacity = int(
+                    availability[0]
+                    if isinstance(availability, Iterable)
+                    else availability
+                )
+                self.model.Add(
+                    sum(
+                        mode_details[task][mode].get(resource, 0)
+                        * self.modes[task][mode]
+                        for task in self.rcpsp_model.tasks_list
+                        for mode in self.modes[task]
+                    )
+                    <= capacity
+                )
+            else:
+                self.add_renewable_resource(resource, availability)
+        # own variable, so that its bound and the ones of the sink start time are independent
+        self.makespan = self.model.NewIntVar(0, horizon, "makespan")
+        self.model.Add(self.makespan == self.start[self.rcpsp_model.sink_task])
+        self.model.Minimize(self.makespan)
+        self.instance = self.model
+        self.initial_domains = {}
+
+    def add_renewable_resource(
+        self, resource: str, availability: Union[int, Sequence[int]]
+    ) -> None:
+        """Add a cumulative constraint, the variations of the calendar being fixed intervals."""
+        horizon = int(self.rcpsp_model.horizon)
+        intervals = []
+        demands = []
+        for task in self.rcpsp_model.tasks_list:
+            for mode, interval in self.mode_intervals[task].items():
+                demand = self.rcpsp_model.mode_details[task][mode].get(resource, 0)
+                if demand > 0:
+                    intervals.append(interval)
+                    demands.append(demand)
+        if len(intervals) == 0:
+            return
+        if not isinstance(availability, Iterable):
+            capacity = int(availability)
+        else:
+            breakpoints, values = calendar_step_function(availability, horizon)
+            capacity = int(max(values, default=0))
+            ends = list(breakpoints[1:]) + [horizon]
+            for start, end, value in zip(breakpoints, ends, values):
+                if value < capacity:
+                    intervals.append(
+                        self.model.NewFixedSizeIntervalVar(
+                            int(start), int(end - start), f"calendar_{resource}_{start}"
+                        )
+                    )
+                    demands.append(capacity - max(int(value), 0))
+        self.model.AddCumulative(intervals, demands, capacity)
+
+    def set_domain(self, variable: cp_model.IntVar, lower: int, upper: int) -> None:
+        """Restrict the domain of a variable to [lower, upper] until the next reset_domains()."""
+        variable_proto = self.model.Proto().variables[variable.Index()]
+        initial_domain = self.initial_domains.setdefault(
+            variable.Index(), list(variable_proto.domain)
+        )
+        domain = cp_model.Domain.FromFlatIntervals(initial_domain).IntersectionWith(
+            cp_model.Domain(lower, upper)
+        )
+        variable_proto.domain[:] = domain.FlattenedIntervals()
+
+    def set_start_bounds(self, task: Hashable, lower: int, upper: int) -> None:
+        self.set_domain(self.start[task], lower, upper)
+
+    def fix_mode(self, task: Hashable, mode: int) -> None:
+        if len(self.modes[task]) == 1:
+            return
+        for other_mode, literal in self.modes[task].items():
+            value = int(other_mode == mode)
+            self.set_domain(literal, value, value)
+
+    def set_makespan_upper_bound(self, upper: int) -> None:
+        self.set_domain(self.makespan, 0, upper)
+
+    def reset_domains(self) -> None:
+        """Restore the domains of the variables modified since the model was built."""
+        for index, domain in self.initial_domains.items():
+            self.model.Proto().variables[index].domain[:] = domain
+        self.initial_domains = {}
+
+    def set_hint(self, solution: RCPSPSolution) -> None:
+        """Replace the solution hint of the model by the given solution."""
+        self.model.ClearHints()
+        modes = self.get_solution_modes(solution)
+        for task in self.rcpsp_model.tasks_list:
+            self.model.AddHint(self.start[task], solution.get_start_time(task))
+            for mode, literal in self.modes[task].items():
+                if len(self.modes[task]) > 1:
+                    self.model.AddHint(literal, int(mode == modes[task]))
+
+    def get_solution_modes(self, solution: RCPSPSolution) -> Dict[Hashable, int]:
+        modes = {
+            task: mode
+            for task, mode in zip(
+                self.rcpsp_model.tasks_list_non_dummy, solution.rcpsp_modes
+            )
+        }
+        for task in [self.rcpsp_model.source_task, self.rcpsp_model.sink_task]:
+            modes[task] = min(self.rcpsp_model.mode_details[task])
+        return modes
+
+    def get_modes_from_values(self, values: Dict[int, int]) -> Dict[Hashable, int]:
+        return {
+            task: next(
+                mode
+                for mode, literal in self.modes[task].items()
+                if values[literal.Index()]
+            )
+            for task in self.rcpsp_model.tasks_list
+        }
+
+    def get_solution_variables(self) -> List[cp_model.IntVar]:
+        """Variables whose values are stored for each solution."""
+        variables = [self.start[task] for task in self.rcpsp_model.tasks_list]
+        for task in self.rcpsp_model.tasks_list:
+            variables += list(self.modes[task].values())
+        return variables
+
+    def solve(
+        self, parameters_cp: Optional[ParametersCP] = None, **kwargs: Any
+    ) -> ResultStorage:
+        if parameters_cp is None:
+            parameters_cp = ParametersCP.default()
+        if self.model is None:
+            self.init_model(**kwargs)
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = parameters_cp.time_limit
+        solver.parameters.num_workers = (
+            parameters_cp.nb_process if parameters_cp.multiprocess else 1
+        )
+        collector = _SolutionCollector(
+            variables=self.get_solution_variables(),
+            nr_solutions=parameters_cp.nr_solutions
+            if parameters_cp.intermediate_solution
+            else float("inf"),
+        )
+        status = solver.Solve(self.model, collector)
+        self.status_solver = map_cpsat_status_to_do_status[status]
+        logger.debug(f"CP-SAT status : {solver.StatusName(status)}")
+        logger.debug(solver.ResponseStats())
+        return self.retrieve_solutions(result=collector, parameters_cp=parameters_cp)
+
+    def retrieve_solutions(
+        self, result: _SolutionCollector, parameters_cp: ParametersCP
+    ) -> ResultStorage:
+        list_values = result.values
+        if not parameters_cp.intermediate_solution:
+            list_values = list_values[-1:]
+        list_solution_fits = []
+        for values in list_values:
+            solution = self.build_solution(
+                {
+                    variable.Index(): value
+                    for variable, value in zip(result.variables, values)
+                }
+            )
+            list_solution_fits.append((solution, self.aggreg_from_sol(solution)))
+        if len(list_solution_fits) > 0:
+            # the last solution found by CP-SAT is the best one for its objective
+            list_solution_fits[-1][0].opti_from_cp = True
+        return ResultStorage(
+            list_solution_fits=list_solution_fits,
+            mode_optim=self.params_objective_function.sense_function,
+        )
+
+    def build_solution(self, values: Dict[int, int]) -> RCPSPSolution:
+        """Build the solution from the values of the solution variables, indexed by their proto index."""
+        modes = self.get_modes_from_values(values)
+        rcpsp_schedule = {}
+        for task in self.rcpsp_model.tasks_list:
+            start_time = values[self.start[task].Index()]
+            rcpsp_schedule[task] = {
+                "start_time": start_time,
+                "end_time": start_time
+                + self.rcpsp_model.mode_details[task][modes[task]]["duration"],
+            }
+        return RCPSPSolution(
+            problem=self.rcpsp_model,
+            rcpsp_schedule=rcpsp_schedule,
+            rcpsp_modes=[modes[task] for task in self.rcpsp_model.tasks_list_non_dummy],
+            rcpsp_schedule_feasible=True,
+        )
@@ -6,9 +6,10 @@ import logging
 import operator
 import random
 from enum import Enum
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set
 
 import numpy as np
+import numpy.typing as npt
 from deap import algorithms, creator, gp, tools
 from deap.base import Fitness, Toolbox
 from deap.gp import PrimitiveSet, PrimitiveTree, genHalfAndHalf
@@ -23,6 +24,10 @@ from discrete_optimization.generic_tools.do_problem import (
     build_aggreg_function_and_params_objective,
 )
 from discrete_optimization.generic_tools.do_solver import SolverDO
+from discrete_optimization.generic_tools.ghh_tools import (
+    heuristic_values,
+    register_population_map,
+)
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
 )
@@ -152,6 +157,16 @@ def feature_all_descendants(problem: ANY_RCPSP, cpm, cpm_esd, task_id: int, **kw
     return len(problem.graph.full_successors[task_id]) / problem.n_jobs
 
 
+def compute_full_successors(problem: ANY_RCPSP):
+    """Store the ancestors and descendants of the tasks in the graph, used by feature_all_descendants."""
+    try:
+        if problem.graph.full_successors is None:
+            problem.graph.full_predecessors = problem.graph.ancestors_map()
+            problem.graph.full_successors = problem.graph.descendants_map()
+    except:
+        pass
+
+
 def compute_cpm(problem: ANY_RCPSP):
     cpm_solver = CPM(problem)
     path = cpm_solver.run_classic_cpm()
@@ -240,6 +255,32 @@ feature_static_map = {
 }
 
 
+def compute_feature_matrix(
+    problem: ANY_RCPSP, list_feature: List[FeatureEnum], cpm, cpm_esd
+) -> npt.NDArray[np.float_]:
+    """Features of the tasks of a problem.
+
+    Returns: array(task index, feature index), the tasks being in the order of problem.tasks_list
+
+    """
+    return np.array(
+        [
+            [
+                feature_function_map[lf](
+                    problem=problem,
+                    cpm=cpm,
+                    cpm_esd=cpm_esd,
+                    task_id=task_id,
+                    increase=1,
+                )
+                for lf in list_feature
+            ]
+            for task_id in problem.tasks_list
+        ],
+        dtype=float,
+    ).reshape((problem.n_jobs, len(list_feature)))
+
+
 class EvaluationGPHH(Enum):
     SGS = 0
     PERMUTATION_DISTANCE = 1
@@ -505,13 +546,9 @@ class GPHH(SolverDO):
         self.pset = self.init_primitives(self.params_gphh.set_primitves)
         self.weight = weight
         self.evaluation_method = self.params_gphh.evaluation
-        model = self.domain_model
-        try:
-            if model.graph.full_successors is None:
-                model.graph.full_predecessors = model.graph.ancestors_map()
-                model.graph.full_successors = model.graph.descendants_map()
-        except:
-            pass
+        compute_full_successors(self.domain_model)
+        self.cpm_data = {}
+        self.feature_matrices: Dict[Problem, npt.NDArray[np.float_]] = {}
         self.initialize_cpm_data_for_training()
         self.graphs = {}
         (
@@ -548,11 +585,11 @@ class GPHH(SolverDO):
             "population", tools.initRepeat, list, self.toolbox.individual
         )
         self.toolbox.register("compile", gp.compile, pset=self.pset)
-
         if self.evaluation_method == EvaluationGPHH.SGS:
             self.toolbox.register(
                 "evaluate", self.evaluate_heuristic, domains=self.training_domains
             )
+            register_population_map(self.toolbox, self.evaluate_population)
         elif self.evaluation_method == EvaluationGPHH.PERMUTATION_DISTANCE:
             self.toolbox.register(
                 "evaluate",
@@ -609,7 +646,7 @@ class GPHH(SolverDO):
         self.final_pop = pop
         self.func_heuristic = self.toolbox.compile(expr=self.best_heuristic)
         solution = self.build_solution(
-            domain=self.domain_model, func_heuristic=self.func_heuristic
+            domain=self.domain_model, individual=self.best_heuristic
         )
         return ResultStorage(
             list_solution_fits=[(solution, self.aggreg_from_sol(solution))],
@@ -621,43 +658,61 @@ class GPHH(SolverDO):
             pset.renameArguments(**{"ARG" + str(i): self.list_feature[i].value})
         return pset
 
+    def get_feature_matrix(self, domain: ANY_RCPSP) -> npt.NDArray[np.float_]:
+        """Features of the non dummy tasks of a domain, computed once per domain.
+
+        Returns: array(index of the task in domain.tasks_list_non_dummy, feature index)
+
+        """
+        if domain not in self.feature_matrices:
+            compute_full_successors(domain)
+            if domain not in self.cpm_data:
+                cpm, cpm_esd = compute_cpm(domain)
+                self.cpm_data[domain] = {"cpm": cpm, "cpm_esd": cpm_esd}
+            self.feature_matrices[domain] = compute_feature_matrix(
+                problem=domain,
+                list_feature=self.list_feature,
+                cpm=self.cpm_data[domain]["cpm"],
+                cpm_esd=self.cpm_data[domain]["cpm_esd"],
+            )[[domain.index_task[t] for t in domain.tasks_list_non_dummy]]
+        return self.feature_matrices[domain]
+
+    def compute_permutation(
+        self,
+        domain: ANY_RCPSP,
+        individual: Optional[PrimitiveTree] = None,
+        func_heuristic: Optional[Callable[..., float]] = None,
+    ) -> npt.NDArray[np.int_]:
+        """Non dummy tasks sorted by increasing value of the heuristic.
+
+        Returns: permutation of the indexes of domain.tasks_list_non_dummy, as in RCPSPSolution.rcpsp_permutation
+
+        """
+        feature_matrix = self.get_feature_matrix(domain)
+        values = heuristic_values(
+            expr=individual,
+            pset=self.pset,
+            features=list(feature_matrix.T),
+            shape=(feature_matrix.shape[0],),
+            func_heuristic=func_heuristic,
+        )
+        return np.argsort(values, kind="stable")
+
     def build_solution(self, domain, individual=None, func_heuristic=None):
-        if func_heuristic is None:
-            func_heuristic = self.toolbox.compile(expr=individual)
+        permutation = self.compute_permutation(
+            domain=domain, individual=individual, func_heuristic=func_heuristic
+        )
+        return self.build_solution_from_permutation(
+            domain=domain, permutation=permutation.tolist()
+        )
+
+    def build_solution_from_permutation(self, domain, permutation: List[int]):
         d: ANY_RCPSP = domain
         modes = [1 for j in range(d.n_jobs_non_dummy)]
-        cpm = self.cpm_data[domain]["cpm"]
-        cpm_esd = self.cpm_data[domain]["cpm_esd"]
-        raw_values = []
-        for task_id in d.tasks_list:
-            input_features = [
-                feature_function_map[lf](
-                    problem=domain,
-                    cpm=cpm,
-                    cpm_esd=cpm_esd,
-                    task_id=task_id,
-                    increase=1,
-                )
-                for lf in self.list_feature
-            ]
-            output_value = func_heuristic(*input_features)
-            raw_values.append(output_value)
-
-        normalized_values = [
-            x
-            for x in sorted(
-                range(len(raw_values)), key=lambda k: raw_values[k], reverse=False
-            )
-        ]
-        normalized_values_for_do = [
-            d.index_task_non_dummy[t]
-            for t in normalized_values
-            if t in d.index_task_non_dummy
-        ]
         if isinstance(domain, MS_RCPSPModel):
             solution = MS_RCPSPSolution_Variant(
                 problem=d,
-                priority_list_task=normalized_values_for_do,
+                priority_list_task=permutation,
                 priority_worker_per_task=[
                     [w for w in d.employees_list] for i in range(d.n_jobs_non_dummy)
                 ],
@@ -665,24 +720,50 @@ class GPHH(SolverDO):
             )
         else:
             solution = RCPSPSolution(
-                problem=d, rcpsp_permutation=normalized_values_for_do, rcpsp_modes=modes
+                problem=d, rcpsp_permutation=permutation, rcpsp_modes=modes
             )
         return solution
 
     def evaluate_heuristic(self, individual, domains) -> float:
-        vals = []
-        func_heuristic = self.toolbox.compile(expr=individual)
-        for domain in domains:
-            solution = self.build_solution(
-                individual=individual, domain=domain, func_heuristic=func_heuristic
+        return self.evaluate_population(individuals=[individual], domains=domains)[0]
+
+    def evaluate_population(
+        self, individuals: List[PrimitiveTree], domains: Optional[List[Problem]] = None
+    ) -> List[List[float]]:
+        """Fitness of a population, i.e. the opposite of the mean makespan over the domains.
+
+        Each domain schedules the whole population at once, with its batch sgs (parallel over
+        the individuals) when supported, see `RCPSPModel.evaluate_batch_from_encoding()`.
+        """
+        if domains is None:
+            domains = self.training_domains
+        if len(individuals) == 0:
+            return []
+        makespans = np.zeros((len(domains), len(individuals)))
+        for i, domain in enumerate(domains):
+            permutations = np.array(
+                [
+                    self.compute_permutation(domain=domain, individual=individual)
+                    for individual in individuals
+                ],
+                dtype=np.int32,
             )
-            do_makespan = -solution.get_end_time(domain.sink_task)
-            vals.append(do_makespan)
-        fitness = [np.mean(vals)]
-        return fitness
+            objectives = None
+            if hasattr(domain, "evaluate_batch_from_encoding"):
+                objectives = domain.evaluate_batch_from_encoding(
+                    permutations, "rcpsp_permutation"
+                )
+            if objectives is not None:
+                makespans[i, :] = [obj["makespan"] for obj in objectives]
+            else:
+                makespans[i, :] = [
+                    self.build_solution_from_permutation(
+                        domain=domain, permutation=permutation.tolist()
+                    ).get_end_time(domain.sink_task)
+                    for permutation in permutations
+                ]
+        return [[-mean_makespan] for mean_makespan in np.mean(makespans, axis=0)]
 
     def initialize_cpm_data_for_training(self):
-        self.cpm_data = {}
         for domain in self.training_domains:
-            cpm, cpm_esd = compute_cpm(domain)
-            self.cpm_data[domain] = {"cpm": cpm, "cpm_esd": cpm_esd}
+            self.get_feature_matrix(domain)
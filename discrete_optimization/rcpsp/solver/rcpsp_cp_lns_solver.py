@@ -647,4 +647,5 @@ class LNS_CP_RCPSP_SOLVER(SolverDO):
             skip_first_iteration=kwargs.get("skip_first_iteration", False),
             nb_iteration_no_improvement=kwargs.get("nb_iteration_no_improvement", 100),
             nb_iteration_lns=kwargs.get("nb_iteration_lns", 100),
+            callbacks=kwargs.get("callbacks", None),
         )
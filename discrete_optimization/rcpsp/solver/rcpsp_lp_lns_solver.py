@@ -489,4 +489,5 @@ class LNS_LP_RCPSP_SOLVER(SolverDO):
         return self.lns_solver.solve_lns(
             parameters_milp=self.parameters_milp,
             nb_iteration_lns=kwargs.get("nb_iteration_lns", 100),
+            callbacks=kwargs.get("callbacks", None),
         )
@@ -315,6 +315,10 @@ class RCPSPModelSpecialConstraints(RCPSPModel):
             return objectives
         return None
 
+    def evaluate_batch_from_encoding(self, int_vectors, encoding_name):
+        # the batch sgs does not handle the special constraints
+        return None
+
     def evaluate_function(self, rcpsp_sol: RCPSPSolution):
         if rcpsp_sol._schedule_to_recompute:
             rcpsp_sol.generate_schedule_from_permutation_serial_sgs()
@@ -2,15 +2,46 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
+import heapq
+
 import numba.typed
 import numba.types
 import numpy as np
-from numba import njit
+
+from discrete_optimization.generic_tools.jit_kernels import jit_kernel
+from discrete_optimization.rcpsp.fast_function_rcpsp import _insert_breakpoint
 
 int32_array = numba.types.Array(numba.types.int32, 1, "C")
 
 
-@njit
+@jit_kernel
+def _workers_next_unavailable(worker_available, horizon):
+    # next_unavailable[w, t]: first time >= t where worker w is unavailable, horizon if none,
+    # so that w is available on [t, end) iff next_unavailable[w, t] >= min(end, horizon)
+    nb_workers = worker_available.shape[0]
+    next_unavailable = np.empty((nb_workers, horizon + 1), dtype=np.int32)
+    for w in range(nb_workers):
+        next_unavailable[w, horizon] = horizon
+        for t in range(horizon - 1, -1, -1):
+            if worker_available[w, t] > 0:
+                next_unavailable[w, t] = next_unavailable[w, t + 1]
+            else:
+                next_unavailable[w, t] = t
+    return next_unavailable
+
+
+@jit_kernel
+def _set_worker_unavailable(next_unavailable, worker, start, end):
+    for t in range(start, min(end, next_unavailable.shape[1] - 1)):
+        next_unavailable[worker, t] = t
+    # the times before start where the worker was available until at least start
+    t = start - 1
+    while t >= 0 and next_unavailable[worker, t] > start:
+        next_unavailable[worker, t] = start
+        t -= 1
+
+
+@jit_kernel
 def sgs_fast_ms(
     permutation_task,  # permutation_task=array(task)->task index
     priority_worker_per_task,  # array(task, worker)
@@ -32,7 +63,9 @@ def sgs_fast_ms(
     unfeasible_non_renewable_resources = False
     new_horizon = horizon
     resource_avail_in_time = {}
-    worker_avail_in_time = np.copy(worker_available)
+    nb_workers = worker_available.shape[0]
+    # availability of workers, updated when they are assigned to a task
+    next_unavailable = _workers_next_unavailable(worker_available, horizon)
     for index in range(ressource_available.shape[0]):
         resource_avail_in_time[index] = np.copy(
             ressource_available[index][: new_horizon + 1]
@@ -45,6 +78,7 @@ def sgs_fast_ms(
     nb_task = permutation_task.shape[0]
     pred_links = np.sum(predecessors, axis=1)
     done_np = np.zeros((permutation_task.shape[0]), dtype=np.int64)
+    present = np.zeros(nb_workers, dtype=np.int64)
     while done < nb_task and not unfeasible_non_renewable_resources:
         act_id = 0
         for i in range(nb_task):
@@ -54,11 +88,22 @@ def sgs_fast_ms(
             ):
                 act_id = permutation_task[i]
                 break
+        skills = skills_needs[act_id, modes_array[act_id]]
+        duration = duration_array[act_id, modes_array[act_id]]
+        need_workers = duration > 0 and np.max(skills) > 0
+        # workers able to contribute to the task, computed once for all candidate times
+        useful = np.zeros(nb_workers, dtype=np.bool_)
+        for w in range(nb_workers):
+            if one_unit_per_task:
+                useful[w] = np.all(worker_skills[w, :] >= skills)
+            else:
+                useful[w] = np.any((worker_skills[w, :] > 0) & (skills > 0))
         current_min_time = minimum_starting_time[act_id]
+        nb_present = 0
         valid = False
         while not valid:
             valid = True
-            end_time = current_min_time + duration_array[act_id, modes_array[act_id]]
+            end_time = current_min_time + duration
             for t in range(current_min_time, end_time):
                 for res in range(ressource_available.shape[0]):
                     if t < new_horizon:
@@ -72,53 +117,42 @@ def sgs_fast_ms(
                     else:
                         unfeasible_non_renewable_resources = True
                         break
-                if not valid:
+                if not valid or unfeasible_non_renewable_resources:
                     break
-            if valid:
-                skills = skills_needs[act_id, modes_array[act_id]]
-                if end_time - current_min_time > 0 and np.max(skills) > 0:
-                    indexes_present_worker = np.array(
-                        [
-                            priority_worker_per_task[act_id, i]
-                            for i in range(worker_avail_in_time.shape[0])
-                            if np.min(
-                                worker_avail_in_time[
-                                    priority_worker_per_task[act_id, i],
-                                    current_min_time:end_time,
-                                ]
-                            )
-                            > 0
-                        ]
-                    )
-                    if one_unit_per_task:
-                        indexes_present_worker = np.array(
-                            [
-                                i
-                                for i in indexes_present_worker
-                                if np.all(worker_skills[i, :] >= skills)
-                            ]
-                        )
-                    if len(indexes_present_worker) > 0:
-                        available_skills_t = np.sum(
-                            worker_skills[indexes_present_worker, :], axis=0
+            if unfeasible_non_renewable_resources:
+                break
+            next_time = current_min_time + 1
+            if valid and need_workers:
+                # workers available during the whole task, in priority order
+                nb_present = 0
+                next_time = horizon + 1
+                for i in range(nb_workers):
+                    w = priority_worker_per_task[act_id, i]
+                    if next_unavailable[w, current_min_time] >= min(end_time, horizon):
+                        if useful[w] or not one_unit_per_task:
+                            present[nb_present] = w
+                            nb_present += 1
+                    elif useful[w]:
+                        # w cannot be present before it becomes available again
+                        next_time = min(
+                            next_time, next_unavailable[w, current_min_time] + 1
                         )
-                        if (
-                            np.min(
-                                available_skills_t
-                                - skills_needs[act_id, modes_array[act_id]]
-                            )
-                            < 0
-                        ):
-                            valid = False
-                    else:
-                        valid = False
+                if (
+                    nb_present == 0
+                    or np.min(
+                        np.sum(worker_skills[present[:nb_present], :], axis=0) - skills
+                    )
+                    < 0
+                ):
+                    # until next_time, the present workers can only be a subset of these ones
+                    valid = False
             if not valid:
-                current_min_time += 1
+                current_min_time = max(current_min_time + 1, next_time)
                 if current_min_time > horizon:
                     unfeasible_non_renewable_resources = True
                     break
         if not unfeasible_non_renewable_resources:
-            end_t = current_min_time + duration_array[act_id, modes_array[act_id]]
+            end_t = current_min_time + duration
             for res in range(ressource_available.shape[0]):
                 if ressource_renewable[res]:
                     resource_avail_in_time[res][
@@ -131,13 +165,11 @@ def sgs_fast_ms(
                     if resource_avail_in_time[res][horizon] < 0:
                         unfeasible_non_renewable_resources = True
                         break
-            skills = skills_needs[act_id, modes_array[act_id]]
+            indexes_present_worker = present[:nb_present]
             skills_done = np.zeros((skills.shape[0]))
-            skills_usage_i = np.zeros(
-                (worker_avail_in_time.shape[0], skills_needs.shape[2])
-            )
+            skills_usage_i = np.zeros((nb_workers, skills_needs.shape[2]))
             used = [0]
-            if np.max(skills) > 0:
+            if need_workers:
                 while True:
                     score = [
                         np.sum(worker_skills[p, :] * ((skills - skills_done) > 0))
@@ -154,7 +186,9 @@ def sgs_fast_ms(
                         for nnz in nz:
                             skills_usage_i[j, nnz] = 1
                             skills_done[nnz] += worker_skills[j, nnz]
-                        worker_avail_in_time[j, current_min_time:end_t] = 0
+                        _set_worker_unavailable(
+                            next_unavailable, j, current_min_time, end_t
+                        )
                         used += [j]
                     if np.all(skills_done >= skills):
                         break
@@ -180,7 +214,290 @@ def sgs_fast_ms(
     return rcpsp_schedule, skills_usage, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
+def _worker_is_available(
+    worker,
+    start,
+    end,
+    worker_intervals_ptr,
+    worker_intervals,
+    busy_starts,
+    busy_ends,
+    busy_count,
+):
+    # the worker is available on [start, end) if an availability interval contains it
+    # and no task already assigned to the worker overlaps it
+    first = worker_intervals_ptr[worker]
+    last = worker_intervals_ptr[worker + 1]
+    k = (
+        first
+        + np.searchsorted(worker_intervals[first:last, 0], start, side="right")
+        - 1
+    )
+    if k < first or worker_intervals[k, 1] < end:
+        return False
+    # busy intervals are sorted and disjoint, so are their ends
+    i = np.searchsorted(busy_starts[worker, : busy_count[worker]], end, side="left")
+    return not (i > 0 and busy_ends[worker, i - 1] > start)
+
+
+@jit_kernel
+def _worker_earliest_start(
+    worker,
+    start,
+    duration,
+    horizon,
+    worker_intervals_ptr,
+    worker_intervals,
+    busy_starts,
+    busy_ends,
+    busy_count,
+):
+    # earliest time >= start where the worker is available during duration, horizon + 1 if none
+    first = worker_intervals_ptr[worker]
+    last = worker_intervals_ptr[worker + 1]
+    while start + duration <= horizon:
+        k = (
+            first
+            + np.searchsorted(worker_intervals[first:last, 0], start, side="right")
+            - 1
+        )
+        if k < first or worker_intervals[k, 1] < start + duration:
+            # availability intervals are maximal: jump to the next one
+            if k + 1 >= last:
+                return horizon + 1
+            start = worker_intervals[k + 1, 0]
+            continue
+        i = np.searchsorted(
+            busy_starts[worker, : busy_count[worker]], start + duration, side="left"
+        )
+        if i > 0 and busy_ends[worker, i - 1] > start:
+            start = busy_ends[worker, i - 1]
+            continue
+        return start
+    return horizon + 1
+
+
+@jit_kernel
+def sgs_fast_ms_event(
+    permutation_task,  # permutation_task=array(task)->task index
+    priority_worker_per_task,  # array(task, worker)
+    modes_array,  # modes=array(task)->0, 1...
+    consumption_array,  # consumption_array=array3D(task, mode, res),
+    skills_needs,  # array(task, mode, skill)
+    duration_array,  # array(task, mode) -> d
+    predecessors_count,  # array(task)->number of predecessors
+    successors_ptr,  # CSR pointers of successors lists
+    successors_index,  # CSR successors indexes
+    horizon,  # int
+    ressource_breakpoints,  # array(nb_breakpoints)->time where availability changes
+    ressource_breakpoints_availability,  # array(res, nb_breakpoints)->availability
+    ressource_renewable,  # array(res)->bool
+    worker_intervals_ptr,  # CSR pointers of the availability intervals of workers
+    worker_intervals,  # array(nb_intervals, 2)->[start, end) where a worker is available
+    worker_skills,  # array(workers, skills)->int
+    minimum_starting_time_array,
+    one_unit_per_task: bool = True,
+):
+    """Serial SGS of multiskill problems reading calendars given as step functions.
+
+    Same output as sgs_fast_ms, without arrays of horizon length: the resources availability is
+    a profile of breakpoints and the workers availability a list of intervals per worker.
+    The candidate start time of a task jumps to the next time where some resource or some worker
+    becomes available, and precedences are given in CSR format.
+    """
+    nb_task = permutation_task.shape[0]
+    nb_res = ressource_breakpoints_availability.shape[0]
+    nb_workers = worker_skills.shape[0]
+    nb_skills = worker_skills.shape[1]
+    capacity = ressource_breakpoints.shape[0] + 2 * nb_task + 1
+    times = np.zeros(capacity, dtype=np.int64)
+    avail = np.zeros((nb_res, capacity), dtype=np.int64)
+    nb_points = ressource_breakpoints.shape[0]
+    for k in range(nb_points):
+        times[k] = ressource_breakpoints[k]
+        for res in range(nb_res):
+            avail[res, k] = ressource_breakpoints_availability[res, k]
+    busy_starts = np.zeros((nb_workers, nb_task), dtype=np.int64)
+    busy_ends = np.zeros((nb_workers, nb_task), dtype=np.int64)
+    busy_count = np.zeros(nb_workers, dtype=np.int64)
+    position = np.zeros(nb_task, dtype=np.int64)
+    for i in range(nb_task):
+        position[permutation_task[i]] = i
+    pred_links = np.zeros(nb_task, dtype=np.int64)
+    minimum_starting_time = np.zeros(nb_task, dtype=np.int64)
+    eligible = [np.int64(x) for x in range(0)]
+    for i in range(nb_task):
+        pred_links[i] = predecessors_count[i]
+        minimum_starting_time[i] = minimum_starting_time_array[i]
+    for i in range(nb_task):
+        if pred_links[permutation_task[i]] == 0:
+            heapq.heappush(eligible, np.int64(i))
+    rcpsp_schedule = {}
+    skills_usage = {}
+    unfeasible_non_renewable_resources = False
+    while len(eligible) > 0:
+        act_id = permutation_task[heapq.heappop(eligible)]
+        mode = modes_array[act_id]
+        duration = duration_array[act_id, mode]
+        skills = skills_needs[act_id, mode]
+        need_workers = duration > 0 and np.max(skills) > 0
+        start = minimum_starting_time[act_id]
+        indexes_present_worker = np.zeros(0, dtype=np.int64)
+        if duration > 0:
+            k = np.searchsorted(times[:nb_points], start, side="right") - 1
+            while True:
+                if start + duration > horizon:
+                    unfeasible_non_renewable_resources = True
+                    break
+                valid = True
+                j = k
+                while j < nb_points and times[j] < start + duration:
+                    for res in range(nb_res):
+                        if avail[res, j] < consumption_array[act_id, mode, res]:
+                            valid = False
+                            break
+                    if not valid:
+                        break
+                    j += 1
+                if not valid:
+                    # jump to the end of the segment lacking resources
+                    k = j + 1
+                    start = times[k] if k < nb_points else horizon
+                    continue
+                if not need_workers:
+                    break
+                present = np.zeros(nb_workers, dtype=np.int64)
+                nb_present = 0
+                for i in range(nb_workers):
+                    worker = priority_worker_per_task[act_id, i]
+                    if _worker_is_available(
+                        worker,
+                        start,
+                        start + duration,
+                        worker_intervals_ptr,
+                        worker_intervals,
+                        busy_starts,
+                        busy_ends,
+                        busy_count,
+                    ):
+                        if not one_unit_per_task or np.all(
+                            worker_skills[worker, :] >= skills
+                        ):
+                            present[nb_present] = worker
+                            nb_present += 1
+                indexes_present_worker = present[:nb_present]
+                if nb_present > 0:
+                    available_skills_t = np.sum(
+                        worker_skills[indexes_present_worker, :], axis=0
+                    )
+                    if np.min(available_skills_t - skills) >= 0:
+                        break
+                # the workers available at start are not enough: jump to the earliest time
+                # where another useful worker becomes available
+                next_start = horizon + 1
+                for worker in range(nb_workers):
+                    if one_unit_per_task:
+                        useful = np.all(worker_skills[worker, :] >= skills)
+                    else:
+                        useful = np.any((worker_skills[worker, :] > 0) & (skills > 0))
+                    if not useful or _worker_is_available(
+                        worker,
+                        start,
+                        start + duration,
+                        worker_intervals_ptr,
+                        worker_intervals,
+                        busy_starts,
+                        busy_ends,
+                        busy_count,
+                    ):
+                        continue
+                    next_start = min(
+                        next_start,
+                        _worker_earliest_start(
+                            worker,
+                            start + 1,
+                            duration,
+                            horizon,
+                            worker_intervals_ptr,
+                            worker_intervals,
+                            busy_starts,
+                            busy_ends,
+                            busy_count,
+                        ),
+                    )
+                if next_start > horizon:
+                    unfeasible_non_renewable_resources = True
+                    break
+                start = next_start
+                k = np.searchsorted(times[:nb_points], start, side="right") - 1
+            if unfeasible_non_renewable_resources:
+                break
+        end = start + duration
+        k_start = nb_points
+        if start < horizon:
+            k_start, nb_points = _insert_breakpoint(times, avail, nb_points, start)
+        k_end = nb_points
+        if end < horizon:
+            k_end, nb_points = _insert_breakpoint(times, avail, nb_points, end)
+        for res in range(nb_res):
+            consumption = consumption_array[act_id, mode, res]
+            if ressource_renewable[res]:
+                for k in range(k_start, k_end):
+                    avail[res, k] -= consumption
+            else:
+                for k in range(k_start, nb_points):
+                    avail[res, k] -= consumption
+                if avail[res, nb_points - 1] < 0:
+                    unfeasible_non_renewable_resources = True
+                    break
+        if unfeasible_non_renewable_resources:
+            break
+        # greedy choice of the workers, as in sgs_fast_ms
+        skills_done = np.zeros((skills.shape[0]))
+        skills_usage_i = np.zeros((nb_workers, nb_skills))
+        used = [0]
+        if need_workers:
+            while True:
+                score = [
+                    np.sum(worker_skills[p, :] * ((skills - skills_done) > 0))
+                    for p in indexes_present_worker
+                ]
+                sort = [
+                    indexes_present_worker[p]
+                    for p in np.argsort(-np.array(score))
+                    if indexes_present_worker[p] not in used[1:]
+                ]
+                j = sort[0]
+                nz = np.nonzero(worker_skills[j, :] * skills > 0)[0]
+                if len(nz) > 0:
+                    for nnz in nz:
+                        skills_usage_i[j, nnz] = 1
+                        skills_done[nnz] += worker_skills[j, nnz]
+                    # insert [start, end) in the sorted busy intervals of the worker
+                    i = busy_count[j]
+                    while i > 0 and busy_starts[j, i - 1] > start:
+                        busy_starts[j, i] = busy_starts[j, i - 1]
+                        busy_ends[j, i] = busy_ends[j, i - 1]
+                        i -= 1
+                    busy_starts[j, i] = start
+                    busy_ends[j, i] = end
+                    busy_count[j] += 1
+                    used += [j]
+                if np.all(skills_done >= skills):
+                    break
+        rcpsp_schedule[act_id] = (start, end)
+        skills_usage[act_id] = skills_usage_i
+        for s in range(successors_ptr[act_id], successors_ptr[act_id + 1]):
+            succ = successors_index[s]
+            minimum_starting_time[succ] = max(minimum_starting_time[succ], end)
+            pred_links[succ] -= 1
+            if pred_links[succ] == 0:
+                heapq.heappush(eligible, position[succ])
+    return rcpsp_schedule, skills_usage, unfeasible_non_renewable_resources
+
+
+@jit_kernel
 def sgs_fast_ms_partial_schedule(
     permutation_task,  # permutation_task=array(task)->task index
     priority_worker_per_task,  # array(task, worker)
@@ -395,7 +712,7 @@ def sgs_fast_ms_partial_schedule(
     return rcpsp_schedule, skills_usage, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_ms_preemptive(
     permutation_task,  # permutation_task=array(task)->task index
     priority_worker_per_task,  # array(task, worker)
@@ -738,7 +1055,7 @@ def sgs_fast_ms_preemptive(
     return starts_dict, ends_dict, skills_usage, unfeasible_sched
 
 
-@njit
+@jit_kernel
 def sgs_fast_ms_preemptive_some_special_constraints(
     permutation_task,  # permutation_task=array(task)->task index
     priority_worker_per_task,  # array(task, worker)
@@ -1063,7 +1380,7 @@ def sgs_fast_ms_preemptive_some_special_constraints(
     return starts_dict, ends_dict, skills_usage, unfeasible_non_renewable_resources
 
 
-@njit
+@jit_kernel
 def sgs_fast_ms_preemptive_partial_schedule(
     permutation_task,  # permutation_task=array(task)->task index
     priority_worker_per_task,  # array(task, worker)
@@ -1398,3 +1715,277 @@ def sgs_fast_ms_preemptive_partial_schedule(
                     )
                     pred_links[s] -= 1
     return starts_dict, ends_dict, skills_usage, unfeasible_non_renewable_resources
+
+
+@jit_kernel
+def _add_busy_interval(busy_starts, busy_ends, busy_count, worker, start, end):
+    # insert [start, end) in the busy intervals of the worker, sorted by start
+    i = busy_count[worker]
+    while i > 0 and busy_starts[worker, i - 1] > start:
+        busy_starts[worker, i] = busy_starts[worker, i - 1]
+        busy_ends[worker, i] = busy_ends[worker, i - 1]
+        i -= 1
+    busy_starts[worker, i] = start
+    busy_ends[worker, i] = end
+    busy_count[worker] += 1
+
+
+@jit_kernel
+def sgs_fast_ms_event_partial_schedule(
+    permutation_task,  # permutation_task=array(task)->task index
+    priority_worker_per_task,  # array(task, worker)
+    modes_array,  # modes=array(task)->0, 1...
+    scheduled_task_indicator,  # array(task)->bool
+    scheduled_start_task_times,  # array(task)->int
+    scheduled_end_task_times,  # array(task)->int
+    worker_used,  # array(task, worker)->bool
+    current_time,  # int
+    consumption_array,  # consumption_array=array3D(task, mode, res),
+    skills_needs,  # array(task, mode, skill)
+    duration_array,  # array(task, mode) -> d
+    predecessors_count,  # array(task)->number of predecessors
+    successors_ptr,  # CSR pointers of successors lists
+    successors_index,  # CSR successors indexes
+    horizon,  # int
+    ressource_breakpoints,  # array(nb_breakpoints)->time where availability changes
+    ressource_breakpoints_availability,  # array(res, nb_breakpoints)->availability
+    ressource_renewable,  # array(res)->bool
+    worker_intervals_ptr,  # CSR pointers of the availability intervals of workers
+    worker_intervals,  # array(nb_intervals, 2)->[start, end) where a worker is available
+    worker_skills,  # array(workers, skills)->int
+    minimum_starting_time_array,
+    one_unit_per_task: bool = True,
+):
+    """Partial serial SGS of multiskill problems reading calendars given as step functions.
+
+    Same output as sgs_fast_ms_partial_schedule, with the calendars and precedences of
+    sgs_fast_ms_event. Tasks of null duration are not assigned any worker.
+    """
+    nb_task = permutation_task.shape[0]
+    nb_res = ressource_breakpoints_availability.shape[0]
+    nb_workers = worker_skills.shape[0]
+    nb_skills = worker_skills.shape[1]
+    capacity = ressource_breakpoints.shape[0] + 2 * nb_task + 1
+    times = np.zeros(capacity, dtype=np.int64)
+    avail = np.zeros((nb_res, capacity), dtype=np.int64)
+    nb_points = ressource_breakpoints.shape[0]
+    for k in range(nb_points):
+        times[k] = ressource_breakpoints[k]
+        for res in range(nb_res):
+            avail[res, k] = ressource_breakpoints_availability[res, k]
+    busy_starts = np.zeros((nb_workers, nb_task), dtype=np.int64)
+    busy_ends = np.zeros((nb_workers, nb_task), dtype=np.int64)
+    busy_count = np.zeros(nb_workers, dtype=np.int64)
+    position = np.zeros(nb_task, dtype=np.int64)
+    for i in range(nb_task):
+        position[permutation_task[i]] = i
+    pred_links = np.zeros(nb_task, dtype=np.int64)
+    minimum_starting_time = np.zeros(nb_task, dtype=np.int64)
+    done_np = np.zeros(nb_task, dtype=np.bool_)
+    for i in range(nb_task):
+        pred_links[i] = predecessors_count[i]
+        minimum_starting_time[i] = max(current_time, minimum_starting_time_array[i])
+    rcpsp_schedule = {}
+    skills_usage = {}
+    unfeasible_non_renewable_resources = False
+    for t in range(nb_task):
+        if scheduled_task_indicator[t] == 0:
+            continue
+        mode = modes_array[t]
+        start = scheduled_start_task_times[t]
+        end = scheduled_end_task_times[t]
+        rcpsp_schedule[t] = (start, end)
+        # the consumption of non renewable resources is counted from the end of the task
+        k_start = nb_points
+        if start < horizon:
+            k_start, nb_points = _insert_breakpoint(times, avail, nb_points, start)
+        k_end = nb_points
+        if end < horizon:
+            k_end, nb_points = _insert_breakpoint(times, avail, nb_points, end)
+        for res in range(nb_res):
+            consumption = consumption_array[t, mode, res]
+            if ressource_renewable[res]:
+                for k in range(k_start, k_end):
+                    avail[res, k] -= consumption
+            else:
+                for k in range(k_end, nb_points):
+                    avail[res, k] -= consumption
+                if avail[res, nb_points - 1] < 0:
+                    unfeasible_non_renewable_resources = True
+                    break
+        if unfeasible_non_renewable_resources:
+            break
+        for s in range(successors_ptr[t], successors_ptr[t + 1]):
+            succ = successors_index[s]
+            minimum_starting_time[succ] = max(minimum_starting_time[succ], end)
+            pred_links[succ] -= 1
+        done_np[t] = True
+        skills_usage_t = np.zeros((nb_workers, nb_skills))
+        skills = skills_needs[t, mode]
+        if np.max(skills) > 0:
+            skills_done = np.zeros((skills.shape[0]))
+            for worker in range(nb_workers):
+                if not worker_used[t, worker]:
+                    continue
+                nz = np.nonzero(worker_skills[worker, :] * skills > 0)[0]
+                if len(nz) > 0:
+                    for nnz in nz:
+                        skills_usage_t[worker, nnz] = 1
+                        skills_done[nnz] += worker_skills[worker, nnz]
+                    if end > start:
+                        _add_busy_interval(
+                            busy_starts, busy_ends, busy_count, worker, start, end
+                        )
+                if np.all(skills_done > skills):
+                    break
+        skills_usage[t] = skills_usage_t
+    eligible = [np.int64(x) for x in range(0)]
+    if not unfeasible_non_renewable_resources:
+        for i in range(nb_task):
+            if (
+                pred_links[permutation_task[i]] == 0
+                and not done_np[permutation_task[i]]
+            ):
+                heapq.heappush(eligible, np.int64(i))
+    while len(eligible) > 0:
+        act_id = permutation_task[heapq.heappop(eligible)]
+        mode = modes_array[act_id]
+        duration = duration_array[act_id, mode]
+        skills = skills_needs[act_id, mode]
+        need_workers = duration > 0 and np.max(skills) > 0
+        start = minimum_starting_time[act_id]
+        indexes_present_worker = np.zeros(0, dtype=np.int64)
+        if duration > 0:
+            k = np.searchsorted(times[:nb_points], start, side="right") - 1
+            while True:
+                if start + duration > horizon:
+                    unfeasible_non_renewable_resources = True
+                    break
+                valid = True
+                j = k
+                while j < nb_points and times[j] < start + duration:
+                    for res in range(nb_res):
+                        if avail[res, j] < consumption_array[act_id, mode, res]:
+                            valid = False
+                            break
+                    if not valid:
+                        break
+                    j += 1
+                if not valid:
+                    # jump to the end of the segment lacking resources
+                    k = j + 1
+                    start = times[k] if k < nb_points else horizon
+                    continue
+                if not need_workers:
+                    break
+                present = np.zeros(nb_workers, dtype=np.int64)
+                nb_present = 0
+                for i in range(nb_workers):
+                    worker = priority_worker_per_task[act_id, i]
+                    if _worker_is_available(
+                        worker,
+                        start,
+                        start + duration,
+                        worker_intervals_ptr,
+                        worker_intervals,
+                        busy_starts,
+                        busy_ends,
+                        busy_count,
+                    ):
+                        if not one_unit_per_task or np.all(
+                            worker_skills[worker, :] >= skills
+                        ):
+                            present[nb_present] = worker
+                            nb_present += 1
+                indexes_present_worker = present[:nb_present]
+                if nb_present > 0:
+                    available_skills_t = np.sum(
+                        worker_skills[indexes_present_worker, :], axis=0
+                    )
+                    if np.min(available_skills_t - skills) >= 0:
+                        break
+                # the workers available at start are not enough: jump to the earliest time
+                # where another useful worker becomes available
+                next_start = horizon + 1
+                for worker in range(nb_workers):
+                    if one_unit_per_task:
+                        useful = np.all(worker_skills[worker, :] >= skills)
+                    else:
+                        useful = np.any((worker_skills[worker, :] > 0) & (skills > 0))
+                    if not useful or _worker_is_available(
+                        worker,
+                        start,
+                        start + duration,
+                        worker_intervals_ptr,
+                        worker_intervals,
+                        busy_starts,
+                        busy_ends,
+                        busy_count,
+                    ):
+                        continue
+                    next_start = min(
+                        next_start,
+                        _worker_earliest_start(
+                            worker,
+                            start + 1,
+                            duration,
+                            horizon,
+                            worker_intervals_ptr,
+                            worker_intervals,
+                            busy_starts,
+                            busy_ends,
+                            busy_count,
+                        ),
+                    )
+                if next_start > horizon:
+                    unfeasible_non_renewable_resources = True
+                    break
+                start = next_start
+                k = np.searchsorted(times[:nb_points], start, side="right") - 1
+            if unfeasible_non_renewable_resources:
+                break
+        end = start + duration
+        k_start = nb_points
+        if start < horizon:
+            k_start, nb_points = _insert_breakpoint(times, avail, nb_points, start)
+        k_end = nb_points
+        if end < horizon:
+            k_end, nb_points = _insert_breakpoint(times, avail, nb_points, end)
+        for res in range(nb_res):
+            consumption = consumption_array[act_id, mode, res]
+            if ressource_renewable[res]:
+                for k in range(k_start, k_end):
+                    avail[res, k] -= consumption
+            else:
+                for k in range(k_start, nb_points):
+                    avail[res, k] -= consumption
+                if avail[res, nb_points - 1] < 0:
+                    unfeasible_non_renewable_resources = True
+                    break
+        if unfeasible_non_renewable_resources:
+            break
+        # workers assigned in priority order, as in sgs_fast_ms_partial_schedule
+        skills_done = np.zeros((skills.shape[0]))
+        skills_usage_i = np.zeros((nb_workers, nb_skills))
+        if need_workers:
+            for worker in indexes_present_worker:
+                nz = np.nonzero(worker_skills[worker, :] * skills > 0)[0]
+                if len(nz) > 0:
+                    for nnz in nz:
+                        skills_usage_i[worker, nnz] = 1
+                        skills_done[nnz] += worker_skills[worker, nnz]
+                    _add_busy_interval(
+                        busy_starts, busy_ends, busy_count, worker, start, end
+                    )
+                if np.all(skills_done >= skills):
+                    break
+        rcpsp_schedule[act_id] = (start, end)
+        done_np[act_id] = True
+        skills_usage[act_id] = skills_usage_i
+        for s in range(successors_ptr[act_id], successors_ptr[act_id + 1]):
+            succ = successors_index[s]
+            minimum_starting_time[succ] = max(minimum_starting_time[succ], end)
+            pred_links[succ] -= 1
+            if pred_links[succ] == 0 and not done_np[succ]:
+                heapq.heappush(eligible, position[succ])
+    return rcpsp_schedule, skills_usage, unfeasible_non_renewable_resources
@@ -8,10 +8,20 @@ from collections import defaultdict
 from copy import deepcopy
 from enum import Enum
 from functools import partial
-from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
-import scipy.stats as ss
 
 from discrete_optimization.generic_tools.do_problem import (
     EncodingRegister,
@@ -26,12 +36,25 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeObjective,
 )
 from discrete_optimization.generic_tools.graph_api import Graph
-from discrete_optimization.rcpsp.rcpsp_model import RCPSPModel
+from discrete_optimization.generic_tools.interval_calendar import (
+    IntervalCalendar,
+    calendar_available_intervals,
+    calendar_step_function,
+    calendar_total,
+)
+from discrete_optimization.generic_tools.jit_kernels import register_warm_up
+from discrete_optimization.rcpsp.fast_function_rcpsp import (
+    build_successors_csr,
+    dense_precedences_from_csr,
+)
+from discrete_optimization.rcpsp.rcpsp_model import EVENT_SGS_MIN_HORIZON, RCPSPModel
 from discrete_optimization.rcpsp.specialized_rcpsp.rcpsp_specialized_constraints import (
     SpecialConstraintsDescription,
 )
 from discrete_optimization.rcpsp_multiskill.fast_function_ms_rcpsp import (
     sgs_fast_ms,
+    sgs_fast_ms_event,
+    sgs_fast_ms_event_partial_schedule,
     sgs_fast_ms_partial_schedule,
     sgs_fast_ms_preemptive,
     sgs_fast_ms_preemptive_partial_schedule,
@@ -1858,12 +1881,12 @@ class SkillDetail:
 
 class Employee:
     dict_skill: Dict[str, SkillDetail]
-    calendar_employee: List[bool]
+    calendar_employee: Union[List[bool], IntervalCalendar]
 
     def __init__(
         self,
         dict_skill: Dict[str, SkillDetail],
-        calendar_employee: List[bool],
+        calendar_employee: Union[List[bool], IntervalCalendar],
         salary: float = 0.0,
     ):
         self.salary = salary
@@ -1873,7 +1896,10 @@ class Employee:
     def copy(self):
         return Employee(
             dict_skill={s: self.dict_skill[s].copy() for s in self.dict_skill},
-            calendar_employee=list(self.calendar_employee),
+            # interval calendars are immutable
+            calendar_employee=self.calendar_employee
+            if isinstance(self.calendar_employee, IntervalCalendar)
+            else list(self.calendar_employee),
         )
 
     def get_non_zero_skills(self):
@@ -1889,7 +1915,9 @@ class Employee:
                     }
                     for s in self.dict_skill
                 },
-                "calendar_employee": list(self.calendar_employee),
+                "calendar_employee": self.calendar_employee.to_json()
+                if isinstance(self.calendar_employee, IntervalCalendar)
+                else list(self.calendar_employee),
             }
         else:
             return {
@@ -1903,6 +1931,19 @@ class Employee:
                 "calendar_employee": [True],
             }
 
+    @staticmethod
+    def from_json(data: Dict[str, Any]) -> "Employee":
+        """Inverse of `to_json()`."""
+        calendar_employee = data["calendar_employee"]
+        if isinstance(calendar_employee, dict):
+            calendar_employee = IntervalCalendar.from_json(calendar_employee)
+        return Employee(
+            dict_skill={
+                s: SkillDetail(**data["dict_skill"][s]) for s in data["dict_skill"]
+            },
+            calendar_employee=calendar_employee,
+        )
+
     def get_skill_level(self, s):
         return self.dict_skill.get(s, SkillDetail(0, 0, 0)).skill_value
 
@@ -1959,6 +2000,7 @@ class MS_RCPSPModel(Problem):
         never_releasable_resources: Set[str] = None,
         resource_blocking_data: List[Tuple[List[Hashable], Set[str]]] = None,
         strictly_disjunctive_subtasks: bool = True,
+        np_data: Optional[Dict[str, np.ndarray]] = None,
     ):
         self.skills_set = skills_set
         self.skills_list = sorted(self.skills_set)
@@ -2021,7 +2063,11 @@ class MS_RCPSPModel(Problem):
                 max(
                     [
                         len(
-                            set(self.resources_availability[res])
+                            set(self.resources_availability[res].values.tolist())
+                            if isinstance(
+                                self.resources_availability[res], IntervalCalendar
+                            )
+                            else set(self.resources_availability[res])
                             if isinstance(self.resources_availability[res], Iterable)
                             else {self.resources_availability[res]}
                         )
@@ -2033,7 +2079,11 @@ class MS_RCPSPModel(Problem):
 
         self.max_resource_capacity = {}
         for r in self.resources_availability:
-            if isinstance(self.resources_availability[r], Iterable):
+            if isinstance(self.resources_availability[r], IntervalCalendar):
+                self.max_resource_capacity[r] = int(
+                    np.max(self.resources_availability[r].values, initial=0)
+                )
+            elif isinstance(self.resources_availability[r], Iterable):
                 self.max_resource_capacity[r] = max(self.resources_availability[r])
             else:
                 self.max_resource_capacity[r] = self.resources_availability[r]
@@ -2073,10 +2123,11 @@ class MS_RCPSPModel(Problem):
                 for predt2 in self.predecessors_dict[t2]:
                     if t1 not in self.successors[predt2]:
                         self.successors[predt2] += [t1]
-        self.graph = self.compute_graph()
-        self.predecessors = self.graph.predecessors_dict
+        self._graph: Optional[Graph] = None
         self.total_number_step_available = {
-            employee: sum(self.employees[employee].calendar_employee[: self.horizon])
+            employee: calendar_total(
+                self.employees[employee].calendar_employee, self.horizon
+            )
             for employee in self.employees
         }
 
@@ -2133,8 +2184,13 @@ class MS_RCPSPModel(Problem):
                 ):
                     self.always_releasable_resources.add(r)
         self.strictly_disjunctive_subtasks = strictly_disjunctive_subtasks
-        self.func_sgs, self.func_sgs_partial = create_np_data_and_jit_functions(
-            rcpsp_problem=self
+        # numpy data (see create_np_data()) can be given when already available,
+        # e.g. when loading a saved model
+        if np_data is None:
+            np_data = create_np_data(self)
+        self.np_data = np_data
+        self.func_sgs, self.func_sgs_partial = create_jit_functions(
+            self, np_data=self.np_data
         )
         self.resource_blocking_data = resource_blocking_data
         if self.resource_blocking_data is None:
@@ -2161,9 +2217,25 @@ class MS_RCPSPModel(Problem):
         else:
             return self.resources_availability[res]
 
+    @property
+    def graph(self) -> Graph:
+        """Precedence graph, computed at first use."""
+        if self._graph is None:
+            self._graph = self.compute_graph()
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Graph) -> None:
+        self._graph = graph
+
+    @property
+    def predecessors(self) -> Dict[Hashable, Set[Hashable]]:
+        return self.graph.predecessors_dict
+
     def update_functions(self):
-        self.func_sgs, self.func_sgs_partial = create_np_data_and_jit_functions(
-            rcpsp_problem=self
+        self.np_data = create_np_data(self)
+        self.func_sgs, self.func_sgs_partial = create_jit_functions(
+            self, np_data=self.np_data
         )
 
     def update_function(self):
@@ -2631,25 +2703,16 @@ class MS_RCPSPModel(Problem):
         )
 
     def copy(self):
-        return MS_RCPSPModel(
-            skills_set=self.skills_set,
-            resources_set=self.resources_set,
-            non_renewable_resources=self.non_renewable_resources,
-            resources_availability=self.resources_availability,
-            employees=self.employees,
-            employees_availability=self.employees_availability,
-            mode_details=self.mode_details,
-            successors=self.successors,
-            horizon=self.horizon,
-            sink_task=self.sink_task,
-            source_task=self.source_task,
-            horizon_multiplier=self.horizon_multiplier,
-            partial_preemption_data=self.partial_preemption_data,
-            always_releasable_resources=self.always_releasable_resources,
-            never_releasable_resources=self.never_releasable_resources,
-            resource_blocking_data=self.resource_blocking_data,
-            strictly_disjunctive_subtasks=self.strictly_disjunctive_subtasks,
-        )
+        """Copy the problem without rebuilding its numpy data.
+
+        The copy shares with the original problem its fields (mode_details, successors, employees...),
+        numpy data, sgs functions and precedence graph.
+        Call update_functions() on the copy after replacing some of its fields.
+
+        """
+        model = type(self).__new__(type(self))
+        model.__dict__.update(self.__dict__)
+        return model
 
     def to_variant_model(self):
         return MS_RCPSPModel_Variant(
@@ -2711,6 +2774,7 @@ class MS_RCPSPModel_Variant(MS_RCPSPModel):
         never_releasable_resources: Set[str] = None,
         resource_blocking_data: List[Tuple[List[Hashable], Set[str]]] = None,
         strictly_disjunctive_subtasks: bool = True,
+        np_data: Optional[Dict[str, np.ndarray]] = None,
     ):
         MS_RCPSPModel.__init__(
             self,
@@ -2737,6 +2801,7 @@ class MS_RCPSPModel_Variant(MS_RCPSPModel):
             never_releasable_resources=never_releasable_resources,
             resource_blocking_data=resource_blocking_data,
             strictly_disjunctive_subtasks=strictly_disjunctive_subtasks,
+            np_data=np_data,
         )
         self.fixed_modes = None
         self.fixed_permutation = None
@@ -2864,12 +2929,14 @@ class MS_RCPSPModel_Variant(MS_RCPSPModel):
         )
 
     def convert_fixed_priority_worker_per_task_from_permutation(self, permutation):
+        from scipy.stats import rankdata
+
         priority_worker_per_task_corrected = []
         for i in range(self.n_jobs_non_dummy):
             tmp = []
             for j in range(len(self.employees.keys())):
                 tmp.append(permutation[i * len(self.employees.keys()) + j])
-            tmp_corrected = [int(x) for x in ss.rankdata(tmp)]
+            tmp_corrected = [int(x) for x in rankdata(tmp)]
             priority_worker_per_task_corrected.append(tmp_corrected)
         return priority_worker_per_task_corrected
 
@@ -2901,6 +2968,8 @@ class MS_RCPSPModel_Variant(MS_RCPSPModel):
                 priority_worker_per_task=self.fixed_priority_worker_per_task,
             )
         elif encoding_name == "priority_worker_per_task":
+            from scipy.stats import rankdata
+
             # change the resource permutation priority lists in the solution from int_vector and set the permutation
             # with self.fixed_permutation and the modes with self.fixed_modes
             priority_worker_per_task_corrected = []
@@ -2908,7 +2977,7 @@ class MS_RCPSPModel_Variant(MS_RCPSPModel):
                 tmp = []
                 for j in range(len(self.employees.keys())):
                     tmp.append(int_vector[i * len(self.employees.keys()) + j])
-                tmp_corrected = [int(x) for x in ss.rankdata(tmp)]
+                tmp_corrected = [int(x) for x in rankdata(tmp)]
                 priority_worker_per_task_corrected.append(tmp_corrected)
             rcpsp_sol = MS_RCPSPSolution_Variant(
                 problem=self,
@@ -3092,144 +3161,251 @@ def cluster_employees_to_resource_types(ms_rcpsp_problem: MS_RCPSPModel):
     return skills_representation_str, skills_dict
 
 
+def use_interval_calendars(
+    rcpsp_problem: Union[MS_RCPSPModel, MS_RCPSPModel_Variant]
+) -> bool:
+    """Decide if the calendars should be compiled as step functions (see `create_np_data()`).
+
+    Arrays of horizon length per resource and per employee become too costly on long horizons,
+    or are not wanted when the calendars are already given as IntervalCalendar.
+    Only the non preemptive sgs supports step functions.
+    """
+    if rcpsp_problem.preemptive:
+        return False
+    return (
+        rcpsp_problem.horizon >= EVENT_SGS_MIN_HORIZON
+        or any(
+            isinstance(rcpsp_problem.resources_availability[resource], IntervalCalendar)
+            for resource in rcpsp_problem.resources_list
+        )
+        or any(
+            isinstance(
+                rcpsp_problem.employees[employee].calendar_employee, IntervalCalendar
+            )
+            for employee in rcpsp_problem.employees_list
+        )
+    )
+
+
 def create_np_data_and_jit_functions(
     rcpsp_problem: Union[MS_RCPSPModel, MS_RCPSPModel_Variant]
 ):
-    consumption_array = np.zeros(
-        (
-            rcpsp_problem.n_jobs,
-            rcpsp_problem.max_number_of_mode,
-            len(rcpsp_problem.resources_list),
-        ),
-        dtype=np.int32,
-    )
-    is_releasable_array = np.zeros(
-        (
-            rcpsp_problem.n_jobs,
-            rcpsp_problem.max_number_of_mode,
-            len(rcpsp_problem.resources_list),
-        ),
-        dtype=np.int32,
-    )
-    skills_need = np.zeros(
-        (
-            rcpsp_problem.n_jobs,
-            rcpsp_problem.max_number_of_mode,
-            len(rcpsp_problem.skills_list),
-        ),
-        dtype=np.int32,
-    )
-    duration_array = np.zeros(
-        (rcpsp_problem.n_jobs, rcpsp_problem.max_number_of_mode), dtype=np.int32
-    )
+    return create_jit_functions(rcpsp_problem, np_data=create_np_data(rcpsp_problem))
 
-    predecessors = np.zeros(
-        (rcpsp_problem.n_jobs, rcpsp_problem.n_jobs), dtype=np.int32
-    )
-    successors = np.zeros((rcpsp_problem.n_jobs, rcpsp_problem.n_jobs), dtype=np.int32)
+
+def create_np_data(
+    rcpsp_problem: Union[MS_RCPSPModel, MS_RCPSPModel_Variant]
+) -> Dict[str, np.ndarray]:
+    """Build the numpy arrays describing the problem, used by the sgs kernels.
+
+    Returns: dictionary of arrays with keys
+        consumption_array: array(task, mode, res) of resource consumption
+        is_releasable_array: array(task, mode, res), 1 if the resource is released during preemption
+        consider_partial_preemptive: 0-d boolean array, True if some resource is not releasable
+        skills_need: array(task, mode, skill) of skills needed
+        duration_array: array(task, mode) of durations
+        successors_ptr, successors_index, predecessors_count: precedences in CSR format,
+            see `build_successors_csr()`
+        ressource_available: array(res, horizon) of resource availability
+        ressource_renewable: array(res) of booleans
+        worker_available: array(worker, horizon) of worker availability
+        worker_skills: array(worker, skill) of skill levels
+        minimum_starting_time_array: array(task) of release dates
+        start_at_end_plus_offset, start_after_nunit: array(constraint, 3) of (task1, task2, offset)
+            special constraints
+        preemptive_tag: array(task), 1 if the task can be preempted
+
+    When `use_interval_calendars()` is True, the calendars are given as step functions
+    instead of ressource_available and worker_available:
+        ressource_breakpoints: array(nb_breakpoints) of times where some resource availability changes
+        ressource_breakpoints_availability: array(res, nb_breakpoints) of availability from each breakpoint
+        worker_intervals_ptr, worker_intervals: availability intervals [start, end) of the workers
+            in CSR format, the ones of worker i being worker_intervals[ptr[i]:ptr[i + 1]]
+
+    """
+    n_jobs = rcpsp_problem.n_jobs
+    max_number_of_mode = rcpsp_problem.max_number_of_mode
+    n_resources = len(rcpsp_problem.resources_list)
+    n_skills = len(rcpsp_problem.skills_list)
+    n_workers = len(rcpsp_problem.employees_list)
     horizon = rcpsp_problem.horizon
-    ressource_available = np.zeros(
-        (len(rcpsp_problem.resources_list), horizon), dtype=np.int32
-    )
-    worker_available = np.zeros(
-        (len(rcpsp_problem.employees_list), horizon), dtype=np.int32
+    consumption_array = np.zeros(
+        (n_jobs, max_number_of_mode, n_resources), dtype=np.int32
     )
-    ressource_renewable = np.ones((len(rcpsp_problem.resources_list)), dtype=bool)
-    worker_skills = np.zeros(
-        (len(rcpsp_problem.employees_list), len(rcpsp_problem.skills_list)),
-        dtype=np.int32,
+    is_releasable_array = np.zeros(
+        (n_jobs, max_number_of_mode, n_resources), dtype=np.int32
     )
-    minimum_starting_time_array = np.zeros(rcpsp_problem.n_jobs, dtype=int)
+    skills_need = np.zeros((n_jobs, max_number_of_mode, n_skills), dtype=np.int32)
+    duration_array = np.zeros((n_jobs, max_number_of_mode), dtype=np.int32)
+    ressource_renewable = np.ones(n_resources, dtype=bool)
+    worker_skills = np.zeros((n_workers, n_skills), dtype=np.int32)
+    minimum_starting_time_array = np.zeros(n_jobs, dtype=int)
     consider_partial_preemptive = False
-    for i in range(len(rcpsp_problem.tasks_list)):
-        task = rcpsp_problem.tasks_list[i]
+    for i, task in enumerate(rcpsp_problem.tasks_list):
         task_mode_details = rcpsp_problem.mode_details[task]
-        index_mode = 0
-
-        for mode in sorted(task_mode_details):
-            for k in range(len(rcpsp_problem.resources_list)):
-                resource = rcpsp_problem.resources_list[k]
-                consumption_array[i, index_mode, k] = task_mode_details[mode].get(
-                    resource, 0
-                )
-                if rcpsp_problem.partial_preemption_data[task][mode].get(
-                    resource, True
-                ):
+        for index_mode, mode in enumerate(sorted(task_mode_details)):
+            details = task_mode_details[mode]
+            releasable = rcpsp_problem.partial_preemption_data[task][mode]
+            for k, resource in enumerate(rcpsp_problem.resources_list):
+                consumption_array[i, index_mode, k] = details.get(resource, 0)
+                if releasable.get(resource, True):
                     is_releasable_array[i, index_mode, k] = 1
                 else:
-                    is_releasable_array[i, index_mode, k] = 0
-                if not is_releasable_array[i, index_mode, k]:
                     consider_partial_preemptive = True
-            for s in range(len(rcpsp_problem.skills_list)):
-                skills_need[i, index_mode, s] = rcpsp_problem.mode_details[task][
-                    mode
-                ].get(rcpsp_problem.skills_list[s], 0)
-            duration_array[i, index_mode] = rcpsp_problem.mode_details[task][mode][
-                "duration"
-            ]
-            index_mode += 1
+            for k, skill in enumerate(rcpsp_problem.skills_list):
+                skills_need[i, index_mode, k] = details.get(skill, 0)
+            duration_array[i, index_mode] = details["duration"]
     if rcpsp_problem.includes_special_constraint():
         for t in rcpsp_problem.special_constraints.start_times_window:
             if rcpsp_problem.special_constraints.start_times_window[t][0] is not None:
                 minimum_starting_time_array[
                     rcpsp_problem.index_task[t]
                 ] = rcpsp_problem.special_constraints.start_times_window[t][0]
-    task_index = {rcpsp_problem.tasks_list[i]: i for i in range(rcpsp_problem.n_jobs)}
-    for k in range(len(rcpsp_problem.resources_list)):
-        ressource_available[k, :] = rcpsp_problem.resources_availability[
-            rcpsp_problem.resources_list[k]
-        ][:horizon]
-        if rcpsp_problem.resources_list[k] in rcpsp_problem.non_renewable_resources:
-            ressource_renewable[k] = False
-    for emp in range(len(rcpsp_problem.employees_list)):
-        worker_available[emp, :] = np.array(
-            rcpsp_problem.employees[
-                rcpsp_problem.employees_list[emp]
-            ].calendar_employee,
-            dtype=np.int32,
-        )[:horizon]
-        for s in range(len(rcpsp_problem.skills_list)):
-            worker_skills[emp, s] = (
-                rcpsp_problem.employees[rcpsp_problem.employees_list[emp]]
-                .dict_skill.get(
-                    rcpsp_problem.skills_list[s],
-                    SkillDetail(skill_value=0, efficiency_ratio=0, experience=0),
-                )
-                .skill_value
+    calendars: Dict[str, np.ndarray] = {}
+    if use_interval_calendars(rcpsp_problem):
+        step_functions = [
+            calendar_step_function(
+                rcpsp_problem.resources_availability[resource], horizon
+            )
+            for resource in rcpsp_problem.resources_list
+        ]
+        ressource_breakpoints = np.unique(
+            np.concatenate(
+                [np.zeros(1, dtype=np.int64)]
+                + [breakpoints for breakpoints, _ in step_functions]
             )
-    for i in range(len(rcpsp_problem.tasks_list)):
-        task = rcpsp_problem.tasks_list[i]
-        for s in rcpsp_problem.successors[task]:
-            index_s = task_index[s]
-            predecessors[index_s, i] = 1
-            successors[i, index_s] = 1
-
-    if rcpsp_problem.includes_special_constraint():
-        start_at_end_plus_offset = np.zeros(
-            (len(rcpsp_problem.special_constraints.start_at_end_plus_offset), 3),
-            dtype=int,
         )
-        start_after_nunit = np.zeros(
-            (len(rcpsp_problem.special_constraints.start_after_nunit), 3), dtype=int
+        ressource_breakpoints_availability = np.zeros(
+            (n_resources, ressource_breakpoints.shape[0]), dtype=np.int64
         )
-        j = 0
-        for t1, t2, off in rcpsp_problem.special_constraints.start_at_end_plus_offset:
-            start_at_end_plus_offset[j, 0] = rcpsp_problem.index_task[t1]
-            start_at_end_plus_offset[j, 1] = rcpsp_problem.index_task[t2]
-            start_at_end_plus_offset[j, 2] = off
-            j += 1
-        j = 0
-        for t1, t2, off in rcpsp_problem.special_constraints.start_after_nunit:
-            start_after_nunit[j, 0] = rcpsp_problem.index_task[t1]
-            start_after_nunit[j, 1] = rcpsp_problem.index_task[t2]
-            start_after_nunit[j, 2] = off
-            j += 1
+        for k, (breakpoints, values) in enumerate(step_functions):
+            if breakpoints.shape[0] > 0:
+                ressource_breakpoints_availability[k, :] = values[
+                    np.searchsorted(breakpoints, ressource_breakpoints, side="right")
+                    - 1
+                ]
+        worker_intervals_list = [
+            calendar_available_intervals(
+                rcpsp_problem.employees[employee].calendar_employee, horizon
+            )
+            for employee in rcpsp_problem.employees_list
+        ]
+        worker_intervals_ptr = np.zeros(n_workers + 1, dtype=np.int64)
+        worker_intervals_ptr[1:] = np.cumsum(
+            [intervals.shape[0] for intervals in worker_intervals_list]
+        )
+        calendars["ressource_breakpoints"] = ressource_breakpoints
+        calendars[
+            "ressource_breakpoints_availability"
+        ] = ressource_breakpoints_availability
+        calendars["worker_intervals_ptr"] = worker_intervals_ptr
+        calendars["worker_intervals"] = np.concatenate(
+            [np.zeros((0, 2), dtype=np.int64)] + worker_intervals_list
+        )
+    else:
+        ressource_available = np.zeros((n_resources, horizon), dtype=np.int32)
+        worker_available = np.zeros((n_workers, horizon), dtype=np.int32)
+        for k, resource in enumerate(rcpsp_problem.resources_list):
+            ressource_available[k, :] = rcpsp_problem.resources_availability[resource][
+                :horizon
+            ]
+        for i, employee in enumerate(rcpsp_problem.employees_list):
+            worker_available[i, :] = np.array(
+                rcpsp_problem.employees[employee].calendar_employee[:horizon],
+                dtype=np.int32,
+            )
+        calendars["ressource_available"] = ressource_available
+        calendars["worker_available"] = worker_available
+    for k, resource in enumerate(rcpsp_problem.resources_list):
+        if resource in rcpsp_problem.non_renewable_resources:
+            ressource_renewable[k] = False
+    for i, employee in enumerate(rcpsp_problem.employees_list):
+        dict_skill = rcpsp_problem.employees[employee].dict_skill
+        for k, skill in enumerate(rcpsp_problem.skills_list):
+            if skill in dict_skill:
+                worker_skills[i, k] = dict_skill[skill].skill_value
+    task_index = rcpsp_problem.index_task
+    edges = [
+        (i, task_index[s])
+        for i, task in enumerate(rcpsp_problem.tasks_list)
+        for s in rcpsp_problem.successors[task]
+    ]
+    successors_ptr, successors_index, predecessors_count = build_successors_csr(
+        n_jobs, edges
+    )
+    start_at_end_plus_offset = np.zeros((0, 3), dtype=int)
+    start_after_nunit = np.zeros((0, 3), dtype=int)
+    if rcpsp_problem.includes_special_constraint():
+        start_at_end_plus_offset = np.array(
+            [
+                (task_index[t1], task_index[t2], off)
+                for t1, t2, off in rcpsp_problem.special_constraints.start_at_end_plus_offset
+            ],
+            dtype=int,
+        ).reshape((-1, 3))
+        start_after_nunit = np.array(
+            [
+                (task_index[t1], task_index[t2], off)
+                for t1, t2, off in rcpsp_problem.special_constraints.start_after_nunit
+            ],
+            dtype=int,
+        ).reshape((-1, 3))
+    preemptive_tag = np.ones(n_jobs, dtype=np.int32)
     if rcpsp_problem.preemptive:
-        preemptive_tag = np.ones(rcpsp_problem.n_jobs, dtype=np.int32)
         for t in rcpsp_problem.preemptive_indicator:
-            preemptive_tag[rcpsp_problem.index_task[t]] = (
+            preemptive_tag[task_index[t]] = (
                 1 if rcpsp_problem.preemptive_indicator[t] else 0
             )
+    return dict(
+        consumption_array=consumption_array,
+        is_releasable_array=is_releasable_array,
+        consider_partial_preemptive=np.array(consider_partial_preemptive),
+        skills_need=skills_need,
+        duration_array=duration_array,
+        successors_ptr=successors_ptr,
+        successors_index=successors_index,
+        predecessors_count=predecessors_count,
+        ressource_renewable=ressource_renewable,
+        worker_skills=worker_skills,
+        minimum_starting_time_array=minimum_starting_time_array,
+        start_at_end_plus_offset=start_at_end_plus_offset,
+        start_after_nunit=start_after_nunit,
+        preemptive_tag=preemptive_tag,
+        **calendars,
+    )
+
+
+def create_jit_functions(
+    rcpsp_problem: Union[MS_RCPSPModel, MS_RCPSPModel_Variant],
+    np_data: Dict[str, np.ndarray],
+):
+    """Build the sgs functions from the numpy data of the problem (see `create_np_data()`).
+
+    The step function sgs (sgs_fast_ms_event) is used when the calendars are compiled
+    as step functions.
+
+    Returns: func_sgs, func_sgs_partial
+
+    """
+    if "worker_available" not in np_data:
+        return create_jit_functions_interval_calendars(rcpsp_problem, np_data=np_data)
+    consumption_array = np_data["consumption_array"]
+    is_releasable_array = np_data["is_releasable_array"]
+    consider_partial_preemptive = bool(np_data["consider_partial_preemptive"])
+    skills_need = np_data["skills_need"]
+    duration_array = np_data["duration_array"]
+    ressource_available = np_data["ressource_available"]
+    ressource_renewable = np_data["ressource_renewable"]
+    worker_available = np_data["worker_available"]
+    worker_skills = np_data["worker_skills"]
+    minimum_starting_time_array = np_data["minimum_starting_time_array"]
+    start_at_end_plus_offset = np_data["start_at_end_plus_offset"]
+    start_after_nunit = np_data["start_after_nunit"]
+    preemptive_tag = np_data["preemptive_tag"]
+    predecessors, successors = dense_precedences_from_csr(
+        np_data["successors_ptr"], np_data["successors_index"]
+    )
+    horizon = rcpsp_problem.horizon
 
     # modes_array,          # modes=array(task)->0, 1...
     # consumption_array,    # consumption_array=array3D(task, mode, res),
@@ -3339,6 +3515,43 @@ def create_np_data_and_jit_functions(
     return func_sgs, func_sgs_partial
 
 
+def create_jit_functions_interval_calendars(
+    rcpsp_problem: Union[MS_RCPSPModel, MS_RCPSPModel_Variant],
+    np_data: Dict[str, np.ndarray],
+):
+    """Build the sgs functions from calendars compiled as step functions (see `create_np_data()`).
+
+    Returns: func_sgs, func_sgs_partial
+
+    """
+    if rcpsp_problem.preemptive:
+        raise NotImplementedError(
+            "Calendars given as step functions are not supported by the preemptive sgs."
+        )
+    common_kwargs = dict(
+        consumption_array=np_data["consumption_array"],
+        skills_needs=np_data["skills_need"],
+        worker_skills=np_data["worker_skills"],
+        duration_array=np_data["duration_array"],
+        minimum_starting_time_array=np_data["minimum_starting_time_array"],
+        predecessors_count=np_data["predecessors_count"],
+        successors_ptr=np_data["successors_ptr"],
+        successors_index=np_data["successors_index"],
+        horizon=rcpsp_problem.horizon,
+        ressource_breakpoints=np_data["ressource_breakpoints"],
+        ressource_breakpoints_availability=np_data[
+            "ressource_breakpoints_availability"
+        ],
+        ressource_renewable=np_data["ressource_renewable"],
+        worker_intervals_ptr=np_data["worker_intervals_ptr"],
+        worker_intervals=np_data["worker_intervals"],
+        one_unit_per_task=rcpsp_problem.one_unit_per_task_max,
+    )
+    func_sgs = partial(sgs_fast_ms_event, **common_kwargs)
+    func_sgs_partial = partial(sgs_fast_ms_event_partial_schedule, **common_kwargs)
+    return func_sgs, func_sgs_partial
+
+
 def employee_usage(
     solution: Union[MS_RCPSPSolution, MS_RCPSPSolution_Preemptive],
     problem: MS_RCPSPModel,
@@ -3683,3 +3896,39 @@ def compute_overskill(problem: MS_RCPSPModel, solution: MS_RCPSPSolution_Preempt
                             required_skills[skill],
                         )
     return overskill
+
+
+@register_warm_up("ms_rcpsp")
+def warm_up_ms_rcpsp_kernels() -> None:
+    """Run the sgs kernels used by MS_RCPSPModel_Variant on a tiny instance, see jit_kernels.warm_up_kernels()."""
+    for preemptive, interval_calendars in [
+        (False, False),
+        (True, False),
+        (False, True),
+    ]:
+        calendar_employee: Union[List[bool], IntervalCalendar] = [True] * 10
+        if interval_calendars:
+            calendar_employee = IntervalCalendar.constant(1, 10)
+        model = MS_RCPSPModel_Variant(
+            skills_set={"S1"},
+            resources_set={"R1"},
+            non_renewable_resources=set(),
+            resources_availability={"R1": [2] * 10},
+            employees={
+                1: Employee(
+                    dict_skill={"S1": SkillDetail(1, 0, 0)},
+                    calendar_employee=calendar_employee,
+                )
+            },
+            employees_availability=[1] * 10,
+            mode_details={
+                1: {1: {"duration": 0}},
+                2: {1: {"duration": 2, "R1": 1, "S1": 1}},
+                3: {1: {"duration": 3, "R1": 2}},
+                4: {1: {"duration": 0}},
+            },
+            successors={1: [2, 3], 2: [4], 3: [4], 4: []},
+            horizon=10,
+            preemptive=preemptive,
+        )
+        model.evaluate(model.get_dummy_solution())
@@ -6,6 +6,7 @@ import os
 from typing import Dict, Optional
 
 from discrete_optimization.datasets import fetch_data_from_mslib, get_data_home
+from discrete_optimization.generic_tools.interval_calendar import IntervalCalendar
 from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
     Employee,
     MS_RCPSPModel,
@@ -52,7 +53,9 @@ def get_data_available(
     }
 
 
-def parse_file_mslib(file_path, skill_level_version: bool = True):
+def parse_file_mslib(
+    file_path, skill_level_version: bool = True, interval_calendars: bool = False
+):
     logger.info(f"Parsing file {file_path}")
     with open(file_path, "r", encoding="utf-8") as file:
         f = file.readlines()
@@ -101,7 +104,11 @@ def parse_file_mslib(file_path, skill_level_version: bool = True):
         skills_list = [f"sk-{i}" for i in range(number_skills)]
         workers: Dict[str, Employee] = {
             w: Employee(
-                dict_skill={}, calendar_employee=[True] * (2 * horizon_1 + 1), salary=0
+                dict_skill={},
+                calendar_employee=IntervalCalendar.constant(1, 2 * horizon_1 + 1)
+                if interval_calendars
+                else [True] * (2 * horizon_1 + 1),
+                salary=0,
             )
             for w in workers_list
         }
@@ -10,6 +10,7 @@ import numpy as np
 import pymzn
 
 from discrete_optimization.datasets import fetch_data_from_mspsplib_repo, get_data_home
+from discrete_optimization.generic_tools.interval_calendar import IntervalCalendar
 from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
     Employee,
     MS_RCPSPModel,
@@ -50,7 +51,15 @@ def get_data_available_mspsp(
     return file_paths
 
 
-def parse_dzn_file(file_path) -> MS_RCPSPModel:
+def parse_dzn_file(file_path, interval_calendars: bool = False) -> MS_RCPSPModel:
+    """Parse a mspsp instance in dzn format.
+
+    Args:
+        file_path: path of the instance
+        interval_calendars: if True, the employee calendars are given as IntervalCalendar
+            instead of lists of booleans
+
+    """
     data = pymzn.dzn2dict(file_path, rebase_arrays=True)
     number_of_acts = data["nActs"]
     durations = data["dur"]
@@ -75,7 +84,9 @@ def parse_dzn_file(file_path) -> MS_RCPSPModel:
                 for k in range(len(master[j]))
                 if master[j][k]
             },
-            calendar_employee=[True] * 2000,
+            calendar_employee=IntervalCalendar.constant(1, 2000)
+            if interval_calendars
+            else [True] * 2000,
         )
         for j in range(number_employee)
     }
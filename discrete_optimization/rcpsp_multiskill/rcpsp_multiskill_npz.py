@@ -0,0 +1,433 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+"""Binary .npz format for multiskill rcpsp models, see also discrete_optimization.rcpsp.rcpsp_npz."""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from discrete_optimization.generic_tools.interval_calendar import IntervalCalendar
+from discrete_optimization.generic_tools.npz_archive import (
+    check_json_serializable,
+    load_npz_archive,
+    pack_sequences,
+    save_npz_archive,
+    unpack_sequences,
+)
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
+    Employee,
+    MS_RCPSPModel,
+    MS_RCPSPModel_Variant,
+    SkillDetail,
+)
+
+FORMAT_VERSION = 1
+
+ms_rcpsp_model_classes = {
+    cls.__name__: cls for cls in [MS_RCPSPModel, MS_RCPSPModel_Variant]
+}
+
+# arrays of MS_RCPSPModel.np_data (the calendars being compiled either densely or as step functions)
+np_data_keys = [
+    "consumption_array",
+    "is_releasable_array",
+    "consider_partial_preemptive",
+    "skills_need",
+    "duration_array",
+    "successors_ptr",
+    "successors_index",
+    "predecessors_count",
+    "ressource_available",
+    "ressource_renewable",
+    "worker_available",
+    "worker_skills",
+    "minimum_starting_time_array",
+    "start_at_end_plus_offset",
+    "start_after_nunit",
+    "preemptive_tag",
+    "ressource_breakpoints",
+    "ressource_breakpoints_availability",
+    "worker_intervals_ptr",
+    "worker_intervals",
+]
+
+# np_data arrays and the axis indexed by the resources
+np_data_resource_axis = {
+    "consumption_array": 2,
+    "is_releasable_array": 2,
+    "ressource_available": 0,
+    "ressource_renewable": 0,
+    "ressource_breakpoints_availability": 0,
+}
+
+
+def save_ms_rcpsp_model(
+    ms_rcpsp_model: MS_RCPSPModel, path: Union[str, os.PathLike]
+) -> None:
+    """Save a multiskill rcpsp model in .npz format.
+
+    Supported models are MS_RCPSPModel and MS_RCPSPModel_Variant without special constraints nor
+    resource blocking data, with integer or string task and employee ids and integer mode ids.
+    Calendars are stored as step functions when some of them is an IntervalCalendar.
+
+    Args:
+        ms_rcpsp_model: model to save
+        path: path of the file. The .npz extension is appended if missing.
+
+    """
+    class_name = ms_rcpsp_model.__class__.__name__
+    if ms_rcpsp_model_classes.get(class_name) is not ms_rcpsp_model.__class__:
+        raise NotImplementedError(f"{class_name} cannot be saved in npz format.")
+    if (
+        ms_rcpsp_model.includes_special_constraint()
+        or len(ms_rcpsp_model.resource_blocking_data) > 0
+    ):
+        raise NotImplementedError(
+            "Models with special constraints or resource blocking data cannot be saved in npz format."
+        )
+    for name in ["tasks_list", "employees_list", "resources_list", "skills_list"]:
+        check_json_serializable(getattr(ms_rcpsp_model, name), name)
+    arrays: Dict[str, np.ndarray] = {
+        key: ms_rcpsp_model.np_data[key]
+        for key in np_data_keys
+        if key in ms_rcpsp_model.np_data
+    }
+
+    # mode details
+    n_jobs = ms_rcpsp_model.n_jobs
+    max_number_of_mode = ms_rcpsp_model.max_number_of_mode
+    resources_list = ms_rcpsp_model.resources_list
+    skills_list = ms_rcpsp_model.skills_list
+    mode_ids = np.zeros((n_jobs, max_number_of_mode), dtype=int)
+    nb_modes = np.zeros(n_jobs, dtype=int)
+    resources_defined = np.zeros(
+        (n_jobs, max_number_of_mode, len(resources_list)), dtype=bool
+    )
+    skills_defined = np.zeros(
+        (n_jobs, max_number_of_mode, len(skills_list)), dtype=bool
+    )
+    keys = set(resources_list) | set(skills_list) | {"duration"}
+    for i, task in enumerate(ms_rcpsp_model.tasks_list):
+        task_mode_details = ms_rcpsp_model.mode_details[task]
+        nb_modes[i] = len(task_mode_details)
+        for index_mode, mode in enumerate(sorted(task_mode_details)):
+            details = task_mode_details[mode]
+            if not isinstance(mode, int) or not keys.issuperset(details):
+                raise ValueError(
+                    f"Mode {mode} of task {task} cannot be saved in npz format: {details}"
+                )
+            mode_ids[i, index_mode] = mode
+            resources_defined[i, index_mode, :] = [
+                resource in details for resource in resources_list
+            ]
+            skills_defined[i, index_mode, :] = [
+                skill in details for skill in skills_list
+            ]
+    arrays["mode_ids"] = mode_ids
+    arrays["nb_modes"] = nb_modes
+    arrays["resources_defined"] = resources_defined
+    arrays["skills_defined"] = skills_defined
+    arrays["task_successors_ptr"], arrays["task_successors_index"] = pack_sequences(
+        [
+            [ms_rcpsp_model.index_task[s] for s in ms_rcpsp_model.successors[task]]
+            for task in ms_rcpsp_model.tasks_list
+        ],
+        dtype=np.int32,
+    )
+    arrays["preemptive_indicator"] = np.array(
+        [ms_rcpsp_model.preemptive_indicator[t] for t in ms_rcpsp_model.tasks_list],
+        dtype=bool,
+    )
+
+    # resources and employees calendars
+    employees = [ms_rcpsp_model.employees[e] for e in ms_rcpsp_model.employees_list]
+    resources_calendars = [
+        ms_rcpsp_model.resources_availability[r] for r in resources_list
+    ]
+    employees_calendars = [employee.calendar_employee for employee in employees]
+    interval_calendars = any(
+        isinstance(calendar, IntervalCalendar)
+        for calendar in resources_calendars + employees_calendars
+    )
+    _pack_calendars(
+        arrays,
+        resources_calendars,
+        prefix="resources",
+        values_key="resources_values",
+        dtype=np.int32,
+        interval_calendars=interval_calendars,
+    )
+    _pack_calendars(
+        arrays,
+        employees_calendars,
+        prefix="employees_calendar",
+        values_key="employees_calendar",
+        dtype=bool,
+        interval_calendars=interval_calendars,
+    )
+    arrays["employees_salary"] = np.array(
+        [employee.salary for employee in employees], dtype=float
+    )
+    skills_shape = (len(employees), len(skills_list))
+    arrays["employees_skill_defined"] = np.zeros(skills_shape, dtype=bool)
+    for attribute in ["skill_value", "efficiency_ratio", "experience"]:
+        arrays[f"employees_{attribute}"] = np.zeros(skills_shape, dtype=float)
+    index_skill = {skill: k for k, skill in enumerate(skills_list)}
+    for i, employee in enumerate(employees):
+        for skill, skill_detail in employee.dict_skill.items():
+            if skill not in index_skill:
+                raise ValueError(
+                    f"Skill {skill} of employee {ms_rcpsp_model.employees_list[i]} "
+                    f"is not in the skills of the problem."
+                )
+            arrays["employees_skill_defined"][i, index_skill[skill]] = True
+            for attribute in ["skill_value", "efficiency_ratio", "experience"]:
+                arrays[f"employees_{attribute}"][i, index_skill[skill]] = getattr(
+                    skill_detail, attribute
+                )
+    if ms_rcpsp_model.employees_availability is not None:
+        arrays["employees_availability"] = np.array(
+            ms_rcpsp_model.employees_availability, dtype=np.int32
+        )
+
+    metadata: Dict[str, Any] = dict(
+        format_version=FORMAT_VERSION,
+        class_name=class_name,
+        tasks_list=ms_rcpsp_model.tasks_list,
+        source_task=ms_rcpsp_model.source_task,
+        sink_task=ms_rcpsp_model.sink_task,
+        employees_list=ms_rcpsp_model.employees_list,
+        resources_list=resources_list,
+        skills_list=skills_list,
+        non_renewable_resources=sorted(ms_rcpsp_model.non_renewable_resources),
+        horizon=int(ms_rcpsp_model.horizon),
+        horizon_multiplier=ms_rcpsp_model.horizon_multiplier,
+        one_unit_per_task_max=ms_rcpsp_model.one_unit_per_task_max,
+        preemptive=ms_rcpsp_model.preemptive,
+        strictly_disjunctive_subtasks=ms_rcpsp_model.strictly_disjunctive_subtasks,
+        interval_calendars=interval_calendars,
+        always_releasable_resources=_sorted_or_none(
+            ms_rcpsp_model.always_releasable_resources
+        ),
+        never_releasable_resources=_sorted_or_none(
+            ms_rcpsp_model.never_releasable_resources
+        ),
+    )
+    check_json_serializable(metadata, "metadata")
+    save_npz_archive(path, arrays=arrays, metadata=metadata)
+
+
+def load_ms_rcpsp_model(
+    path: Union[str, os.PathLike], mmap_mode: Optional[str] = None
+) -> MS_RCPSPModel:
+    """Load a multiskill rcpsp model saved by `save_ms_rcpsp_model()`.
+
+    Args:
+        path: path of the file
+        mmap_mode: if not None, memory-map the numpy data used by the sgs kernels
+            (see numpy.memmap, "c" giving writeable copy-on-write arrays)
+
+    """
+    arrays, metadata = load_npz_archive(path, mmap_mode=mmap_mode)
+    if metadata["format_version"] != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported format version {metadata['format_version']} for {path}."
+        )
+    tasks_list = metadata["tasks_list"]
+    resources_list = metadata["resources_list"]
+    skills_list = metadata["skills_list"]
+
+    # mode details
+    durations = arrays["duration_array"].tolist()
+    consumptions = arrays["consumption_array"].tolist()
+    skills_need = arrays["skills_need"].tolist()
+    is_releasable = arrays["is_releasable_array"].tolist()
+    mode_ids = arrays["mode_ids"].tolist()
+    nb_modes = arrays["nb_modes"].tolist()
+    resources_defined = arrays["resources_defined"].tolist()
+    skills_defined = arrays["skills_defined"].tolist()
+    mode_details: Dict[Any, Dict[int, Dict[str, int]]] = {}
+    partial_preemption_data: Dict[Any, Dict[int, Dict[str, bool]]] = {}
+    for i, task in enumerate(tasks_list):
+        mode_details[task] = {}
+        partial_preemption_data[task] = {}
+        for index_mode in range(nb_modes[i]):
+            mode = mode_ids[i][index_mode]
+            details = {"duration": durations[i][index_mode]}
+            for names, values, defined in [
+                (
+                    resources_list,
+                    consumptions[i][index_mode],
+                    resources_defined[i][index_mode],
+                ),
+                (
+                    skills_list,
+                    skills_need[i][index_mode],
+                    skills_defined[i][index_mode],
+                ),
+            ]:
+                for name, value, is_defined in zip(names, values, defined):
+                    if is_defined:
+                        details[name] = value
+            mode_details[task][mode] = details
+            partial_preemption_data[task][mode] = {
+                resource: bool(releasable)
+                for resource, releasable in zip(
+                    resources_list, is_releasable[i][index_mode]
+                )
+            }
+    successors = {
+        task: [tasks_list[j] for j in task_successors]
+        for task, task_successors in zip(
+            tasks_list,
+            unpack_sequences(
+                arrays["task_successors_ptr"], arrays["task_successors_index"]
+            ),
+        )
+    }
+
+    # employees
+    interval_calendars = metadata.get("interval_calendars", False)
+    calendars = _unpack_calendars(
+        arrays,
+        prefix="employees_calendar",
+        values_key="employees_calendar",
+        interval_calendars=interval_calendars,
+    )
+    salaries = arrays["employees_salary"].tolist()
+    skill_defined = arrays["employees_skill_defined"].tolist()
+    skill_attributes = {
+        attribute: arrays[f"employees_{attribute}"].tolist()
+        for attribute in ["skill_value", "efficiency_ratio", "experience"]
+    }
+    employees = {}
+    for i, employee in enumerate(metadata["employees_list"]):
+        employees[employee] = Employee(
+            dict_skill={
+                skill: SkillDetail(
+                    **{
+                        attribute: _as_int_if_integral(values[i][k])
+                        for attribute, values in skill_attributes.items()
+                    }
+                )
+                for k, skill in enumerate(skills_list)
+                if skill_defined[i][k]
+            },
+            calendar_employee=calendars[i],
+            salary=salaries[i],
+        )
+    employees_availability = None
+    if "employees_availability" in arrays:
+        employees_availability = arrays["employees_availability"].tolist()
+
+    # the resources order of the new model depends on the iteration order of resources_set
+    resources_set = set(resources_list)
+    new_order = [resources_list.index(resource) for resource in resources_set]
+    np_data = {key: arrays[key] for key in np_data_keys if key in arrays}
+    if new_order != list(range(len(resources_list))):
+        for key, axis in np_data_resource_axis.items():
+            if key in np_data:
+                np_data[key] = np.take(np_data[key], new_order, axis=axis)
+
+    return ms_rcpsp_model_classes[metadata["class_name"]](
+        skills_set=set(skills_list),
+        resources_set=resources_set,
+        non_renewable_resources=set(metadata["non_renewable_resources"]),
+        resources_availability=dict(
+            zip(
+                resources_list,
+                _unpack_calendars(
+                    arrays,
+                    prefix="resources",
+                    values_key="resources_values",
+                    interval_calendars=interval_calendars,
+                ),
+            )
+        ),
+        employees=employees,
+        employees_availability=employees_availability,
+        mode_details=mode_details,
+        successors=successors,
+        horizon=metadata["horizon"],
+        tasks_list=tasks_list,
+        employees_list=metadata["employees_list"],
+        horizon_multiplier=metadata["horizon_multiplier"],
+        sink_task=metadata["sink_task"],
+        source_task=metadata["source_task"],
+        one_unit_per_task_max=metadata["one_unit_per_task_max"],
+        preemptive=metadata["preemptive"],
+        preemptive_indicator=dict(
+            zip(tasks_list, arrays["preemptive_indicator"].tolist())
+        ),
+        partial_preemption_data=partial_preemption_data,
+        always_releasable_resources=_set_or_none(
+            metadata["always_releasable_resources"]
+        ),
+        never_releasable_resources=_set_or_none(metadata["never_releasable_resources"]),
+        strictly_disjunctive_subtasks=metadata["strictly_disjunctive_subtasks"],
+        np_data=np_data,
+    )
+
+
+def _pack_calendars(
+    arrays: Dict[str, np.ndarray],
+    calendars: Sequence[Union[Sequence[int], IntervalCalendar]],
+    prefix: str,
+    values_key: str,
+    dtype: Any,
+    interval_calendars: bool,
+) -> None:
+    if not interval_calendars:
+        arrays[f"{prefix}_ptr"], arrays[values_key] = pack_sequences(
+            calendars, dtype=dtype
+        )
+        return
+    interval_calendars_list = [
+        calendar
+        if isinstance(calendar, IntervalCalendar)
+        else IntervalCalendar.from_sequence(calendar)
+        for calendar in calendars
+    ]
+    arrays[f"{prefix}_ptr"], arrays[f"{prefix}_breakpoints"] = pack_sequences(
+        [calendar.breakpoints for calendar in interval_calendars_list],
+        dtype=np.int64,
+    )
+    _, arrays[values_key] = pack_sequences(
+        [calendar.values for calendar in interval_calendars_list], dtype=np.int64
+    )
+    arrays[f"{prefix}_horizon"] = np.array(
+        [calendar.horizon for calendar in interval_calendars_list], dtype=np.int64
+    )
+
+
+def _unpack_calendars(
+    arrays: Dict[str, np.ndarray],
+    prefix: str,
+    values_key: str,
+    interval_calendars: bool,
+) -> List[Union[List[Any], IntervalCalendar]]:
+    if not interval_calendars:
+        return unpack_sequences(arrays[f"{prefix}_ptr"], arrays[values_key])
+    return [
+        IntervalCalendar(breakpoints=breakpoints, values=values, horizon=horizon)
+        for breakpoints, values, horizon in zip(
+            unpack_sequences(arrays[f"{prefix}_ptr"], arrays[f"{prefix}_breakpoints"]),
+            unpack_sequences(arrays[f"{prefix}_ptr"], arrays[values_key]),
+            arrays[f"{prefix}_horizon"].tolist(),
+        )
+    ]
+
+
+def _sorted_or_none(values: Optional[Any]) -> Optional[List[Any]]:
+    return None if values is None else sorted(values)
+
+
+def _set_or_none(values: Optional[List[Any]]) -> Optional[set]:
+    return None if values is None else set(values)
+
+
+def _as_int_if_integral(value: float) -> Union[int, float]:
+    return int(value) if value.is_integer() else value
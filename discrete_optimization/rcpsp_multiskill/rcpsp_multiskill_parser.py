@@ -6,6 +6,7 @@ import os
 from typing import Dict, Optional, Tuple
 
 from discrete_optimization.datasets import get_data_home
+from discrete_optimization.generic_tools.interval_calendar import IntervalCalendar
 from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
     Employee,
     MS_RCPSPModel,
@@ -37,7 +38,11 @@ def get_data_available(
 
 
 def parse_imopse(
-    input_data, max_horizon=None, one_unit_per_task=True, preemptive=False
+    input_data,
+    max_horizon=None,
+    one_unit_per_task=True,
+    preemptive=False,
+    interval_calendars: bool = False,
 ):
     # parse the input
     lines = input_data.split("\n")
@@ -187,7 +192,9 @@ def parse_imopse(
                         if skill != "salary"
                     },
                     salary=resource_dict[res]["salary"],
-                    calendar_employee=[True] * max_horizon,
+                    calendar_employee=IntervalCalendar.constant(1, max_horizon)
+                    if interval_calendars
+                    else [True] * max_horizon,
                 )
                 for res in resource_dict
             },
@@ -205,11 +212,19 @@ def parse_imopse(
 
 
 def parse_file(
-    file_path, max_horizon=None, one_unit_per_task=True, preemptive=False
+    file_path,
+    max_horizon=None,
+    one_unit_per_task=True,
+    preemptive=False,
+    interval_calendars: bool = False,
 ) -> Tuple[MS_RCPSPModel, Dict]:
     with open(file_path, "r", encoding="utf-8") as input_data_file:
         input_data = input_data_file.read()
         rcpsp_model, new_tame_to_original_task_id = parse_imopse(
-            input_data, max_horizon, one_unit_per_task, preemptive=preemptive
+            input_data,
+            max_horizon,
+            one_unit_per_task,
+            preemptive=preemptive,
+            interval_calendars=interval_calendars,
         )
         return rcpsp_model, new_tame_to_original_task_id
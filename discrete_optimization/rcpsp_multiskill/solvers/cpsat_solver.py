@@ -0,0 +1,175 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import logging
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Union
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from discrete_optimization.generic_tools.do_problem import ParamsObjectiveFunction
+from discrete_optimization.generic_tools.interval_calendar import (
+    IntervalCalendar,
+    calendar_available_intervals,
+)
+from discrete_optimization.rcpsp.solver.cpsat_solver import CPSatRCPSPSolver
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
+    MS_RCPSPModel,
+    MS_RCPSPSolution,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CPSatMSRCPSPSolver(CPSatRCPSPSolver):
+    """CP-SAT model of a non-preemptive multiskill rcpsp, minimizing the makespan.
+
+    On top of the rcpsp model, a boolean variable tells if an employee works on a task.
+    The employees working on a task should cover its skill requirements,
+    work on one task at a time and be available (following their calendar) during the task.
+    """
+
+    rcpsp_model: MS_RCPSPModel
+
+    def __init__(
+        self,
+        rcpsp_model: MS_RCPSPModel,
+        params_objective_function: Optional[ParamsObjectiveFunction] = None,
+        **kwargs: Any,
+    ):
+        if rcpsp_model.preemptive:
+            raise NotImplementedError(
+                "CP-SAT solver is not implemented for preemptive multiskill rcpsp."
+            )
+        super().__init__(
+            rcpsp_model=rcpsp_model,
+            params_objective_function=params_objective_function,
+            **kwargs,
+        )
+        self.employee_used: Dict[Hashable, Dict[Hashable, cp_model.IntVar]] = {}
+
+    def get_resource_availability(
+        self, resource: str
+    ) -> Union[int, Sequence[int], IntervalCalendar]:
+        return self.rcpsp_model.resources_availability[resource]
+
+    def get_required_skills(self, task: Hashable, mode: int) -> Dict[str, int]:
+        return {
+            skill: self.rcpsp_model.mode_details[task][mode][skill]
+            for skill in self.rcpsp_model.skills_list
+            if self.rcpsp_model.mode_details[task][mode].get(skill, 0) > 0
+        }
+
+    def get_employee_skills(self, employee: Hashable) -> Dict[str, int]:
+        skills = {}
+        for skill in self.rcpsp_model.employees[employee].get_non_zero_skills():
+            skill_value = self.rcpsp_model.employees[employee].get_skill_level(skill)
+            if skill_value != int(skill_value):
+                raise NotImplementedError(
+                    f"CP-SAT solver needs integer skill values, got {skill_value} "
+                    f"for skill {skill} of employee {employee}."
+                )
+            skills[skill] = int(skill_value)
+        return skills
+
+    def init_model(self, **kwargs: Any) -> None:
+        super().init_model(**kwargs)
+        horizon = int(self.rcpsp_model.horizon)
+        employee_skills = {
+            employee: self.get_employee_skills(employee)
+            for employee in self.rcpsp_model.employees_list
+        }
+        employee_intervals: Dict[Hashable, List[cp_model.IntervalVar]] = {
+            employee: [] for employee in self.rcpsp_model.employees_list
+        }
+        self.employee_used = {}
+        for task in self.rcpsp_model.tasks_list:
+            self.employee_used[task] = {}
+            skills_task: Set[str] = set()
+            for mode in self.modes[task]:
+                skills_task.update(self.get_required_skills(task, mode))
+            for employee in self.rcpsp_model.employees_list:
+                if skills_task.isdisjoint(employee_skills[employee]):
+                    continue
+                used = self.model.NewBoolVar(f"used_{task}_{employee}")
+                self.employee_used[task][employee] = used
+                employee_intervals[employee].append(
+                    self.model.NewOptionalIntervalVar(
+                        self.start[task],
+                        self.duration[task],
+                        self.end[task],
+                        used,
+                        f"interval_{task}_{employee}",
+                    )
+                )
+            for mode in self.modes[task]:
+                for skill, requirement in self.get_required_skills(task, mode).items():
+                    self.model.Add(
+                        sum(
+                            employee_skills[employee].get(skill, 0) * used
+                            for employee, used in self.employee_used[task].items()
+                        )
+                        >= requirement * self.modes[task][mode]
+                    )
+            if self.rcpsp_model.one_unit_per_task_max:
+                self.model.Add(sum(self.employee_used[task].values()) <= 1)
+        for employee in self.rcpsp_model.employees_list:
+            if len(employee_intervals[employee]) == 0:
+                continue
+            available = calendar_available_intervals(
+                self.rcpsp_model.employees[employee].calendar_employee, horizon
+            )
+            # unavailability periods of the employee, between its available intervals
+            bounds = np.concatenate(([0], available.reshape(-1), [horizon]))
+            for start, end in bounds.reshape(-1, 2).tolist():
+                if end > start:
+                    employee_intervals[employee].append(
+                        self.model.NewFixedSizeIntervalVar(
+                            start, end - start, f"calendar_{employee}_{start}"
+                        )
+                    )
+            self.model.AddNoOverlap(employee_intervals[employee])
+
+    def get_solution_modes(self, solution: MS_RCPSPSolution) -> Dict[Hashable, int]:
+        return solution.modes
+
+    def set_hint(self, solution: MS_RCPSPSolution) -> None:
+        super().set_hint(solution)
+        for task in self.rcpsp_model.tasks_list:
+            employees = solution.employee_used(task)[0]
+            for employee, used in self.employee_used[task].items():
+                self.model.AddHint(used, int(employee in employees))
+
+    def get_solution_variables(self) -> List[cp_model.IntVar]:
+        variables = super().get_solution_variables()
+        for task in self.rcpsp_model.tasks_list:
+            variables += list(self.employee_used[task].values())
+        return variables
+
+    def build_solution(self, values: Dict[int, int]) -> MS_RCPSPSolution:
+        modes = self.get_modes_from_values(values)
+        schedule = {}
+        employee_usage = {}
+        for task in self.rcpsp_model.tasks_list:
+            start_time = values[self.start[task].Index()]
+            schedule[task] = {
+                "start_time": start_time,
+                "end_time": start_time
+                + self.rcpsp_model.mode_details[task][modes[task]]["duration"],
+            }
+            required_skills = self.get_required_skills(task, modes[task])
+            for employee, used in self.employee_used[task].items():
+                if not values[used.Index()]:
+                    continue
+                skills = set(required_skills).intersection(
+                    self.rcpsp_model.employees[employee].get_non_zero_skills()
+                )
+                if len(skills) > 0:
+                    employee_usage.setdefault(task, {})[employee] = skills
+        return MS_RCPSPSolution(
+            problem=self.rcpsp_model,
+            modes=modes,
+            schedule=schedule,
+            employee_usage=employee_usage,
+        )
@@ -662,4 +662,5 @@ class LNS_CP_MS_RCPSP_SOLVER(SolverDO):
             skip_first_iteration=kwargs.get("skip_first_iteration", False),
             nb_iteration_no_improvement=kwargs.get("nb_iteration_no_improvement", None),
             max_time_seconds=kwargs.get("max_time_seconds", None),
+            callbacks=kwargs.get("callbacks", None),
         )
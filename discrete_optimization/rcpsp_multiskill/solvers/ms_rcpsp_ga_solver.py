@@ -47,5 +47,8 @@ class GA_MSRCPSP_Solver(SolverDO):
             crossover_rate=parameters_ga.crossover_rate,
             tournament_size=parameters_ga.tournament_size,
             deap_verbose=parameters_ga.deap_verbose,
+            evaluation_backend=parameters_ga.evaluation_backend,
+            n_workers=parameters_ga.n_workers,
+            chunk_size=parameters_ga.chunk_size,
         )
         return ga_solver.solve()
@@ -2,12 +2,13 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
-from typing import Callable, Iterable, List, Sequence, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import numpy.typing as npt
+from scipy.spatial import cKDTree
 
-from discrete_optimization.tsp.tsp_model import Point2D, length
+from discrete_optimization.tsp.tsp_model import Point2D, build_candidate_lists, length
 
 
 def length_1(point1: Point2D, point2: Point2D) -> float:
@@ -72,8 +73,21 @@ def build_matrice_distance_np(
 
 
 def closest_greedy(
-    nodeCount: int, points: Sequence[Point2D]
+    nodeCount: int,
+    points: Sequence[Point2D],
+    candidates: Optional[np.ndarray] = None,
 ) -> Tuple[List[int], float, int]:
+    """Nearest neighbour tour starting from node 0.
+
+    Args:
+        nodeCount: number of nodes
+        points: coordinates of the nodes
+        candidates: array(node, k) of the nearest neighbours of each node, sorted by distance.
+            If given, no distance matrix is built, see `closest_greedy_candidates()`.
+
+    """
+    if candidates is not None:
+        return closest_greedy_candidates(nodeCount, points, candidates=candidates)
     sd, d = build_matrice_distance_np(nodeCount, points)
     sol = [0]
     length_circuit = 0.0
@@ -90,3 +104,63 @@ def closest_greedy(
         nb_point += 1
     length_circuit += length(points[cur_point], points[0])
     return sol, length_circuit, 0
+
+
+def closest_greedy_candidates(
+    nodeCount: int,
+    points: Sequence[Point2D],
+    candidates: Optional[np.ndarray] = None,
+    nb_candidates: int = 10,
+) -> Tuple[List[int], float, int]:
+    """Nearest neighbour tour starting from node 0, using k nearest neighbours candidate lists.
+
+    The next node is the first unvisited node of the candidate list of the current node.
+    When they are all visited, the nearest unvisited node is found with a KD-tree on the unvisited
+    nodes, rebuilt each time half of its nodes have been visited. Memory stays in O(n.k).
+
+    Args:
+        nodeCount: number of nodes
+        points: coordinates of the nodes
+        candidates: array(node, k) of the nearest neighbours of each node, sorted by distance.
+            Computed with `build_candidate_lists()` if not given.
+        nb_candidates: size of the candidate lists computed when candidates is None
+
+    """
+    np_points = np.array([[p.x, p.y] for p in points], dtype=float).reshape(
+        (nodeCount, 2)
+    )
+    if candidates is None:
+        candidates, _ = build_candidate_lists(np_points, nb_candidates=nb_candidates)
+    visited = np.zeros(nodeCount, dtype=bool)
+    remaining_nodes = np.arange(nodeCount)
+    remaining_tree = cKDTree(np_points)
+
+    def closest_unvisited(node: int) -> int:
+        nonlocal remaining_nodes, remaining_tree
+        if np.count_nonzero(visited[remaining_nodes]) > len(remaining_nodes) // 2:
+            remaining_nodes = remaining_nodes[~visited[remaining_nodes]]
+            remaining_tree = cKDTree(np_points[remaining_nodes])
+        k = 1
+        while True:
+            k = min(2 * k, len(remaining_nodes))
+            _, neighbours = remaining_tree.query(np_points[node], k=k)
+            for n in remaining_nodes[np.atleast_1d(neighbours)]:
+                if not visited[n]:
+                    return int(n)
+
+    sol = [0]
+    visited[0] = True
+    length_circuit = 0.0
+    cur_point = 0
+    nb_point = 1
+    while nb_point < nodeCount:
+        n = next((int(p) for p in candidates[cur_point] if not visited[p]), None)
+        if n is None:
+            n = closest_unvisited(cur_point)
+        length_circuit += length(points[cur_point], points[n])
+        visited[n] = True
+        sol += [n]
+        cur_point = n
+        nb_point += 1
+    length_circuit += length(points[cur_point], points[0])
+    return sol, length_circuit, 0
@@ -5,6 +5,8 @@
 import random
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from discrete_optimization.generic_tools.do_mutation import (
     LocalMove,
     LocalMoveDefault,
@@ -16,6 +18,7 @@ from discrete_optimization.tsp.tsp_model import (
     SolutionTSP,
     TSPModel,
     TSPModel2D,
+    TSPModel2DCandidateList,
 )
 
 
@@ -81,6 +84,13 @@ def get_points_index(
 
 
 class Mutation2Opt(Mutation):
+    """2-opt mutation reversing the best of some randomly sampled segments.
+
+    If candidate lists are given (by default those of a `TSPModel2DCandidateList`),
+    the segments tested for a starting position are the ones whose reversal links the node
+    before the segment to one of its nearest neighbours.
+    """
+
     node_count: int
     points: Sequence[Point2D]
 
@@ -94,6 +104,7 @@ class Mutation2Opt(Mutation):
         test_all: bool = False,
         nb_test: Optional[int] = None,
         return_only_improvement: bool = False,
+        candidates: Optional[np.ndarray] = None,
         **kwargs: Any
     ):
         self.node_count = tsp_model.node_count
@@ -107,6 +118,9 @@ class Mutation2Opt(Mutation):
         self.evaluate_function_indexes = tsp_model.evaluate_function_indexes
         self.return_only_improvement = return_only_improvement
         self.tsp_model = tsp_model
+        if candidates is None and isinstance(tsp_model, TSPModel2DCandidateList):
+            candidates = tsp_model.candidates
+        self.candidates = candidates
 
     def get_points(
         self, it: int, jt: int, variable: SolutionTSP
@@ -142,9 +156,8 @@ class Mutation2Opt(Mutation):
 
     def mutate_and_compute_obj(self, variable: SolutionTSP) -> Tuple[SolutionTSP, LocalMove, Dict[str, float]]:  # type: ignore # avoid isinstance checks for efficiency
         if variable.length is None or variable.lengths is None:
-            raise RuntimeError(
-                "length and lengths variable's attributes should not be None at this point."
-            )
+            # lengths are not maintained by TSPModel.evaluate_delta()
+            self.tsp_model.evaluate(variable)
         it = random.randint(0, self.length_permutation - 2)
         jt = random.randint(it + 1, self.length_permutation - 1)
         min_change = float("inf")
@@ -156,9 +169,18 @@ class Mutation2Opt(Mutation):
                 min(self.nb_test, self.length_permutation),
             )
         )
+        if self.candidates is not None:
+            position = np.full(self.node_count, -1, dtype=int)
+            position[variable.permutation] = np.arange(self.length_permutation)
         for i in range_its:
             if i == self.length_permutation - 1:
                 range_jts: Iterable[int] = []
+            elif self.candidates is not None:
+                # the reversal of [i, j] links the node before i to the node in j
+                i_before = (
+                    variable.start_index if i == 0 else variable.permutation[i - 1]
+                )
+                range_jts = [j for j in position[self.candidates[i_before]] if j > i]
             else:
                 range_jts = (
                     range(i + 1, self.length_permutation)
@@ -180,6 +202,15 @@ class Mutation2Opt(Mutation):
                     it = i
                     jt = j
                     min_change = change
+        if min_change == float("inf"):
+            # no segment tested, the random one is used
+            i_before, i_, j_, j_after = self.get_points_index(it, jt, variable)
+            min_change = (
+                self.evaluate_function_indexes(i_before, j_)
+                - self.evaluate_function_indexes(i_before, i_)
+                - self.evaluate_function_indexes(j_, j_after)
+                + self.evaluate_function_indexes(i_, j_after)
+            )
         fitness = variable.length + min_change
         i_before, i_, j_, j_after = self.get_points_index(it, jt, variable)
         permut = (
@@ -242,9 +273,8 @@ class Mutation2OptIntersection(Mutation2Opt):
 
     def mutate_and_compute_obj(self, variable: SolutionTSP) -> Tuple[SolutionTSP, LocalMove, Dict[str, float]]:  # type: ignore # avoid isinstance checks for efficiency
         if variable.length is None or variable.lengths is None:
-            raise RuntimeError(
-                "length and lengths variable's attributes should not be None at this point."
-            )
+            # lengths are not maintained by TSPModel.evaluate_delta()
+            self.tsp_model.evaluate(variable)
         reset_end = True
         ints = find_intersection(
             variable, self.points, nb_tests=min(3000, self.node_count - 2)
@@ -312,9 +342,8 @@ class SwapTSPMove(LocalMove):
 
     def apply_local_move(self, solution: SolutionTSP) -> SolutionTSP:  # type: ignore # avoid isinstance checks for efficiency
         if solution.length is None or solution.lengths is None:
-            raise RuntimeError(
-                "length and lengths solution's attributes should not be None at this point."
-            )
+            # lengths are not maintained by TSPModel.evaluate_delta()
+            self.tsp_model.evaluate(solution)
         current = getattr(solution, self.attribute)
         i1, i2 = self.swap
         v1, v2 = current[i1], current[i2]
@@ -0,0 +1,413 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import logging
+import math
+from typing import Any, List, Optional
+
+import numpy as np
+from numba import njit
+
+from discrete_optimization.generic_tools.do_problem import (
+    ParamsObjectiveFunction,
+    build_aggreg_function_and_params_objective,
+)
+from discrete_optimization.generic_tools.do_solver import ResultStorage
+from discrete_optimization.tsp.common_tools_tsp import closest_greedy_candidates
+from discrete_optimization.tsp.solver.tsp_solver import SolverTSP
+from discrete_optimization.tsp.tsp_model import (
+    SolutionTSP,
+    TSPModel,
+    TSPModel2D,
+    TSPModel2DCandidateList,
+    TSPModelDistanceMatrix,
+    build_candidate_lists,
+)
+
+logger = logging.getLogger(__name__)
+
+_EPSILON_GAIN = 1e-9
+
+
+@njit
+def _distance(a, b, points, distance_matrix, use_matrix):
+    if use_matrix:
+        return distance_matrix[a, b]
+    dx = points[a, 0] - points[b, 0]
+    dy = points[a, 1] - points[b, 1]
+    return math.sqrt(dx * dx + dy * dy)
+
+
+@njit
+def _reverse(tour, position, i, j):
+    # reverse tour[i..j] in place
+    while i < j:
+        tour[i], tour[j] = tour[j], tour[i]
+        position[tour[i]] = i
+        position[tour[j]] = j
+        i += 1
+        j -= 1
+
+
+@njit
+def _push(node, stack, in_stack, size):
+    # clear the don't-look bit of the node
+    if not in_stack[node]:
+        in_stack[node] = True
+        stack[size] = node
+        size += 1
+    return size
+
+
+@njit
+def local_search_2opt_oropt(
+    tour,  # array(node_count) int32, tour[0] is the start node, modified in place
+    neighbours,  # array(node, k)->nearest neighbours of the node
+    points,  # array(node, 2)->coordinates, used if not use_matrix
+    distance_matrix,  # array(node, node)->distance, used if use_matrix
+    use_matrix,
+    fixed_closing_edge,  # True if the edge from tour[-1] to tour[0] cannot be removed (path)
+    max_or_opt_length,
+):
+    """2-opt and Or-opt local search with don't-look bits and neighbour lists.
+
+    The tour is seen as a cycle, tour[0] never moves. Distances are supposed symmetric.
+    Returns: the number of improving moves applied.
+    """
+    n = tour.shape[0]
+    position = np.empty(n, dtype=np.int64)
+    for p in range(n):
+        position[tour[p]] = p
+    stack = np.empty(n, dtype=np.int64)
+    in_stack = np.zeros(n, dtype=np.bool_)
+    last_free = n - 2 if fixed_closing_edge else n - 1
+    segment = np.empty(max(max_or_opt_length, 1), dtype=tour.dtype)
+    nb_moves = 0
+    if n < 4:
+        return nb_moves
+    nb_moves_last_pass = -1
+    # don't-look bits may miss moves created by the changes of other nodes,
+    # passes over all nodes are done until none of them is improving
+    while nb_moves_last_pass != nb_moves:
+        nb_moves_last_pass = nb_moves
+        size = 0
+        for p in range(n - 1, -1, -1):
+            size = _push(tour[p], stack, in_stack, size)
+        nb_moves = _run_dont_look_bits(
+            tour,
+            position,
+            stack,
+            in_stack,
+            size,
+            segment,
+            neighbours,
+            points,
+            distance_matrix,
+            use_matrix,
+            fixed_closing_edge,
+            last_free,
+            max_or_opt_length,
+            nb_moves,
+        )
+    return nb_moves
+
+
+@njit
+def _run_dont_look_bits(
+    tour,
+    position,
+    stack,
+    in_stack,
+    size,
+    segment,
+    neighbours,
+    points,
+    distance_matrix,
+    use_matrix,
+    fixed_closing_edge,
+    last_free,
+    max_or_opt_length,
+    nb_moves,
+):
+    # apply improving moves around the nodes of the stack until it is empty
+    n = tour.shape[0]
+    while size > 0:
+        size -= 1
+        a = stack[size]
+        in_stack[a] = False
+        improved = False
+        # 2-opt: replace (a, b) and (c, d) by (a, c) and (b, d), c close to a
+        for direction in range(2):
+            pa = position[a]
+            if direction == 0:
+                p_ab = pa
+                b = tour[(pa + 1) % n]
+            else:
+                p_ab = (pa - 1 + n) % n
+                b = tour[p_ab]
+            if fixed_closing_edge and p_ab == n - 1:
+                continue
+            d_ab = _distance(a, b, points, distance_matrix, use_matrix)
+            for k in range(neighbours.shape[1]):
+                c = neighbours[a, k]
+                d_ac = _distance(a, c, points, distance_matrix, use_matrix)
+                if d_ac >= d_ab:
+                    break
+                pc = position[c]
+                if direction == 0:
+                    p_cd = pc
+                    d = tour[(pc + 1) % n]
+                else:
+                    p_cd = (pc - 1 + n) % n
+                    d = tour[p_cd]
+                if c == b or d == a:
+                    continue
+                if fixed_closing_edge and p_cd == n - 1:
+                    continue
+                gain = (
+                    d_ab
+                    + _distance(c, d, points, distance_matrix, use_matrix)
+                    - d_ac
+                    - _distance(b, d, points, distance_matrix, use_matrix)
+                )
+                if gain > _EPSILON_GAIN:
+                    _reverse(tour, position, min(p_ab, p_cd) + 1, max(p_ab, p_cd))
+                    size = _push(a, stack, in_stack, size)
+                    size = _push(b, stack, in_stack, size)
+                    size = _push(c, stack, in_stack, size)
+                    size = _push(d, stack, in_stack, size)
+                    improved = True
+                    nb_moves += 1
+                    break
+            if improved:
+                break
+        if improved:
+            continue
+        # Or-opt: move the segment starting at a between two nodes close to its ends
+        for length_segment in range(1, max_or_opt_length + 1):
+            i = position[a]
+            j = i + length_segment - 1
+            if i < 1 or j > last_free:
+                break
+            s1 = tour[i]
+            s2 = tour[j]
+            p = tour[i - 1]
+            nx = tour[(j + 1) % n]
+            removal_gain = (
+                _distance(p, s1, points, distance_matrix, use_matrix)
+                + _distance(s2, nx, points, distance_matrix, use_matrix)
+                - _distance(p, nx, points, distance_matrix, use_matrix)
+            )
+            if removal_gain <= _EPSILON_GAIN:
+                continue
+            for end in range(2):
+                s = s1 if end == 0 else s2
+                for k in range(neighbours.shape[1]):
+                    c = neighbours[s, k]
+                    if (
+                        _distance(s, c, points, distance_matrix, use_matrix)
+                        >= removal_gain
+                    ):
+                        break
+                    pc = position[c]
+                    if i <= pc <= j:
+                        continue
+                    for side in range(2):
+                        q = pc if side == 0 else (pc - 1 + n) % n
+                        if q == i - 1 or q == j:
+                            continue
+                        if fixed_closing_edge and q == n - 1:
+                            continue
+                        x = tour[q]
+                        y = tour[(q + 1) % n]
+                        d_xy = _distance(x, y, points, distance_matrix, use_matrix)
+                        add_forward = (
+                            _distance(x, s1, points, distance_matrix, use_matrix)
+                            + _distance(s2, y, points, distance_matrix, use_matrix)
+                            - d_xy
+                        )
+                        add_reversed = (
+                            _distance(x, s2, points, distance_matrix, use_matrix)
+                            + _distance(s1, y, points, distance_matrix, use_matrix)
+                            - d_xy
+                        )
+                        reversed_segment = add_reversed < add_forward
+                        gain = removal_gain - min(add_forward, add_reversed)
+                        if gain <= _EPSILON_GAIN:
+                            continue
+                        for t in range(length_segment):
+                            if reversed_segment:
+                                segment[t] = tour[j - t]
+                            else:
+                                segment[t] = tour[i + t]
+                        if q > j:
+                            for r in range(j + 1, q + 1):
+                                tour[r - length_segment] = tour[r]
+                                position[tour[r - length_segment]] = r - length_segment
+                            start_segment = q - length_segment + 1
+                        else:
+                            for r in range(i - 1, q, -1):
+                                tour[r + length_segment] = tour[r]
+                                position[tour[r + length_segment]] = r + length_segment
+                            start_segment = q + 1
+                        for t in range(length_segment):
+                            tour[start_segment + t] = segment[t]
+                            position[segment[t]] = start_segment + t
+                        size = _push(p, stack, in_stack, size)
+                        size = _push(nx, stack, in_stack, size)
+                        size = _push(s1, stack, in_stack, size)
+                        size = _push(s2, stack, in_stack, size)
+                        size = _push(x, stack, in_stack, size)
+                        size = _push(y, stack, in_stack, size)
+                        improved = True
+                        nb_moves += 1
+                        break
+                    if improved:
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    return nb_moves
+
+
+class TSP_LocalSearch(SolverTSP):
+    """2-opt and Or-opt local search run until a local optimum is reached.
+
+    The moves are searched in a numba kernel working in place on an int32 tour array,
+    with don't-look bits and nearest neighbours lists, so that 10k nodes instances
+    are brought to a local optimum in a few seconds.
+    Distances are supposed symmetric.
+
+    Args:
+        tsp_model: a TSPModel2D (possibly with candidate lists) or a TSPModelDistanceMatrix
+
+    """
+
+    def __init__(
+        self,
+        tsp_model: TSPModel,
+        params_objective_function: Optional[ParamsObjectiveFunction] = None,
+        **kwargs: Any,
+    ):
+        SolverTSP.__init__(self, tsp_model=tsp_model)
+        self.node_count = self.tsp_model.node_count
+        self.start_index = self.tsp_model.start_index
+        self.end_index = self.tsp_model.end_index
+        (
+            self.aggreg_sol,
+            self.aggreg_dict,
+            self.params_objective_function,
+        ) = build_aggreg_function_and_params_objective(
+            problem=self.tsp_model, params_objective_function=params_objective_function
+        )
+        self.neighbours: Optional[np.ndarray] = None
+
+    def init_model(self, nb_neighbours: int = 10, **kwargs: Any) -> None:
+        if isinstance(self.tsp_model, TSPModel2DCandidateList):
+            self.neighbours = self.tsp_model.candidates
+        elif isinstance(self.tsp_model, TSPModel2D):
+            self.neighbours, _ = build_candidate_lists(
+                self.tsp_model.np_points, nb_candidates=nb_neighbours
+            )
+        elif isinstance(self.tsp_model, TSPModelDistanceMatrix):
+            self.neighbours = build_candidate_lists_from_matrix(
+                self.tsp_model.distance_matrix, nb_candidates=nb_neighbours
+            )
+        else:
+            raise ValueError(
+                "TSP_LocalSearch handles only TSPModel2D and TSPModelDistanceMatrix."
+            )
+
+    def solve(
+        self,
+        initial_solution: Optional[SolutionTSP] = None,
+        max_or_opt_length: int = 3,
+        **kwargs: Any,
+    ) -> ResultStorage:
+        """Improve a solution until no improving 2-opt or Or-opt move remains.
+
+        Args:
+            initial_solution: solution to improve. By default, a nearest neighbour
+                tour for 2D models, the dummy solution otherwise.
+            max_or_opt_length: maximum length of the segments moved by Or-opt
+
+        """
+        if self.neighbours is None:
+            self.init_model(**kwargs)
+        if initial_solution is None:
+            permutation = self.initial_permutation()
+        else:
+            permutation = list(initial_solution.permutation)
+        tour = np.array(
+            [self.start_index]
+            + permutation
+            + ([self.end_index] if self.end_index != self.start_index else []),
+            dtype=np.int32,
+        )
+        if isinstance(self.tsp_model, TSPModelDistanceMatrix):
+            points = np.zeros((1, 2))
+            distance_matrix = self.tsp_model.distance_matrix
+            use_matrix = True
+        else:
+            points = self.tsp_model.np_points
+            distance_matrix = np.zeros((1, 1))
+            use_matrix = False
+        nb_moves = local_search_2opt_oropt(
+            tour=tour,
+            neighbours=self.neighbours,
+            points=points,
+            distance_matrix=distance_matrix,
+            use_matrix=use_matrix,
+            fixed_closing_edge=self.end_index != self.start_index,
+            max_or_opt_length=max_or_opt_length,
+        )
+        logger.debug(f"{nb_moves} improving moves applied")
+        end_permutation = len(tour) - 1 if self.end_index != self.start_index else None
+        solution = SolutionTSP(
+            problem=self.tsp_model,
+            start_index=self.start_index,
+            end_index=self.end_index,
+            permutation=[int(x) for x in tour[1:end_permutation]],
+            lengths=None,
+            length=None,
+        )
+        fitness = self.aggreg_sol(solution)
+        return ResultStorage(
+            list_solution_fits=[(solution, fitness)],
+            mode_optim=self.params_objective_function.sense_function,
+        )
+
+    def initial_permutation(self) -> List[int]:
+        if isinstance(self.tsp_model, TSPModel2D):
+            sol, _, _ = closest_greedy_candidates(
+                self.node_count,
+                self.tsp_model.list_points,
+                candidates=self.neighbours,
+            )
+            # rotate the greedy cycle to start at the start node
+            start = sol.index(self.start_index)
+            return [
+                node
+                for node in sol[start:] + sol[:start]
+                if node != self.start_index and node != self.end_index
+            ]
+        return list(self.tsp_model.get_dummy_solution().permutation)
+
+
+def build_candidate_lists_from_matrix(
+    distance_matrix: np.ndarray, nb_candidates: int
+) -> np.ndarray:
+    """Nearest neighbours of each node, sorted by increasing distance, from a distance matrix."""
+    node_count = distance_matrix.shape[0]
+    nb_candidates = max(0, min(nb_candidates, node_count - 1))
+    neighbours = np.zeros((node_count, nb_candidates), dtype=int)
+    if nb_candidates == 0:
+        return neighbours
+    for i in range(node_count):
+        row = np.array(distance_matrix[i, :], dtype=float)
+        row[i] = np.inf
+        closest = np.argpartition(row, nb_candidates - 1)[:nb_candidates]
+        neighbours[i, :] = closest[np.argsort(row[closest], kind="stable")]
+    return neighbours
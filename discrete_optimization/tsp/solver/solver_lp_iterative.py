@@ -32,10 +32,7 @@ from discrete_optimization.generic_tools.do_problem import (
     build_aggreg_function_and_params_objective,
 )
 from discrete_optimization.generic_tools.do_solver import ResultStorage
-from discrete_optimization.tsp.common_tools_tsp import (
-    build_matrice_distance,
-    build_matrice_distance_np,
-)
+from discrete_optimization.tsp.common_tools_tsp import build_matrice_distance
 from discrete_optimization.tsp.solver.tsp_solver import SolverTSP
 from discrete_optimization.tsp.tsp_model import (
     Point,
@@ -43,6 +40,8 @@ from discrete_optimization.tsp.tsp_model import (
     SolutionTSP,
     TSPModel,
     TSPModel2D,
+    TSPModel2DCandidateList,
+    build_candidate_lists,
 )
 
 try:
@@ -62,15 +61,23 @@ Edge = Tuple[Node, Node]
 
 def build_graph_pruned(
     tsp_model: TSPModel2D,
+    nb_candidates: int = 49,
 ) -> Tuple[
     nx.DiGraph,
     nx.DiGraph,
     Dict[int, Set[Tuple[int, int]]],
     Dict[int, Set[Tuple[int, int]]],
 ]:
+    """Graph linking each node to its nearest neighbours, to the next nodes and to the end node.
+
+    Nearest neighbours are given by the candidate lists of a `TSPModel2DCandidateList`,
+    or else computed with a KD-tree, no distance matrix is built.
+    """
     nodeCount = tsp_model.node_count
-    points = tsp_model.list_points
-    sd, d = build_matrice_distance_np(nodeCount, points)
+    if isinstance(tsp_model, TSPModel2DCandidateList):
+        sd = tsp_model.candidates
+    else:
+        sd, _ = build_candidate_lists(tsp_model.np_points, nb_candidates=nb_candidates)
     g = nx.DiGraph()
     g.add_nodes_from([i for i in range(nodeCount)])
     shape = sd.shape[0]
@@ -81,7 +88,7 @@ def build_graph_pruned(
         return tsp_model.evaluate_function_indexes(i, j)
 
     for i in range(shape):
-        nodes_to_add: Iterable[int] = sd[i, 1:50]
+        nodes_to_add: Iterable[int] = sd[i, :]
         for n in nodes_to_add:
             if n == i:
                 continue
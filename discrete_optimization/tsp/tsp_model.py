@@ -9,6 +9,8 @@ from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     Iterable,
@@ -23,6 +25,7 @@ from typing import (
 import numpy as np
 import numpy.typing as npt
 from numba import njit
+from scipy.spatial import cKDTree
 
 from discrete_optimization.generic_tools.do_problem import (
     EncodingRegister,
@@ -36,6 +39,9 @@ from discrete_optimization.generic_tools.do_problem import (
     TypeObjective,
 )
 
+if TYPE_CHECKING:  # only for type checkers
+    from discrete_optimization.generic_tools.do_mutation import LocalMove
+
 
 class SolutionTSP(Solution):
     permutation_from0: List[int]
@@ -216,6 +222,51 @@ class TSPModel(Problem):
         var_tsp.lengths = list(lengths)
         return {"length": obj}
 
+    def init_delta_state(self, var_tsp: SolutionTSP) -> float:  # type: ignore # avoid isinstance checks for efficiency
+        """Delta state of a tsp solution: the length of the tour."""
+        return self.evaluate_function(var_tsp)[1]
+
+    def evaluate_delta(  # type: ignore # avoid isinstance checks for efficiency
+        self, var_tsp: SolutionTSP, move: "LocalMove", cached_state: float
+    ) -> Optional[Tuple[Dict[str, float], float]]:
+        """Update the length of the tour with the edges touching the moved nodes only.
+
+        Only moves modifying the "permutation" attribute are supported.
+        The lengths attribute of the solution is not maintained and is reset to None.
+
+        """
+        changes = move.changed_values(var_tsp)
+        if changes is None or changes[0] != "permutation":
+            return None
+        changed = changes[1]
+        permutation = var_tsp.permutation
+        last = self.length_permutation
+        obj = cached_state
+        edges = set()
+        for i in changed:
+            edges.add(i)
+            edges.add(i + 1)
+        for edge in edges:
+            # edge between positions edge-1 and edge, -1 (resp. last) being the start (resp. end) node
+            prev_nodes: List[Any] = []
+            new_nodes: List[Any] = []
+            for i in (edge - 1, edge):
+                if i == -1:
+                    prev_nodes.append(self.start_index)
+                    new_nodes.append(self.start_index)
+                elif i == last:
+                    prev_nodes.append(self.end_index)
+                    new_nodes.append(self.end_index)
+                else:
+                    new_nodes.append(permutation[i])
+                    prev_nodes.append(changed[i][0] if i in changed else permutation[i])
+            obj += self.evaluate_function_indexes(
+                new_nodes[0], new_nodes[1]
+            ) - self.evaluate_function_indexes(prev_nodes[0], prev_nodes[1])
+        var_tsp.length = obj
+        var_tsp.lengths = None
+        return {"length": obj}, obj
+
     def satisfy(self, var_tsp: SolutionTSP) -> bool:  # type: ignore # avoid isinstance checks for efficiency
         b = (
             var_tsp.start_index == self.start_index
@@ -340,6 +391,40 @@ class TSPModel2D(TSPModel):
         return length(self.list_points[index_1], self.list_points[index_2])
 
 
+class TSPModel2DCandidateList(TSPModel2D):
+    """2D TSP model storing the k nearest neighbours of each node instead of a distance matrix.
+
+    Candidate lists are built with a KD-tree in O(n.log(n)) time and O(n.k) memory,
+    distances between nodes are computed lazily from np_points.
+
+    Args:
+        nb_candidates: number of nearest neighbours kept for each node
+
+    """
+
+    def __init__(
+        self,
+        list_points: Sequence[Point2D],
+        node_count: int,
+        start_index: int = 0,
+        end_index: int = 0,
+        use_numba: bool = True,
+        nb_candidates: int = 10,
+    ):
+        TSPModel2D.__init__(
+            self,
+            list_points=list_points,
+            node_count=node_count,
+            start_index=start_index,
+            end_index=end_index,
+            use_numba=use_numba,
+        )
+        self.nb_candidates = nb_candidates
+        self.candidates, self.candidates_distances = build_candidate_lists(
+            self.np_points, nb_candidates=nb_candidates
+        )
+
+
 class TSPModelDistanceMatrix(TSPModel):
     def __init__(
         self,
@@ -367,6 +452,32 @@ class TSPModelDistanceMatrix(TSPModel):
         return int(self.distance_matrix[index_1, index_2])
 
 
+def build_candidate_lists(
+    np_points: np.ndarray, nb_candidates: int
+) -> Tuple[npt.NDArray[np.int_], npt.NDArray[np.float_]]:
+    """Compute the nearest neighbours of each point with a KD-tree.
+
+    Returns: array(node, nb_candidates) of the neighbours of each node sorted by increasing
+        distance, and array(node, nb_candidates) of the corresponding distances.
+
+    """
+    node_count = np_points.shape[0]
+    nb_candidates = max(0, min(nb_candidates, node_count - 1))
+    if nb_candidates == 0:
+        return (
+            np.zeros((node_count, 0), dtype=int),
+            np.zeros((node_count, 0), dtype=float),
+        )
+    distances, neighbours = cKDTree(np_points).query(np_points, k=nb_candidates + 1)
+    # remove each node from its own list, it is not always the first one with duplicated points
+    is_self = neighbours == np.arange(node_count)[:, np.newaxis]
+    is_self[~is_self.any(axis=1), -1] = True
+    return (
+        neighbours[~is_self].reshape((node_count, nb_candidates)),
+        distances[~is_self].reshape((node_count, nb_candidates)),
+    )
+
+
 def length(point1: Point2D, point2: Point2D) -> float:
     return math.sqrt((point1.x - point2.x) ** 2 + (point1.y - point2.y) ** 2)
 
@@ -431,7 +542,7 @@ def compute_length_matrix(
     length_permutation: int,
 ) -> Tuple[List[int], int]:
     obj = int(distance_matrix[start_index, solution[0]])
-    lengths = np.zeros(node_count, dtype=int)
+    lengths = np.zeros(node_count, dtype=np.int64)
     lengths[0] = obj
     for index in range(0, length_permutation - 1):
         ll = int(distance_matrix[solution[index], solution[index + 1]])
@@ -8,6 +8,7 @@ from discrete_optimization.generic_tools.do_problem import Problem
 from discrete_optimization.generic_tools.result_storage.result_storage import (
     ResultStorage,
 )
+from discrete_optimization.tsp.solver.solver_local_search import TSP_LocalSearch
 from discrete_optimization.tsp.solver.solver_lp_iterative import (
     LP_TSP_Iterative,
     MILPSolver,
@@ -33,6 +34,7 @@ solvers: Dict[str, List[Tuple[Type[SolverTSP], Dict[str, Any]]]] = {
         )
     ],
     "ortools": [(TSP_ORtools, {})],
+    "local_search": [(TSP_LocalSearch, {})],
     "cp": [
         (
             TSP_CP_Solver,
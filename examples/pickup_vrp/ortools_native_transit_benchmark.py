@@ -0,0 +1,83 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+# Compare the transits of ORToolsGPDP registered as python callbacks and as native matrices.
+# With greedy descent and a solution limit, both modes follow the same search,
+# so that the wall clock time only measures the cost of evaluating the transits.
+import random
+import time
+
+import numpy as np
+
+from discrete_optimization.pickup_vrp.builders.instance_builders import (
+    create_pickup_and_delivery,
+    create_selective_tsp,
+)
+from discrete_optimization.pickup_vrp.gpdp import GPDP, build_pruned_problem
+from discrete_optimization.pickup_vrp.solver.ortools_solver import (
+    ORToolsGPDP,
+    ParametersCost,
+    first_solution_strategy_enum,
+    local_search_metaheuristic_enum,
+)
+
+
+def run_solver(gpdp: GPDP, use_native_transit: bool, solution_limit: int, **kwargs):
+    solver = ORToolsGPDP(problem=gpdp)
+    t_init = time.perf_counter()
+    solver.init_model(
+        use_native_transit=use_native_transit,
+        parameters_cost=[ParametersCost(dimension_name="Distance", global_span=True)],
+        first_solution_strategy=first_solution_strategy_enum.PATH_CHEAPEST_ARC,
+        local_search_metaheuristic=local_search_metaheuristic_enum.GREEDY_DESCENT,
+        time_limit=60,
+        **kwargs,
+    )
+    solver.search_parameters.solution_limit = solution_limit
+    t_solve = time.perf_counter()
+    results = solver.solve()
+    t_end = time.perf_counter()
+    return t_solve - t_init, t_end - t_solve, min(r[-1] for r in results)
+
+
+def benchmark(name: str, gpdp: GPDP, solution_limit: int = 20, **kwargs):
+    for use_native_transit in [False, True]:
+        time_init, time_solve, cost = run_solver(
+            gpdp,
+            use_native_transit=use_native_transit,
+            solution_limit=solution_limit,
+            **kwargs,
+        )
+        print(
+            f"{name:<30} {'native' if use_native_transit else 'callback':<9}"
+            f" init {time_init:7.2f}s  solve {time_solve:7.2f}s  cost {cost}"
+        )
+
+
+def run_benchmark():
+    random.seed(0)
+    np.random.seed(0)
+    gpdp = create_selective_tsp(nb_nodes=200, nb_vehicles=1, nb_clusters=40)
+    kwargs = dict(
+        one_visit_per_cluster=True,
+        include_time_dimension=True,
+        include_demand=True,
+        include_mandatory=True,
+    )
+    benchmark("selective tsp 200 nodes", gpdp, **kwargs)
+    gpdp.compute_graph()
+    benchmark("pruned selective tsp 200 nodes", build_pruned_problem(gpdp), **kwargs)
+    gpdp = create_pickup_and_delivery(number_of_vehicles=4, number_of_node=80)
+    benchmark(
+        "pickup and delivery 80 nodes",
+        gpdp,
+        include_time_dimension=True,
+        include_demand=True,
+        include_resource_dimension=True,
+        include_pickup_and_delivery=True,
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+# Cost of the schedule of RCPSPSolution around the sgs, when stored as an ArraySchedule
+# (computed by the sgs) or as a dictionary of dictionaries (e.g. given by a solver):
+# decoding of a permutation, copy of the solution and access to the makespan.
+import time
+
+import numpy as np
+
+from discrete_optimization.benchmarks.generators import generate_rcpsp_model
+from discrete_optimization.rcpsp.rcpsp_model import (
+    RCPSPModel,
+    RCPSPSolution,
+    permutation_do_to_permutation_sgs_fast,
+)
+
+
+def timeit(function, nb_runs: int) -> float:
+    function()
+    t_start = time.perf_counter()
+    for _ in range(nb_runs):
+        function()
+    return (time.perf_counter() - t_start) / nb_runs
+
+
+def benchmark(name: str, rcpsp_model: RCPSPModel, nb_runs: int):
+    rng = np.random.default_rng(0)
+    permutation = list(rng.permutation(rcpsp_model.n_jobs_non_dummy))
+    solution = RCPSPSolution(problem=rcpsp_model, rcpsp_permutation=permutation)
+    solution_dict = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_permutation=permutation,
+        rcpsp_schedule={
+            task: dict(details) for task, details in solution.rcpsp_schedule.items()
+        },
+    )
+    permutation_task = permutation_do_to_permutation_sgs_fast(rcpsp_model, permutation)
+    modes_array = np.array(rcpsp_model.build_mode_array(solution.rcpsp_modes)) - 1
+    n_jobs = rcpsp_model.n_jobs
+    timings = {
+        "sgs kernel": lambda: rcpsp_model.func_sgs_arrays(
+            permutation_task=permutation_task,
+            modes_array=modes_array,
+            starts=np.empty(n_jobs, dtype=np.int64),
+            ends=np.empty(n_jobs, dtype=np.int64),
+            order=np.empty(n_jobs, dtype=np.int64),
+        ),
+        "new solution + evaluate": lambda: rcpsp_model.evaluate(
+            RCPSPSolution(problem=rcpsp_model, rcpsp_permutation=permutation)
+        ),
+        "copy (arrays)": solution.copy,
+        "copy (dict)": solution_dict.copy,
+        "makespan (arrays)": solution.get_max_end_time,
+        "makespan (dict)": solution_dict.get_max_end_time,
+    }
+    for timing_name, function in timings.items():
+        print(
+            f"{name:<12} {timing_name:<24} {1000 * timeit(function, nb_runs):9.3f} ms"
+        )
+
+
+def run_benchmark():
+    benchmark("j120-sized", generate_rcpsp_model(120), nb_runs=200)
+    benchmark("5000 tasks", generate_rcpsp_model(5000), nb_runs=10)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,91 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+# Compare the serial sgs kernels (sgs_fast, sgs_fast_event) with the parallel one (sgs_fast_parallel)
+# on random permutations of synthetic instances: throughput and quality of the decoded schedules.
+import time
+
+import numpy as np
+
+from discrete_optimization.benchmarks.generators import generate_rcpsp_model
+from discrete_optimization.rcpsp.rcpsp_model import (
+    RCPSPModel,
+    create_np_data_and_jit_functions,
+    permutation_do_to_permutation_sgs_fast,
+)
+
+
+def benchmark(name: str, rcpsp_model: RCPSPModel, nb_permutations: int):
+    rng = np.random.default_rng(0)
+    inputs = [
+        (
+            permutation_do_to_permutation_sgs_fast(
+                rcpsp_model, rng.permutation(rcpsp_model.n_jobs_non_dummy)
+            ),
+            np.array(
+                rcpsp_model.build_mode_array(
+                    list(
+                        rng.integers(
+                            1,
+                            rcpsp_model.max_number_of_mode + 1,
+                            size=rcpsp_model.n_jobs_non_dummy,
+                        )
+                    )
+                )
+            )
+            - 1,
+        )
+        for _ in range(nb_permutations)
+    ]
+    kernels = {
+        "sgs_fast": create_np_data_and_jit_functions(rcpsp_model, use_event_sgs=False)[
+            0
+        ],
+        "sgs_fast_event": create_np_data_and_jit_functions(
+            rcpsp_model, use_event_sgs=True
+        )[0],
+        "sgs_fast_parallel": rcpsp_model.func_sgs_parallel,
+    }
+    for kernel_name, kernel in kernels.items():
+        # compilation
+        kernel(permutation_task=inputs[0][0], modes_array=inputs[0][1])
+        makespans = []
+        t_start = time.perf_counter()
+        for permutation_task, modes_array in inputs:
+            schedule, unfeasible = kernel(
+                permutation_task=permutation_task, modes_array=modes_array
+            )
+            if not unfeasible:
+                makespans.append(max(end for start, end in schedule.values()))
+        duration = time.perf_counter() - t_start
+        print(
+            f"{name:<28} {kernel_name:<18} {nb_permutations / duration:9.1f} eval/s"
+            f"  feasible {len(makespans):4d}/{nb_permutations}"
+            f"  mean makespan {np.mean(makespans):9.1f}  best {np.min(makespans):7d}"
+        )
+
+
+def run_benchmark():
+    benchmark("j30-sized", generate_rcpsp_model(30), nb_permutations=1000)
+    benchmark(
+        "j30-sized multimode",
+        generate_rcpsp_model(30, nb_modes=3),
+        nb_permutations=1000,
+    )
+    benchmark("j120-sized", generate_rcpsp_model(120), nb_permutations=1000)
+    benchmark(
+        "j120-sized calendar",
+        generate_rcpsp_model(120, calendar=True),
+        nb_permutations=1000,
+    )
+    benchmark("2000 tasks", generate_rcpsp_model(2000), nb_permutations=20)
+    benchmark(
+        "2000 tasks calendar",
+        generate_rcpsp_model(2000, calendar=True),
+        nb_permutations=20,
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
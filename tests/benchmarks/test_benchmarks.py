@@ -0,0 +1,67 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import json
+
+import numpy as np
+import pytest
+
+from discrete_optimization.benchmarks.suite import (
+    FAMILIES,
+    GENERATORS,
+    RANDOM_SOLUTIONS,
+    SCALES,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_generators_deterministic(family):
+    parameters = SCALES["small"][family]["instance"]
+    problem_1 = GENERATORS[family](**parameters, seed=3)
+    problem_2 = GENERATORS[family](**parameters, seed=3)
+    if family in RANDOM_SOLUTIONS:
+        solution_1 = RANDOM_SOLUTIONS[family](problem_1, np.random.default_rng(0))
+        solution_2 = RANDOM_SOLUTIONS[family](problem_2, np.random.default_rng(0))
+        assert problem_1.evaluate(solution_1) == problem_2.evaluate(solution_2)
+    else:
+        assert problem_1.list_nodes == problem_2.list_nodes
+        assert problem_1.distance_delta == problem_2.distance_delta
+
+
+def test_run_benchmarks_json(tmp_path):
+    results = run_benchmarks(families=["rcpsp", "knapsack"], scale="small", seed=0)
+    assert {(r["family"], r["scenario"]) for r in results["results"]} == {
+        ("rcpsp", "instance"),
+        ("rcpsp", "evaluation"),
+        ("rcpsp", "sgs"),
+        ("rcpsp", "local_search"),
+        ("knapsack", "instance"),
+        ("knapsack", "evaluation"),
+        ("knapsack", "local_search"),
+    }
+    path = str(tmp_path / "results.json")
+    save_results(results, path)
+    loaded = load_results(path)
+    assert loaded == json.loads(json.dumps(results))
+    local_search = [r for r in loaded["results"] if r["scenario"] == "local_search"]
+    for result in local_search:
+        assert len(result["metrics"]["incumbents"]) > 0
+
+    comparisons = compare_results(loaded, loaded)
+    assert len(comparisons) > 0
+    assert all(c["ratio"] == 1 and not c["regression"] for c in comparisons)
+
+    slower = json.loads(json.dumps(loaded))
+    for result in slower["results"]:
+        if result["scenario"] == "evaluation":
+            result["metrics"]["evaluations_per_second"] /= 2
+    regressions = [c for c in compare_results(loaded, slower) if c["regression"]]
+    assert {(c["family"], c["metric"]) for c in regressions} == {
+        ("rcpsp", "evaluations_per_second"),
+        ("knapsack", "evaluations_per_second"),
+    }
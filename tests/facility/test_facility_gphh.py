@@ -0,0 +1,75 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+
+from discrete_optimization.benchmarks.generators import generate_facility_problem
+from discrete_optimization.facility.solvers.gphh_facility import (
+    GPHH,
+    ParametersGPHH,
+    feature_function_map,
+)
+from discrete_optimization.facility.solvers.greedy_solvers import (
+    GreedySolverDistanceBased,
+)
+
+
+def test_gphh_facility():
+    random.seed(0)
+    domains = [generate_facility_problem(8, 60, seed=seed) for seed in range(3)]
+    params_gphh = ParametersGPHH.default()
+    params_gphh.pop_size = 10
+    params_gphh.n_gen = 3
+    solver = GPHH(
+        training_domains=domains[:2],
+        facility_problem=domains[2],
+        params_gphh=params_gphh,
+    )
+    solver.init_model()
+    solution, fit = solver.solve().get_best_solution_fit()
+    assert fit == solver.aggreg_from_sol(solution)
+
+    # allocations of the batch kernel vs greedy solver given the priorities of each customer
+    for individual in solver.final_pop[:3]:
+        func_heuristic = solver.toolbox.compile(expr=individual)
+        for domain in domains:
+            solution, fit = solver.build_solution(
+                domain=domain, individual=individual
+            ).get_best_solution_fit()
+            prio = {
+                c: np.argsort(
+                    func_heuristic(
+                        *[
+                            feature_function_map[lf](problem=domain, customer_index=c)
+                            for lf in solver.list_feature
+                        ]
+                    )
+                )
+                for c in range(domain.customer_count)
+            }
+            solution_greedy, fit_greedy = (
+                GreedySolverDistanceBased(facility_problem=domain)
+                .solve(prio=prio)
+                .get_best_solution_fit()
+            )
+            assert (
+                solution.facility_for_customers
+                == solution_greedy.facility_for_customers
+            )
+            assert fit == fit_greedy
+        fitness = solver.evaluate_heuristic(individual, domains)
+        assert np.isclose(
+            fitness[0],
+            np.mean(
+                [
+                    solver.build_solution(
+                        domain=domain, individual=individual
+                    ).get_best_solution_fit()[1]
+                    for domain in domains
+                ]
+            )
+            - 10 * solver.evaluate_complexity(individual),
+        )
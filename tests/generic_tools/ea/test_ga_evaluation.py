@@ -0,0 +1,66 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.benchmarks.generators import generate_knapsack_model
+from discrete_optimization.generic_tools.do_problem import get_default_objective_setup
+from discrete_optimization.generic_tools.ea.ga import EvaluationBackend, Ga
+from discrete_optimization.generic_tools.ea.nsga import Nsga
+from discrete_optimization.knapsack.knapsack_model import KnapsackModel_Mobj
+
+
+@pytest.mark.parametrize(
+    "evaluation_backend",
+    [
+        EvaluationBackend.SERIAL,
+        EvaluationBackend.PROCESS_POOL,
+        EvaluationBackend.BATCH,
+    ],
+)
+def test_ga_evaluation_backends(evaluation_backend):
+    knapsack_model = generate_knapsack_model(nb_items=40)
+    params = get_default_objective_setup(knapsack_model)
+    results = []
+    for backend in [EvaluationBackend.SERIAL, evaluation_backend]:
+        random.seed(0)
+        ga_solver = Ga(
+            knapsack_model,
+            max_evals=1000,
+            objective_handling=params.objective_handling,
+            objectives=params.objectives,
+            objective_weights=params.weights,
+            deap_verbose=False,
+            evaluation_backend=backend,
+            n_workers=2,
+            chunk_size=10,
+        )
+        results.append(ga_solver.solve().get_best_solution().list_taken)
+    assert results[0] == results[1]
+
+
+def test_nsga_process_pool():
+    knapsack_model = KnapsackModel_Mobj.from_knapsack(
+        generate_knapsack_model(nb_items=40)
+    )
+    results = []
+    for backend in [EvaluationBackend.SERIAL, EvaluationBackend.PROCESS_POOL]:
+        random.seed(0)
+        np.random.seed(0)  # used by the nsga3 selection
+        nsga_solver = Nsga(
+            knapsack_model,
+            objectives=["value", "heaviest_item"],
+            objective_weights=[1, -1],
+            max_evals=500,
+            deap_verbose=False,
+            evaluation_backend=backend,
+            n_workers=2,
+        )
+        results.append(
+            [sol.list_taken for sol, _ in nsga_solver.solve().list_solution_fits]
+        )
+    assert results[0] == results[1]
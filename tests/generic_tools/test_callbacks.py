@@ -0,0 +1,235 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import csv
+import json
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.benchmarks.generators import generate_knapsack_model
+from discrete_optimization.generic_tools.callbacks.callback import (
+    Callback,
+    CallbackList,
+)
+from discrete_optimization.generic_tools.callbacks.early_stoppers import (
+    NbIterationStopper,
+    ObjectiveTargetStopper,
+    TimerStopper,
+)
+from discrete_optimization.generic_tools.callbacks.recorder import (
+    CSV_COLUMNS,
+    TelemetryRecorder,
+)
+from discrete_optimization.generic_tools.do_problem import (
+    ModeOptim,
+    get_default_objective_setup,
+)
+from discrete_optimization.generic_tools.ea.ga import Ga
+from discrete_optimization.generic_tools.ea.nsga import Nsga
+from discrete_optimization.generic_tools.ls.hill_climber import HillClimber
+from discrete_optimization.generic_tools.ls.local_search import RestartHandlerLimit
+from discrete_optimization.generic_tools.ls.simulated_annealing import (
+    ModeMutation,
+    SimulatedAnnealing,
+    TemperatureSchedulingFactor,
+)
+from discrete_optimization.generic_tools.mutations.mixed_mutation import (
+    BasicPortfolioMutation,
+)
+from discrete_optimization.generic_tools.mutations.mutation_catalog import (
+    get_available_mutations,
+)
+from discrete_optimization.knapsack.knapsack_model import KnapsackModel_Mobj
+
+
+def build_sa(model, hill_climber=False):
+    solution = model.get_dummy_solution()
+    _, list_mutation = get_available_mutations(model, solution)
+    list_mutation = [
+        mutate[0].build(model, solution, **mutate[1]) for mutate in list_mutation
+    ]
+    mixed_mutation = BasicPortfolioMutation(
+        list_mutation, np.ones((len(list_mutation)))
+    )
+    res = RestartHandlerLimit(3000, solution, model.evaluate(solution))
+    if hill_climber:
+        solver = HillClimber(
+            evaluator=model,
+            mutator=mixed_mutation,
+            restart_handler=res,
+            mode_mutation=ModeMutation.MUTATE,
+        )
+    else:
+        solver = SimulatedAnnealing(
+            evaluator=model,
+            mutator=mixed_mutation,
+            restart_handler=res,
+            temperature_handler=TemperatureSchedulingFactor(1000, res, 0.99),
+            mode_mutation=ModeMutation.MUTATE,
+        )
+    return solver, solution
+
+
+def is_improving(fitnesses, mode_optim):
+    if mode_optim == ModeOptim.MAXIMIZATION:
+        return all(f2 > f1 for f1, f2 in zip(fitnesses[:-1], fitnesses[1:]))
+    return all(f2 < f1 for f1, f2 in zip(fitnesses[:-1], fitnesses[1:]))
+
+
+class EventCounter(Callback):
+    def __init__(self):
+        self.events = []
+
+    def on_solve_start(self, solver):
+        self.events.append("start")
+
+    def on_solve_end(self, res, solver):
+        self.events.append("end")
+
+    def on_step_end(self, step, res, solver):
+        self.events.append("step")
+        return step >= 2
+
+
+def test_callback_list():
+    counters = [EventCounter(), EventCounter()]
+    callbacks_list = CallbackList(callbacks=counters + [Callback()])
+    callbacks_list.on_solve_start(solver=None)
+    assert not callbacks_list.on_step_end(step=0, res=None, solver=None)
+    assert callbacks_list.on_step_end(step=2, res=None, solver=None)
+    callbacks_list.on_solve_end(res=None, solver=None)
+    for counter in counters:
+        assert counter.events == ["start", "step", "step", "end"]
+
+
+@pytest.mark.parametrize("hill_climber", [False, True])
+def test_ls_recorder_nb_iteration_stopper(hill_climber):
+    model = generate_knapsack_model(nb_items=40)
+    solver, solution = build_sa(model, hill_climber=hill_climber)
+    recorder = TelemetryRecorder(every_n_steps=10)
+    solver.solve(
+        solution,
+        nb_iteration_max=100000,
+        callbacks=[recorder, NbIterationStopper(nb_iteration_max=500)],
+    )
+    assert [step for _, step in recorder.steps] == list(range(0, 500, 10))
+    assert recorder.solve_time is not None
+    assert len(recorder.incumbents) > 1
+    assert is_improving(
+        [fitness for _, _, fitness in recorder.incumbents],
+        solver.mode_optim,
+    )
+
+
+def test_ls_objective_target_stopper():
+    model = generate_knapsack_model(nb_items=40)
+    solver, solution = build_sa(model, hill_climber=True)
+    mode_optim = solver.mode_optim
+    recorder = TelemetryRecorder()
+    target = solver.aggreg_from_solution(solution) + 100
+    stopper = ObjectiveTargetStopper(target=target, mode_optim=mode_optim)
+    result_storage = solver.solve(
+        solution, nb_iteration_max=100000, callbacks=[recorder, stopper]
+    )
+    assert stopper.reached
+    last_step = recorder.steps[-1][1]
+    assert last_step < 100000 - 1
+    assert recorder.incumbents[-1][1] == last_step
+    assert recorder.time_to_target(target, mode_optim) == recorder.incumbents[-1][0]
+    assert result_storage.get_best_solution_fit()[1] >= target
+
+
+def test_timer_stopper():
+    model = generate_knapsack_model(nb_items=40)
+    solver, solution = build_sa(model)
+    recorder = TelemetryRecorder(every_n_steps=1000)
+    solver.solve(
+        solution,
+        nb_iteration_max=10**9,
+        callbacks=[recorder, TimerStopper(total_seconds=0.5)],
+    )
+    assert 0.5 <= recorder.solve_time < 5
+
+
+def test_recorder_export(tmp_path):
+    model = generate_knapsack_model(nb_items=40)
+    solver, solution = build_sa(model)
+    recorder = TelemetryRecorder()
+    solver.solve(
+        solution,
+        nb_iteration_max=200,
+        callbacks=[recorder],
+    )
+    recorder.phases.append((recorder.solve_time, 199, "solve", 0.1))
+    assert recorder.phase_durations() == {"solve": 0.1}
+
+    csv_path = tmp_path / "telemetry.csv"
+    recorder.to_csv(str(csv_path))
+    with open(csv_path) as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == CSV_COLUMNS
+    assert len(rows) == len(recorder.incumbents) + 200 + 1
+    assert [float(row["time"]) for row in rows] == sorted(
+        float(row["time"]) for row in rows
+    )
+
+    json_path = tmp_path / "telemetry.json"
+    recorder.to_json(str(json_path))
+    with open(json_path) as f:
+        telemetry = json.load(f)
+    assert telemetry["solve_time"] == recorder.solve_time
+    assert telemetry["events"] == recorder.to_records()
+    incumbents = [
+        event for event in telemetry["events"] if event["event"] == "incumbent"
+    ]
+    assert [event["fitness"] for event in incumbents] == [
+        fitness for _, _, fitness in recorder.incumbents
+    ]
+
+
+def test_ga_callbacks():
+    model = generate_knapsack_model(nb_items=40)
+    params = get_default_objective_setup(model)
+    random.seed(0)
+    ga_solver = Ga(
+        model,
+        max_evals=2000,
+        objective_handling=params.objective_handling,
+        objectives=params.objectives,
+        objective_weights=params.weights,
+        deap_verbose=False,
+    )
+    recorder = TelemetryRecorder()
+    result_storage = ga_solver.solve(callbacks=[recorder])
+    ngen = 2000 // ga_solver._pop_size
+    assert [step for _, step in recorder.steps] == list(range(1, ngen + 1))
+    assert set(recorder.phase_durations()) == {"variation", "evaluation"}
+    assert len(recorder.phases) == 2 * ngen
+    fitnesses = [fitness for _, _, fitness in recorder.incumbents]
+    assert is_improving(fitnesses, params.sense_function)
+    assert result_storage.get_best_solution_fit()[1] == fitnesses[-1]
+
+    recorder = TelemetryRecorder()
+    ga_solver.solve(callbacks=[recorder, NbIterationStopper(nb_iteration_max=3)])
+    assert [step for _, step in recorder.steps] == [1, 2, 3]
+
+
+def test_nsga_callbacks():
+    model = KnapsackModel_Mobj.from_knapsack(generate_knapsack_model(nb_items=40))
+    random.seed(0)
+    np.random.seed(0)
+    nsga_solver = Nsga(
+        model,
+        objectives=["value", "heaviest_item"],
+        objective_weights=[1, -1],
+        max_evals=500,
+        deap_verbose=False,
+    )
+    recorder = TelemetryRecorder()
+    nsga_solver.solve(callbacks=[recorder, NbIterationStopper(nb_iteration_max=2)])
+    assert [step for _, step in recorder.steps] == [1, 2]
+    assert set(recorder.phase_durations()) == {"variation", "evaluation", "selection"}
+    assert recorder.solve_time is not None
@@ -0,0 +1,266 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.benchmarks.generators import generate_knapsack_model
+from discrete_optimization.coloring.coloring_model import (
+    ColoringProblem,
+    ColoringSolution,
+)
+from discrete_optimization.facility.facility_model import (
+    Customer,
+    Facility,
+    FacilityProblem2DPoints,
+    FacilitySolution,
+    Point,
+)
+from discrete_optimization.generic_tools.do_problem import get_default_objective_setup
+from discrete_optimization.generic_tools.graph_api import Graph
+from discrete_optimization.generic_tools.ls.hill_climber import HillClimber
+from discrete_optimization.generic_tools.ls.local_search import (
+    ModeMutation,
+    RestartHandlerLimit,
+    evaluate_neighbour,
+)
+from discrete_optimization.generic_tools.ls.simulated_annealing import (
+    SimulatedAnnealing,
+    TemperatureSchedulingFactor,
+)
+from discrete_optimization.generic_tools.mutations.mutation_bool import MutationBitFlip
+from discrete_optimization.generic_tools.mutations.mutation_integer import (
+    MutationIntegerSpecificArity,
+)
+from discrete_optimization.generic_tools.mutations.permutation_mutations import (
+    PermutationShuffleMutation,
+    PermutationSwap,
+    TwoOptMutation,
+)
+from discrete_optimization.knapsack.knapsack_model import KnapsackSolution
+from discrete_optimization.knapsack.mutation.mutation_knapsack import (
+    KnapsackMutationSingleBitFlip,
+    MutationKnapsack,
+)
+from discrete_optimization.tsp.tsp_model import (
+    Point2D,
+    SolutionTSP,
+    TSPModel2D,
+    TSPModelDistanceMatrix,
+)
+
+
+def create_coloring_problem(nb_nodes=40, nb_edges=120):
+    rng = random.Random(0)
+    nodes = [(i, {}) for i in range(nb_nodes)]
+    edges = [
+        (rng.randint(0, nb_nodes - 1), rng.randint(0, nb_nodes - 1), {})
+        for _ in range(nb_edges)
+    ]
+    return ColoringProblem(Graph(nodes=nodes, edges=edges, compute_predecessors=False))
+
+
+def create_facility_problem(facility_count=8, customer_count=60):
+    rng = random.Random(0)
+    facilities = [
+        Facility(
+            index=f,
+            setup_cost=rng.randint(10, 100),
+            capacity=rng.randint(50, 150),
+            location=Point(x=rng.random() * 100, y=rng.random() * 100),
+        )
+        for f in range(facility_count)
+    ]
+    customers = [
+        Customer(
+            index=i,
+            demand=rng.randint(1, 20),
+            location=Point(x=rng.random() * 100, y=rng.random() * 100),
+        )
+        for i in range(customer_count)
+    ]
+    return FacilityProblem2DPoints(
+        facility_count=facility_count,
+        customer_count=customer_count,
+        facilities=facilities,
+        customers=customers,
+    )
+
+
+def create_tsp_model(node_count=60, distance_matrix=False, end_index=0):
+    rng = random.Random(0)
+    points = [
+        Point2D(x=rng.random() * 100, y=rng.random() * 100) for _ in range(node_count)
+    ]
+    if distance_matrix:
+        matrix = np.array(
+            [
+                [rng.randint(1, 100) for _ in range(node_count)]
+                for _ in range(node_count)
+            ]
+        )
+        return TSPModelDistanceMatrix(
+            list_points=points,
+            distance_matrix=matrix,
+            node_count=node_count,
+            end_index=end_index,
+        )
+    return TSPModel2D(list_points=points, node_count=node_count, end_index=end_index)
+
+
+def knapsack_case(mutation):
+    model = generate_knapsack_model(nb_items=50)
+    solution = KnapsackSolution(
+        problem=model,
+        list_taken=[random.Random(1).randint(0, 1) for _ in range(model.nb_items)],
+    )
+    model.evaluate(solution)
+
+    def fresh(sol):
+        return KnapsackSolution(problem=model, list_taken=list(sol.list_taken))
+
+    return model, solution, mutation(model), fresh
+
+
+def coloring_case():
+    problem = create_coloring_problem()
+    rng = random.Random(1)
+    solution = ColoringSolution(
+        problem=problem, colors=[rng.randint(1, 6) for _ in range(40)]
+    )
+    mutation = MutationIntegerSpecificArity(
+        problem, attribute="colors", arities=[6] * 40, probability_flip=0.05
+    )
+
+    def fresh(sol):
+        return ColoringSolution(problem=problem, colors=list(sol.colors))
+
+    return problem, solution, mutation, fresh
+
+
+def facility_case():
+    problem = create_facility_problem()
+    rng = random.Random(1)
+    solution = FacilitySolution(
+        problem, facility_for_customers=[rng.randint(0, 7) for _ in range(60)]
+    )
+    mutation = MutationIntegerSpecificArity(
+        problem,
+        attribute="facility_for_customers",
+        arities=[8] * 60,
+        probability_flip=0.05,
+        min_value=0,
+    )
+
+    def fresh(sol):
+        return FacilitySolution(problem, list(sol.facility_for_customers))
+
+    return problem, solution, mutation, fresh
+
+
+def tsp_case(mutation, **kwargs):
+    model = create_tsp_model(**kwargs)
+    solution = model.get_random_dummy_solution()
+
+    def fresh(sol):
+        return SolutionTSP(problem=model, permutation=list(sol.permutation))
+
+    return model, solution, mutation(model, solution), fresh
+
+
+cases = {
+    "knapsack-bitflip": lambda: knapsack_case(
+        lambda model: MutationBitFlip(model, probability_flip=0.05)
+    ),
+    "knapsack-singlebitflip": lambda: knapsack_case(KnapsackMutationSingleBitFlip),
+    "knapsack-kp": lambda: knapsack_case(MutationKnapsack),
+    "coloring": coloring_case,
+    "facility": facility_case,
+    "tsp-swap": lambda: tsp_case(
+        lambda model, sol: PermutationSwap(
+            model, sol, attribute="permutation", nb_swap=3
+        )
+    ),
+    "tsp-2opt": lambda: tsp_case(
+        lambda model, sol: TwoOptMutation(model, sol, attribute="permutation")
+    ),
+    "tsp-matrix-swap": lambda: tsp_case(
+        lambda model, sol: PermutationSwap(
+            model, sol, attribute="permutation", nb_swap=2
+        ),
+        distance_matrix=True,
+        end_index=5,
+    ),
+}
+
+
+@pytest.mark.parametrize("case", sorted(cases))
+def test_evaluate_delta_same_as_evaluate(case):
+    random.seed(0)
+    np.random.seed(0)
+    problem, solution, mutation, fresh = cases[case]()
+    objectives = get_default_objective_setup(problem).objectives
+    state = problem.init_delta_state(solution)
+    assert state is not None
+    for _ in range(300):
+        new_solution, move = mutation.mutate(solution)
+        res = problem.evaluate_delta(new_solution, move, state)
+        assert res is not None
+        kpis, new_state = res
+        expected = problem.evaluate(fresh(new_solution))
+        for objective in objectives:
+            assert kpis[objective] == pytest.approx(expected[objective])
+        if random.random() < 0.5:
+            solution, state = new_solution, new_state
+        else:
+            solution = move.backtrack_local_move(new_solution)
+
+
+def test_evaluate_neighbour_not_supported_move():
+    model = create_tsp_model()
+    solution = model.get_random_dummy_solution()
+    state = model.init_delta_state(solution)
+    mutation = PermutationShuffleMutation(model, solution, attribute="permutation")
+    new_solution, move = mutation.mutate(solution)
+    assert model.evaluate_delta(new_solution, move, state) is None
+    kpis, new_state = evaluate_neighbour(model, new_solution, move, state)
+    assert new_state is None
+    assert kpis["length"] == model.evaluate(new_solution)["length"]
+
+
+@pytest.mark.parametrize("local_search", ["sa", "hc"])
+def test_local_search_with_delta_evaluation(local_search):
+    random.seed(0)
+    np.random.seed(0)
+    model = create_tsp_model()
+    solution = model.get_dummy_solution()
+    mutation = PermutationSwap(model, solution, attribute="permutation", nb_swap=1)
+    restart_handler = RestartHandlerLimit(200, solution, model.evaluate(solution))
+    if local_search == "sa":
+        solver = SimulatedAnnealing(
+            evaluator=model,
+            mutator=mutation,
+            restart_handler=restart_handler,
+            temperature_handler=TemperatureSchedulingFactor(10, restart_handler, 0.999),
+            mode_mutation=ModeMutation.MUTATE,
+            params_objective_function=get_default_objective_setup(model),
+        )
+    else:
+        solver = HillClimber(
+            evaluator=model,
+            mutator=mutation,
+            restart_handler=restart_handler,
+            mode_mutation=ModeMutation.MUTATE,
+            params_objective_function=get_default_objective_setup(model),
+        )
+    result = solver.solve(solution, nb_iteration_max=3000)
+    # last solution stored is the last improvement
+    best_solution, best_fitness = result.list_solution_fits[-1]
+    length = model.evaluate(
+        SolutionTSP(problem=model, permutation=list(best_solution.permutation))
+    )["length"]
+    assert length < model.evaluate(solution)["length"]
+    assert best_fitness == pytest.approx(length)
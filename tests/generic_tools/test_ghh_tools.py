@@ -0,0 +1,100 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+from deap import base, gp
+
+from discrete_optimization.generic_tools.ghh_tools import (
+    compile_vectorized,
+    heuristic_values,
+    protected_div_array,
+    register_population_map,
+)
+from discrete_optimization.knapsack.solvers.gphh_knapsack import (
+    ParametersGPHH as ParametersGPHHKnapsack,
+)
+from discrete_optimization.knapsack.solvers.gphh_knapsack import (
+    vectorized_primitives as knapsack_vectorized_primitives,
+)
+from discrete_optimization.rcpsp.solver.gphh_solver import ParametersGPHH
+
+
+def test_protected_div_array():
+    np.testing.assert_array_equal(
+        protected_div_array([1.0, 2.0, 3.0], [2.0, 0.0, -1.0]), [0.5, 1.0, -3.0]
+    )
+
+
+def test_vectorized_trees_rcpsp_primitives():
+    random.seed(0)
+    rng = np.random.default_rng(0)
+    pset = ParametersGPHH.default().set_primitves
+    features = list(rng.integers(-2, 3, size=(len(pset.arguments), 50)).astype(float))
+    for _ in range(50):
+        expr = gp.PrimitiveTree(gp.genHalfAndHalf(pset, min_=0, max_=5))
+        assert compile_vectorized(expr, pset) is not None
+        func_heuristic = gp.compile(expr, pset)
+        np.testing.assert_allclose(
+            heuristic_values(expr, pset, features, shape=(50,)),
+            heuristic_values(
+                expr, pset, features, shape=(50,), func_heuristic=func_heuristic
+            ),
+        )
+
+
+def test_vectorized_trees_list_features():
+    random.seed(0)
+    rng = np.random.default_rng(0)
+    pset = ParametersGPHHKnapsack.default().set_primitves
+    # profit, capacities, average consumption of 20 items in a knapsack with 3 dimensions
+    features = [
+        rng.uniform(1, 10, size=20),
+        np.broadcast_to(rng.uniform(10, 20, size=3), (20, 3)),
+        rng.uniform(0, 1, size=20),
+    ]
+    for _ in range(50):
+        expr = gp.PrimitiveTree(gp.genHalfAndHalf(pset, min_=1, max_=4))
+        func_heuristic = gp.compile(expr, pset)
+        np.testing.assert_allclose(
+            heuristic_values(
+                expr,
+                pset,
+                features,
+                shape=(20,),
+                vectorized_primitives=knapsack_vectorized_primitives,
+            ),
+            heuristic_values(
+                expr, pset, features, shape=(20,), func_heuristic=func_heuristic
+            ),
+        )
+
+
+def test_non_vectorized_primitive():
+    pset = gp.PrimitiveSet("main", 2)
+    pset.addPrimitive(lambda x, y: x if x > y else -y, 2, name="custom")
+    pset.addPrimitive(np.add, 2, name="add")
+    expr = gp.PrimitiveTree.from_string("custom(ARG0, add(ARG0, ARG1))", pset)
+    assert compile_vectorized(expr, pset) is None
+    values = heuristic_values(
+        expr, pset, [np.array([1.0, 3.0]), np.array([-2.0, 1.0])], shape=(2,)
+    )
+    np.testing.assert_array_equal(values, [1.0, -4.0])
+
+
+def test_register_population_map():
+    toolbox = base.Toolbox()
+    toolbox.register("evaluate", lambda x: (x,))
+    populations = []
+
+    def evaluate_population(individuals):
+        populations.append(individuals)
+        return [(2 * x,) for x in individuals]
+
+    register_population_map(toolbox, evaluate_population)
+    assert toolbox.map(toolbox.evaluate, iter([1, 2, 3])) == [(2,), (4,), (6,)]
+    assert populations == [[1, 2, 3]]
+    assert toolbox.map(str, [1, 2]) == ["1", "2"]
+    assert len(populations) == 1
@@ -0,0 +1,76 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import networkx as nx
+import pytest
+
+from discrete_optimization.generic_tools.graph_api import Graph
+from discrete_optimization.generic_tools.graph_closure import TransitiveClosure
+
+
+def random_dag(nb_nodes, seed=0):
+    rng = random.Random(seed)
+    edges = [
+        (i, j)
+        for i in range(nb_nodes)
+        for j in range(i + 1, nb_nodes)
+        if rng.random() < 3 / nb_nodes
+    ]
+    nodes = list(range(nb_nodes))
+    # the closure should not depend on the order of the nodes
+    rng.shuffle(nodes)
+    graph_nx = nx.DiGraph()
+    graph_nx.add_nodes_from(nodes)
+    graph_nx.add_edges_from(edges)
+    return nodes, edges, graph_nx
+
+
+@pytest.mark.parametrize("nb_nodes", [1, 10, 130])
+def test_transitive_closure(nb_nodes):
+    nodes, edges, graph_nx = random_dag(nb_nodes)
+    closure = TransitiveClosure(nodes=nodes, edges=edges)
+    for node in nodes:
+        descendants = nx.descendants(graph_nx, node)
+        ancestors = nx.ancestors(graph_nx, node)
+        assert closure.descendants(node) == descendants
+        assert closure.ancestors(node) == ancestors
+        assert closure.nb_descendants[closure.index[node]] == len(descendants)
+        assert closure.nb_ancestors[closure.index[node]] == len(ancestors)
+        assert closure.unrelated(node) == set(nodes) - descendants - ancestors - {node}
+        for other_node in nodes:
+            assert closure.is_reachable(node, other_node) == (other_node in descendants)
+    assert set(closure.transitive_reduction()) == set(
+        nx.transitive_reduction(graph_nx).edges()
+    )
+
+
+def test_transitive_closure_cycle():
+    with pytest.raises(ValueError):
+        TransitiveClosure(nodes=[0, 1, 2], edges=[(0, 1), (1, 2), (2, 0)])
+
+
+def test_graph_maps():
+    nodes, edges, graph_nx = random_dag(50)
+    graph = Graph(
+        nodes=[(node, {}) for node in nodes],
+        edges=[(n1, n2, {}) for n1, n2 in edges],
+        undirected=False,
+    )
+    assert graph.get_transitive_closure() is not None
+    assert graph.full_successors == {
+        node: nx.descendants(graph_nx, node) for node in nodes
+    }
+    assert graph.full_predecessors == {
+        node: nx.ancestors(graph_nx, node) for node in nodes
+    }
+    # cyclic graphs fall back to networkx
+    graph = Graph(
+        nodes=[(0, {}), (1, {})],
+        edges=[(0, 1, {}), (1, 0, {})],
+        undirected=False,
+    )
+    assert graph.get_transitive_closure() is None
+    assert graph.full_successors == {0: {1}, 1: {0}}
@@ -0,0 +1,59 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.generic_tools.interval_calendar import (
+    IntervalCalendar,
+    calendar_available_intervals,
+    calendar_step_function,
+    calendar_total,
+)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_from_sequence(seed):
+    rng = random.Random(seed)
+    sequence = [rng.choice([0, 0, 1, 2]) for _ in range(50)]
+    calendar = IntervalCalendar.from_sequence(sequence)
+    assert len(calendar) == len(sequence)
+    assert list(calendar) == sequence
+    assert [calendar[t] for t in range(len(sequence))] == sequence
+    assert calendar[-1] == sequence[-1]
+    assert calendar[10:20] == sequence[10:20]
+    assert np.array_equal(np.array(calendar), sequence)
+    assert np.all(np.diff(calendar.values) != 0)
+    assert IntervalCalendar.from_json(calendar.to_json()) == calendar
+    with pytest.raises(IndexError):
+        calendar[len(sequence)]
+
+
+def test_from_intervals():
+    calendar = IntervalCalendar.from_intervals([(8, 12), (2, 5), (5, 6)], horizon=10)
+    assert list(calendar) == [0, 0, 1, 1, 1, 1, 0, 0, 1, 1]
+    assert calendar.intervals() == [(0, 2, 0), (2, 6, 1), (6, 8, 0), (8, 10, 1)]
+    assert IntervalCalendar.constant(3, 4) == IntervalCalendar.from_sequence([3] * 4)
+    with pytest.raises(ValueError):
+        IntervalCalendar.from_intervals([(0, 5), (3, 6)], horizon=10)
+
+
+@pytest.mark.parametrize("horizon", [5, 10, 15])
+def test_helpers(horizon):
+    sequence = [1, 1, 0, 2, 2, 0, 0, 1, 3, 0]
+    for calendar in [sequence, IntervalCalendar.from_sequence(sequence)]:
+        dense = (sequence + [0] * horizon)[:horizon]
+        breakpoints, values = calendar_step_function(calendar, horizon)
+        assert (
+            list(np.repeat(values, np.diff(np.append(breakpoints, horizon)))) == dense
+        )
+        assert calendar_total(calendar, horizon) == sum(dense)
+        intervals = calendar_available_intervals(calendar, horizon)
+        available = [0] * horizon
+        for start, end in intervals:
+            available[start:end] = [1] * (end - start)
+        assert available == [int(value > 0) for value in dense]
+        assert np.all(intervals[1:, 0] > intervals[:-1, 1])
@@ -0,0 +1,47 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+from discrete_optimization.generic_tools.jit_kernels import (
+    get_kernels,
+    get_kernels_stats,
+    jit_kernel,
+    warm_up_kernels,
+)
+from discrete_optimization.rcpsp.fast_function_rcpsp import sgs_fast
+from discrete_optimization.rcpsp_multiskill.fast_function_ms_rcpsp import sgs_fast_ms
+
+
+def test_sgs_kernels_registered_with_disk_cache():
+    kernels = get_kernels()
+    assert (
+        kernels["discrete_optimization.rcpsp.fast_function_rcpsp.sgs_fast"] is sgs_fast
+    )
+    assert (
+        kernels[
+            "discrete_optimization.rcpsp_multiskill.fast_function_ms_rcpsp.sgs_fast_ms"
+        ]
+        is sgs_fast_ms
+    )
+    assert sgs_fast.stats.cache_path is not None
+
+
+def test_jit_kernel_lazy_compilation():
+    @jit_kernel
+    def add_one(x):
+        return x + 1
+
+    name = f"{__name__}.add_one"
+    assert name not in [stats.name for stats in get_kernels_stats()]
+    assert add_one(1) == 2
+    (stats,) = [stats for stats in get_kernels_stats() if stats.name == name]
+    assert stats.nb_signatures == 1
+    assert stats.cache_hits + stats.cache_misses == 1
+
+
+def test_warm_up_kernels():
+    durations = warm_up_kernels(["rcpsp"])
+    assert list(durations) == ["rcpsp"]
+    names = [stats.name for stats in get_kernels_stats()]
+    assert "discrete_optimization.rcpsp.fast_function_rcpsp.sgs_fast" in names
+    assert "discrete_optimization.rcpsp.fast_function_rcpsp.sgs_fast_event" in names
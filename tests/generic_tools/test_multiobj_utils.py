@@ -3,9 +3,16 @@
 #  LICENSE file in the root directory of this source tree.
 
 import numpy as np
+import pytest
 
+from discrete_optimization.generic_tools.do_problem import ModeOptim
 from discrete_optimization.generic_tools.result_storage.multiobj_utils import (
+    ParetoArchive,
     TupleFitness,
+    get_non_dominated_mask,
+)
+from discrete_optimization.generic_tools.result_storage.result_storage import (
+    ParetoFront,
 )
 
 
@@ -26,5 +33,52 @@ def test_tuplefitness():
     assert not (fitness_3 == fitness_2)
 
 
+def naive_non_dominated_mask(points, maximize):
+    fitnesses = [TupleFitness(p, len(p)) for p in points]
+    if maximize:
+        return np.array([not any(f < g for g in fitnesses) for f in fitnesses])
+    else:
+        return np.array([not any(f > g for g in fitnesses) for f in fitnesses])
+
+
+@pytest.mark.parametrize("nb_objectives", [1, 2, 3, 4])
+@pytest.mark.parametrize("maximize", [True, False])
+def test_non_dominated_mask(nb_objectives, maximize):
+    rng = np.random.default_rng(42)
+    # small integer range to get duplicates and ties
+    points = rng.integers(0, 6, size=(300, nb_objectives))
+    mask = get_non_dominated_mask(points, maximize=maximize)
+    assert (mask == naive_non_dominated_mask(points, maximize=maximize)).all()
+
+
+def test_pareto_archive_batches():
+    rng = np.random.default_rng(0)
+    points = rng.random((500, 3))
+    archive = ParetoArchive(maximize=True, batch_size=64)
+    for i, p in enumerate(points):
+        archive.add(i, p)
+    expected = list(np.flatnonzero(naive_non_dominated_mask(points, maximize=True)))
+    assert archive.items == expected
+    assert (archive.points == points[expected]).all()
+
+
+@pytest.mark.parametrize("mode_optim", [ModeOptim.MAXIMIZATION, ModeOptim.MINIMIZATION])
+def test_pareto_front_finalize(mode_optim):
+    rng = np.random.default_rng(1)
+    points = rng.integers(0, 20, size=(200, 2))
+    list_solution_fits = [(i, TupleFitness(p, 2)) for i, p in enumerate(points)]
+    pareto_front = ParetoFront(
+        list_solution_fits=list_solution_fits,
+        best_solution=None,
+        mode_optim=mode_optim,
+    )
+    pareto_front.finalize()
+    mask = naive_non_dominated_mask(
+        points, maximize=mode_optim == ModeOptim.MAXIMIZATION
+    )
+    assert [s for s, _ in pareto_front.paretos] == list(np.flatnonzero(mask))
+    assert pareto_front.len_pareto_front() == mask.sum()
+
+
 if __name__ == "__main__":
     test_tuplefitness()
@@ -0,0 +1,70 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import pytest
+
+from discrete_optimization.generic_tools.do_problem import ModeOptim, Problem, Solution
+from discrete_optimization.generic_tools.result_storage.result_storage import (
+    BoundedResultStorage,
+    ResultStorage,
+)
+
+
+class DummySolution(Solution):
+    def __init__(self, value: int):
+        self.value = value
+
+    def copy(self) -> "DummySolution":
+        return DummySolution(self.value)
+
+    def change_problem(self, new_problem: Problem) -> None:
+        pass
+
+
+@pytest.mark.parametrize("mode_optim", [ModeOptim.MAXIMIZATION, ModeOptim.MINIMIZATION])
+def test_bounded_result_storage_matches_result_storage(mode_optim):
+    random.seed(0)
+    fitnesses = [random.randint(0, 50) for _ in range(500)]
+    solutions = [DummySolution(i) for i in range(len(fitnesses))]
+    storage = ResultStorage(list_solution_fits=[], mode_optim=mode_optim)
+    bounded = BoundedResultStorage(
+        list_solution_fits=[],
+        mode_optim=mode_optim,
+        nb_best_store=20,
+        nb_last_store=10,
+    )
+    for solution, fitness in zip(solutions, fitnesses):
+        storage.list_solution_fits.append((solution, fitness))
+        bounded.add_solution(solution, fitness)
+        assert bounded.get_best_solution() is storage.get_best_solution()
+        assert bounded.get_best_solution_fit() == storage.get_best_solution_fit()
+        assert bounded.get_last_best_solution() == storage.get_last_best_solution()
+    assert len(bounded.list_solution_fits) <= 30
+    assert bounded.list_solution_fits[-10:] == storage.list_solution_fits[-10:]
+    assert [f for _, f in bounded.get_n_best_solution(20)] == [
+        f for _, f in storage.get_n_best_solution(20)
+    ]
+    best_fitness = bounded.get_best_solution_fit()[1]
+    assert bounded.get_random_best_solution()[1] == best_fitness
+    for _ in range(20):
+        solution, fitness = bounded.get_random_solution()
+        assert fitness != best_fitness
+        assert (solution, fitness) in bounded.list_solution_fits
+
+
+def test_bounded_result_storage_list_assignment():
+    bounded = BoundedResultStorage(
+        list_solution_fits=[(DummySolution(i), i) for i in range(10)],
+        mode_optim=ModeOptim.MINIMIZATION,
+        nb_best_store=2,
+        nb_last_store=2,
+    )
+    assert bounded.nb_best_store == bounded.nb_best_score == 2
+    assert [s.value for s, _ in bounded.list_solution_fits] == [0, 1, 8, 9]
+    bounded.list_solution_fits += [(DummySolution(-1), -1)]
+    assert bounded.get_best_solution().value == -1
+    assert [s.value for s, _ in bounded.list_solution_fits] == [0, 9, -1]
+    assert len(bounded.map_solutions) == 3
@@ -0,0 +1,75 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import pytest
+
+from discrete_optimization.knapsack.knapsack_model import Item, KnapsackModel
+from discrete_optimization.knapsack.solvers.dyn_prog_knapsack import (
+    KnapsackDynProg,
+    reduce_items,
+)
+
+
+def create_random_knapsack_model(nb_items=60, capacity=200, seed=0):
+    rng = random.Random(seed)
+    list_items = []
+    for i in range(nb_items):
+        if i > 0 and rng.random() < 0.3:
+            # identical to a previous item
+            other = rng.choice(list_items)
+            list_items.append(Item(index=i, value=other.value, weight=other.weight))
+        else:
+            list_items.append(
+                Item(index=i, value=rng.randint(-5, 100), weight=rng.randint(0, 60))
+            )
+    list_items.append(Item(index=nb_items, value=1000, weight=capacity + 1))
+    return KnapsackModel(list_items=list_items, max_capacity=capacity)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("greedy_start", [False, True])
+def test_dyn_prog_lean_memory(seed, greedy_start):
+    knapsack_model = create_random_knapsack_model(seed=seed)
+    solver = KnapsackDynProg(knapsack_model)
+    expected_value = solver.solve().get_best_solution().value
+    assert solver.solve_np().get_best_solution().value == expected_value
+    sol = solver.solve(lean_memory=True, greedy_start=greedy_start).get_best_solution()
+    assert knapsack_model.satisfy(sol)
+    assert sol.value == expected_value
+
+
+def test_reduce_items():
+    list_items = [
+        Item(index=0, value=10, weight=4),
+        Item(index=1, value=10, weight=4),
+        Item(index=2, value=10, weight=4),
+        Item(index=3, value=10, weight=4),
+        Item(index=4, value=3, weight=4),
+        Item(index=5, value=7, weight=0),
+        Item(index=6, value=0, weight=1),
+        Item(index=7, value=50, weight=11),
+    ]
+    knapsack_model = KnapsackModel(list_items=list_items, max_capacity=10)
+    weights, values, groups, always_taken = reduce_items(knapsack_model, capacity=10)
+    # only 2 items of weight 4 can be taken: the 2 most valuable, grouped in 1 + 1
+    assert always_taken == [5]
+    assert sorted(weights) == [4, 4]
+    assert sorted(values) == [10, 10]
+    assert sorted(len(group) for group in groups) == [1, 1]
+
+
+def test_dyn_prog_lean_memory_large_capacity():
+    rng = random.Random(1)
+    capacity = 10**6
+    list_items = [
+        Item(index=i, value=rng.randint(1, 1000), weight=rng.randint(1, 10**5))
+        for i in range(100)
+    ]
+    knapsack_model = KnapsackModel(list_items=list_items, max_capacity=capacity)
+    solver = KnapsackDynProg(knapsack_model)
+    sol = solver.solve(lean_memory=True).get_best_solution()
+    assert knapsack_model.satisfy(sol)
+    assert solver.table is None
@@ -2,6 +2,9 @@
 #  This source code is licensed under the MIT license found in the
 #  LICENSE file in the root directory of this source tree.
 
+import random
+
+from discrete_optimization.benchmarks.generators import generate_knapsack_model
 from discrete_optimization.knapsack.knapsack_model import (
     KnapsackModel,
     from_kp_to_multi,
@@ -44,5 +47,41 @@ def test_run_one_example():
     gphh_solver.plot_solution(show=False)
 
 
+def test_gphh_population_evaluation():
+    random.seed(0)
+    domains = [
+        from_kp_to_multi(generate_knapsack_model(100, seed=seed)) for seed in range(3)
+    ]
+    params_gphh = ParametersGPHH.default()
+    params_gphh.pop_size = 20
+    params_gphh.n_gen = 3
+    gphh_solver = GPHH(
+        training_domains=domains[:2],
+        domain_model=domains[2],
+        params_gphh=params_gphh,
+    )
+    gphh_solver.init_model()
+    sol, fit = gphh_solver.solve().get_best_solution_fit()
+    assert domains[2].satisfy(sol)
+
+    # batch evaluation of the population vs solutions built one by one
+    population = gphh_solver.final_pop
+    fitnesses = gphh_solver.evaluate_population(population, domains=domains)
+    for individual, fitness in zip(population, fitnesses):
+        values = []
+        for domain in domains:
+            solution = gphh_solver.build_solution(
+                domain=domain,
+                func_heuristic=gphh_solver.toolbox.compile(expr=individual),
+            )
+            assert solution == gphh_solver.build_solution(
+                domain=domain, individual=individual
+            )
+            values.append(gphh_solver.aggreg_dict(domain.evaluate(solution)))
+        assert fitness == [
+            sum(values) / len(values) - 10 * gphh_solver.evaluate_complexity(individual)
+        ]
+
+
 if __name__ == "__main__":
     test_run_one_example()
@@ -42,6 +42,7 @@ def test_pickup_and_delivery():
         fraction_of_pickup_deliver=0.125,
         include_cluster=False,
         pickup_per_cluster=False,
+        seed=0,
     )
     list_params_cost = [
         ParametersCost(
@@ -78,6 +79,7 @@ def test_pickup_and_delivery_equilibrate():
         fraction_of_pickup_deliver=0.125,
         include_cluster=False,
         pickup_per_cluster=False,
+        seed=0,
     )
     list_params_cost = [
         ParametersCost(
@@ -115,7 +117,7 @@ def test_pickup_and_delivery_equilibrate():
 
 
 def test_selective_tsp():
-    gpdp = create_selective_tsp(nb_nodes=1000, nb_vehicles=1, nb_clusters=100)
+    gpdp = create_selective_tsp(nb_nodes=1000, nb_vehicles=1, nb_clusters=100, seed=0)
     solver = ORToolsGPDP(
         problem=gpdp, factor_multiplier_distance=1, factor_multiplier_time=1
     )
@@ -0,0 +1,99 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.pickup_vrp.builders.instance_builders import (
+    create_pickup_and_delivery,
+)
+from discrete_optimization.pickup_vrp.gpdp import (
+    GPDP,
+    build_matrix_distance,
+    build_pruned_problem,
+    build_sparse_matrix,
+)
+from discrete_optimization.pickup_vrp.solver.ortools_solver import (
+    ORToolsGPDP,
+    ParametersCost,
+    build_matrix_resource_transition,
+    first_solution_strategy_enum,
+    local_search_metaheuristic_enum,
+)
+
+
+@pytest.fixture
+def random_seed():
+    random.seed(0)
+    np.random.seed(0)
+
+
+def naive_matrix_distance(problem: GPDP) -> np.ndarray:
+    matrix = 100000 * np.ones(
+        (len(problem.all_nodes_dict), len(problem.all_nodes_dict))
+    )
+    for j in problem.distance_delta:
+        for k in problem.distance_delta[j]:
+            matrix[
+                problem.index_nodes[j], problem.index_nodes[k]
+            ] = problem.distance_delta[j][k]
+    return matrix
+
+
+def test_sparse_matrix_pruned_problem(random_seed):
+    gpdp = create_pickup_and_delivery(number_of_vehicles=2, number_of_node=40)
+    gpdp.compute_graph()
+    pruned = build_pruned_problem(gpdp, compute_graph=True)
+    for problem in [gpdp, pruned]:
+        ptr, index, values = build_sparse_matrix(problem, problem.distance_delta)
+        nb_edges = sum(len(problem.distance_delta[j]) for j in problem.distance_delta)
+        assert ptr[-1] == len(index) == len(values) == nb_edges
+        node = problem.list_nodes[3]
+        assert {
+            (problem.list_nodes[k], v)
+            for k, v in zip(index[ptr[3] : ptr[4]], values[ptr[3] : ptr[4]])
+        } == set(problem.distance_delta[node].items())
+        assert np.array_equal(
+            build_matrix_distance(problem), naive_matrix_distance(problem)
+        )
+    assert ptr[-1] < sum(len(gpdp.distance_delta[j]) for j in gpdp.distance_delta)
+
+
+def test_resource_transition_matrix(random_seed):
+    gpdp = create_pickup_and_delivery(number_of_vehicles=2, number_of_node=20)
+    for r in gpdp.resources_set:
+        matrix = build_matrix_resource_transition(gpdp, r)
+        for i in range(len(gpdp.list_nodes)):
+            for j in range(len(gpdp.list_nodes)):
+                assert matrix[i, j] == gpdp.resources_flow_edges.get((i, j), {r: 0})[
+                    r
+                ] + gpdp.resources_flow_node.get(j, {r: 0}).get(r, 0)
+
+
+@pytest.mark.parametrize("use_matrix", [True, False])
+def test_native_transit_same_solution(random_seed, use_matrix):
+    gpdp = create_pickup_and_delivery(number_of_vehicles=2, number_of_node=20)
+    solutions = []
+    for use_native_transit in [True, False]:
+        solver = ORToolsGPDP(problem=gpdp)
+        solver.init_model(
+            use_native_transit=use_native_transit,
+            use_matrix=use_matrix,
+            include_time_dimension=use_matrix,
+            include_demand=True,
+            include_resource_dimension=True,
+            include_pickup_and_delivery=True,
+            parameters_cost=[
+                ParametersCost(dimension_name="Distance", global_span=True)
+            ],
+            first_solution_strategy=first_solution_strategy_enum.PATH_CHEAPEST_ARC,
+            local_search_metaheuristic=local_search_metaheuristic_enum.GREEDY_DESCENT,
+            time_limit=10,
+        )
+        solver.search_parameters.solution_limit = 20
+        solutions.append(solver.solve()[-1])
+    assert solutions[0][0] == solutions[1][0]
+    assert solutions[0][-1] == solutions[1][-1]
@@ -0,0 +1,64 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.rcpsp.rcpsp_model import RCPSPModel
+
+
+def _create_random_rcpsp_model(
+    nb_tasks=40, nb_modes=1, calendar=False, non_renewable=False, seed=0
+):
+    rng = random.Random(seed)
+    horizon = 50 * nb_tasks
+    resources = {"R1": 6, "R2": 4}
+    non_renewable_resources = []
+    if non_renewable:
+        resources["N1"] = 30 * nb_tasks
+        non_renewable_resources = ["N1"]
+    if calendar:
+        for res in ["R1", "R2"]:
+            availability = np.full(horizon, resources[res], dtype=int)
+            for _ in range(20):
+                t = rng.randint(0, horizon - 50)
+                availability[t : t + rng.randint(1, 50)] -= rng.randint(1, 3)
+            resources[res] = list(availability)
+        if non_renewable:
+            resources["N1"] = [resources["N1"]] * horizon
+    tasks = list(range(1, nb_tasks + 3))
+    mode_details = {tasks[0]: {1: {"duration": 0}}, tasks[-1]: {1: {"duration": 0}}}
+    for task in tasks[1:-1]:
+        mode_details[task] = {}
+        for mode in range(1, nb_modes + 1):
+            mode_details[task][mode] = {
+                "duration": rng.randint(0, 10),
+                "R1": rng.randint(0, 4),
+                "R2": rng.randint(0, 3),
+            }
+            if non_renewable:
+                mode_details[task][mode]["N1"] = rng.randint(0, 20)
+    successors = {task: [] for task in tasks}
+    for task in tasks[1:-1]:
+        successors[tasks[0]].append(task)
+        successors[task].append(tasks[-1])
+        for _ in range(rng.randint(0, 2)):
+            succ = rng.randint(task + 1, tasks[-1])
+            if succ not in successors[task]:
+                successors[task].append(succ)
+    return RCPSPModel(
+        resources=resources,
+        non_renewable_resources=non_renewable_resources,
+        mode_details=mode_details,
+        successors=successors,
+        horizon=horizon,
+    )
+
+
+@pytest.fixture
+def create_random_rcpsp_model():
+    """Factory of seeded random rcpsp models."""
+    return _create_random_rcpsp_model
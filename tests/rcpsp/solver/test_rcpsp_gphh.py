@@ -0,0 +1,44 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+
+from discrete_optimization.benchmarks.generators import generate_rcpsp_model
+from discrete_optimization.rcpsp.solver.gphh_solver import GPHH, ParametersGPHH
+
+
+def test_gphh_rcpsp():
+    random.seed(0)
+    domains = [generate_rcpsp_model(30, seed=seed) for seed in range(3)]
+    params_gphh = ParametersGPHH.default()
+    params_gphh.pop_size = 20
+    params_gphh.n_gen = 3
+    solver = GPHH(
+        training_domains=domains[:2], domain_model=domains[2], params_gphh=params_gphh
+    )
+    solver.init_model()
+    result_storage = solver.solve()
+    solution, fit = result_storage.get_best_solution_fit()
+    assert sorted(solution.rcpsp_permutation) == list(range(30))
+    assert domains[2].satisfy(solution)
+
+    # batch evaluation of the population vs sgs of the solutions built one by one
+    population = solver.final_pop
+    fitnesses = solver.evaluate_population(population, domains=domains)
+    for individual, fitness in zip(population, fitnesses):
+        makespans = []
+        for domain in domains:
+            solution = solver.build_solution(
+                domain=domain, func_heuristic=solver.toolbox.compile(expr=individual)
+            )
+            assert (
+                solution.rcpsp_permutation
+                == solver.build_solution(
+                    domain=domain, individual=individual
+                ).rcpsp_permutation
+            )
+            makespans.append(solution.get_end_time(domain.sink_task))
+        assert fitness == [-np.mean(makespans)]
@@ -0,0 +1,184 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import pickle
+from copy import copy, deepcopy
+
+import numpy as np
+import pytest
+
+from discrete_optimization.rcpsp.rcpsp_model import (
+    UNFEASIBLE_MAKESPAN,
+    RCPSPSolution,
+    ScheduleGenerationScheme,
+    create_np_data,
+    create_np_data_and_jit_functions,
+    create_sgs_arrays_functions,
+    permutation_do_to_permutation_sgs_fast,
+)
+from discrete_optimization.rcpsp.rcpsp_schedule import ArraySchedule
+
+
+@pytest.mark.parametrize("use_event_sgs", [False, True])
+@pytest.mark.parametrize("nb_modes", [1, 3])
+@pytest.mark.parametrize("non_renewable", [False, True])
+def test_sgs_arrays_same_as_sgs_dict(
+    use_event_sgs, nb_modes, non_renewable, create_random_rcpsp_model
+):
+    rcpsp_model = create_random_rcpsp_model(
+        nb_modes=nb_modes, calendar=True, non_renewable=non_renewable
+    )
+    func_sgs, _, _, _ = create_np_data_and_jit_functions(
+        rcpsp_model, use_event_sgs=use_event_sgs
+    )
+    func_sgs_arrays, func_sgs_parallel_arrays = create_sgs_arrays_functions(
+        rcpsp_model, np_data=create_np_data(rcpsp_model), use_event_sgs=use_event_sgs
+    )
+    rng = np.random.default_rng(1)
+    for _ in range(10):
+        kwargs = dict(
+            permutation_task=permutation_do_to_permutation_sgs_fast(
+                rcpsp_model, rng.permutation(rcpsp_model.n_jobs_non_dummy)
+            ),
+            modes_array=rng.integers(0, nb_modes, size=rcpsp_model.n_jobs),
+        )
+        for func_dict, func_arrays in [
+            (func_sgs, func_sgs_arrays),
+            (rcpsp_model.func_sgs_parallel, func_sgs_parallel_arrays),
+        ]:
+            schedule, unfeasible = func_dict(**kwargs)
+            starts = np.zeros(rcpsp_model.n_jobs, dtype=np.int64)
+            ends = np.zeros(rcpsp_model.n_jobs, dtype=np.int64)
+            order = np.zeros(rcpsp_model.n_jobs, dtype=np.int64)
+            nb_scheduled, unfeasible_arrays = func_arrays(
+                starts=starts, ends=ends, order=order, **kwargs
+            )
+            assert unfeasible_arrays == unfeasible
+            assert order[:nb_scheduled].tolist() == list(schedule)
+            assert {
+                i: (starts[i], ends[i]) for i in order[:nb_scheduled].tolist()
+            } == dict(schedule)
+            not_scheduled = np.ones(rcpsp_model.n_jobs, dtype=bool)
+            not_scheduled[order[:nb_scheduled]] = False
+            assert (starts[not_scheduled] == -1).all()
+            assert (ends[not_scheduled] == -1).all()
+
+
+@pytest.mark.parametrize(
+    "sgs", [ScheduleGenerationScheme.SERIAL_SGS, ScheduleGenerationScheme.PARALLEL_SGS]
+)
+def test_solution_array_schedule(sgs, create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_modes=2)
+    solution = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_permutation=list(range(rcpsp_model.n_jobs_non_dummy)),
+        rcpsp_modes=[1 + i % 2 for i in range(rcpsp_model.n_jobs_non_dummy)],
+        sgs=sgs,
+    )
+    schedule = solution.rcpsp_schedule
+    assert isinstance(schedule, ArraySchedule)
+    assert solution.rcpsp_schedule_feasible
+    assert rcpsp_model.satisfy(solution)
+    dict_schedule = {task: dict(schedule[task]) for task in schedule}
+    assert schedule == dict_schedule
+    assert list(schedule) == list(dict_schedule)
+    assert len(schedule) == rcpsp_model.n_jobs
+    for task in rcpsp_model.tasks_list:
+        assert solution.get_start_time(task) == dict_schedule[task]["start_time"]
+        assert solution.get_end_time(task) == dict_schedule[task]["end_time"]
+    assert solution.get_max_end_time() == max(
+        details["end_time"] for details in dict_schedule.values()
+    )
+    assert solution.get_start_time("unknown task") is None
+    # dictionary based solution built from the same schedule
+    solution_dict = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_schedule=dict_schedule,
+        rcpsp_modes=solution.rcpsp_modes,
+    )
+    assert solution_dict.rcpsp_schedule is dict_schedule
+    assert solution_dict.get_max_end_time() == solution.get_max_end_time()
+    assert (
+        solution_dict.generate_permutation_from_schedule()
+        == solution.generate_permutation_from_schedule()
+    )
+    assert rcpsp_model.evaluate(solution_dict) == rcpsp_model.evaluate(solution)
+
+
+def test_array_schedule_read_only_and_shared(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    solution = rcpsp_model.get_dummy_solution()
+    schedule = solution.rcpsp_schedule
+    with pytest.raises(TypeError):
+        schedule[rcpsp_model.sink_task] = {"start_time": 0, "end_time": 0}
+    with pytest.raises(ValueError):
+        schedule.starts[0] = 10
+    with pytest.raises(TypeError):
+        schedule[rcpsp_model.sink_task]["end_time"] = 0
+    assert copy(schedule).starts is schedule.starts
+    schedule_deepcopy = deepcopy(schedule)
+    assert schedule_deepcopy == schedule
+    assert schedule_deepcopy.starts is not schedule.starts
+    assert not schedule_deepcopy.starts.flags.writeable
+    solution_copy = solution.copy()
+    assert solution_copy.rcpsp_schedule == schedule
+    solution_copy.rcpsp_permutation = solution_copy.rcpsp_permutation[::-1]
+    rcpsp_model.evaluate(solution_copy)
+    assert solution.rcpsp_schedule is schedule
+    assert pickle.loads(pickle.dumps(schedule)) == schedule
+
+
+def test_array_schedule_unfeasible(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    rcpsp_model.horizon = 20
+    rcpsp_model.update_functions(["horizon"])
+    solution = rcpsp_model.get_dummy_solution()
+    assert not solution.rcpsp_schedule_feasible
+    schedule = solution.rcpsp_schedule
+    assert list(schedule)[-1] == rcpsp_model.sink_task
+    assert schedule[rcpsp_model.sink_task] == {
+        "start_time": UNFEASIBLE_MAKESPAN,
+        "end_time": UNFEASIBLE_MAKESPAN,
+    }
+    assert len(schedule) < rcpsp_model.n_jobs
+    not_scheduled = next(t for t in rcpsp_model.tasks_list if t not in schedule)
+    assert solution.get_start_time(not_scheduled) is None
+    with pytest.raises(KeyError):
+        schedule[not_scheduled]
+    assert solution.get_max_end_time() == UNFEASIBLE_MAKESPAN
+
+
+def test_dense_precedences_built_once(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    for key in ["predecessors", "successors"]:
+        assert (
+            rcpsp_model.func_sgs.keywords[key]
+            is rcpsp_model.func_sgs_arrays.keywords[key]
+        )
+
+
+@pytest.mark.parametrize(
+    "sgs", [ScheduleGenerationScheme.SERIAL_SGS, ScheduleGenerationScheme.PARALLEL_SGS]
+)
+def test_solution_mode_not_existing_for_task(sgs, create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_modes=2)
+    task = rcpsp_model.tasks_list_non_dummy[0]
+    del rcpsp_model.mode_details[task][2]
+    rcpsp_model.update_functions(modified_fields=["mode_details"])
+    # mode 2 exists for every task but the first one
+    rcpsp_modes = [2] * rcpsp_model.n_jobs_non_dummy
+    solution = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_permutation=list(range(rcpsp_model.n_jobs_non_dummy)),
+        rcpsp_modes=rcpsp_modes,
+        sgs=sgs,
+    )
+    assert not solution.rcpsp_schedule_feasible
+    assert solution.get_max_end_time() == UNFEASIBLE_MAKESPAN
+    assert solution.compute_mean_resource_reserve() == 0.0
+    solution.generate_schedule_from_permutation_serial_sgs_2()
+    assert not solution.rcpsp_schedule_feasible
+    solution.rcpsp_modes = [1] + rcpsp_modes[1:]
+    solution.generate_schedule_from_permutation()
+    assert solution.rcpsp_schedule_feasible
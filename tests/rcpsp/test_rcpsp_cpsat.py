@@ -0,0 +1,110 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import pytest
+
+from discrete_optimization.generic_rcpsp_tools.neighbor_tools_rcpsp import (
+    ConstraintHandlerCPSat,
+    NeighborRandom,
+)
+from discrete_optimization.generic_tools.cp_tools import ParametersCP, StatusSolver
+from discrete_optimization.generic_tools.lns_cp import LNS_CPlex
+from discrete_optimization.rcpsp.solver.cpsat_solver import CPSatRCPSPSolver
+from discrete_optimization.rcpsp.solver.rcpsp_lp_lns_solver import (
+    InitialMethodRCPSP,
+    InitialSolutionRCPSP,
+)
+
+
+@pytest.mark.parametrize(
+    "nb_modes, calendar, non_renewable", [(1, False, False), (3, True, True)]
+)
+def test_cpsat_solver(nb_modes, calendar, non_renewable, create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(
+        nb_tasks=15, nb_modes=nb_modes, calendar=calendar, non_renewable=non_renewable
+    )
+    solver = CPSatRCPSPSolver(rcpsp_model)
+    parameters_cp = ParametersCP.default()
+    parameters_cp.time_limit = 5
+    result_storage = solver.solve(parameters_cp=parameters_cp)
+    assert solver.get_status_solver() in {StatusSolver.OPTIMAL, StatusSolver.SATISFIED}
+    solution, fit = result_storage.get_best_solution_fit()
+    assert rcpsp_model.satisfy(solution)
+    assert -fit == rcpsp_model.evaluate(solution)["makespan"]
+
+
+def test_cpsat_domains(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=15, nb_modes=2)
+    solver = CPSatRCPSPSolver(rcpsp_model)
+    solver.init_model()
+    domains = [list(variable.domain) for variable in solver.model.Proto().variables]
+    task = rcpsp_model.tasks_list_non_dummy[0]
+    solver.set_start_bounds(task, lower=10, upper=10)
+    solver.fix_mode(task, 2)
+    solver.set_makespan_upper_bound(200)
+    parameters_cp = ParametersCP.default()
+    parameters_cp.time_limit = 5
+    solution, _ = solver.solve(parameters_cp=parameters_cp).get_best_solution_fit()
+    assert solution.get_start_time(task) == 10
+    assert solution.rcpsp_modes[0] == 2
+    solver.reset_domains()
+    assert [
+        list(variable.domain) for variable in solver.model.Proto().variables
+    ] == domains
+
+
+def test_cpsat_makespan_and_sink_bounds(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=15)
+    solver = CPSatRCPSPSolver(rcpsp_model)
+    solver.init_model()
+    parameters_cp = ParametersCP.default()
+    parameters_cp.time_limit = 5
+    solution, _ = solver.solve(parameters_cp=parameters_cp).get_best_solution_fit()
+    assert solver.get_status_solver() == StatusSolver.OPTIMAL
+    makespan = solution.get_end_time(rcpsp_model.sink_task)
+    # the bound on the sink start time does not discard the makespan bound
+    solver.set_makespan_upper_bound(makespan - 1)
+    solver.set_start_bounds(rcpsp_model.sink_task, lower=0, upper=rcpsp_model.horizon)
+    solver.solve(parameters_cp=parameters_cp)
+    assert solver.get_status_solver() == StatusSolver.UNSATISFIABLE
+    solver.reset_domains()
+    solver.set_start_bounds(rcpsp_model.sink_task, lower=makespan, upper=makespan)
+    solver.set_makespan_upper_bound(rcpsp_model.horizon)
+    solution, _ = solver.solve(parameters_cp=parameters_cp).get_best_solution_fit()
+    assert solution.get_end_time(rcpsp_model.sink_task) == makespan
+
+
+def test_cpsat_lns(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=30)
+    initial_solution_provider = InitialSolutionRCPSP(
+        problem=rcpsp_model, initial_method=InitialMethodRCPSP.DUMMY
+    )
+    (
+        initial_solution,
+        initial_fit,
+    ) = initial_solution_provider.get_starting_solution().get_best_solution_fit()
+    solver = CPSatRCPSPSolver(rcpsp_model)
+    solver.init_model()
+    model = solver.model
+    constraint_handler = ConstraintHandlerCPSat(
+        problem=rcpsp_model,
+        neighbor_builder=NeighborRandom(problem=rcpsp_model, fraction_subproblem=0.3),
+    )
+    lns_solver = LNS_CPlex(
+        problem=rcpsp_model,
+        cp_solver=solver,
+        initial_solution_provider=initial_solution_provider,
+        constraint_handler=constraint_handler,
+    )
+    parameters_cp = ParametersCP.default()
+    parameters_cp.time_limit = 1
+    result_storage = lns_solver.solve_lns(
+        parameters_cp=parameters_cp, nb_iteration_lns=5
+    )
+    # the model is not rebuilt between the iterations
+    assert solver.model is model
+    assert len(result_storage.list_solution_fits) > 1
+    solution, fit = result_storage.get_best_solution_fit()
+    assert rcpsp_model.satisfy(solution)
+    assert fit >= initial_fit
@@ -0,0 +1,37 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import networkx as nx
+
+from discrete_optimization.generic_rcpsp_tools.graph_tools_rcpsp import (
+    GraphRCPSP,
+    build_unrelated_task,
+)
+
+
+def test_graph_rcpsp(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=60)
+    graph = GraphRCPSP(problem=rcpsp_model)
+    graph_nx = graph.graph_nx
+    for task in rcpsp_model.tasks_list:
+        descendants = nx.descendants(graph_nx, task)
+        ancestors = nx.ancestors(graph_nx, task)
+        assert graph.get_descendants_activities(task) == descendants
+        assert graph.get_ancestors_activities(task) == ancestors
+        assert graph.descendants_map[task] == {
+            "succs": descendants,
+            "nb": len(descendants),
+        }
+        assert graph.ancestors_map[task]["succs"] == ancestors
+        assert graph.is_descendant(rcpsp_model.source_task, task) == (
+            task != rcpsp_model.source_task
+        )
+    reduction = graph.get_transitive_reduction()
+    assert set(reduction) == set(nx.transitive_reduction(graph_nx).edges())
+    unrelated, pairs = build_unrelated_task(graph)
+    for task in rcpsp_model.tasks_list:
+        assert unrelated[task] == set(rcpsp_model.tasks_list).difference(
+            nx.descendants(graph_nx, task), nx.ancestors(graph_nx, task), {task}
+        )
+    assert len(pairs) == sum(len(u) for u in unrelated.values()) // 2
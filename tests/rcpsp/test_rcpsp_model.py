@@ -171,3 +171,72 @@ def test_partial_sgs(rcpsp_model_file):
         assert ongoing[task].start == rcpsp_sol_copy.get_start_time(task)
         assert ongoing[task].end == rcpsp_sol_copy.get_end_time(task)
     rcpsp_sol_copy.rcpsp_schedule[rcpsp_model.sink_task]
+
+
+def create_small_rcpsp_model(calendar=False):
+    horizon = 20
+    resources = {"R1": 2, "N1": 5}
+    if calendar:
+        resources = {"R1": [2] * 5 + [1] * 5 + [2] * 10, "N1": [5] * horizon}
+    return RCPSPModel(
+        resources=resources,
+        non_renewable_resources=["N1"],
+        mode_details={
+            1: {1: {"duration": 0}},
+            2: {1: {"duration": 3, "R1": 1, "N1": 2}, 2: {"duration": 2, "R1": 2}},
+            3: {1: {"duration": 2, "R1": 1, "N1": 2}},
+            4: {1: {"duration": 4, "R1": 1, "N1": 1}},
+            5: {1: {"duration": 0}},
+        },
+        successors={1: [2, 3, 4], 2: [5], 3: [5], 4: [5], 5: []},
+        horizon=horizon,
+    )
+
+
+def build_schedule(starts, durations):
+    return {
+        t: {"start_time": starts[t], "end_time": starts[t] + durations[t]}
+        for t in starts
+    }
+
+
+@pytest.mark.parametrize(
+    "starts, modes, calendar, expected",
+    [
+        ({1: 0, 2: 0, 3: 0, 4: 3, 5: 7}, [1, 1, 1], False, True),
+        ({1: 0, 2: 0, 3: 0, 4: 0, 5: 7}, [1, 1, 1], False, False),  # R1 overload
+        ({1: 0, 2: 0, 3: 5, 4: 5, 5: 9}, [2, 1, 1], False, True),
+        ({1: 0, 2: 0, 3: 5, 4: 5, 5: 9}, [2, 1, 1], True, False),  # calendar drop
+        ({1: 0, 2: 0, 3: 0, 4: 3, 5: 6}, [1, 1, 1], False, False),  # precedence
+        ({1: 0, 2: 0, 3: 3, 4: 5, 5: 9}, [1, 1, 1], True, True),
+    ],
+)
+def test_satisfy(starts, modes, calendar, expected):
+    rcpsp_model = create_small_rcpsp_model(calendar=calendar)
+    durations = {
+        t: rcpsp_model.mode_details[t][mode]["duration"]
+        for t, mode in rcpsp_model.build_mode_dict(modes).items()
+    }
+    rcpsp_sol = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_permutation=[0, 1, 2],
+        rcpsp_modes=modes,
+        rcpsp_schedule=build_schedule(starts, durations),
+        rcpsp_schedule_feasible=True,
+    )
+    assert rcpsp_model.satisfy(rcpsp_sol) is expected
+
+
+def test_satisfy_non_renewable():
+    rcpsp_model = create_small_rcpsp_model()
+    rcpsp_model.resources["N1"] = 4
+    starts = {1: 0, 2: 0, 3: 3, 4: 5, 5: 9}
+    durations = {1: 0, 2: 3, 3: 2, 4: 4, 5: 0}
+    rcpsp_sol = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_permutation=[0, 1, 2],
+        rcpsp_modes=[1, 1, 1],
+        rcpsp_schedule=build_schedule(starts, durations),
+        rcpsp_schedule_feasible=True,
+    )
+    assert not rcpsp_model.satisfy(rcpsp_sol)
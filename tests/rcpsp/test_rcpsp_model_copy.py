@@ -0,0 +1,130 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import numpy as np
+import pytest
+
+from discrete_optimization.rcpsp.rcpsp_model import (
+    MethodBaseRobustification,
+    MethodRobustification,
+    MultiModeRCPSPModel,
+    RCPSPModel,
+    RCPSPSolution,
+    UncertainRCPSPModel,
+    create_np_data,
+    create_poisson_laws_duration,
+)
+from discrete_optimization.rcpsp.rcpsp_model_preemptive import RCPSPModelPreemptive
+
+
+def get_makespan(rcpsp_model: RCPSPModel, permutation, modes) -> int:
+    solution = RCPSPSolution(
+        problem=rcpsp_model, rcpsp_permutation=permutation, rcpsp_modes=modes
+    )
+    return rcpsp_model.evaluate(solution)["makespan"]
+
+
+@pytest.mark.parametrize("calendar", [False, True])
+def test_copy_shares_compiled_data(calendar, create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(calendar=calendar)
+    graph = rcpsp_model.graph
+    rcpsp_model_copy = rcpsp_model.copy()
+    assert type(rcpsp_model_copy) is type(rcpsp_model)
+    assert rcpsp_model_copy.np_data is rcpsp_model.np_data
+    assert rcpsp_model_copy.func_sgs is rcpsp_model.func_sgs
+    assert rcpsp_model_copy.graph is graph
+    assert rcpsp_model_copy.mode_details == rcpsp_model.mode_details
+    assert rcpsp_model_copy.mode_details is not rcpsp_model.mode_details
+    assert rcpsp_model_copy.successors == rcpsp_model.successors
+    assert rcpsp_model_copy.successors is not rcpsp_model.successors
+
+
+def test_update_modified_fields(create_random_rcpsp_model):
+    random_model = create_random_rcpsp_model(nb_modes=2)
+    rcpsp_model = MultiModeRCPSPModel(
+        resources=random_model.resources,
+        non_renewable_resources=random_model.non_renewable_resources,
+        mode_details=random_model.mode_details,
+        successors=random_model.successors,
+        horizon=random_model.horizon,
+    )
+    rcpsp_model.set_fixed_modes([1] * rcpsp_model.n_jobs_non_dummy)
+    permutation = list(range(rcpsp_model.n_jobs_non_dummy))
+    modes = rcpsp_model.fixed_modes
+    makespan = get_makespan(rcpsp_model, permutation, modes)
+
+    rcpsp_model_copy = rcpsp_model.copy()
+    assert rcpsp_model_copy.fixed_modes == rcpsp_model.fixed_modes
+    for task in rcpsp_model_copy.tasks_list_non_dummy:
+        rcpsp_model_copy.mode_details[task][1]["duration"] += 5
+    rcpsp_model_copy.update_functions(modified_fields=["mode_details"])
+    # only the arrays depending on the mode details are rebuilt
+    for key, array in rcpsp_model_copy.np_data.items():
+        if key in {"consumption_array", "duration_array", "nb_modes_array"}:
+            assert array is not rcpsp_model.np_data[key]
+        else:
+            assert array is rcpsp_model.np_data[key]
+    for key, array in create_np_data(rcpsp_model_copy).items():
+        assert np.array_equal(array, rcpsp_model_copy.np_data[key])
+    assert get_makespan(rcpsp_model_copy, permutation, modes) > makespan
+    # the original problem is unchanged
+    assert get_makespan(rcpsp_model, permutation, modes) == makespan
+
+    with pytest.raises(ValueError):
+        rcpsp_model_copy.update_functions(modified_fields=["tasks_list"])
+
+
+def test_uncertain_model_uses_modified_durations(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    uncertain_model = UncertainRCPSPModel(
+        base_rcpsp_model=rcpsp_model,
+        poisson_laws=create_poisson_laws_duration(rcpsp_model),
+    )
+    worst_model = uncertain_model.create_rcpsp_model(
+        MethodRobustification(
+            method_base=MethodBaseRobustification.WORST_CASE, percentile=0
+        )
+    )
+    assert np.array_equal(
+        worst_model.np_data["duration_array"],
+        create_np_data(worst_model)["duration_array"],
+    )
+    assert (
+        worst_model.np_data["duration_array"].sum()
+        > rcpsp_model.np_data["duration_array"].sum()
+    )
+
+
+def test_preemptive_copy_update_functions(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    preemptive_model = RCPSPModelPreemptive(
+        resources=rcpsp_model.resources,
+        non_renewable_resources=rcpsp_model.non_renewable_resources,
+        mode_details=rcpsp_model.mode_details,
+        successors=rcpsp_model.successors,
+        horizon=rcpsp_model.horizon,
+    )
+    preemptive_model_copy = preemptive_model.copy()
+    assert preemptive_model_copy.func_sgs is preemptive_model.func_sgs
+    for task in preemptive_model_copy.tasks_list_non_dummy:
+        preemptive_model_copy.mode_details[task][1]["duration"] += 5
+    preemptive_model_copy.update_functions()
+    assert preemptive_model_copy.func_sgs is not preemptive_model.func_sgs
+    makespan = preemptive_model.get_dummy_solution().get_max_end_time()
+    assert preemptive_model_copy.get_dummy_solution().get_max_end_time() > makespan
+
+
+def test_preemptive_copy_keeps_class(create_random_rcpsp_model):
+    class PreemptiveModel(RCPSPModelPreemptive):
+        pass
+
+    rcpsp_model = create_random_rcpsp_model()
+    preemptive_model = PreemptiveModel(
+        resources=rcpsp_model.resources,
+        non_renewable_resources=rcpsp_model.non_renewable_resources,
+        mode_details=rcpsp_model.mode_details,
+        successors=rcpsp_model.successors,
+        horizon=rcpsp_model.horizon,
+    )
+    assert type(preemptive_model.copy()) is PreemptiveModel
@@ -0,0 +1,134 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.rcpsp.rcpsp_model import (
+    RCPSPModelCalendar,
+    RCPSPSolution,
+    SingleModeRCPSPModel,
+)
+from discrete_optimization.rcpsp.rcpsp_npz import load_rcpsp_model, save_rcpsp_model
+from discrete_optimization.rcpsp.rcpsp_parser import parse_psplib
+
+psplib_instance = """************************************************************************
+file with basedata            : test.bas
+initial value random generator: 0
+************************************************************************
+projects                      :  1
+jobs (incl. supersource/sink ):  5
+horizon                       :  20
+RESOURCES
+  - renewable                 :  1   R
+  - nonrenewable              :  1   N
+  - doubly constrained        :  0   D
+************************************************************************
+PROJECT INFORMATION:
+pronr.  #jobs rel.date duedate tardcost  MPM-Time
+    1      3      0       10        0       10
+************************************************************************
+PRECEDENCE RELATIONS:
+jobnr.    #modes  #successors   successors
+   1        1          2           2   3
+   2        1          1           4
+   3        1          1           5
+   4        1          1           5
+   5        1          0
+************************************************************************
+REQUESTS/DURATIONS:
+jobnr. mode duration  R 1  N 1
+------------------------------------------------------------------------
+  1      1     0       0    0
+  2      1     3       2    1
+  3      1     2       2    2
+  4      1     4       1    0
+  5      1     0       0    0
+************************************************************************
+RESOURCEAVAILABILITIES:
+  R 1  N 1
+    3   10
+************************************************************************
+"""
+
+
+def check_same_model(model, loaded_model):
+    assert type(loaded_model) is type(model)
+    assert loaded_model.tasks_list == model.tasks_list
+    assert loaded_model.mode_details == model.mode_details
+    assert loaded_model.successors == model.successors
+    assert loaded_model.resources == model.resources
+    assert loaded_model.non_renewable_resources == model.non_renewable_resources
+    assert loaded_model.name_task == model.name_task
+    rng = random.Random(0)
+    for _ in range(10):
+        permutation = rng.sample(range(model.n_jobs_non_dummy), model.n_jobs_non_dummy)
+        modes = [
+            rng.randint(1, len(model.mode_details[task]))
+            for task in model.tasks_list_non_dummy
+        ]
+        solutions = [
+            RCPSPSolution(problem=m, rcpsp_permutation=permutation, rcpsp_modes=modes)
+            for m in [model, loaded_model]
+        ]
+        assert model.evaluate(solutions[0]) == loaded_model.evaluate(solutions[1])
+        assert solutions[0].rcpsp_schedule == solutions[1].rcpsp_schedule
+
+
+def test_parsed_model(tmp_path):
+    model = parse_psplib(psplib_instance)
+    assert isinstance(model, SingleModeRCPSPModel)
+    assert model.mode_details[2][1] == {"duration": 3, "R1": 2, "N1": 1}
+    assert model.non_renewable_resources == ["N1"]
+    save_rcpsp_model(model, tmp_path / "model.npz")
+    check_same_model(model, load_rcpsp_model(tmp_path / "model.npz"))
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r", "c"])
+@pytest.mark.parametrize("calendar", [False, True])
+def test_save_load(tmp_path, mmap_mode, calendar, create_random_rcpsp_model):
+    model = create_random_rcpsp_model(nb_modes=3, calendar=calendar, non_renewable=True)
+    # tasks without resource usage
+    model.mode_details[model.source_task][1]["R1"] = 0
+    save_rcpsp_model(model, tmp_path / "model.npz")
+    loaded_model = load_rcpsp_model(tmp_path / "model.npz", mmap_mode=mmap_mode)
+    if mmap_mode is not None:
+        assert isinstance(loaded_model.np_data["duration_array"], np.memmap)
+    check_same_model(model, loaded_model)
+
+
+def test_save_load_calendar_model(tmp_path, create_random_rcpsp_model):
+    random_model = create_random_rcpsp_model(calendar=True)
+    model = RCPSPModelCalendar(
+        resources=random_model.resources,
+        non_renewable_resources=random_model.non_renewable_resources,
+        mode_details={
+            f"task_{task}": details
+            for task, details in random_model.mode_details.items()
+        },
+        successors={
+            f"task_{task}": [f"task_{succ}" for succ in successors]
+            for task, successors in random_model.successors.items()
+        },
+        horizon=random_model.horizon,
+        tasks_list=[f"task_{task}" for task in random_model.tasks_list],
+        source_task=f"task_{random_model.source_task}",
+        sink_task=f"task_{random_model.sink_task}",
+        calendar_details={"R1": [[1] * 10, [0] * 10]},
+        name_ressource_to_index={"R1": 0, "R2": 1},
+    )
+    save_rcpsp_model(model, tmp_path / "model.npz")
+    loaded_model = load_rcpsp_model(tmp_path / "model.npz")
+    check_same_model(model, loaded_model)
+    assert loaded_model.calendar_details == model.calendar_details
+    assert loaded_model.name_ressource_to_index == model.name_ressource_to_index
+
+
+def test_save_not_supported_model(tmp_path, create_random_rcpsp_model):
+    model = create_random_rcpsp_model()
+    model.mode_details[model.source_task][1]["skill"] = 1
+    with pytest.raises(ValueError):
+        save_rcpsp_model(model, tmp_path / "model.npz")
@@ -0,0 +1,182 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.generic_tools.do_problem import (
+    BaseMethodAggregating,
+    MethodAggregating,
+)
+from discrete_optimization.rcpsp.rcpsp_model import (
+    Aggreg_RCPSPModel,
+    MethodBaseRobustification,
+    MethodRobustification,
+    RCPSPSolution,
+    UncertainRCPSPModel,
+    create_poisson_laws,
+)
+from discrete_optimization.rcpsp.specialized_rcpsp.rcpsp_specialized_constraints import (
+    RCPSPModelSpecialConstraints,
+    RCPSPSolutionSpecial,
+    SpecialConstraintsDescription,
+)
+
+
+def create_scenarios(
+    create_random_rcpsp_model, nb_scenarios, do_uncertain_resource=True, **kwargs
+):
+    rcpsp_model = create_random_rcpsp_model(**kwargs)
+    uncertain_model = UncertainRCPSPModel(
+        base_rcpsp_model=rcpsp_model,
+        poisson_laws=create_poisson_laws(
+            rcpsp_model,
+            range_around_mean_resource=1,
+            range_around_mean_duration=3,
+            do_uncertain_resource=do_uncertain_resource,
+        ),
+    )
+    return [
+        uncertain_model.create_rcpsp_model(
+            MethodRobustification(method_base=MethodBaseRobustification.SAMPLE)
+        )
+        for _ in range(nb_scenarios)
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(calendar=True, do_uncertain_resource=False),
+        dict(non_renewable=True, nb_modes=2),
+    ],
+)
+def test_evaluate_scenarios(kwargs, create_random_rcpsp_model):
+    random.seed(0)
+    np.random.seed(0)
+    scenarios = create_scenarios(create_random_rcpsp_model, 30, **kwargs)
+    aggreg_model = Aggreg_RCPSPModel(
+        list_problem=scenarios,
+        method_aggregating=MethodAggregating(BaseMethodAggregating.MAX),
+    )
+    assert aggreg_model.np_data_scenarios is not None
+    rng = random.Random(0)
+    for _ in range(5):
+        solution = RCPSPSolution(
+            problem=scenarios[0],
+            rcpsp_permutation=rng.sample(
+                range(scenarios[0].n_jobs_non_dummy), scenarios[0].n_jobs_non_dummy
+            ),
+            rcpsp_modes=[
+                rng.randint(1, scenarios[0].max_number_of_mode)
+                for _ in range(scenarios[0].n_jobs_non_dummy)
+            ],
+        )
+        fits = aggreg_model.evaluate_scenarios(solution)
+        for i, scenario in enumerate(scenarios):
+            scenario_solution = RCPSPSolution(
+                problem=scenario,
+                rcpsp_permutation=solution.rcpsp_permutation,
+                rcpsp_modes=solution.rcpsp_modes,
+            )
+            fit = scenario.evaluate(scenario_solution)
+            assert fits["makespan"][i] == fit["makespan"]
+            assert fits["mean_resource_reserve"][i] == fit["mean_resource_reserve"]
+            assert fits["feasible"][i] == scenario_solution.rcpsp_schedule_feasible
+        assert aggreg_model.evaluate(solution) == {
+            "makespan": np.max(fits["makespan"]),
+            "mean_resource_reserve": 0,
+        }
+
+
+def test_evaluate_scenarios_mean_resource_reserve(create_random_rcpsp_model):
+    random.seed(0)
+    np.random.seed(0)
+    scenarios = create_scenarios(create_random_rcpsp_model, 5)
+    for scenario in scenarios:
+        scenario.costs["mean_resource_reserve"] = True
+    aggreg_model = Aggreg_RCPSPModel(
+        list_problem=scenarios,
+        method_aggregating=MethodAggregating(BaseMethodAggregating.MEAN),
+    )
+    # not supported by the scenarios kernel, evaluated scenario by scenario
+    assert aggreg_model.np_data_scenarios is None
+    solution = scenarios[0].get_dummy_solution()
+    fits = aggreg_model.evaluate_scenarios(solution)
+    assert fits["feasible"].all()
+    assert np.all(fits["mean_resource_reserve"] > 0)
+
+
+def test_evaluate_scenarios_mode_not_existing_for_task(create_random_rcpsp_model):
+    random.seed(0)
+    np.random.seed(0)
+    scenarios = create_scenarios(create_random_rcpsp_model, 5, nb_modes=2)
+    task = scenarios[0].tasks_list_non_dummy[0]
+    for scenario in scenarios:
+        scenario.mode_details[task] = {1: scenario.mode_details[task][1]}
+        scenario.update_functions(modified_fields=["mode_details"])
+    aggreg_model = Aggreg_RCPSPModel(
+        list_problem=scenarios,
+        method_aggregating=MethodAggregating(BaseMethodAggregating.MAX),
+    )
+    assert aggreg_model.np_data_scenarios is not None
+    solution = RCPSPSolution(
+        problem=scenarios[0],
+        rcpsp_permutation=list(range(scenarios[0].n_jobs_non_dummy)),
+        rcpsp_modes=[2] * scenarios[0].n_jobs_non_dummy,
+    )
+    # mode 2 exists for other tasks, but not for the first one
+    fits = aggreg_model.evaluate_scenarios(solution)
+    assert not fits["feasible"].any()
+    solution.rcpsp_modes[0] = 1
+    fits = aggreg_model.evaluate_scenarios(solution)
+    assert fits["feasible"].all()
+
+
+def test_evaluate_scenarios_special_constraints(create_random_rcpsp_model):
+    random.seed(0)
+    np.random.seed(0)
+    scenarios = create_scenarios(
+        create_random_rcpsp_model, 5, do_uncertain_resource=False, nb_tasks=20
+    )
+    # deadline too short, penalized in every scenario
+    task = scenarios[0].tasks_list_non_dummy[-1]
+    special_scenarios = [
+        RCPSPModelSpecialConstraints(
+            resources=scenario.resources,
+            non_renewable_resources=scenario.non_renewable_resources,
+            mode_details=scenario.mode_details,
+            successors=scenario.successors,
+            horizon=scenario.horizon,
+            special_constraints=SpecialConstraintsDescription(
+                end_times_window={task: (None, 1)}
+            ),
+        )
+        for scenario in scenarios
+    ]
+    aggreg_model = Aggreg_RCPSPModel(
+        list_problem=special_scenarios,
+        method_aggregating=MethodAggregating(BaseMethodAggregating.MAX),
+    )
+    # not supported by the scenarios kernel, evaluated scenario by scenario
+    assert aggreg_model.np_data_scenarios is None
+    solution = RCPSPSolutionSpecial(
+        problem=special_scenarios[0],
+        rcpsp_permutation=list(range(special_scenarios[0].n_jobs_non_dummy)),
+    )
+    fits = [
+        scenario.evaluate(
+            RCPSPSolutionSpecial(
+                problem=scenario, rcpsp_permutation=solution.rcpsp_permutation
+            )
+        )
+        for scenario in special_scenarios
+    ]
+    assert all(fit["constraint_penalty"] > 0 for fit in fits)
+    assert aggreg_model.evaluate(solution) == {
+        key: max(fit[key] for fit in fits) for key in fits[0]
+    }
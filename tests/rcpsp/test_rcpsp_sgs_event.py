@@ -0,0 +1,202 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import numpy as np
+import pytest
+
+from discrete_optimization.generic_tools.do_problem import ObjectiveHandling
+from discrete_optimization.generic_tools.ea.ga import Ga
+from discrete_optimization.rcpsp.rcpsp_model import (
+    RCPSPSolution,
+    create_np_data,
+    create_np_data_and_jit_functions,
+    create_sgs_arrays_functions,
+    permutation_do_to_permutation_sgs_fast,
+)
+
+
+@pytest.mark.parametrize("nb_modes", [1, 3])
+@pytest.mark.parametrize("calendar", [False, True])
+@pytest.mark.parametrize("non_renewable", [False, True])
+def test_sgs_event_same_as_sgs_fast(
+    nb_modes, calendar, non_renewable, create_random_rcpsp_model
+):
+    rcpsp_model = create_random_rcpsp_model(
+        nb_modes=nb_modes, calendar=calendar, non_renewable=non_renewable
+    )
+    func_sgs, _, _, _ = create_np_data_and_jit_functions(
+        rcpsp_model, use_event_sgs=False
+    )
+    func_sgs_event, _, _, _ = create_np_data_and_jit_functions(
+        rcpsp_model, use_event_sgs=True
+    )
+    rng = random.Random(1)
+    for _ in range(20):
+        permutation = list(range(rcpsp_model.n_jobs_non_dummy))
+        rng.shuffle(permutation)
+        modes = [rng.randint(1, nb_modes) for _ in permutation]
+        kwargs = dict(
+            permutation_task=permutation_do_to_permutation_sgs_fast(
+                rcpsp_model, permutation
+            ),
+            modes_array=np.array(rcpsp_model.build_mode_array(modes)) - 1,
+        )
+        schedule, unfeasible = func_sgs(**kwargs)
+        schedule_event, unfeasible_event = func_sgs_event(**kwargs)
+        assert unfeasible == unfeasible_event
+        assert dict(schedule) == dict(schedule_event)
+
+
+@pytest.mark.parametrize("calendar", [False, True])
+@pytest.mark.parametrize("non_renewable", [False, True])
+def test_partial_sgs_csr_same_as_dense(
+    calendar, non_renewable, create_random_rcpsp_model
+):
+    rcpsp_model = create_random_rcpsp_model(
+        nb_modes=2, calendar=calendar, non_renewable=non_renewable
+    )
+    _, func_sgs_2, _, _ = create_np_data_and_jit_functions(
+        rcpsp_model, use_event_sgs=False
+    )
+    _, func_sgs_2_csr, _, _ = create_np_data_and_jit_functions(
+        rcpsp_model, use_event_sgs=True
+    )
+    assert (
+        func_sgs_2_csr.func.__name__
+        == "sgs_fast_partial_schedule_incomplete_permutation_tasks_csr"
+    )
+    rng = random.Random(1)
+    for _ in range(20):
+        permutation = list(range(rcpsp_model.n_jobs_non_dummy))
+        rng.shuffle(permutation)
+        modes = [rng.randint(1, 2) for _ in permutation]
+        solution = RCPSPSolution(
+            problem=rcpsp_model, rcpsp_permutation=permutation, rcpsp_modes=modes
+        )
+        # tasks ending before current_time are completed, tasks running at that time are scheduled
+        current_time = solution.get_max_end_time() // 2
+        completed_task_indicator = np.zeros(rcpsp_model.n_jobs, dtype=int)
+        completed_task_times = np.zeros(rcpsp_model.n_jobs, dtype=int)
+        scheduled_task = -np.ones(rcpsp_model.n_jobs, dtype=int)
+        for i, task in enumerate(rcpsp_model.tasks_list):
+            if solution.get_end_time(task) <= current_time:
+                completed_task_indicator[i] = 1
+                completed_task_times[i] = solution.get_end_time(task)
+            elif solution.get_start_time(task) <= current_time:
+                scheduled_task[i] = solution.get_start_time(task)
+        rng.shuffle(permutation)
+        kwargs = dict(
+            current_time=current_time,
+            completed_task_indicator=completed_task_indicator,
+            completed_task_times=completed_task_times,
+            scheduled_task=scheduled_task,
+            permutation_task=permutation_do_to_permutation_sgs_fast(
+                rcpsp_model, permutation
+            ),
+            modes_array=np.array(rcpsp_model.build_mode_array(modes)) - 1,
+        )
+        schedule, unfeasible = func_sgs_2(**kwargs)
+        schedule_csr, unfeasible_csr = func_sgs_2_csr(**kwargs)
+        assert unfeasible == unfeasible_csr
+        assert dict(schedule) == dict(schedule_csr)
+
+
+def test_sgs_event_short_horizon(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    rcpsp_model.horizon = 20
+    rcpsp_model.func_sgs_arrays, _ = create_sgs_arrays_functions(
+        rcpsp_model, np_data=create_np_data(rcpsp_model), use_event_sgs=True
+    )
+    solution = rcpsp_model.get_dummy_solution()
+    assert not solution.rcpsp_schedule_feasible
+    assert solution.get_end_time(rcpsp_model.sink_task) == 99999999
+
+
+def test_sgs_event_large_instance_selected(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=1100, seed=3)
+    assert rcpsp_model.func_sgs.func.__name__ == "sgs_fast_event"
+    solution = RCPSPSolution(
+        problem=rcpsp_model,
+        rcpsp_permutation=list(range(rcpsp_model.n_jobs_non_dummy)),
+    )
+    assert solution.rcpsp_schedule_feasible
+    assert rcpsp_model.satisfy(solution)
+
+
+@pytest.mark.parametrize("nb_modes", [1, 3])
+@pytest.mark.parametrize("calendar", [False, True])
+@pytest.mark.parametrize("non_renewable", [False, True])
+def test_evaluate_batch_same_as_evaluate(
+    nb_modes, calendar, non_renewable, create_random_rcpsp_model
+):
+    rcpsp_model = create_random_rcpsp_model(
+        nb_modes=nb_modes, calendar=calendar, non_renewable=non_renewable
+    )
+    rng = np.random.default_rng(1)
+    permutations = np.array(
+        [rng.permutation(rcpsp_model.n_jobs_non_dummy) for _ in range(20)]
+    )
+    modes = rng.integers(1, nb_modes + 1, size=permutations.shape)
+    makespans, feasible = rcpsp_model.evaluate_batch(permutations, modes)
+    for permutation, mode, makespan, feasible_i in zip(
+        permutations, modes, makespans, feasible
+    ):
+        solution = RCPSPSolution(
+            problem=rcpsp_model,
+            rcpsp_permutation=list(permutation),
+            rcpsp_modes=list(mode),
+        )
+        assert rcpsp_model.evaluate(solution)["makespan"] == makespan
+        assert solution.rcpsp_schedule_feasible == feasible_i
+
+
+def test_evaluate_batch_non_existing_mode(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_modes=2)
+    permutations = np.tile(np.arange(rcpsp_model.n_jobs_non_dummy), (2, 1))
+    modes = np.ones(permutations.shape, dtype=int)
+    modes[1, 0] = 3
+    makespans, feasible = rcpsp_model.evaluate_batch(permutations, modes)
+    assert list(feasible) == [True, False]
+    assert makespans[1] == 99999999
+
+
+def test_evaluate_batch_mode_not_existing_for_task(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_modes=2)
+    task = rcpsp_model.tasks_list_non_dummy[0]
+    del rcpsp_model.mode_details[task][2]
+    rcpsp_model.update_functions(modified_fields=["mode_details"])
+    assert rcpsp_model.max_number_of_mode == 2
+    permutations = np.tile(np.arange(rcpsp_model.n_jobs_non_dummy), (3, 1))
+    modes = np.ones(permutations.shape, dtype=int)
+    # mode 2 exists for every task but the first one
+    modes[1, 1] = 2
+    modes[2, 0] = 2
+    makespans, feasible = rcpsp_model.evaluate_batch(permutations, modes)
+    assert list(feasible) == [True, True, False]
+    assert makespans[2] == 99999999
+
+
+def test_ga_batch_evaluation(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model()
+    individuals = [
+        random.Random(i).sample(
+            range(rcpsp_model.n_jobs_non_dummy), rcpsp_model.n_jobs_non_dummy
+        )
+        for i in range(10)
+    ]
+    ga_solver = Ga(
+        rcpsp_model,
+        encoding="rcpsp_permutation",
+        objective_handling=ObjectiveHandling.AGGREGATE,
+        objectives=["makespan"],
+        objective_weights=[-1],
+        max_evals=200,
+    )
+    assert ga_solver.evaluate_population(individuals) == [
+        ga_solver.evaluate_problem(ind) for ind in individuals
+    ]
+    solution = ga_solver.solve().get_best_solution()
+    assert rcpsp_model.satisfy(solution)
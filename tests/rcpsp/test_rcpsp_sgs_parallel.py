@@ -0,0 +1,222 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import numpy as np
+import pytest
+
+from discrete_optimization.rcpsp.rcpsp_model import (
+    RCPSPModel,
+    RCPSPSolution,
+    ScheduleGenerationScheme,
+    create_sgs_arrays_functions,
+    permutation_do_to_permutation_sgs_fast,
+)
+from discrete_optimization.rcpsp.specialized_rcpsp.rcpsp_specialized_constraints import (
+    RCPSPModelSpecialConstraints,
+    RCPSPSolutionSpecial,
+    SpecialConstraintsDescription,
+)
+
+
+def naive_parallel_sgs(rcpsp_model: RCPSPModel, permutation_task, modes_array):
+    """Time step by time step parallel sgs."""
+    np_data = rcpsp_model.np_data
+    available = np_data["ressource_available"].astype(np.int64)
+    renewable = np_data["ressource_renewable"]
+    horizon = rcpsp_model.horizon
+    predecessors = {
+        i: [
+            j
+            for j in range(rcpsp_model.n_jobs)
+            if i
+            in np_data["successors_index"][
+                np_data["successors_ptr"][j] : np_data["successors_ptr"][j + 1]
+            ]
+        ]
+        for i in range(rcpsp_model.n_jobs)
+    }
+    position = {task: i for i, task in enumerate(permutation_task)}
+    schedule = {}
+    for time in range(horizon + 1):
+        tried = set()
+        while True:
+            candidates = [
+                task
+                for task in permutation_task
+                if task not in schedule
+                and task not in tried
+                and all(
+                    p in schedule and schedule[p][1] <= time for p in predecessors[task]
+                )
+            ]
+            if len(candidates) == 0:
+                break
+            task = min(candidates, key=lambda x: position[x])
+            mode = modes_array[task]
+            consumption = np_data["consumption_array"][task, mode]
+            end = time + np_data["duration_array"][task, mode]
+            if end > horizon:
+                return schedule, True
+            if np.any(available[:, time:end] < consumption[:, np.newaxis]):
+                tried.add(task)
+                continue
+            for res in range(available.shape[0]):
+                if renewable[res]:
+                    available[res, time:end] -= consumption[res]
+                else:
+                    available[res, time:] -= consumption[res]
+                    if available[res, -1] < 0:
+                        return schedule, True
+            schedule[task] = (time, end)
+        if len(schedule) == rcpsp_model.n_jobs:
+            break
+    return schedule, len(schedule) < rcpsp_model.n_jobs
+
+
+@pytest.mark.parametrize("nb_modes", [1, 3])
+@pytest.mark.parametrize("calendar", [False, True])
+@pytest.mark.parametrize("non_renewable", [False, True])
+def test_sgs_parallel_same_as_naive(
+    nb_modes, calendar, non_renewable, create_random_rcpsp_model
+):
+    rcpsp_model = create_random_rcpsp_model(
+        nb_modes=nb_modes, calendar=calendar, non_renewable=non_renewable
+    )
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        permutation = rng.permutation(rcpsp_model.n_jobs_non_dummy)
+        modes = rng.integers(1, nb_modes + 1, size=rcpsp_model.n_jobs_non_dummy)
+        permutation_task = permutation_do_to_permutation_sgs_fast(
+            rcpsp_model, permutation
+        )
+        modes_array = np.array(rcpsp_model.build_mode_array(list(modes))) - 1
+        schedule, unfeasible = rcpsp_model.func_sgs_parallel(
+            permutation_task=permutation_task, modes_array=modes_array
+        )
+        expected_schedule, expected_unfeasible = naive_parallel_sgs(
+            rcpsp_model, permutation_task.tolist(), modes_array
+        )
+        assert unfeasible == expected_unfeasible
+        if not unfeasible:
+            assert {k: tuple(v) for k, v in schedule.items()} == expected_schedule
+
+
+def test_solution_parallel_sgs(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_modes=2, calendar=True)
+    rng = np.random.default_rng(1)
+    permutations = np.array(
+        [rng.permutation(rcpsp_model.n_jobs_non_dummy) for _ in range(8)]
+    )
+    modes = [2] * rcpsp_model.n_jobs_non_dummy
+    for permutation in permutations:
+        solution = RCPSPSolution(
+            problem=rcpsp_model,
+            rcpsp_permutation=list(permutation),
+            rcpsp_modes=modes,
+            sgs=ScheduleGenerationScheme.PARALLEL_SGS,
+        )
+        schedule, _ = rcpsp_model.func_sgs_parallel(
+            permutation_task=permutation_do_to_permutation_sgs_fast(
+                rcpsp_model, permutation
+            ),
+            modes_array=np.array(rcpsp_model.build_mode_array(modes)) - 1,
+        )
+        assert solution.get_max_end_time() == max(e for s, e in schedule.values())
+        assert rcpsp_model.satisfy(solution)
+        assert solution.copy().sgs == ScheduleGenerationScheme.PARALLEL_SGS
+        solution.rcpsp_permutation = list(permutation[::-1])
+        reversed_solution = RCPSPSolution(
+            problem=rcpsp_model,
+            rcpsp_permutation=list(permutation[::-1]),
+            rcpsp_modes=modes,
+            sgs=ScheduleGenerationScheme.PARALLEL_SGS,
+        )
+        assert (
+            rcpsp_model.evaluate(solution)["makespan"]
+            == reversed_solution.get_max_end_time()
+        )
+
+
+def test_problem_parallel_sgs(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=60)
+    assert rcpsp_model.get_dummy_solution().sgs == ScheduleGenerationScheme.SERIAL_SGS
+    rng = np.random.default_rng(2)
+    permutations = np.array(
+        [rng.permutation(rcpsp_model.n_jobs_non_dummy) for _ in range(8)]
+    )
+    serial_makespans, _ = rcpsp_model.evaluate_batch(permutations)
+    rcpsp_model.sgs = ScheduleGenerationScheme.PARALLEL_SGS
+    makespans, feasible = rcpsp_model.evaluate_batch(permutations)
+    assert np.all(feasible)
+    for permutation, makespan in zip(permutations, makespans):
+        solution = RCPSPSolution(
+            problem=rcpsp_model, rcpsp_permutation=list(permutation)
+        )
+        assert solution.sgs == ScheduleGenerationScheme.PARALLEL_SGS
+        assert rcpsp_model.evaluate(solution)["makespan"] == makespan
+    assert not np.array_equal(makespans, serial_makespans)
+
+
+def test_parallel_sgs_special_constraints(create_random_rcpsp_model):
+    rcpsp_model = create_random_rcpsp_model(nb_tasks=10)
+    task_1, task_2 = rcpsp_model.tasks_list_non_dummy[:2]
+    special_model = RCPSPModelSpecialConstraints(
+        resources=rcpsp_model.resources,
+        non_renewable_resources=rcpsp_model.non_renewable_resources,
+        mode_details=rcpsp_model.mode_details,
+        successors=rcpsp_model.successors,
+        horizon=rcpsp_model.horizon,
+        special_constraints=SpecialConstraintsDescription(
+            start_together=[(task_1, task_2)]
+        ),
+    )
+    special_model.sgs = ScheduleGenerationScheme.PARALLEL_SGS
+    # the parallel kernel would ignore the special constraints
+    permutation = list(range(special_model.n_jobs_non_dummy))
+    with pytest.raises(NotImplementedError):
+        RCPSPSolutionSpecial(problem=special_model, rcpsp_permutation=permutation)
+    with pytest.raises(NotImplementedError):
+        special_model.evaluate_batch(np.array([permutation]))
+    special_model.sgs = ScheduleGenerationScheme.SERIAL_SGS
+    solution = RCPSPSolutionSpecial(
+        problem=special_model, rcpsp_permutation=permutation
+    )
+    assert solution.rcpsp_schedule_feasible
+
+
+def test_parallel_sgs_null_duration_task_with_consumption():
+    rcpsp_model = RCPSPModel(
+        resources={"R1": 2},
+        non_renewable_resources=[],
+        mode_details={
+            1: {1: {"duration": 0}},
+            2: {1: {"duration": 10, "R1": 2}},
+            3: {1: {"duration": 0, "R1": 1}},
+            4: {1: {"duration": 0}},
+        },
+        successors={1: [2, 3], 2: [4], 3: [4], 4: []},
+        horizon=20,
+    )
+    # release date of the null duration task in the middle of the execution of task 2
+    np_data = dict(rcpsp_model.np_data)
+    np_data["minimum_starting_time_array"] = np.array([0, 0, 3, 0])
+    func_sgs_arrays, func_sgs_parallel_arrays = create_sgs_arrays_functions(
+        rcpsp_model, np_data=np_data, use_event_sgs=True
+    )
+    schedules = []
+    for func in [func_sgs_arrays, func_sgs_parallel_arrays]:
+        starts = np.zeros(rcpsp_model.n_jobs, dtype=np.int64)
+        ends = np.zeros(rcpsp_model.n_jobs, dtype=np.int64)
+        order = np.zeros(rcpsp_model.n_jobs, dtype=np.int64)
+        _, unfeasible = func(
+            permutation_task=np.array([0, 1, 2, 3], dtype=np.int32),
+            modes_array=np.zeros(rcpsp_model.n_jobs, dtype=np.int64),
+            starts=starts,
+            ends=ends,
+            order=order,
+        )
+        assert not unfeasible
+        schedules.append(starts.tolist())
+    assert schedules[0][2] == 3
+    assert schedules[1] == schedules[0]
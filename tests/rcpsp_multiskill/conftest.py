@@ -0,0 +1,126 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import pytest
+
+from discrete_optimization.generic_tools.interval_calendar import IntervalCalendar
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
+    Employee,
+    MS_RCPSPModel_Variant,
+    SkillDetail,
+)
+
+
+def _create_random_ms_rcpsp_model(preemptive=False, nb_tasks=15, seed=0):
+    rng = random.Random(seed)
+    horizon = 200
+    tasks = list(range(1, nb_tasks + 3))
+    mode_details = {tasks[0]: {1: {"duration": 0}}, tasks[-1]: {1: {"duration": 0}}}
+    for task in tasks[1:-1]:
+        mode_details[task] = {
+            mode: {
+                "duration": rng.randint(1, 6),
+                "R1": rng.randint(0, 2),
+                "R2": rng.randint(0, 1),
+                "S1": rng.randint(0, 1),
+                "S2": rng.randint(0, 2),
+            }
+            for mode in range(1, rng.randint(1, 2) + 1)
+        }
+    successors = {task: [] for task in tasks}
+    for task in tasks[1:-1]:
+        successors[tasks[0]].append(task)
+        successors[task].append(tasks[-1])
+        if rng.random() < 0.3:
+            successors[task].insert(0, task + 1)
+    employees = {
+        f"employee_{i}": Employee(
+            dict_skill={
+                "S1": SkillDetail(1, 1.0, 0.5),
+                "S2": SkillDetail(rng.randint(1, 2), 1.0, 1.0),
+            },
+            calendar_employee=[rng.random() < 0.9 for _ in range(horizon)],
+            salary=rng.random(),
+        )
+        for i in range(4)
+    }
+    return MS_RCPSPModel_Variant(
+        skills_set={"S1", "S2"},
+        resources_set={"R1", "R2"},
+        non_renewable_resources=set(),
+        resources_availability={
+            "R1": [3] * horizon,
+            "R2": [rng.randint(1, 2) for _ in range(horizon)],
+        },
+        employees=employees,
+        employees_availability=[len(employees)] * horizon,
+        mode_details=mode_details,
+        successors=successors,
+        horizon=horizon,
+        preemptive=preemptive,
+    )
+
+
+def _with_interval_calendars(model: MS_RCPSPModel_Variant) -> MS_RCPSPModel_Variant:
+    return MS_RCPSPModel_Variant(
+        skills_set=model.skills_set,
+        resources_set=model.resources_set,
+        non_renewable_resources=model.non_renewable_resources,
+        resources_availability={
+            resource: IntervalCalendar.from_sequence(calendar)
+            for resource, calendar in model.resources_availability.items()
+        },
+        employees={
+            employee: Employee(
+                dict_skill=model.employees[employee].dict_skill,
+                calendar_employee=IntervalCalendar.from_sequence(
+                    model.employees[employee].calendar_employee
+                ),
+                salary=model.employees[employee].salary,
+            )
+            for employee in model.employees_list
+        },
+        employees_availability=model.employees_availability,
+        mode_details=model.mode_details,
+        successors=model.successors,
+        horizon=model.horizon,
+        tasks_list=model.tasks_list,
+        employees_list=model.employees_list,
+        one_unit_per_task_max=model.one_unit_per_task_max,
+    )
+
+
+def _random_solutions(model: MS_RCPSPModel_Variant, nb_solutions: int, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(nb_solutions):
+        permutation = rng.sample(range(model.n_jobs_non_dummy), model.n_jobs_non_dummy)
+        modes = [
+            rng.randint(1, len(model.mode_details[task]))
+            for task in model.tasks_list_non_dummy
+        ]
+        priority_worker_per_task = [
+            rng.sample(model.employees_list, len(model.employees_list))
+            for _ in range(model.n_jobs_non_dummy)
+        ]
+        yield permutation, modes, priority_worker_per_task
+
+
+@pytest.fixture
+def create_random_ms_rcpsp_model():
+    """Factory of seeded random multiskill rcpsp models."""
+    return _create_random_ms_rcpsp_model
+
+
+@pytest.fixture
+def with_interval_calendars():
+    """Copy of a multiskill model with its calendars stored as intervals."""
+    return _with_interval_calendars
+
+
+@pytest.fixture
+def random_solutions():
+    """Generator of seeded random (permutation, modes, worker priorities)."""
+    return _random_solutions
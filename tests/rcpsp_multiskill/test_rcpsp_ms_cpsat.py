@@ -0,0 +1,66 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import pytest
+
+from discrete_optimization.generic_rcpsp_tools.neighbor_tools_rcpsp import (
+    ConstraintHandlerCPSat,
+    NeighborRandom,
+)
+from discrete_optimization.generic_tools.cp_tools import ParametersCP, StatusSolver
+from discrete_optimization.generic_tools.lns_cp import LNS_CPlex
+from discrete_optimization.rcpsp.solver.rcpsp_lp_lns_solver import InitialMethodRCPSP
+from discrete_optimization.rcpsp_multiskill.solvers.cpsat_solver import (
+    CPSatMSRCPSPSolver,
+)
+from discrete_optimization.rcpsp_multiskill.solvers.ms_rcpsp_lp_lns_solver import (
+    InitialSolutionMS_RCPSP,
+)
+
+
+@pytest.mark.parametrize("interval_calendars", [False, True])
+def test_cpsat_solver(
+    interval_calendars, create_random_ms_rcpsp_model, with_interval_calendars
+):
+    model = create_random_ms_rcpsp_model()
+    if interval_calendars:
+        model = with_interval_calendars(model)
+    solver = CPSatMSRCPSPSolver(model)
+    parameters_cp = ParametersCP.default()
+    parameters_cp.time_limit = 5
+    result_storage = solver.solve(parameters_cp=parameters_cp)
+    assert solver.get_status_solver() in {StatusSolver.OPTIMAL, StatusSolver.SATISFIED}
+    solution, fit = result_storage.get_best_solution_fit()
+    assert model.satisfy(solution)
+
+
+def test_cpsat_lns(create_random_ms_rcpsp_model):
+    model = create_random_ms_rcpsp_model(nb_tasks=30)
+    initial_solution_provider = InitialSolutionMS_RCPSP(
+        problem=model, initial_method=InitialMethodRCPSP.DUMMY
+    )
+    (
+        initial_solution,
+        initial_fit,
+    ) = initial_solution_provider.get_starting_solution().get_best_solution_fit()
+    solver = CPSatMSRCPSPSolver(model)
+    lns_solver = LNS_CPlex(
+        problem=model,
+        cp_solver=solver,
+        initial_solution_provider=initial_solution_provider,
+        constraint_handler=ConstraintHandlerCPSat(
+            problem=model,
+            neighbor_builder=NeighborRandom(problem=model, fraction_subproblem=0.3),
+        ),
+    )
+    parameters_cp = ParametersCP.default()
+    parameters_cp.time_limit = 1
+    result_storage = lns_solver.solve_lns(
+        parameters_cp=parameters_cp, nb_iteration_lns=5
+    )
+    # solutions were found by the iterations
+    assert len(result_storage.list_solution_fits) > 1
+    solution, fit = result_storage.get_best_solution_fit()
+    assert model.satisfy(solution)
+    assert fit >= initial_fit
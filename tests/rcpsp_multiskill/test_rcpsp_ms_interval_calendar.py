@@ -0,0 +1,100 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import pytest
+
+from discrete_optimization.generic_tools.interval_calendar import IntervalCalendar
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
+    Employee,
+    TaskDetails,
+    use_interval_calendars,
+)
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill_npz import (
+    load_ms_rcpsp_model,
+    save_ms_rcpsp_model,
+)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_interval_calendars_same_schedule(
+    seed, create_random_ms_rcpsp_model, with_interval_calendars, random_solutions
+):
+    model = create_random_ms_rcpsp_model(seed=seed)
+    interval_model = with_interval_calendars(model)
+    assert not use_interval_calendars(model)
+    assert use_interval_calendars(interval_model)
+    assert "worker_available" not in interval_model.np_data
+    assert interval_model.max_resource_capacity == model.max_resource_capacity
+    assert (
+        interval_model.total_number_step_available == model.total_number_step_available
+    )
+    for permutation, modes, priority_worker_per_task in random_solutions(model, 20):
+        solutions = [
+            m.get_solution_type()(
+                problem=m,
+                priority_list_task=permutation,
+                modes_vector=modes,
+                priority_worker_per_task=priority_worker_per_task,
+            )
+            for m in [model, interval_model]
+        ]
+        assert solutions[0].schedule == solutions[1].schedule
+        assert solutions[0].employee_usage == solutions[1].employee_usage
+        assert model.evaluate(solutions[0]) == interval_model.evaluate(solutions[1])
+
+        # partial schedule from the first tasks of the schedule
+        schedule = solutions[0].schedule
+        first_tasks = sorted(schedule, key=lambda t: schedule[t]["start_time"])[:5]
+        current_t = schedule[first_tasks[-1]]["start_time"]
+        completed_tasks = {
+            t: TaskDetails(schedule[t]["start_time"], schedule[t]["end_time"], [])
+            for t in first_tasks
+            if schedule[t]["end_time"] <= current_t
+        }
+        scheduled_tasks_start_times = {
+            t: TaskDetails(schedule[t]["start_time"], schedule[t]["end_time"], [])
+            for t in first_tasks
+            if t not in completed_tasks
+        }
+        for solution in solutions:
+            solution.run_sgs_partial(
+                current_t=current_t,
+                completed_tasks=completed_tasks,
+                scheduled_tasks_start_times=scheduled_tasks_start_times,
+            )
+        assert solutions[0].schedule == solutions[1].schedule
+
+
+def test_interval_calendars_save_load(
+    tmp_path, create_random_ms_rcpsp_model, with_interval_calendars, random_solutions
+):
+    model = with_interval_calendars(create_random_ms_rcpsp_model())
+    save_ms_rcpsp_model(model, tmp_path / "model.npz")
+    loaded_model = load_ms_rcpsp_model(tmp_path / "model.npz")
+    assert loaded_model.resources_availability == model.resources_availability
+    for employee in model.employees_list:
+        assert (
+            loaded_model.employees[employee].calendar_employee
+            == model.employees[employee].calendar_employee
+        )
+    assert set(loaded_model.np_data) == set(model.np_data)
+    for permutation, modes, priority_worker_per_task in random_solutions(model, 5):
+        solutions = [
+            m.get_solution_type()(
+                problem=m,
+                priority_list_task=permutation,
+                modes_vector=modes,
+                priority_worker_per_task=priority_worker_per_task,
+            )
+            for m in [model, loaded_model]
+        ]
+        assert model.evaluate(solutions[0]) == loaded_model.evaluate(solutions[1])
+
+
+def test_employee_json_round_trip(create_random_ms_rcpsp_model):
+    employee = create_random_ms_rcpsp_model().employees["employee_0"]
+    employee.calendar_employee = IntervalCalendar.from_sequence(
+        employee.calendar_employee
+    )
+    assert Employee.from_json(employee.to_json()).to_json() == employee.to_json()
@@ -9,6 +9,7 @@ import pytest
 
 from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
     MS_RCPSPModel,
+    MS_RCPSPModel_Variant,
     MS_RCPSPSolution_Preemptive_Variant,
     MS_RCPSPSolution_Variant,
     TaskDetails,
@@ -195,3 +196,11 @@ def test_partial_sgs(rcpsp_model_file, preemptive_version):
                     e in dict_[o].resource_units_used
                     for e in dummy_solution.employee_usage.get(o, {})
                 )
+
+
+def test_copy_keeps_class(create_random_ms_rcpsp_model):
+    model = create_random_ms_rcpsp_model()
+    assert isinstance(model, MS_RCPSPModel_Variant)
+    model_copy = model.copy()
+    assert type(model_copy) is MS_RCPSPModel_Variant
+    assert model_copy.func_sgs is model.func_sgs
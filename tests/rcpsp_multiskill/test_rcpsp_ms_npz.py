@@ -0,0 +1,56 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import pytest
+
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill_npz import (
+    load_ms_rcpsp_model,
+    save_ms_rcpsp_model,
+)
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+@pytest.mark.parametrize("preemptive", [False, True])
+def test_save_load(tmp_path, preemptive, mmap_mode, create_random_ms_rcpsp_model):
+    model = create_random_ms_rcpsp_model(preemptive=preemptive)
+    save_ms_rcpsp_model(model, tmp_path / "model.npz")
+    loaded_model = load_ms_rcpsp_model(tmp_path / "model.npz", mmap_mode=mmap_mode)
+    assert type(loaded_model) is type(model)
+    assert loaded_model.tasks_list == model.tasks_list
+    assert loaded_model.mode_details == model.mode_details
+    assert loaded_model.successors == model.successors
+    assert loaded_model.resources_availability == model.resources_availability
+    assert loaded_model.partial_preemption_data == model.partial_preemption_data
+    assert loaded_model.preemptive_indicator == model.preemptive_indicator
+    for employee in model.employees_list:
+        assert (
+            loaded_model.employees[employee].to_json()
+            == model.employees[employee].to_json()
+        )
+        assert (
+            loaded_model.employees[employee].salary == model.employees[employee].salary
+        )
+    rng = random.Random(0)
+    for _ in range(10):
+        permutation = rng.sample(range(model.n_jobs_non_dummy), model.n_jobs_non_dummy)
+        modes = [
+            rng.randint(1, len(model.mode_details[task]))
+            for task in model.tasks_list_non_dummy
+        ]
+        priority_worker_per_task = [
+            rng.sample(model.employees_list, len(model.employees_list))
+            for _ in range(model.n_jobs_non_dummy)
+        ]
+        solutions = [
+            m.get_solution_type()(
+                problem=m,
+                priority_list_task=permutation,
+                modes_vector=modes,
+                priority_worker_per_task=priority_worker_per_task,
+            )
+            for m in [model, loaded_model]
+        ]
+        assert model.evaluate(solutions[0]) == loaded_model.evaluate(solutions[1])
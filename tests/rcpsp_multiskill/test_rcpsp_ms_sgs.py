@@ -0,0 +1,211 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import random
+
+import pytest
+
+from discrete_optimization.rcpsp_multiskill.rcpsp_multiskill import (
+    MS_RCPSPModel_Variant,
+    TaskDetails,
+)
+
+
+def create_sparse_calendars_model(
+    create_random_ms_rcpsp_model, seed: int, one_unit_per_task: bool, nb_tasks=20
+):
+    # employees working 8 time units out of 24, so that the sgs needs to skip many times
+    rng = random.Random(seed)
+    model = create_random_ms_rcpsp_model(seed=seed, nb_tasks=nb_tasks)
+    for employee in model.employees_list:
+        shift = rng.randint(0, 23)
+        model.employees[employee].calendar_employee = [
+            (t + shift) % 24 < 8 for t in range(model.horizon)
+        ]
+    return MS_RCPSPModel_Variant(
+        skills_set=model.skills_set,
+        resources_set=model.resources_set,
+        non_renewable_resources=model.non_renewable_resources,
+        resources_availability=model.resources_availability,
+        employees=model.employees,
+        employees_availability=model.employees_availability,
+        mode_details=model.mode_details,
+        successors=model.successors,
+        horizon=model.horizon,
+        tasks_list=model.tasks_list,
+        employees_list=model.employees_list,
+        one_unit_per_task_max=one_unit_per_task,
+    )
+
+
+@pytest.mark.parametrize("one_unit_per_task", [True, False])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_sgs_sparse_calendars(
+    seed,
+    one_unit_per_task,
+    create_random_ms_rcpsp_model,
+    with_interval_calendars,
+    random_solutions,
+):
+    model = create_sparse_calendars_model(
+        create_random_ms_rcpsp_model, seed, one_unit_per_task
+    )
+    interval_model = with_interval_calendars(model)
+    nb_feasible = 0
+    for permutation, modes, priority_worker_per_task in random_solutions(model, 20):
+        solutions = [
+            m.get_solution_type()(
+                problem=m,
+                priority_list_task=permutation,
+                modes_vector=modes,
+                priority_worker_per_task=priority_worker_per_task,
+            )
+            for m in [model, interval_model]
+        ]
+        # same greedy worker assignment as the step function sgs
+        assert solutions[0].schedule == solutions[1].schedule
+        assert solutions[0].employee_usage == solutions[1].employee_usage
+        if solutions[0].get_end_time(model.sink_task) < model.horizon:
+            nb_feasible += 1
+            check_employees_availability(model, solutions[0])
+    assert nb_feasible > 0
+
+
+# start times and employees (indexes in employees_list) of the tasks in tasks_list, as
+# computed by sgs_fast_ms before it tracked worker availability incrementally
+EXPECTED_SCHEDULES = {
+    True: [
+        (
+            [0, 72, 0, 5, 16, 69, 40, 64, 0, 44],
+            [(), (), (2,), (), (3,), (3,), (3,), (3,), (0,), (3,)],
+        ),
+        (
+            [0, 91, 0, 0, 64, 88, 44, 16, 0, 40],
+            [(), (), (), (), (3,), (3,), (3,), (3,), (2,), (3,)],
+        ),
+    ],
+    False: [
+        (
+            [0, 48, 6, 11, 16, 45, 0, 40, 11, 22],
+            [(), (), (1,), (), (3,), (3,), (0, 2), (3,), (1,), (0, 2)],
+        ),
+        (
+            [0, 49, 0, 4, 40, 46, 22, 16, 6, 0],
+            [(), (), (), (), (3,), (0, 2), (0, 2), (3,), (1,), (0, 2)],
+        ),
+    ],
+}
+
+
+@pytest.mark.parametrize("one_unit_per_task", [True, False])
+def test_sgs_fixed_schedules(
+    one_unit_per_task, create_random_ms_rcpsp_model, random_solutions
+):
+    model = create_sparse_calendars_model(
+        create_random_ms_rcpsp_model, 1, one_unit_per_task, nb_tasks=8
+    )
+    for (permutation, modes, priority_worker_per_task), expected in zip(
+        random_solutions(model, 2, seed=1), EXPECTED_SCHEDULES[one_unit_per_task]
+    ):
+        solution = model.get_solution_type()(
+            problem=model,
+            priority_list_task=permutation,
+            modes_vector=modes,
+            priority_worker_per_task=priority_worker_per_task,
+        )
+        start_times = [solution.get_start_time(task) for task in model.tasks_list]
+        employees = [
+            tuple(
+                sorted(
+                    model.employees_list.index(employee)
+                    for employee in solution.employee_usage.get(task, {})
+                )
+            )
+            for task in model.tasks_list
+        ]
+        assert (start_times, employees) == expected
+
+
+def check_employees_availability(model, solution):
+    busy = {employee: set() for employee in model.employees_list}
+    for task, employee_usage in solution.employee_usage.items():
+        times = range(solution.get_start_time(task), solution.get_end_time(task))
+        for employee in employee_usage:
+            calendar = model.employees[employee].calendar_employee
+            assert all(calendar[t] for t in times)
+            assert busy[employee].isdisjoint(times)
+            busy[employee].update(times)
+
+
+@pytest.mark.parametrize("one_unit_per_task", [True, False])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_partial_sgs_sparse_calendars(
+    seed,
+    one_unit_per_task,
+    create_random_ms_rcpsp_model,
+    with_interval_calendars,
+    random_solutions,
+):
+    model = create_sparse_calendars_model(
+        create_random_ms_rcpsp_model, seed, one_unit_per_task
+    )
+    interval_model = with_interval_calendars(model)
+    assert (
+        interval_model.func_sgs_partial.func.__name__
+        == "sgs_fast_ms_event_partial_schedule"
+    )
+    rng = random.Random(seed)
+    nb_feasible = 0
+    for permutation, modes, priority_worker_per_task in random_solutions(model, 20):
+        solution = model.get_solution_type()(
+            problem=model,
+            priority_list_task=permutation,
+            modes_vector=modes,
+            priority_worker_per_task=priority_worker_per_task,
+        )
+        if solution.get_end_time(model.sink_task) >= model.horizon:
+            continue
+        # tasks started before current_t are kept with their workers, the other ones rescheduled
+        current_t = rng.randint(0, solution.get_end_time(model.sink_task))
+        schedule = solution.schedule
+        completed_tasks = {}
+        scheduled_tasks_start_times = {}
+        for task in schedule:
+            if schedule[task]["start_time"] < current_t:
+                task_details = TaskDetails(
+                    schedule[task]["start_time"],
+                    schedule[task]["end_time"],
+                    list(solution.employee_usage.get(task, {})),
+                )
+                if schedule[task]["end_time"] <= current_t:
+                    completed_tasks[task] = task_details
+                else:
+                    scheduled_tasks_start_times[task] = task_details
+        rng.shuffle(permutation)
+        solutions = [
+            m.get_solution_type()(
+                problem=m,
+                priority_list_task=permutation,
+                modes_vector=modes,
+                priority_worker_per_task=priority_worker_per_task,
+            )
+            for m in [model, interval_model]
+        ]
+        for s in solutions:
+            s.run_sgs_partial(
+                current_t=current_t,
+                completed_tasks=completed_tasks,
+                scheduled_tasks_start_times=scheduled_tasks_start_times,
+            )
+        assert solutions[0].schedule == solutions[1].schedule
+        # the dense kernel may assign workers to tasks of null duration
+        for task in model.tasks_list:
+            if schedule[task]["end_time"] > schedule[task]["start_time"]:
+                assert solutions[0].employee_usage.get(task) == solutions[
+                    1
+                ].employee_usage.get(task)
+        if solutions[1].get_end_time(model.sink_task) < model.horizon:
+            nb_feasible += 1
+            check_employees_availability(model, solutions[1])
+    assert nb_feasible > 0
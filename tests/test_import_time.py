@@ -0,0 +1,81 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+core_modules = [
+    "discrete_optimization.coloring.coloring_model",
+    "discrete_optimization.facility.facility_model",
+    "discrete_optimization.knapsack.knapsack_model",
+    "discrete_optimization.pickup_vrp.gpdp",
+    "discrete_optimization.rcpsp.rcpsp_model",
+    "discrete_optimization.rcpsp.rcpsp_model_preemptive",
+    "discrete_optimization.rcpsp.rcpsp_utils",
+    "discrete_optimization.rcpsp_multiskill.rcpsp_multiskill",
+    "discrete_optimization.tsp.tsp_model",
+    "discrete_optimization.vrp.vrp_model",
+]
+
+# plotting and solver backends, loaded only by the modules using them
+lazy_modules = [
+    "matplotlib",
+    "seaborn",
+    "shapely",
+    "scipy.stats",
+    "minizinc",
+    "ortools",
+    "gurobipy",
+    "mip",
+    "deap",
+]
+
+
+def import_time(module):
+    """Import a module in a fresh interpreter with -X importtime.
+
+    Returns: cumulative import time (us) of each module imported
+
+    """
+    env = dict(os.environ)
+    env.pop("DO_SKIP_MZN_CHECK", None)  # the check must not be triggered by the import
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", core_modules)
+def test_core_module_import_is_lean(module):
+    times = import_time(module)
+    assert module in times
+    loaded = sorted(
+        name
+        for name in times
+        for lazy_module in lazy_modules
+        if name == lazy_module or name.startswith(f"{lazy_module}.")
+    )
+    assert loaded == [], (
+        f"{module} imports {loaded[0]}, which should be imported lazily. "
+        f"Slowest imports (us): {sorted(times.items(), key=lambda x: -x[1])[:10]}"
+    )
+
+
+def test_graph_api_import_does_not_load_numba():
+    # the transitive closure kernels are imported when a closure is first computed
+    times = import_time("discrete_optimization.generic_tools.graph_api")
+    assert not [name for name in times if name.split(".")[0] == "numba"]
@@ -0,0 +1,97 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+from math import isclose
+
+import numpy as np
+import pytest
+
+from discrete_optimization.tsp.common_tools_tsp import (
+    closest_greedy,
+    closest_greedy_candidates,
+)
+from discrete_optimization.tsp.mutation.mutation_tsp import Mutation2Opt
+from discrete_optimization.tsp.solver.solver_lp_iterative import (
+    LP_TSP_Iterative,
+    MILPSolver,
+    build_graph_pruned,
+)
+from discrete_optimization.tsp.tsp_model import (
+    Point2D,
+    TSPModel2DCandidateList,
+    build_candidate_lists,
+    compute_length,
+)
+
+
+def create_random_tsp_model(node_count=300, nb_candidates=8, seed=0):
+    rng = np.random.default_rng(seed)
+    coordinates = rng.integers(0, 1000, size=(node_count, 2))
+    # duplicated point
+    coordinates[1] = coordinates[0]
+    return TSPModel2DCandidateList(
+        list_points=[Point2D(float(x), float(y)) for x, y in coordinates],
+        node_count=node_count,
+        nb_candidates=nb_candidates,
+    )
+
+
+def test_candidate_lists():
+    model = create_random_tsp_model()
+    distances = np.linalg.norm(
+        model.np_points[:, np.newaxis, :] - model.np_points[np.newaxis, :, :], axis=2
+    )
+    np.fill_diagonal(distances, np.inf)
+    assert model.candidates.shape == (model.node_count, 8)
+    for i in range(model.node_count):
+        assert i not in model.candidates[i]
+        assert np.allclose(model.candidates_distances[i], np.sort(distances[i])[:8])
+        assert np.allclose(
+            distances[i, model.candidates[i]], model.candidates_distances[i]
+        )
+    candidates, _ = build_candidate_lists(model.np_points[:3], nb_candidates=10)
+    assert candidates.shape == (3, 2)
+
+
+@pytest.mark.parametrize("nb_candidates", [1, 5, 20])
+def test_closest_greedy_candidates(nb_candidates):
+    model = create_random_tsp_model(nb_candidates=nb_candidates)
+    sol, length_circuit, _ = closest_greedy(
+        model.node_count, model.list_points, candidates=model.candidates
+    )
+    assert sorted(sol) == list(range(model.node_count))
+    assert sol[0] == 0
+    permutation = sol[1:]
+    _, obj = compute_length(
+        solution=permutation,
+        start_index=0,
+        end_index=0,
+        list_points=model.list_points,
+        node_count=model.node_count,
+        length_permutation=model.length_permutation,
+    )
+    assert isclose(length_circuit, obj)
+    sol_computed, _, _ = closest_greedy_candidates(
+        model.node_count, model.list_points, nb_candidates=nb_candidates
+    )
+    assert sol_computed == sol
+
+
+def test_mutation_2opt_candidates():
+    model = create_random_tsp_model()
+    mutation = Mutation2Opt(model, nb_test=50)
+    assert mutation.candidates is model.candidates
+    solution = model.get_random_dummy_solution()
+    for _ in range(20):
+        solution, _, fitness = mutation.mutate_and_compute_obj(solution)
+        assert model.satisfy(solution)
+        assert isclose(fitness["length"], model.evaluate(solution.copy())["length"])
+
+
+def test_lp_pruned_graph_candidates():
+    model = create_random_tsp_model(node_count=40)
+    solver = LP_TSP_Iterative(model, build_graph_pruned)
+    solver.init_model(method=MILPSolver.CBC)
+    sol = solver.solve(plot=False, nb_iteration_max=20).get_best_solution()
+    assert model.satisfy(sol)
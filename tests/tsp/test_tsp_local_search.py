@@ -0,0 +1,66 @@
+#  Copyright (c) 2022 AIRBUS and its affiliates.
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+
+import numpy as np
+import pytest
+
+from discrete_optimization.tsp.solver.solver_local_search import TSP_LocalSearch
+from discrete_optimization.tsp.tsp_model import (
+    Point2D,
+    TSPModel2D,
+    TSPModel2DCandidateList,
+    TSPModelDistanceMatrix,
+)
+
+
+def create_random_points(node_count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [Point2D(float(x), float(y)) for x, y in rng.random((node_count, 2)) * 1000]
+
+
+@pytest.mark.parametrize("model_class", [TSPModel2D, TSPModel2DCandidateList])
+@pytest.mark.parametrize("start_index, end_index", [(0, 0), (3, 3), (0, 10)])
+@pytest.mark.parametrize("max_or_opt_length", [0, 3])
+def test_local_search(model_class, start_index, end_index, max_or_opt_length):
+    points = create_random_points(150)
+    model = model_class(
+        list_points=points,
+        node_count=len(points),
+        start_index=start_index,
+        end_index=end_index,
+    )
+    initial_solution = model.get_random_dummy_solution()
+    solver = TSP_LocalSearch(model)
+    solver.init_model()
+    solution, fitness = solver.solve(
+        initial_solution=initial_solution, max_or_opt_length=max_or_opt_length
+    ).get_best_solution_fit()
+    assert model.satisfy(solution)
+    assert solution.length < initial_solution.length
+    assert solution.length == pytest.approx(model.evaluate(solution.copy())["length"])
+    # local optimum reached
+    solution_bis = solver.solve(
+        initial_solution=solution, max_or_opt_length=max_or_opt_length
+    ).get_best_solution()
+    assert solution_bis.permutation == solution.permutation
+
+
+def test_local_search_distance_matrix():
+    points = create_random_points(100)
+    np_points = np.array([[p.x, p.y] for p in points])
+    distance_matrix = np.rint(
+        np.linalg.norm(np_points[:, np.newaxis] - np_points[np.newaxis, :], axis=2)
+    )
+    model = TSPModelDistanceMatrix(
+        list_points=points,
+        distance_matrix=distance_matrix,
+        node_count=len(points),
+        start_index=0,
+        end_index=5,
+    )
+    initial_solution = model.get_dummy_solution()
+    solver = TSP_LocalSearch(model)
+    solution = solver.solve().get_best_solution()
+    assert model.satisfy(solution)
+    assert solution.length < initial_solution.length